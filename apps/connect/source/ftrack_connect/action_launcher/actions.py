@@ -4,13 +4,13 @@ import json
 import logging
 import functools
 import platform
+import threading
 
 try:
     from PySide6 import QtWidgets, QtCore
 except ImportError:
     from PySide2 import QtWidgets, QtCore
 
-import ftrack_api.event.base
 from ftrack_utils.decorators import asynchronous
 from ftrack_utils.usage import get_usage_tracker
 
@@ -25,6 +25,7 @@ from ftrack_connect.utils.preferences import (
     get_connect_preferences,
     write_connect_prefs_file_path,
 )
+from ftrack_connect.action_launcher.discovery import ActionDiscovery
 
 
 class ActionBase(dict):
@@ -107,7 +108,22 @@ class Actions(QtWidgets.QWidget):
 
         self._current_user_id = None
         self._recent_actions = []
+        self._recent_actions_lock = threading.Lock()
+        self._recent_actions_merge_lock = threading.Lock()
+        self._recent_actions_fetched = threading.Event()
+        self._recent_actions_retrieved = False
         self._actions = []
+        self._action_groups = {}
+        self._context = []
+        self._discovery_request_id = None
+
+        self._discovery = ActionDiscovery(self.session, parent=self)
+        self._discovery.actionsDiscovered.connect(
+            self._on_actions_discovered_callback
+        )
+        self._discovery.discoveryFinished.connect(
+            self._on_discovery_finished_callback
+        )
 
         self._entity_selector = entity_selector.EntitySelector(self.session)
 
@@ -220,7 +236,6 @@ class Actions(QtWidgets.QWidget):
         """On action launched, save action and add it to top of list."""
         self.logger.debug(f"Action launched: {action}")
         self._add_recent_action(action["label"])
-        self._move_to_front(self._recent_actions, action["label"])
         self._update_recent_section()
 
         self._show_result_message(results)
@@ -291,7 +306,6 @@ class Actions(QtWidgets.QWidget):
         context = self._context_from_entity(entity)
         self._recent_section.clear()
         self._all_section.clear()
-        self._update_recent_actions()
         self._load_actions_for_context(context)
 
     def _update_recent_section(self):
@@ -325,9 +339,29 @@ class Actions(QtWidgets.QWidget):
                 "<p>Try another selection, add some actions and make sure you have the right integrations set up for the applications you want to launch.</p>"
             )
 
+    @asynchronous
     def _update_recent_actions(self):
-        """Retrieve and update recent actions."""
-        self._recent_actions = self._get_recent_actions()
+        """Retrieve and update recent actions in a background thread.
+
+        Recent actions are then kept up to date locally, they are only
+        retrieved from the server once. Actions launched before the
+        retrieval completes are kept in front of the stored ones.
+        """
+        try:
+            recent_actions = self._get_recent_actions()
+            with self._recent_actions_merge_lock:
+                merged_actions = list(self._recent_actions)
+                for action_label in recent_actions:
+                    if action_label not in merged_actions:
+                        merged_actions.append(action_label)
+                self._recent_actions = merged_actions[
+                    : self.RECENT_ACTIONS_LENGTH
+                ]
+            self._recent_actions_retrieved = True
+        finally:
+            # Unblock pending writes, they are skipped if the retrieval
+            # failed so the stored history is not overwritten.
+            self._recent_actions_fetched.set()
         self.recent_actions_changed.emit()
 
     def _get_current_user_id(self):
@@ -365,66 +399,90 @@ class Actions(QtWidgets.QWidget):
             pass
         item_list.insert(0, item)
 
-    @asynchronous
     def _add_recent_action(self, action_label):
-        """Add *actionLabel* to recent actions, persisting the change."""
-        recent_actions = self._get_recent_actions()
-        self._move_to_front(recent_actions, action_label)
-        recent_actions = recent_actions[: self.RECENT_ACTIONS_LENGTH]
-        encoded_recent_actions = json.dumps(recent_actions)
-
-        self.session.ensure(
-            "Metadata",
-            {
-                "parent_type": "User",
-                "parent_id": self._get_current_user_id(),
-                "key": self.RECENT_METADATA_KEY,
-                "value": encoded_recent_actions,
-            },
-            identifying_keys=["parent_type", "parent_id", "key"],
-        )
+        """Add *action_label* to recent actions, persisting the change."""
+        with self._recent_actions_merge_lock:
+            self._move_to_front(self._recent_actions, action_label)
+            del self._recent_actions[self.RECENT_ACTIONS_LENGTH :]
+        self._write_recent_actions()
 
-    # TODO: To re evaluate: breaks in PySide2 2.14, but works on PyQt5 2.15
-    # @asynchronous
-    def _load_actions_for_context(self, context):
-        """Obtain new actions synchronously for *context*."""
-        self.actions_loading.emit()
-        discovered_actions = []
+    @asynchronous
+    def _write_recent_actions(self):
+        """Persist recent actions in a background thread.
+
+        Waits for the stored recent actions to be retrieved and merged, so
+        that they are not overwritten by launches made in the meantime.
+        """
+        self._recent_actions_fetched.wait()
+        if not self._recent_actions_retrieved:
+            self.logger.warning(
+                "Recent actions could not be retrieved, not saving them."
+            )
+            return
 
-        event = ftrack_api.event.base.Event(
-            topic="ftrack.action.discover", data=dict(selection=context)
-        )
+        with self._recent_actions_lock:
+            # Write the latest recent actions, launches made while waiting
+            # for the lock are saved at once.
+            with self._recent_actions_merge_lock:
+                encoded_recent_actions = json.dumps(list(self._recent_actions))
 
-        results = self.session.event_hub.publish(event, synchronous=True)
+            self.session.ensure(
+                "Metadata",
+                {
+                    "parent_type": "User",
+                    "parent_id": self._get_current_user_id(),
+                    "key": self.RECENT_METADATA_KEY,
+                    "value": encoded_recent_actions,
+                },
+                identifying_keys=["parent_type", "parent_id", "key"],
+            )
 
-        for result in results:
-            if result:
-                for action in result.get("items", []):
-                    discovered_actions.append(ActionBase(action))
+    def _load_actions_for_context(self, context):
+        """Discover actions for *context* in the background.
 
-        # Sort actions by label
-        grouped_actions = []
-        for action in discovered_actions:
-            action["selection"] = context
-            added = False
-            for groupedAction in grouped_actions:
-                if action["label"] == groupedAction[0]["label"]:
-                    groupedAction.append(action)
-                    added = True
-
-            if not added:
-                grouped_actions.append([action])
+        Actions are added to the sections as each discover handler replies,
+        :attr:`actions_loaded` is emitted once all of them replied.
+        """
+        self.actions_loading.emit()
+        self._context = context
+        self._action_groups = {}
+        self._actions = []
+        self._discovery_request_id = self._discovery.discover(context)
+
+    def _on_actions_discovered_callback(self, request_id, actions):
+        """Group and add *actions* discovered by *request_id*."""
+        if request_id != self._discovery_request_id:
+            return
+
+        for action in actions:
+            action = ActionBase(action)
+            action["selection"] = self._context
+            group = self._action_groups.get(action["label"])
+            if group is None:
+                group = self._action_groups[action["label"]] = []
+                self._actions.append(group)
+            group.append(action)
 
         # Sort actions by label
-        grouped_actions = sorted(
-            grouped_actions,
-            key=lambda grouped_action: grouped_action[0]["label"].lower(),
+        self._actions.sort(
+            key=lambda grouped_action: grouped_action[0]["label"].lower()
         )
+        self._update_sections()
 
-        self.actions_loaded.emit(grouped_actions)
+    def _on_discovery_finished_callback(self, request_id):
+        """Emit :attr:`actions_loaded` once *request_id* is finished."""
+        if request_id != self._discovery_request_id:
+            return
+
+        self._discovery_request_id = None
+        self.actions_loaded.emit(self._actions)
 
     def _on_actions_loaded_callback(self, actions):
         self._actions = actions
+        self._update_sections()
+
+    def _update_sections(self):
+        """Show discovered actions and hide the busy overlay."""
         self._update_recent_section()
         self._update_all_section()
         self._overlay.indicator.hide()
@@ -0,0 +1,171 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+import logging
+import os
+import threading
+
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+import ftrack_api.event.base
+
+from ftrack_connect.application_launcher import IntegrationDiscoveryCache
+from ftrack_connect.utils.thread import get_session_lock
+
+logger = logging.getLogger(__name__)
+
+
+class ActionDiscoveryCache(IntegrationDiscoveryCache):
+    """Thread safe cache of action discovery results.
+
+    Results are keyed on the types of the selected entities, so browsing
+    entities of the same type does not run the discover handlers again.
+    Entries expire after *ttl* seconds if set, and the whole cache is
+    invalidated when plugins are reloaded.
+    """
+
+    @staticmethod
+    def make_key(context):
+        """Return cache key for actions discovered for *context*."""
+        return tuple(sorted(entity.get("entityType") for entity in context))
+
+
+#: Seconds action discovery results are cached for by default.
+DEFAULT_ACTION_DISCOVERY_CACHE_TTL = 300
+
+
+def _get_action_discovery_cache_ttl():
+    """Return the action discovery cache TTL set through the environment,
+    :data:`DEFAULT_ACTION_DISCOVERY_CACHE_TTL` if not set or invalid. Set
+    to 0 to disable caching."""
+    value = os.environ.get("FTRACK_CONNECT_ACTION_DISCOVERY_CACHE_TTL")
+    if not value:
+        return DEFAULT_ACTION_DISCOVERY_CACHE_TTL
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_ACTION_DISCOVERY_CACHE_TTL
+
+
+#: Action discovery results shared by all action widgets.
+action_discovery_cache = ActionDiscoveryCache(
+    ttl=_get_action_discovery_cache_ttl()
+)
+
+
+class ActionDiscovery(QtCore.QObject):
+    """Discover actions in a background thread.
+
+    The ``ftrack.action.discover`` event is published synchronously through
+    the event hub of the session, holding the session lock, and the actions
+    replied by each handler are emitted in turn. Discovery not finishing
+    within :attr:`DISCOVERY_TIMEOUT` seconds is abandoned. Complete results
+    are cached per type of selected entities.
+    """
+
+    #: Emitted with the request id and the actions replied by a handler.
+    actionsDiscovered = QtCore.Signal(int, object)
+
+    #: Emitted with the request id once all handlers replied or timed out.
+    discoveryFinished = QtCore.Signal(int)
+
+    #: Seconds to wait for the handlers to reply.
+    DISCOVERY_TIMEOUT = 30.0
+
+    def __init__(self, session, cache=None, parent=None):
+        """Initialise discovery of the actions of *session*, cached in
+        *cache*, the shared :data:`action_discovery_cache` by default."""
+        super(ActionDiscovery, self).__init__(parent)
+        self._session = session
+        self._cache = cache if cache is not None else action_discovery_cache
+        self._request_id = 0
+        self._lock = threading.Lock()
+
+    def discover(self, context):
+        """Start discovering actions for *context* and return the request
+        id passed to the signals. Previous requests are superseded and stop
+        emitting."""
+        with self._lock:
+            self._request_id += 1
+            request_id = self._request_id
+
+        thread = threading.Thread(
+            target=self._discover,
+            args=(request_id, context),
+            name="ftrack-connect-action-discovery",
+        )
+        thread.daemon = True
+        thread.start()
+        return request_id
+
+    def _is_current(self, request_id):
+        """Return whether *request_id* is the latest request."""
+        with self._lock:
+            return request_id == self._request_id
+
+    def _emit_actions(self, request_id, actions):
+        """Emit *actions* of *request_id* if still the latest request."""
+        if actions and self._is_current(request_id):
+            self.actionsDiscovered.emit(request_id, actions)
+
+    def _discover(self, request_id, context):
+        """Run discover handlers for *context*, emitting their actions."""
+        key = self._cache.make_key(context)
+        results = self._cache.get(key)
+        if results is None:
+            results = self._run_handlers(request_id, context)
+            if results is not None:
+                self._cache.set(key, results)
+        else:
+            for actions in results:
+                self._emit_actions(request_id, actions)
+
+        if self._is_current(request_id):
+            self.discoveryFinished.emit(request_id)
+
+    def _publish(self, event, result):
+        """Publish *event* synchronously, storing the list of handler
+        replies in *result*."""
+        try:
+            with get_session_lock(self._session):
+                replies = self._session.event_hub.publish(
+                    event, synchronous=True
+                )
+        except Exception:
+            logger.exception("Error discovering actions.")
+            return
+        result["replies"] = replies or []
+
+    def _run_handlers(self, request_id, context):
+        """Return the list of actions replied by each handler, None if
+        discovery failed or timed out."""
+        event = ftrack_api.event.base.Event(
+            topic="ftrack.action.discover", data=dict(selection=context)
+        )
+        result = {}
+        thread = threading.Thread(
+            target=self._publish,
+            args=(event, result),
+            name="ftrack-connect-action-handlers",
+        )
+        thread.daemon = True
+        thread.start()
+        thread.join(self.DISCOVERY_TIMEOUT)
+        if thread.is_alive():
+            logger.warning(
+                "Action discovery did not finish within {}s.".format(
+                    self.DISCOVERY_TIMEOUT
+                )
+            )
+            return None
+        if "replies" not in result:
+            return None
+
+        results = []
+        for reply in result["replies"]:
+            actions = list((reply or {}).get("items", []))
+            results.append(actions)
+            self._emit_actions(request_id, actions)
+        return results
@@ -10,6 +10,8 @@ import base64
 import json
 import logging
 import platform
+import threading
+import time
 from operator import itemgetter
 import os
 
@@ -19,7 +21,9 @@ else:
     from collections import MutableMapping, Mapping
 
 import ftrack_api
+import platformdirs
 from ftrack_action_handler.action import BaseAction
+from ftrack_utils.directories import DirectoryCache, ExpressionScanner
 from ftrack_utils.usage import get_usage_tracker
 from ftrack_utils.version import (
     CompatVersionString,
@@ -192,6 +196,128 @@ def restore_loader_library_path(environment):
     return environment
 
 
+class IntegrationDiscoveryCache(object):
+    """Thread safe cache of integration discovery results.
+
+    Results are keyed on application identifier, platform and context type,
+    so repeated action discoveries do not publish a synchronous
+    ``ftrack.connect.application.discover`` event per application. Entries
+    expire after *ttl* seconds if set, and the whole cache is invalidated
+    when plugins are reloaded or applications are rediscovered.
+    """
+
+    def __init__(self, ttl=None):
+        self.logger = logging.getLogger(
+            __name__ + "." + self.__class__.__name__
+        )
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self):
+        """Return the time to live of entries in seconds, None if unset."""
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value):
+        """Set the time to live of entries to *value* seconds."""
+        self._ttl = value
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def make_key(application, platform_name, context_type):
+        """Return cache key for *application* on *platform_name* discovered
+        for entities of *context_type*."""
+        return (application["identifier"], platform_name, context_type)
+
+    def get(self, key):
+        """Return cached result for *key*, None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored, value = entry
+            if self._ttl is not None and time.monotonic() - stored > self._ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        """Store result *value* for *key*."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self):
+        """Drop all cached results."""
+        with self._lock:
+            if self._entries:
+                self.logger.debug(
+                    "Invalidating {} cached integration discovery "
+                    "result(s).".format(len(self._entries))
+                )
+            self._entries.clear()
+
+
+def _get_discovery_cache_ttl():
+    """Return the discovery cache TTL set through the environment, None
+    if not set or invalid."""
+    value = os.environ.get("FTRACK_CONNECT_INTEGRATION_DISCOVERY_CACHE_TTL")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+#: Integration discovery results shared by all application launchers.
+integration_discovery_cache = IntegrationDiscoveryCache(
+    ttl=_get_discovery_cache_ttl()
+)
+
+
+def _get_application_scan_cache():
+    """Return the cache of the directory listings of application searches,
+    persisted to the user cache directory or the path set through
+    FTRACK_CONNECT_APPLICATION_SCAN_CACHE_PATH. Return None if disabled
+    through FTRACK_CONNECT_DISABLE_APPLICATION_SCAN_CACHE."""
+    if os.environ.get(
+        "FTRACK_CONNECT_DISABLE_APPLICATION_SCAN_CACHE", ""
+    ).lower() in ("1", "true", "yes"):
+        return None
+    path = os.environ.get(
+        "FTRACK_CONNECT_APPLICATION_SCAN_CACHE_PATH"
+    ) or os.path.join(
+        platformdirs.user_cache_dir("ftrack-connect", "ftrack"),
+        "application_directories.json",
+    )
+    return DirectoryCache(path)
+
+
+#: Filesystem scanner shared by all application stores, so directories
+#: searched by several launchers are listed once.
+application_scanner = ExpressionScanner(cache=_get_application_scan_cache())
+
+
+def parse_search_expression(expression, current_os):
+    """Return the start directory and the compiled regular expressions of
+    the remaining path segments of search *expression* on *current_os*."""
+    pieces = expression[:]
+    start = pieces.pop(0)
+
+    if current_os == "windows":
+        # On Windows C: means current directory so convert roots that look
+        # like drive letters to the C:\ format.
+        if start and start[-1] == ":":
+            start += "\\"
+
+    return start, list(map(re.compile, pieces))
+
+
 class ApplicationStore(object):
     """Discover and store available applications on this host."""
 
@@ -369,14 +495,9 @@ class ApplicationStore(object):
         else:
             versionExpression = re.compile(versionExpression)
 
-        pieces = expression[:]
-        start = pieces.pop(0)
-
-        if self.current_os == "windows":
-            # On Windows C: means current directory so convert roots that look
-            # like drive letters to the C:\ format.
-            if start and start[-1] == ":":
-                start += "\\"
+        start, expressions = parse_search_expression(
+            expression, self.current_os
+        )
 
         if not os.path.exists(start):
             raise ValueError(
@@ -384,155 +505,116 @@ class ApplicationStore(object):
                 "existing entry on the filesystem.".format(start, expression)
             )
 
-        expressions = list(map(re.compile, pieces))
-        expressionsCount = len(expressions)
+        # Note that on OSX executable might equate to a folder (.app).
+        for path in application_scanner.scan(start, expressions):
+            # Extract version from full matching path.
+            versionMatch = versionExpression.search(path)
+            loose_version = Version("0")
+            # Only apply version_year_offset when the
+            # version comes from Info.plist, not when
+            # it was already extracted as a marketing
+            # year from the filesystem path.
+            effective_offset = None
 
-        for location, folders, files in os.walk(
-            start, topdown=True, followlinks=True
-        ):
-            level = location.rstrip(os.path.sep).count(os.path.sep)
-            expression = expressions[level]
+            if versionMatch:
+                version = versionMatch.group("version")
 
-            if level < (expressionsCount - 1):
-                # If not yet at final piece then just prune directories.
-                folders[:] = [
-                    folder for folder in folders if expression.match(folder)
-                ]
-            else:
-                # Match executable. Note that on OSX executable might equate to
-                # a folder (.app).
-                for entry in folders + files:
-                    match = expression.match(entry)
-                    if match:
-                        # Extract version from full matching path.
-                        path = os.path.join(start, location, entry)
-
-                        versionMatch = versionExpression.search(path)
-                        loose_version = Version("0")
-                        # Only apply version_year_offset when the
-                        # version comes from Info.plist, not when
-                        # it was already extracted as a marketing
-                        # year from the filesystem path.
-                        effective_offset = None
-
-                        if versionMatch:
-                            version = versionMatch.group("version")
-
-                            try:
-                                loose_version = parse_application_version(
-                                    version
-                                )
-                            except Exception:
-                                self.logger.warning(
-                                    "Could not parse version"
-                                    " {0} from {1}".format(version, path)
-                                )
-                        elif sys.platform == "darwin" and path.endswith(
-                            ".app"
-                        ):
-                            # Extract version from Info.plist within .app
-                            # bundle.
-                            plist_path = os.path.join(
-                                path, "Contents", "Info.plist"
-                            )
-                            if os.path.isfile(plist_path):
-                                with open(plist_path, "rb") as f:
-                                    infoPlist = plistlib.load(f)
-                                    version = infoPlist.get(
-                                        "CFBundleShortVersionString"
-                                    )
-                                    if version:
-                                        loose_version = (
-                                            parse_application_version(version)
-                                        )
-                                        effective_offset = version_year_offset
-
-                        loose_version, beta_suffix = resolve_marketing_version(
-                            loose_version,
-                            effective_offset,
-                            path,
+                try:
+                    loose_version = parse_application_version(version)
+                except Exception:
+                    self.logger.warning(
+                        "Could not parse version" " {0} from {1}".format(
+                            version, path
                         )
+                    )
+            elif sys.platform == "darwin" and path.endswith(".app"):
+                # Extract version from Info.plist within .app
+                # bundle.
+                plist_path = os.path.join(path, "Contents", "Info.plist")
+                if os.path.isfile(plist_path):
+                    with open(plist_path, "rb") as f:
+                        infoPlist = plistlib.load(f)
+                        version = infoPlist.get("CFBundleShortVersionString")
+                        if version:
+                            loose_version = parse_application_version(version)
+                            effective_offset = version_year_offset
+
+            loose_version, beta_suffix = resolve_marketing_version(
+                loose_version,
+                effective_offset,
+                path,
+            )
 
-                        variant_str = (
-                            variant.format(version=str(loose_version))
-                            + beta_suffix
-                        )
+            variant_str = (
+                variant.format(version=str(loose_version)) + beta_suffix
+            )
 
-                        if integrations:
-                            variant_str = "{} [{}]".format(
-                                variant_str,
-                                ":".join(list(integrations.keys())),
-                            )
+            if integrations:
+                variant_str = "{} [{}]".format(
+                    variant_str,
+                    ":".join(list(integrations.keys())),
+                )
 
-                        application = {
-                            "identifier": applicationIdentifier.format(
-                                variant=str(variant_str)
-                            ),
-                            "path": path,
-                            "launchArguments": launchArguments,
-                            "version": loose_version,
-                            "label": label.format(version=str(loose_version)),
-                            "icon": self._get_icon_url(icon),
-                            "variant": variant_str,
-                            "description": description,
-                            "integrations": integrations or {},
-                            "rosetta": rosetta,
-                        }
-                        if standalone_module:
-                            application["standalone_module"] = (
-                                standalone_module
+            application = {
+                "identifier": applicationIdentifier.format(
+                    variant=str(variant_str)
+                ),
+                "path": path,
+                "launchArguments": launchArguments,
+                "version": loose_version,
+                "label": label.format(version=str(loose_version)),
+                "icon": self._get_icon_url(icon),
+                "variant": variant_str,
+                "description": description,
+                "integrations": integrations or {},
+                "rosetta": rosetta,
+            }
+            if standalone_module:
+                application["standalone_module"] = standalone_module
+            application["environment_variables"] = {}
+            if extensions_path:
+                # Convert to list and expand paths
+                if isinstance(extensions_path, list):
+                    application["environment_variables"][
+                        "FTRACK_FRAMEWORK_EXTENSIONS_PATH"
+                    ] = os.pathsep.join(
+                        [
+                            self._conditional_expand_extension_path(
+                                extension_path, connect_plugin_path
                             )
-                        application["environment_variables"] = {}
-                        if extensions_path:
-                            # Convert to list and expand paths
-                            if isinstance(extensions_path, list):
-                                application["environment_variables"][
-                                    "FTRACK_FRAMEWORK_EXTENSIONS_PATH"
-                                ] = os.pathsep.join(
-                                    [
-                                        self._conditional_expand_extension_path(
-                                            extension_path, connect_plugin_path
-                                        )
-                                        for extension_path in extensions_path
-                                    ]
-                                )
-                            else:
-                                application["environment_variables"][
-                                    "FTRACK_FRAMEWORK_EXTENSIONS_PATH"
-                                ] = self._conditional_expand_extension_path(
-                                    extensions_path, connect_plugin_path
-                                )
-
-                        if environment_variables:
-                            # Parse environment variables
-                            # TODO: support platform specific env vars
-                            for name, value in list(
-                                environment_variables.items()
-                            ):
-                                if name.upper() in [
-                                    "FTRACK_CONNECT_EXTENSIONS_PATH",
-                                    "FTRACK_FRAMEWORK_EXTENSIONS_PATH",
-                                ]:
-                                    # Ignore these - should be handled in config
-                                    self.logger.debug(
-                                        f"Ignoring environment variable {name}={value} in launch config -"
-                                        f" should be configured in extensions section!"
-                                    )
-                                    continue
-                                if isinstance(value, list):
-                                    # Merge on path sep
-                                    application["environment_variables"][
-                                        name
-                                    ] = os.pathsep.join(value)
-                                else:
-                                    application["environment_variables"][
-                                        name
-                                    ] = str(value)
-
-                        applications.append(application)
-
-                # Don't descend any further as out of patterns to match.
-                del folders[:]
+                            for extension_path in extensions_path
+                        ]
+                    )
+                else:
+                    application["environment_variables"][
+                        "FTRACK_FRAMEWORK_EXTENSIONS_PATH"
+                    ] = self._conditional_expand_extension_path(
+                        extensions_path, connect_plugin_path
+                    )
+
+            if environment_variables:
+                # Parse environment variables
+                # TODO: support platform specific env vars
+                for name, value in list(environment_variables.items()):
+                    if name.upper() in [
+                        "FTRACK_CONNECT_EXTENSIONS_PATH",
+                        "FTRACK_FRAMEWORK_EXTENSIONS_PATH",
+                    ]:
+                        # Ignore these - should be handled in config
+                        self.logger.debug(
+                            f"Ignoring environment variable {name}={value} in launch config -"
+                            f" should be configured in extensions section!"
+                        )
+                        continue
+                    if isinstance(value, list):
+                        # Merge on path sep
+                        application["environment_variables"][name] = (
+                            os.pathsep.join(value)
+                        )
+                    else:
+                        application["environment_variables"][name] = str(value)
+
+            applications.append(application)
 
         results = sorted(applications, key=itemgetter("version"), reverse=True)
         self.logger.debug("Discovered applications: {}".format(results))
@@ -632,6 +714,19 @@ class ApplicationLauncher(object):
 
         return found_integrations, lost_integrations
 
+    def discover_integrations_cached(self, application, context, context_type):
+        """Return integrations for *application* like
+        :meth:`discover_integrations`, reusing the result cached for the
+        application identifier, current platform and *context_type*."""
+        key = integration_discovery_cache.make_key(
+            application, self.current_os, context_type
+        )
+        result = integration_discovery_cache.get(key)
+        if result is None:
+            result = self.discover_integrations(application, context)
+            integration_discovery_cache.set(key, result)
+        return result
+
     def launch(self, applicationIdentifier, context=None):
         """Launch application matching *applicationIdentifier*.
 
@@ -1326,6 +1421,9 @@ class ApplicationLaunchAction(BaseAction):
         items = []
         applications = self.application_store.applications
 
+        # Discovery results are cached per type of selected entity.
+        context_type = entities[0][0] if entities else None
+
         applications = sorted(
             applications,
             key=lambda application: (
@@ -1345,7 +1443,9 @@ class ApplicationLaunchAction(BaseAction):
                 (
                     _,
                     lost_integration_groups,
-                ) = self.launcher.discover_integrations(application, context)
+                ) = self.launcher.discover_integrations_cached(
+                    application, context, context_type
+                )
 
                 for lost_integration_group in lost_integration_groups:
                     removed_integrations = application["integrations"][
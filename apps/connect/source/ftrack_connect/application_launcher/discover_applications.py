@@ -4,6 +4,7 @@
 import sys
 import os
 import platform
+import re
 from collections import defaultdict
 import logging
 
@@ -16,6 +17,9 @@ from ftrack_connect.application_launcher import (
     ApplicationStore,
     ApplicationLaunchAction,
     ApplicationLauncher,
+    application_scanner,
+    integration_discovery_cache,
+    parse_search_expression,
 )
 
 
@@ -36,9 +40,14 @@ class DiscoverApplications(object):
 
         self._actions = []
 
+        # Applications are rescanned, previous discovery results are stale.
+        integration_discovery_cache.invalidate()
+        application_scanner.reset()
+
         self._session = session
         configurations = self._parse_configurations(applications_config_paths)
         self._build_launchers(configurations)
+        application_scanner.save()
 
     def _parse_configurations(self, config_paths):
         """Use the extensions library to load and merge launch configurations"""
@@ -96,8 +105,28 @@ class DiscoverApplications(object):
 
         return result_dict
 
+    def _scan_search_paths(self, configurations):
+        """Scan the search paths of all *configurations* at once, so the
+        searches of each launcher only read the listed directories."""
+        searches = []
+        for configuration, _ in configurations:
+            try:
+                search_path = configuration["search_path"].get(self.current_os)
+                if not search_path:
+                    continue
+                start, expressions = parse_search_expression(
+                    search_path["prefix"] + search_path["expression"],
+                    self.current_os,
+                )
+            except (KeyError, TypeError, AttributeError, IndexError, re.error):
+                # Reported when the launcher is built.
+                continue
+            searches.append((start, expressions))
+        application_scanner.scan_many(searches)
+
     def _build_launchers(self, configurations):
         grouped_configurations = self._group_configurations(configurations)
+        self._scan_search_paths(configurations)
         for (
             identifier,
             identified_configuration,
@@ -1,30 +1,271 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2014-2023 ftrack
 
+import logging
+import threading
+import time
+
 try:
     from PySide6 import QtCore
 except ImportError:
     from PySide2 import QtCore
 
+import ftrack_api.exception
+
+# Put on the event queue to wake up the blocking event pump.
+_WAKE_UP = object()
+
+#: Topic of the event published once the event hub gave up reconnecting.
+DISCONNECTED_TOPIC = 'ftrack.meta.disconnected'
+
+
+def _callback_name(callback):
+    '''Return a readable name for subscriber *callback*.'''
+    name = getattr(callback, '__qualname__', None)
+    if name is None:
+        return repr(callback)
+    return '{}.{}'.format(getattr(callback, '__module__', ''), name)
+
+
+class EventHubStatistics(object):
+    '''Counters of the events dispatched by a :class:`NewApiEventHubThread`.
+
+    Latencies are in seconds.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events_dispatched = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._handlers = {}
+
+    def record_event(self, latency):
+        '''Record an event dispatched to its handlers in *latency*.'''
+        with self._lock:
+            self.events_dispatched += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_handler(self, name, latency):
+        '''Record a call of handler *name* which took *latency*.'''
+        with self._lock:
+            calls, total, maximum = self._handlers.get(name, (0, 0.0, 0.0))
+            self._handlers[name] = (
+                calls + 1,
+                total + latency,
+                max(maximum, latency),
+            )
+
+    def handler_statistics(self):
+        '''Return mapping of handler name to its calls, total and max
+        latency.'''
+        with self._lock:
+            return {
+                name: {'calls': calls, 'total': total, 'max': maximum}
+                for name, (calls, total, maximum) in self._handlers.items()
+            }
+
+    def slowest_handlers(self, count=5):
+        '''Return the *count* handlers with the highest total latency, as a
+        list of (name, statistics) tuples.'''
+        return sorted(
+            self.handler_statistics().items(),
+            key=lambda item: item[1]['total'],
+            reverse=True,
+        )[:count]
+
+    def snapshot(self):
+        '''Return a dictionary of the current counters.'''
+        with self._lock:
+            events_dispatched = self.events_dispatched
+            return {
+                'events_dispatched': events_dispatched,
+                'total_latency': self.total_latency,
+                'max_latency': self.max_latency,
+                'average_latency': (
+                    self.total_latency / events_dispatched
+                    if events_dispatched
+                    else 0.0
+                ),
+            }
+
+
+class _TimedCallback(object):
+    '''Subscriber callback recording its latency to statistics.'''
+
+    def __init__(self, callback, statistics, slow_threshold, logger):
+        self.callback = callback
+        self.name = _callback_name(callback)
+        self._statistics = statistics
+        self._slow_threshold = slow_threshold
+        self._logger = logger
+
+    def __call__(self, event):
+        started = time.perf_counter()
+        try:
+            return self.callback(event)
+        finally:
+            latency = time.perf_counter() - started
+            self._statistics.record_handler(self.name, latency)
+            if latency > self._slow_threshold:
+                self._logger.warning(
+                    'Handler {} took {:.2f}s for event {}.'.format(
+                        self.name, latency, event.get('topic')
+                    )
+                )
+
+
+class _EventHubQueue(object):
+    '''Blocking access to the events received by an ftrack_api event hub.
+
+    :meth:`ftrack_api.event.hub.EventHub.wait` polls the event queue, this
+    blocks on it instead. It is the only use of the private ``_event_queue``,
+    ``_handle`` and ``_subscribers`` attributes of the event hub,
+    :attr:`available` is False if they are missing.
+    '''
+
+    def __init__(self, event_hub):
+        self._event_hub = event_hub
+        self._queue = getattr(event_hub, '_event_queue', None)
+        self._handle = getattr(event_hub, '_handle', None)
+        self.available = (
+            hasattr(self._queue, 'get')
+            and hasattr(self._queue, 'put')
+            and callable(self._handle)
+        )
+
+    @property
+    def depth(self):
+        '''Number of events waiting to be dispatched.'''
+        if not self.available:
+            return 0
+        return self._queue.qsize()
+
+    def get(self):
+        '''Return the next event, None if woken up by :meth:`wake`.'''
+        event = self._queue.get()
+        if event is _WAKE_UP:
+            return None
+        return event
+
+    def wake(self):
+        '''Wake up a thread blocked in :meth:`get`.'''
+        if self.available:
+            self._queue.put(_WAKE_UP)
+
+    def handle(self, event):
+        '''Call the subscribers of *event*.'''
+        self._handle(event)
+
+    def subscribers(self):
+        '''Return the subscribers of the event hub.'''
+        return list(getattr(self._event_hub, '_subscribers', None) or [])
+
 
 class NewApiEventHubThread(QtCore.QThread):
-    '''Listen for events from ftrack's event hub.'''
+    '''Listen for events from ftrack's event hub.
+
+    The thread blocks on the event hub queue until an event arrives, it is
+    woken up by :meth:`quit`. Dispatch counters and handler latencies are
+    available through :attr:`statistics`. It stops once the event hub is
+    disconnected, as :meth:`ftrack_api.event.hub.EventHub.wait` does.
+    '''
+
+    #: Seconds above which a handler is logged as slow.
+    SLOW_HANDLER_THRESHOLD = 1.0
+
+    @property
+    def queue_depth(self):
+        '''Number of events waiting to be dispatched.'''
+        if self._event_hub_queue is None:
+            return 0
+        return self._event_hub_queue.depth
+
+    def __init__(self, parent=None):
+        super(NewApiEventHubThread, self).__init__(parent)
+        self.logger = logging.getLogger(
+            __name__ + '.' + self.__class__.__name__
+        )
+        self._session = None
+        self._event_hub_queue = None
+        self.statistics = EventHubStatistics()
 
     def start(self, session):
         '''Start thread for *session*.'''
         self._session = session
+        self._event_hub_queue = _EventHubQueue(session.event_hub)
         super(NewApiEventHubThread, self).start()
 
     def run(self):
         '''Listen for events.'''
+        event_hub_queue = self._event_hub_queue
+        if not event_hub_queue.available:
+            self.logger.debug(
+                'Event hub queue not available, waiting for events instead.'
+            )
+            self._wait_for_events()
+            return
+
         while not self.isInterruptionRequested():
-            self._session.event_hub.wait(duration=0)
+            # Block until there is something to do, instead of polling.
+            event = event_hub_queue.get()
+            if event is None:
+                continue
+            self._instrument_subscribers(event_hub_queue.subscribers())
+            started = time.perf_counter()
+            try:
+                event_hub_queue.handle(event)
+            except Exception:
+                self.logger.exception(
+                    'Failed to handle event {}.'.format(event.get('topic'))
+                )
+            self.statistics.record_event(time.perf_counter() - started)
+
+            if event.get('topic') == DISCONNECTED_TOPIC:
+                if not self._session.event_hub.connected:
+                    self.logger.warning(
+                        'Disconnected from the event server, no longer '
+                        'listening for events.'
+                    )
+                    break
+
+    def _wait_for_events(self):
+        '''Listen for events with the public event hub API.'''
+        while not self.isInterruptionRequested():
+            try:
+                self._session.event_hub.wait(duration=0)
+            except ftrack_api.exception.EventHubConnectionError as error:
+                self.logger.warning(
+                    'Not connected to the event server, no longer listening '
+                    'for events: {}'.format(error)
+                )
+                break
 
     def quit(self):
-        '''Signal the run method to exit after the next loop.'''
+        '''Signal the run method to exit, waking it up if waiting.'''
         self.requestInterruption()
+        if self._event_hub_queue is not None and self.isRunning():
+            self._event_hub_queue.wake()
 
     def cleanup(self):
         '''Attempt to kill the event loop and return after it completes.'''
         self.quit()
         self.wait()
+        self.logger.debug(
+            'Event hub statistics: {}, slowest handlers: {}'.format(
+                self.statistics.snapshot(),
+                self.statistics.slowest_handlers(),
+            )
+        )
+
+    def _instrument_subscribers(self, subscribers):
+        '''Time the callbacks of new *subscribers*.'''
+        for subscriber in subscribers:
+            if not isinstance(subscriber.callback, _TimedCallback):
+                subscriber.callback = _TimedCallback(
+                    subscriber.callback,
+                    self.statistics,
+                    self.SLOW_HANDLER_THRESHOLD,
+                    self.logger,
+                )
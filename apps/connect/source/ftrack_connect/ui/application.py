@@ -56,6 +56,7 @@ from ftrack_connect.ui.widget import about as _about
 from ftrack_connect.ui import login_tools as _login_tools
 from ftrack_connect.ui.widget import configure_scenario as _scenario_widget
 import ftrack_connect.utils.log
+from ftrack_connect.application_launcher import integration_discovery_cache
 from ftrack_connect.application_launcher.discover_applications import (
     DiscoverApplications,
 )
@@ -505,6 +506,15 @@ class Application(QtWidgets.QMainWindow):
         except Exception as error:
             raise ftrack_connect.error.ParseError(error)
 
+        from ftrack_connect.action_launcher.discovery import (
+            action_discovery_cache,
+        )
+
+        # Plugin hooks have been (re)loaded, discovered integrations and
+        # actions may have changed.
+        integration_discovery_cache.invalidate()
+        action_discovery_cache.invalidate()
+
         # Need to reconfigure logging after session is created.
         ftrack_connect.utils.log.configure_logging(
             "ftrack_connect", level=self._log_level, notify=False
@@ -3,14 +3,26 @@
 #             Copyright (c) 2014 Martin Pengelly-Phillips
 # :notice: Derived from Riffle (https://github.com/4degrees/riffle)
 
+import functools
+import logging
+
 try:
-    from PySide6 import QtWidgets, QtCore, QtGui
+    from PySide6 import QtCore, QtGui
 except ImportError:
-    from PySide2 import QtWidgets, QtCore, QtGui
+    from PySide2 import QtCore, QtGui
 
 import ftrack_connect.worker
+from ftrack_connect.utils.thread import get_session_lock
 import qtawesome as qta
 
+logger = logging.getLogger(__name__)
+
+#: Query of the children of contexts, formatted with the filter.
+CHILDREN_QUERY = (
+    "select name, parent_id, object_type_id, object_type.name, "
+    "object_type.is_leaf, object_type.icon from TypedContext where {0}"
+)
+
 
 def ItemFactory(session, entity):
     """Return appropriate :py:class:`Item` to represent *entity*.
@@ -36,6 +48,8 @@ class Item(object):
         self.children = []
         self.parent = None
         self._fetched = False
+        # Children fetched ahead by :func:`prefetchChildren`.
+        self._prefetched = None
 
     def __repr__(self):
         """Return representation."""
@@ -121,10 +135,12 @@ class Item(object):
         """Return whether item may have children."""
         return True
 
-    def fetchChildren(self):
+    def fetchChildren(self, offset=0, limit=None):
         """Fetch and return new children.
 
-        Will only fetch children whilst canFetchMore is True.
+        Will only fetch children whilst canFetchMore is True. Return at most
+        *limit* children from *offset*, all of them if *limit* is None. The
+        item is fetched once a page shorter than *limit* is returned.
 
         .. note::
 
@@ -135,16 +151,36 @@ class Item(object):
         if not self.canFetchMore():
             return []
 
-        self._fetched = True
-        children = self._fetchChildren()
+        children = self.queryChildren(offset, limit)
+        if limit is None or len(children) < limit:
+            self.setFetched()
 
         return children
 
-    def _fetchChildren(self):
+    def queryChildren(self, offset=0, limit=None):
+        """Return at most *limit* new child items from *offset*.
+
+        The state of the item is not changed, so it can be called from a
+        background thread.
+
+        """
+        if self._prefetched is not None:
+            if limit is None:
+                return self._prefetched[offset:]
+            return self._prefetched[offset : offset + limit]
+
+        return self._fetchChildren(offset=offset, limit=limit)
+
+    def setFetched(self, fetched=True):
+        """Set whether all the children of the item are *fetched*."""
+        self._fetched = fetched
+
+    def _fetchChildren(self, offset=0, limit=None):
         """Fetch and return new child items.
 
         Override in subclasses to fetch actual children and return list of
-        *unparented* :py:class:`Item` instances.
+        *unparented* :py:class:`Item` instances, at most *limit* from
+        *offset*.
 
         """
         return []
@@ -157,6 +193,7 @@ class Item(object):
 
         # Enable children fetching
         self._fetched = False
+        self._prefetched = None
 
 
 class Root(Item):
@@ -177,11 +214,15 @@ class Root(Item):
         """Return type of item as string."""
         return "Root"
 
-    def _fetchChildren(self):
+    def _fetchChildren(self, offset=0, limit=None):
         """Fetch and return new child items."""
         children = []
         for entity in self._session.query(
-            "select id, full_name, name from Project where status is active"
+            _paginate(
+                "select id, full_name, name from Project where status is active",
+                offset,
+                limit,
+            )
         ):
             children.append(Project(self._session, entity))
 
@@ -211,15 +252,17 @@ class Context(Item):
         except Exception:
             return qta.icon("mdi.{}".format(icon))
 
-    def _fetchChildren(self):
+    def _fetchChildren(self, offset=0, limit=None):
         """Fetch and return new child items."""
         children = []
         entities = self._session.query(
-            (
-                "select name, object_type_id, object_type.name, "
-                "object_type.is_leaf, object_type.icon from TypedContext "
-                "where parent_id is {0}"
-            ).format(self.entity["id"])
+            _paginate(
+                CHILDREN_QUERY.format(
+                    "parent_id is {0}".format(self.entity["id"])
+                ),
+                offset,
+                limit,
+            )
         )
         for entity in entities:
             children.append(ItemFactory(self._session, entity))
@@ -250,6 +293,69 @@ class Project(Context):
         return self.entity.get("full_name")
 
 
+def _paginate(expression, offset, limit):
+    """Return query *expression* restricted to *limit* results from
+    *offset*."""
+    if limit is None:
+        return expression
+
+    return "{0} offset {1} limit {2}".format(expression, offset, limit)
+
+
+def prefetchChildren(session, items, limit=None):
+    """Fetch the children of the context *items* in a single query.
+
+    The children are kept on each item and returned by
+    :py:meth:`Item.queryChildren` without querying the server. If more than
+    *limit* children are found, the children of the last item of the
+    results are not kept as they may be incomplete.
+
+    """
+    parents = dict(
+        (item.id, item)
+        for item in items
+        if isinstance(item, Context)
+        and item.mayHaveChildren()
+        and item._prefetched is None
+    )
+    if not parents:
+        return
+
+    expression = CHILDREN_QUERY.format(
+        "parent_id in ({0}) order by parent_id".format(", ".join(parents))
+    )
+    entities = list(session.query(_paginate(expression, 0, limit)))
+
+    children = dict((parentId, []) for parentId in parents)
+    for entity in entities:
+        children.setdefault(entity["parent_id"], []).append(
+            ItemFactory(session, entity)
+        )
+
+    truncated = limit is not None and len(entities) >= limit
+    if truncated:
+        # Parents without results may have children past the limit.
+        children.pop(entities[-1]["parent_id"], None)
+        parentIds = set(entity["parent_id"] for entity in entities)
+    else:
+        parentIds = set(parents)
+
+    for parentId, parentChildren in children.items():
+        if parentId in parentIds and parentId in parents:
+            parents[parentId]._prefetched = parentChildren
+
+
+class _FetchRequest(object):
+    """Fetch of a page of children of an :py:class:`Item`."""
+
+    def __init__(self, item, index):
+        """Initialise request for *item* at *index*."""
+        self.item = item
+        self.index = QtCore.QPersistentModelIndex(index)
+        self.worker = None
+        self.cancelled = False
+
+
 class EntityTreeModel(QtCore.QAbstractItemModel):
     """Model representing entity tree."""
 
@@ -265,12 +371,29 @@ class EntityTreeModel(QtCore.QAbstractItemModel):
     #: Signal that a loading operation has ended.
     loadEnded = QtCore.Signal()
 
+    #: Signal that children were fetched under an index. Pass the index.
+    childrenFetched = QtCore.Signal(object)
+
+    #: Signal that fetching children under an index failed. Pass the index
+    #: and the error.
+    fetchFailed = QtCore.Signal(object, object)
+
+    #: Maximum number of children fetched at once.
+    PAGE_SIZE = 250
+
+    #: Maximum number of children of the fetched children fetched ahead in
+    #: the same request, 0 to disable.
+    PREFETCH_SIZE = 1000
+
     def __init__(self, root=None, parent=None):
         """Initialise with *root* entity and optional *parent*."""
         super(EntityTreeModel, self).__init__(parent=parent)
         self.root = root
         self.columns = ["Name", "Type"]
-        self._worker = None
+        # Fetch requests running by item.
+        self._requests = {}
+        # Cancelled requests whose worker is still running.
+        self._cancelledRequests = set()
 
     def rowCount(self, parent):
         """Return number of children *parent* index has."""
@@ -409,54 +532,153 @@ class EntityTreeModel(QtCore.QAbstractItemModel):
     def fetchMore(self, index):
         """Fetch additional data under *index*.
 
-        Loading is done in a background thread with UI events continually
-        processed to maintain a responsive interface.
+        A page of :attr:`PAGE_SIZE` children is fetched in a background
+        thread and inserted once loaded, without blocking the caller. Calls
+        for an index already being fetched are ignored.
 
         :attr:`EntityTreeModel.loadStarted` is emitted at start of load with
-        :attr:`EntityTreeModel.loadEnded` emitted when load completes.
+        :attr:`EntityTreeModel.loadEnded` emitted when all loads complete.
+        :attr:`EntityTreeModel.childrenFetched` is emitted once the children
+        are inserted and :attr:`EntityTreeModel.fetchFailed` on error.
 
         """
-        if not index.isValid():
-            item = self.root
-        else:
-            item = index.internalPointer()
+        item = self._itemFromIndex(index)
+        if item in self._requests or not item.canFetchMore():
+            return
+
+        offset = len(item.children)
+        if item._prefetched is not None:
+            # Children are already available, insert them directly.
+            self._insertChildren(
+                index, item, item.queryChildren(offset, self.PAGE_SIZE)
+            )
+            self.childrenFetched.emit(index)
+            return
 
-        if item.canFetchMore():
+        request = _FetchRequest(item, index)
+        worker = ftrack_connect.worker.Worker(
+            self._fetchPage, [request, offset, self.PAGE_SIZE], parent=self
+        )
+        request.worker = worker
+        worker.finished.connect(
+            functools.partial(self._onFetchFinished, request),
+            QtCore.Qt.ConnectionType.QueuedConnection,
+        )
+        if not self._requests:
             self.loadStarted.emit()
-            startIndex = len(item.children)
+        self._requests[item] = request
+        worker.start()
 
-            self._worker = ftrack_connect.worker.Worker(
-                item.fetchChildren, parent=self
-            )
-            self._worker.start()
+    def _fetchPage(self, request, offset, limit):
+        """Return *limit* children of the item of *request* from *offset*,
+        with their own children prefetched. Run in a background thread.
 
-            while self._worker.isRunning():
-                app = QtWidgets.QApplication.instance()
-                app.processEvents()
+        Fetches query the session one at a time, a fetch cancelled while
+        waiting for its turn does not query it.
 
-            if self._worker.error:
-                raise self._worker.error[1]
+        """
+        item = request.item
+        with get_session_lock(item.session):
+            if request.cancelled:
+                return []
+
+            children = item.queryChildren(offset, limit)
+            if self.PREFETCH_SIZE:
+                prefetchChildren(item.session, children, self.PREFETCH_SIZE)
+            return children
+
+    def _onFetchFinished(self, request):
+        """Insert children fetched by *request*."""
+        request.worker.deleteLater()
+        if request.cancelled:
+            self._cancelledRequests.discard(request)
+            return
+
+        del self._requests[request.item]
+        item = request.item
+        index = self._indexFromRequest(request)
+        # The item may have been removed while fetching.
+        if index.isValid() or item is self.root:
+            if request.worker.error:
+                error = request.worker.error[1]
+                logger.error(
+                    "Could not fetch children of {0}: {1}".format(item, error)
+                )
+                self.fetchFailed.emit(index, error)
+            else:
+                self._insertChildren(index, item, request.worker.result)
+                self.childrenFetched.emit(index)
+
+        if not self._requests:
+            self.loadEnded.emit()
+
+    def _insertChildren(self, index, item, children):
+        """Add fetched *children* to *item* at *index*."""
+        if len(children) < self.PAGE_SIZE:
+            item.setFetched()
 
-            additionalChildren = self._worker.result
+        startIndex = len(item.children)
+        endIndex = startIndex + len(children) - 1
+        if endIndex >= startIndex:
+            self.beginInsertRows(index, startIndex, endIndex)
+            for newChild in children:
+                item.addChild(newChild)
+            self.endInsertRows()
 
-            endIndex = startIndex + len(additionalChildren) - 1
-            if endIndex >= startIndex:
-                self.beginInsertRows(index, startIndex, endIndex)
-                for newChild in additionalChildren:
-                    item.addChild(newChild)
-                self.endInsertRows()
+    def isFetching(self, index):
+        """Return whether children of *index* are being fetched."""
+        return self._itemFromIndex(index) in self._requests
+
+    def cancelFetch(self, index):
+        """Cancel fetching the children of *index*.
+
+        The running query completes in the background but its results are
+        discarded, the children can be fetched again.
+
+        """
+        request = self._requests.pop(self._itemFromIndex(index), None)
+        if request is None:
+            return
 
+        request.cancelled = True
+        self._cancelledRequests.add(request)
+        if not self._requests:
             self.loadEnded.emit()
 
+    def cancelFetches(self, exclude=None):
+        """Cancel all the fetches except the ones of *exclude* and its
+        ancestors."""
+        keep = set()
+        item = self._itemFromIndex(exclude) if exclude is not None else None
+        while item is not None:
+            keep.add(item)
+            item = item.parent
+
+        for request in list(self._requests.values()):
+            if request.item not in keep:
+                self.cancelFetch(self._indexFromRequest(request))
+
+    def _indexFromRequest(self, request):
+        """Return index of the item fetched by *request*."""
+        if request.item is self.root:
+            return QtCore.QModelIndex()
+
+        return QtCore.QModelIndex(request.index)
+
+    def _itemFromIndex(self, index):
+        """Return item at *index*, the root item if invalid."""
+        if not index.isValid():
+            return self.root
+
+        return index.internalPointer()
+
     def reloadChildren(self, index):
         """Reload the children of parent *index*."""
         if not self.hasChildren(index):
             return
 
-        if not index.isValid():
-            item = self.root
-        else:
-            item = index.internalPointer()
+        self.cancelFetch(index)
+        item = self._itemFromIndex(index)
 
         self.beginRemoveRows(index, 0, self.rowCount(index))
         item.clearChildren()
@@ -464,6 +686,7 @@ class EntityTreeModel(QtCore.QAbstractItemModel):
 
     def reset(self):
         """Reset model"""
+        self.cancelFetches()
         self.beginResetModel()
         self.root.clearChildren()
         self.endResetModel()
@@ -518,6 +741,37 @@ class EntityTreeProxyModel(QtCore.QSortFilterProxyModel):
 
         return sourceModel.reloadChildren(self.mapToSource(index))
 
+    def isFetching(self, index):
+        """Return whether children of *index* are being fetched."""
+        sourceModel = self.sourceModel()
+
+        if not sourceModel:
+            return False
+
+        return sourceModel.isFetching(self.mapToSource(index))
+
+    def cancelFetch(self, index):
+        """Cancel fetching the children of *index*."""
+        sourceModel = self.sourceModel()
+
+        if not sourceModel:
+            return
+
+        sourceModel.cancelFetch(self.mapToSource(index))
+
+    def cancelFetches(self, exclude=None):
+        """Cancel all the fetches except the ones of *exclude* and its
+        ancestors."""
+        sourceModel = self.sourceModel()
+
+        if not sourceModel:
+            return
+
+        if exclude is not None:
+            exclude = self.mapToSource(exclude)
+
+        sourceModel.cancelFetches(exclude)
+
     def match(self, start, *args, **kwargs):
         sourceModel = self.sourceModel()
 
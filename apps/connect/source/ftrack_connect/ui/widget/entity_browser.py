@@ -3,6 +3,7 @@
 #             Copyright (c) 2014 Martin Pengelly-Phillips
 # :notice: Derived from Riffle (https://github.com/4degrees/riffle)
 
+import logging
 
 try:
     from PySide6 import QtWidgets, QtCore
@@ -14,6 +15,8 @@ import qtawesome as qta
 import ftrack_connect.ui.model.entity_tree
 import ftrack_connect.ui.widget.overlay
 
+logger = logging.getLogger(__name__)
+
 
 class EntityBrowser(QtWidgets.QDialog):
     """Entity browser."""
@@ -36,6 +39,8 @@ class EntityBrowser(QtWidgets.QDialog):
         self._root = root
         self._selected = []
         self._updatingNavigationBar = False
+        # Location set while its entities are being fetched.
+        self._pendingLocation = None
 
         self._session = session
 
@@ -127,6 +132,10 @@ class EntityBrowser(QtWidgets.QDialog):
 
         self.model.sourceModel().loadStarted.connect(self._onLoadStarted)
         self.model.sourceModel().loadEnded.connect(self._onLoadEnded)
+        self.model.sourceModel().childrenFetched.connect(
+            self._onChildrenFetched
+        )
+        self.model.sourceModel().fetchFailed.connect(self._onFetchFailed)
 
         self.view.horizontalHeader().setSectionResizeMode(
             QtWidgets.QHeaderView.ResizeMode.ResizeToContents
@@ -167,37 +176,48 @@ class EntityBrowser(QtWidgets.QDialog):
 
         Each entry in the list should be an entity id.
 
+        Children missing along the path are fetched in the background and
+        the location is set once they are loaded. A warning is logged if the
+        location can't be matched.
+
         """
-        # Ensure root children loaded in order to begin search.
-        rootIndex = self.model.index(-1, -1)
-        if self.model.hasChildren(rootIndex) and self.model.canFetchMore(
-            rootIndex
-        ):
-            self.model.fetchMore(rootIndex)
-
-        # Search for matching entries by identity.
+        self._pendingLocation = list(location)
+        self._resumeSetLocation()
+
+    def _resumeSetLocation(self):
+        """Match the pending location in the loaded children, fetching the
+        next page of children if needed."""
+        location = self._pendingLocation
+        if location is None:
+            return
+
         role = self.model.sourceModel().IDENTITY_ROLE
 
-        matchingIndex = rootIndex
-        searchIndex = self.model.index(0, 0)
+        matchingIndex = self.model.index(-1, -1)
         for identity in location:
-            matches = self.model.match(searchIndex, role, identity)
+            matches = []
+            if self.model.rowCount(matchingIndex):
+                searchIndex = self.model.index(0, 0, parent=matchingIndex)
+                matches = list(self.model.match(searchIndex, role, identity))
+
             if not matches:
-                break
+                if self.model.hasChildren(
+                    matchingIndex
+                ) and self.model.canFetchMore(matchingIndex):
+                    # Resumed once the children are fetched.
+                    self.model.fetchMore(matchingIndex)
+                    return
+
+                self._pendingLocation = None
+                logger.warning(
+                    "Could not match location {0!r}".format(location)
+                )
+                return
 
             matchingIndex = matches[0]
-            if self.model.hasChildren(
-                matchingIndex
-            ) and self.model.canFetchMore(matchingIndex):
-                self.model.fetchMore(matchingIndex)
 
-            searchIndex = self.model.index(0, 0, parent=matchingIndex)
-
-        else:
-            self.setLocationFromIndex(matchingIndex)
-            return
-
-        raise ValueError("Could not match location {0!r}".format(location))
+        self._pendingLocation = None
+        self.setLocationFromIndex(matchingIndex)
 
     def getLocation(self):
         """Return current location as list of entity ids from root."""
@@ -219,6 +239,9 @@ class EntityBrowser(QtWidgets.QDialog):
         if index == currentIndex:
             return
 
+        self._pendingLocation = None
+        # Children of the previous location are no longer needed.
+        self.model.cancelFetches(exclude=index)
         self.view.setRootIndex(index)
         self._updateNavigationBar()
 
@@ -237,6 +260,14 @@ class EntityBrowser(QtWidgets.QDialog):
         self.overlay.hide()
         self.reloadButton.setEnabled(True)
 
+    def _onChildrenFetched(self, index):
+        """Handle children fetched under *index*."""
+        self._resumeSetLocation()
+
+    def _onFetchFailed(self, index, error):
+        """Handle failure to fetch children under *index*."""
+        self._pendingLocation = None
+
     def _updateNavigationBar(self):
         """Update navigation bar."""
         if self._updatingNavigationBar:
@@ -2,6 +2,8 @@
 # :copyright: Copyright (c) 2014-2023 ftrack
 
 import logging
+import threading
+import weakref
 
 try:
     from PySide6 import QtCore
@@ -64,3 +66,19 @@ def qt_main_thread(func):
         return invoke_in_qt_main_thread(func, *args, **kwargs)
 
     return wrapper
+
+
+#: Locks serialising the use of sessions from background threads, by
+#: session.
+_session_locks = weakref.WeakKeyDictionary()
+_session_locks_lock = threading.Lock()
+
+
+def get_session_lock(session):
+    '''Return the lock to hold while using *session* from a background
+    thread, :py:class:`ftrack_api.Session` not being thread safe.'''
+    with _session_locks_lock:
+        lock = _session_locks.get(session)
+        if lock is None:
+            lock = _session_locks[session] = threading.Lock()
+        return lock
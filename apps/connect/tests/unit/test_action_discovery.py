@@ -0,0 +1,178 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the background action discovery of Connect."""
+
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+ftrack_api = pytest.importorskip("ftrack_api")
+discovery = pytest.importorskip("ftrack_connect.action_launcher.discovery")
+
+from ftrack_connect.utils.thread import get_session_lock
+
+
+class FakeHandler(object):
+    """Discover handler replying *labels* after *delay* seconds."""
+
+    def __init__(self, labels, delay=0, stop=False):
+        self.labels = labels
+        self.delay = delay
+        self.stop = stop
+        self.calls = 0
+
+    def __call__(self, event):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.stop:
+            event.stop()
+        return {"items": [{"label": label} for label in self.labels]}
+
+
+class FakeSession(object):
+    """Session with an unconnected event hub, *handlers* being a list of
+    (handler, priority, topic, subscriber) tuples."""
+
+    def __init__(self, handlers):
+        self.event_hub = ftrack_api.event.hub.EventHub(
+            "https://ftrack.example.com", "user", "key"
+        )
+        for handler, priority, topic, subscriber in handlers:
+            self.event_hub.subscribe(
+                "topic={}".format(topic),
+                handler,
+                subscriber=subscriber,
+                priority=priority,
+            )
+
+
+def _handler(labels, priority=100, topic="ftrack.action.discover", **kwargs):
+    """Return handler tuple of :class:`FakeSession`."""
+    subscriber = kwargs.pop("subscriber", None)
+    return (FakeHandler(labels, **kwargs), priority, topic, subscriber)
+
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def _discover(app, session, context, cache, timeout=5):
+    """Return list of labels replied per handler and whether discovery
+    finished."""
+    action_discovery = discovery.ActionDiscovery(session, cache=cache)
+    discovered = []
+    finished = []
+    action_discovery.actionsDiscovered.connect(
+        lambda request_id, actions: discovered.append(
+            [action["label"] for action in actions]
+        )
+    )
+    action_discovery.discoveryFinished.connect(finished.append)
+
+    request_id = action_discovery.discover(context)
+
+    deadline = time.monotonic() + timeout
+    while not finished:
+        assert time.monotonic() < deadline, "Timed out"
+        app.processEvents()
+        time.sleep(0.001)
+
+    assert finished == [request_id]
+    return discovered
+
+
+def test_actions_are_emitted_by_priority(app):
+    """Test actions of each handler are emitted in priority order."""
+    session = FakeSession(
+        [
+            _handler(["low"], priority=200),
+            _handler(["high", "higher"], priority=1),
+            _handler(["other"], topic="ftrack.action.launch"),
+        ]
+    )
+
+    discovered = _discover(
+        app, session, [], discovery.ActionDiscoveryCache(ttl=0)
+    )
+
+    assert discovered == [["high", "higher"], ["low"]]
+
+
+def test_stopped_event_skips_lower_priority_handlers(app):
+    """Test a handler stopping the event skips the following ones."""
+    low = _handler(["low"], priority=200)
+    session = FakeSession([_handler(["high"], priority=1, stop=True), low])
+
+    discovered = _discover(
+        app, session, [], discovery.ActionDiscoveryCache(ttl=0)
+    )
+
+    assert discovered == [["high"]]
+    assert low[0].calls == 0
+
+
+def test_handlers_hold_session_lock(app):
+    """Test handlers run holding the lock of the session."""
+    locked = []
+    session = FakeSession([_handler(["action"])])
+    session.event_hub.subscribe(
+        "topic=ftrack.action.discover",
+        lambda event: locked.append(get_session_lock(session).locked()),
+    )
+
+    _discover(app, session, [], discovery.ActionDiscoveryCache(ttl=0))
+
+    assert locked == [True]
+
+
+def test_discovery_timeout(app, monkeypatch):
+    """Test discovery not finishing in time is abandoned and not
+    cached."""
+    monkeypatch.setattr(discovery.ActionDiscovery, "DISCOVERY_TIMEOUT", 0.2)
+    release = threading.Event()
+    session = FakeSession([_handler(["fast"])])
+    session.event_hub.subscribe(
+        "topic=ftrack.action.discover", lambda event: release.wait(5)
+    )
+    cache = discovery.ActionDiscoveryCache()
+
+    started = time.monotonic()
+    discovered = _discover(app, session, [], cache)
+    release.set()
+
+    assert discovered == []
+    assert time.monotonic() - started < 2
+    assert len(cache) == 0
+
+
+def test_actions_are_cached_per_context_type(app):
+    """Test handlers run once per type of selected entities."""
+    handler = _handler(["action"])
+    session = FakeSession([handler])
+    subscriber = handler[0]
+    cache = discovery.ActionDiscoveryCache()
+
+    for entity_id in ("task-a", "task-b"):
+        discovered = _discover(
+            app,
+            session,
+            [{"entityId": entity_id, "entityType": "task"}],
+            cache,
+        )
+        assert discovered == [["action"]]
+    assert subscriber.calls == 1
+
+    _discover(
+        app, session, [{"entityId": "shot", "entityType": "shot"}], cache
+    )
+    assert subscriber.calls == 2
+
+    cache.invalidate()
+    _discover(
+        app, session, [{"entityId": "task", "entityType": "task"}], cache
+    )
+    assert subscriber.calls == 3
@@ -0,0 +1,52 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the parsing of application search expressions."""
+
+import importlib.util
+from pathlib import Path
+
+
+def _load_launcher_module():
+    """Load the launcher module directly from its file, skipping the Qt
+    imports of the package __init__."""
+    launcher_path = (
+        Path(__file__).parents[2]
+        / "source"
+        / "ftrack_connect"
+        / "application_launcher"
+        / "__init__.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "connect_application_search_under_test", launcher_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parse_search_expression = _load_launcher_module().parse_search_expression
+
+
+def test_start_and_expressions():
+    """The first piece is the start, the others are compiled."""
+    expression = ["/", "opt", "Maya\\d+", "bin", "maya$"]
+
+    start, expressions = parse_search_expression(expression, "linux")
+
+    assert start == "/"
+    assert [item.pattern for item in expressions] == expression[1:]
+    assert expressions[1].match("Maya2025")
+    # The configuration is left untouched.
+    assert len(expression) == 5
+
+
+def test_windows_drive_root():
+    """Drive letters are converted to the root of the drive on Windows."""
+    start, expressions = parse_search_expression(
+        ["C:", "Program Files.*", "Nuke.*"], "windows"
+    )
+
+    assert start == "C:\\"
+    assert len(expressions) == 2
+    assert parse_search_expression(["C:", "Nuke.*"], "linux")[0] == "C:"
@@ -0,0 +1,220 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the asynchronous fetching of the Connect entity tree."""
+
+import re
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+entity_tree = pytest.importorskip("ftrack_connect.ui.model.entity_tree")
+
+
+def _entity(entity_id, parent_id, is_leaf=False):
+    return {
+        "id": entity_id,
+        "name": entity_id,
+        "parent_id": parent_id,
+        "object_type": {"name": "Folder", "is_leaf": is_leaf},
+    }
+
+
+class FakeSession(object):
+    """Session answering TypedContext queries from a tree of entities."""
+
+    def __init__(self, children):
+        self.children = children
+        self.queries = []
+        self.release = threading.Event()
+        self.release.set()
+        self.active = 0
+        self.maxActive = 0
+        self.lock = threading.Lock()
+
+    def query(self, expression):
+        with self.lock:
+            self.queries.append(expression)
+            self.active += 1
+            self.maxActive = max(self.maxActive, self.active)
+        try:
+            self.release.wait(5)
+            time.sleep(0.01)
+            return self._query(expression)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _query(self, expression):
+        match = re.search(r"parent_id is (\S+)", expression)
+        if match:
+            parentIds = [match.group(1)]
+        else:
+            match = re.search(r"parent_id in \(([^)]*)\)", expression)
+            parentIds = sorted(match.group(1).split(", "))
+        entities = [
+            entity
+            for parentId in parentIds
+            for entity in self.children.get(parentId, [])
+        ]
+
+        match = re.search(r"offset (\d+) limit (\d+)", expression)
+        if match:
+            offset, limit = int(match.group(1)), int(match.group(2))
+            entities = entities[offset : offset + limit]
+        return entities
+
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def session():
+    children = {
+        "root": [
+            _entity("child-{0}".format(index), "root") for index in range(5)
+        ],
+    }
+    for index in range(5):
+        children["child-{0}".format(index)] = [
+            _entity(
+                "grandchild-{0}-{1}".format(index, child),
+                "child-{0}".format(index),
+                True,
+            )
+            for child in range(2)
+        ]
+    return FakeSession(children)
+
+
+@pytest.fixture
+def model(session, app):
+    root = entity_tree.Context(session, _entity("root", None))
+    model = entity_tree.EntityTreeModel(root=root)
+    model.PAGE_SIZE = 2
+    fetched = []
+    model.childrenFetched.connect(fetched.append)
+    model.fetched = fetched
+    yield model
+    model.cancelFetches()
+
+
+def _waitFor(app, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out"
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def test_fetch_more_does_not_block(model, session, app):
+    """Test children are fetched in the background, a page at a time."""
+    session.release.clear()
+    rootIndex = QtCore.QModelIndex()
+
+    model.fetchMore(rootIndex)
+    model.fetchMore(rootIndex)
+
+    assert model.isFetching(rootIndex)
+    assert model.rowCount(rootIndex) == 0
+    session.release.set()
+    _waitFor(app, lambda: model.fetched)
+    assert model.rowCount(rootIndex) == 2
+    assert len(session.queries) == 2
+
+    while model.canFetchMore(rootIndex):
+        model.fetchMore(rootIndex)
+        _waitFor(app, lambda: not model.isFetching(rootIndex))
+
+    assert model.rowCount(rootIndex) == 5
+
+
+def test_cancelled_fetch_is_discarded(model, session, app):
+    """Test the results of a cancelled fetch are not inserted."""
+    session.release.clear()
+    rootIndex = QtCore.QModelIndex()
+    loadEnded = []
+    model.loadEnded.connect(lambda: loadEnded.append(True))
+
+    model.fetchMore(rootIndex)
+    model.cancelFetch(rootIndex)
+    session.release.set()
+    _waitFor(app, lambda: not model._cancelledRequests)
+
+    assert loadEnded == [True]
+    assert model.rowCount(rootIndex) == 0
+    assert model.canFetchMore(rootIndex)
+    assert not model.fetched
+
+
+def test_fetches_query_session_one_at_a_time(model, session, app):
+    """Test concurrent fetches do not query the session concurrently."""
+    model.PREFETCH_SIZE = 0
+    rootIndex = QtCore.QModelIndex()
+    model.fetchMore(rootIndex)
+    _waitFor(app, lambda: model.fetched)
+    while model.canFetchMore(rootIndex):
+        model.fetchMore(rootIndex)
+        _waitFor(app, lambda: not model.isFetching(rootIndex))
+    del session.queries[:]
+
+    session.release.clear()
+    indexes = [model.index(row, 0, rootIndex) for row in range(5)]
+    for index in indexes:
+        model.fetchMore(index)
+    assert all(model.isFetching(index) for index in indexes)
+
+    # Fetches waiting for their turn are cancelled before querying.
+    _waitFor(app, lambda: session.queries)
+    model.cancelFetches(exclude=indexes[-1])
+    session.release.set()
+    _waitFor(app, lambda: not model.isFetching(indexes[-1]))
+    _waitFor(app, lambda: not model._cancelledRequests)
+
+    assert session.maxActive == 1
+    # The fetch holding the lock, then the one not cancelled.
+    assert len(session.queries) <= 2
+    assert model.rowCount(indexes[-1]) == 2
+
+
+def test_next_level_is_prefetched(model, session, app):
+    """Test the children of fetched items are fetched in one query."""
+    rootIndex = QtCore.QModelIndex()
+    model.fetchMore(rootIndex)
+    _waitFor(app, lambda: model.fetched)
+    queryCount = len(session.queries)
+
+    childIndex = model.index(0, 0, rootIndex)
+    model.fetchMore(childIndex)
+
+    assert len(session.queries) == queryCount
+    assert not model.isFetching(childIndex)
+    assert [
+        model.item(model.index(row, 0, childIndex)).id
+        for row in range(model.rowCount(childIndex))
+    ] == ["grandchild-0-0", "grandchild-0-1"]
+
+
+def test_truncated_prefetch_keeps_complete_children(session):
+    """Test children of the last parent of a truncated prefetch are
+    fetched again."""
+    items = [
+        entity_tree.Context(
+            session, _entity("child-{0}".format(index), "root")
+        )
+        for index in range(3)
+    ]
+
+    entity_tree.prefetchChildren(session, items, limit=3)
+
+    assert [item.id for item in items[0].queryChildren()] == [
+        "grandchild-0-0",
+        "grandchild-0-1",
+    ]
+    assert items[1]._prefetched is None
+    assert items[2]._prefetched is None
+    assert len(session.queries) == 1
@@ -0,0 +1,173 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the Connect event hub thread.
+
+The module is loaded by path to skip the ftrack_connect package __init__,
+see test_application_launcher_environment.py.
+"""
+
+import importlib.util
+import queue
+import time
+from pathlib import Path
+
+import ftrack_api.exception
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+
+def _load_event_hub_thread_module():
+    module_path = (
+        Path(__file__).parents[2]
+        / "source"
+        / "ftrack_connect"
+        / "event_hub_thread.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "connect_event_hub_thread_under_test", module_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_event_hub_thread = _load_event_hub_thread_module()
+
+
+class CountingQueue(queue.Queue):
+    def __init__(self):
+        super().__init__()
+        self.get_calls = 0
+
+    def get(self, *args, **kwargs):
+        self.get_calls += 1
+        return super().get(*args, **kwargs)
+
+
+class FakeSubscriber:
+    def __init__(self, topic, callback):
+        self.topic = topic
+        self.callback = callback
+
+
+class FakeEventHub:
+    def __init__(self):
+        self.connected = True
+        self._event_queue = CountingQueue()
+        self._subscribers = []
+
+    def _handle(self, event):
+        for subscriber in self._subscribers:
+            if subscriber.topic == event["topic"]:
+                subscriber.callback(event)
+
+
+class FakeSession:
+    def __init__(self):
+        self.event_hub = FakeEventHub()
+
+
+def slow_handler(event):
+    time.sleep(0.05)
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def hub_thread(session):
+    thread = _event_hub_thread.NewApiEventHubThread()
+    thread.start(session)
+    yield thread
+    thread.cleanup()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_idle_thread_blocks_instead_of_polling(session, hub_thread):
+    time.sleep(0.3)
+
+    assert session.event_hub._event_queue.get_calls == 1
+    assert hub_thread.queue_depth == 0
+
+
+def test_cleanup_wakes_up_blocked_thread(session):
+    thread = _event_hub_thread.NewApiEventHubThread()
+    thread.start(session)
+    assert wait_until(thread.isRunning)
+
+    started = time.monotonic()
+    thread.cleanup()
+
+    assert thread.isFinished()
+    assert time.monotonic() - started < 1
+
+
+def test_events_and_handler_latency_are_counted(session, hub_thread):
+    handled = []
+    session.event_hub._subscribers.append(
+        FakeSubscriber("fast", handled.append)
+    )
+    session.event_hub._subscribers.append(FakeSubscriber("slow", slow_handler))
+
+    for topic in ("fast", "slow", "fast"):
+        session.event_hub._event_queue.put({"topic": topic})
+
+    assert wait_until(
+        lambda: hub_thread.statistics.snapshot()["events_dispatched"] == 3
+    )
+    assert len(handled) == 2
+    (name, statistics), _ = hub_thread.statistics.slowest_handlers(2)
+    assert name.endswith("slow_handler")
+    assert statistics["calls"] == 1
+    assert statistics["max"] >= 0.05
+    assert hub_thread.statistics.snapshot()["max_latency"] >= 0.05
+
+
+def test_thread_stops_once_disconnected(session, hub_thread):
+    handled = []
+    session.event_hub._subscribers.append(
+        FakeSubscriber("ftrack.meta.disconnected", handled.append)
+    )
+    session.event_hub.connected = False
+
+    session.event_hub._event_queue.put({"topic": "ftrack.meta.disconnected"})
+
+    assert wait_until(hub_thread.isFinished)
+    assert len(handled) == 1
+
+
+class PublicEventHub:
+    """Event hub without the private attributes of ftrack_api."""
+
+    def __init__(self):
+        self.waits = 0
+
+    def wait(self, duration=None):
+        self.waits += 1
+        time.sleep(0.01)
+        if self.waits == 3:
+            raise ftrack_api.exception.EventHubConnectionError(
+                "Not connected."
+            )
+
+
+def test_falls_back_to_event_hub_wait():
+    session = FakeSession()
+    session.event_hub = PublicEventHub()
+    thread = _event_hub_thread.NewApiEventHubThread()
+    thread.start(session)
+
+    assert wait_until(thread.isFinished)
+    assert session.event_hub.waits == 3
+    assert thread.queue_depth == 0
+    thread.cleanup()
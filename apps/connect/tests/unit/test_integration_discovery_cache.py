@@ -0,0 +1,103 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the integration discovery cache of the launcher.
+
+The launcher module is loaded by path to stay Qt-free, see
+test_application_launcher_environment.py.
+"""
+
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _load_launcher_module():
+    launcher_path = (
+        Path(__file__).parents[2]
+        / "source"
+        / "ftrack_connect"
+        / "application_launcher"
+        / "__init__.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "connect_application_launcher_cache_under_test", launcher_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_launcher = _load_launcher_module()
+
+
+class FakeEventHub:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, event, synchronous=False):
+        self.published.append(event)
+        return [{"integration": {"name": "ftrack-framework-maya"}}]
+
+
+class FakeSession:
+    def __init__(self):
+        self.event_hub = FakeEventHub()
+
+
+class FakeStore:
+    def __init__(self):
+        self.session = FakeSession()
+
+
+APPLICATION = {
+    "identifier": "maya_2025",
+    "version": "2025",
+    "integrations": {"framework": ["ftrack-framework-maya"]},
+}
+
+
+@pytest.fixture
+def launcher():
+    _launcher.integration_discovery_cache.invalidate()
+    _launcher.integration_discovery_cache.ttl = None
+    yield _launcher.ApplicationLauncher(FakeStore())
+    _launcher.integration_discovery_cache.invalidate()
+
+
+def test_discovery_is_published_once_per_context_type(launcher):
+    published = launcher.session.event_hub.published
+
+    for _ in range(3):
+        found, lost = launcher.discover_integrations_cached(
+            APPLICATION, {}, "task"
+        )
+    assert len(published) == 1
+    assert found == [{"name": "ftrack-framework-maya"}]
+    assert lost == []
+
+    launcher.discover_integrations_cached(APPLICATION, {}, "shot")
+    assert len(published) == 2
+
+
+def test_invalidate_forces_rediscovery(launcher):
+    published = launcher.session.event_hub.published
+
+    launcher.discover_integrations_cached(APPLICATION, {}, "task")
+    _launcher.integration_discovery_cache.invalidate()
+    launcher.discover_integrations_cached(APPLICATION, {}, "task")
+
+    assert len(published) == 2
+
+
+def test_entries_expire_after_ttl(launcher):
+    published = launcher.session.event_hub.published
+    _launcher.integration_discovery_cache.ttl = 0.01
+
+    launcher.discover_integrations_cached(APPLICATION, {}, "task")
+    time.sleep(0.02)
+    launcher.discover_integrations_cached(APPLICATION, {}, "task")
+
+    assert len(published) == 2
@@ -0,0 +1,99 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the recent actions of Connect."""
+
+import json
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+actions = pytest.importorskip("ftrack_connect.action_launcher.actions")
+
+
+class FakeSignal(object):
+    def emit(self):
+        pass
+
+
+class FakeSession(object):
+    """Session storing recent actions, retrieval waits for *release*."""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.release = threading.Event()
+        self.written = []
+
+    def ensure(self, entity_type, data, identifying_keys=None):
+        self.written.append(json.loads(data["value"]))
+
+
+class FakeActions(object):
+    """Recent actions logic of :class:`Actions` without the widgets."""
+
+    RECENT_METADATA_KEY = actions.Actions.RECENT_METADATA_KEY
+    RECENT_ACTIONS_LENGTH = 3
+    _update_recent_actions = actions.Actions._update_recent_actions
+    _move_to_front = actions.Actions._move_to_front
+    _add_recent_action = actions.Actions._add_recent_action
+    _write_recent_actions = actions.Actions._write_recent_actions
+
+    def __init__(self, session, fail=False):
+        self.session = session
+        self.fail = fail
+        self.logger = actions.logging.getLogger(__name__)
+        self.recent_actions_changed = FakeSignal()
+        self._recent_actions = []
+        self._recent_actions_lock = threading.Lock()
+        self._recent_actions_merge_lock = threading.Lock()
+        self._recent_actions_fetched = threading.Event()
+        self._recent_actions_retrieved = False
+
+    def _get_current_user_id(self):
+        return "user-id"
+
+    def _get_recent_actions(self):
+        self.session.release.wait(5)
+        if self.fail:
+            raise RuntimeError("Server unavailable")
+        return list(self.session.stored)
+
+
+def _wait_for_threads(timeout=5):
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and not thread.daemon:
+            thread.join(timeout)
+
+
+def test_launch_before_retrieval_keeps_history():
+    """Test a launch before recent actions are retrieved is merged."""
+    session = FakeSession(["Maya", "Nuke", "Houdini"])
+    recent = FakeActions(session)
+    recent._update_recent_actions()
+
+    recent._add_recent_action("Nuke")
+    recent._add_recent_action("Blender")
+    assert session.written == []
+
+    session.release.set()
+    _wait_for_threads()
+
+    assert recent._recent_actions == ["Blender", "Nuke", "Maya"]
+    assert session.written
+    assert session.written[-1] == ["Blender", "Nuke", "Maya"]
+
+
+def test_failed_retrieval_does_not_overwrite_history(monkeypatch):
+    """Test nothing is written when recent actions cannot be retrieved."""
+    monkeypatch.setattr(sys, "excepthook", lambda *args: None)
+    session = FakeSession(["Maya"])
+    session.release.set()
+    recent = FakeActions(session, fail=True)
+    recent._update_recent_actions()
+    recent._add_recent_action("Nuke")
+    _wait_for_threads()
+
+    assert session.written == []
+    assert recent._recent_actions == ["Nuke"]
@@ -14,6 +14,11 @@ _BASE_ = 'ftrack.framework'
 
 #: Discover host topic event, used to discover available hosts.
 DISCOVER_HOST_TOPIC = '{}.host.discover.host'.format(_BASE_)
+#: Host announce topic event, sent by a host when it becomes available or its
+#: information changes, so clients can keep track of the available hosts.
+HOST_ANNOUNCE_TOPIC = '{}.host.announce'.format(_BASE_)
+#: Host depart topic event, sent by a host when it is no longer available.
+HOST_DEPART_TOPIC = '{}.host.depart'.format(_BASE_)
 #: Pipeline host run plugin topic event, used to communicate between client and
 #: host, by the host connection to make the host run the plugin.
 HOST_RUN_TOOL_CONFIG_TOPIC = '{}.host.run.tool_config'.format(_BASE_)
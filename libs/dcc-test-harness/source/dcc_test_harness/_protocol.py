@@ -1,6 +1,8 @@
 """JSON-RPC 2.0 protocol over TCP with length-prefixed framing.
 
-Shared by both the external client and the DCC-side server.
+A message is either a single request or response object, or a JSON-RPC
+2.0 batch: an array of them. Shared by both the external client and the
+DCC-side server.
 Must remain compatible with Python 3.11+.
 """
 
@@ -9,27 +11,31 @@ from __future__ import annotations
 import json
 import socket
 import struct
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 0  # OS-assigned
 HEADER_SIZE = 4  # bytes, big-endian uint32 length prefix
 JSONRPC_VERSION = "2.0"
 
+#: A single JSON-RPC object or a batch of them.
+Message = Union[dict, list]
 
-def encode_message(obj: dict) -> bytes:
-    """Encode a dict as a length-prefixed JSON message."""
+
+def encode_message(obj: Message) -> bytes:
+    """Encode a dict, or a batch list of dicts, as a length-prefixed JSON
+    message."""
     payload = json.dumps(obj, default=_json_default).encode("utf-8")
     header = struct.pack("!I", len(payload))
     return header + payload
 
 
-def decode_message(data: bytes) -> dict:
+def decode_message(data: bytes) -> Message:
     """Decode a JSON payload (without the length header)."""
     return json.loads(data.decode("utf-8"))
 
 
-def read_message(sock: socket.socket) -> Optional[dict]:
+def read_message(sock: socket.socket) -> Optional[Message]:
     """Read one length-prefixed JSON message from a socket.
 
     Returns None if the connection is closed.
@@ -44,7 +50,7 @@ def read_message(sock: socket.socket) -> Optional[dict]:
     return decode_message(payload)
 
 
-def write_message(sock: socket.socket, obj: dict) -> None:
+def write_message(sock: socket.socket, obj: Message) -> None:
     """Write one length-prefixed JSON message to a socket."""
     sock.sendall(encode_message(obj))
 
@@ -65,7 +71,7 @@ def make_request(
     return msg
 
 
-def make_response(request_id: int, result: Any) -> dict:
+def make_response(request_id: Optional[int], result: Any) -> dict:
     """Build a JSON-RPC 2.0 success response."""
     return {
         "jsonrpc": JSONRPC_VERSION,
@@ -75,7 +81,7 @@ def make_response(request_id: int, result: Any) -> dict:
 
 
 def make_error(
-    request_id: int,
+    request_id: Optional[int],
     code: int,
     message: str,
     data: Optional[dict] = None,
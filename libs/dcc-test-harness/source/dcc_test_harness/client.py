@@ -6,9 +6,11 @@ for test authors to interact with the DCC application.
 
 from __future__ import annotations
 
+import logging
 import socket
 import threading
-from typing import Any, Optional
+import time
+from typing import Any, Iterable, Optional, Union
 
 from dcc_test_harness._protocol import (
     make_request,
@@ -22,6 +24,50 @@ from dcc_test_harness.exceptions import (
     WidgetNotFoundError,
 )
 
+logger = logging.getLogger(__name__)
+
+#: A call of :meth:`DCCClient.call_many`, a method name or a
+#: ``(method, params)`` tuple.
+Call = Union[str, tuple[str, Optional[dict]]]
+
+
+class _PendingReply:
+    """A request sent to the server, waiting for its response."""
+
+    __slots__ = (
+        "event",
+        "sock",
+        "request_id",
+        "method",
+        "params",
+        "response",
+        "error",
+    )
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        request_id: int,
+        method: str,
+        params: Optional[dict],
+    ) -> None:
+        self.event = threading.Event()
+        self.sock = sock
+        self.request_id = request_id
+        self.method = method
+        self.params = params
+        self.response: Optional[dict] = None
+        self.error: Optional[Exception] = None
+
+    def resolve(
+        self,
+        response: Optional[dict] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.response = response
+        self.error = error
+        self.event.set()
+
 
 class WidgetProxy:
     """Lightweight proxy for a Qt widget inside the DCC.
@@ -136,6 +182,10 @@ class WidgetProxy:
 class DCCClient:
     """RPC client for communicating with a DCC test server.
 
+    Responses are read by a background thread and matched to their
+    request by id, so several requests can be in flight at once, from
+    :meth:`call_many` or from several threads.
+
     Example::
 
         client = DCCClient(port=9876)
@@ -156,6 +206,8 @@ class DCCClient:
         self._sock: Optional[socket.socket] = None
         self._request_id = 0
         self._lock = threading.Lock()
+        self._pending: dict[int, _PendingReply] = {}
+        self._pending_lock = threading.Lock()
 
     def connect(self) -> None:
         """Establish a TCP connection to the DCC test server."""
@@ -165,20 +217,34 @@ class DCCClient:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(self.timeout)
             sock.connect((self.host, self.port))
+            # The reader blocks until a response arrives, callers apply
+            # their own timeout.
+            sock.settimeout(None)
             self._sock = sock
         except OSError as e:
             raise DCCConnectionError(
                 f"Cannot connect to DCC at {self.host}:{self.port}: {e}"
             ) from e
 
+        threading.Thread(
+            target=self._read_responses,
+            args=(sock,),
+            daemon=True,
+            name="dcc-test-client-reader",
+        ).start()
+
     def disconnect(self) -> None:
         """Close the TCP connection."""
-        if self._sock is not None:
+        sock, self._sock = self._sock, None
+        if sock is not None:
             try:
-                self._sock.close()
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                sock.close()
             except OSError:
                 pass
-            self._sock = None
 
     def ping(self) -> bool:
         """Check if the server is responsive."""
@@ -199,35 +265,121 @@ class DCCClient:
         Raises RPCError on server-side errors,
         RPCTimeoutError on timeout.
         """
-        if self._sock is None:
+        (pending,) = self._send([(method, params)], batch=False)
+        effective_timeout = timeout or self.timeout
+        self._wait(
+            pending, time.monotonic() + effective_timeout, effective_timeout
+        )
+        return self._result(pending)
+
+    def call_many(
+        self,
+        calls: Iterable[Call],
+        timeout: Optional[float] = None,
+        batch: bool = True,
+        raise_on_error: bool = True,
+    ) -> list[Any]:
+        """Send several JSON-RPC requests at once and return their results,
+        in order.
+
+        Each call is a method name or a ``(method, params)`` tuple. With
+        *batch* the requests are sent as a single JSON-RPC 2.0 batch,
+        dispatched in one go on the DCC main thread, otherwise they are
+        pipelined without waiting for each response. *timeout* applies to
+        all the calls.
+
+        The first error is raised, unless *raise_on_error* is False, in
+        which case errors are returned in place of their result::
+
+            texts = client.call_many(
+                ("qt.widget_action", {"widget_id": wid, "action": "refresh"})
+                for wid in widget_ids
+            )
+        """
+        requests = [
+            (call, None) if isinstance(call, str) else tuple(call)
+            for call in calls
+        ]
+        if not requests:
+            return []
+
+        pending = self._send(requests, batch=batch)
+        effective_timeout = timeout or self.timeout
+        deadline = time.monotonic() + effective_timeout
+        results: list[Any] = []
+        for reply in pending:
+            self._wait(reply, deadline, effective_timeout)
+            try:
+                results.append(self._result(reply))
+            except (RPCError, WidgetNotFoundError) as error:
+                if raise_on_error:
+                    raise
+                results.append(error)
+        return results
+
+    def _send(
+        self,
+        requests: list[tuple[str, Optional[dict]]],
+        batch: bool,
+    ) -> list[_PendingReply]:
+        """Send *requests*, as a JSON-RPC batch if *batch*, and return
+        their pending replies."""
+        sock = self._sock
+        if sock is None:
             raise DCCConnectionError("Not connected")
 
+        pending: list[_PendingReply] = []
+        messages: list[dict] = []
         with self._lock:
-            self._request_id += 1
-            request_id = self._request_id
-
-            request = make_request(method, params, request_id)
-
-            effective_timeout = timeout or self.timeout
-            self._sock.settimeout(effective_timeout)
+            with self._pending_lock:
+                for method, params in requests:
+                    self._request_id += 1
+                    reply = _PendingReply(
+                        sock, self._request_id, method, params
+                    )
+                    self._pending[self._request_id] = reply
+                    pending.append(reply)
+                    messages.append(
+                        make_request(method, params, self._request_id)
+                    )
 
             try:
-                write_message(self._sock, request)
-                response = read_message(self._sock)
-            except socket.timeout as e:
-                raise RPCTimeoutError(
-                    f"RPC call {method!r} timed out after {effective_timeout}s"
-                ) from e
+                if batch:
+                    write_message(sock, messages)
+                else:
+                    for message in messages:
+                        write_message(sock, message)
             except (ConnectionError, OSError) as e:
                 self._sock = None
+                self._discard(pending)
                 raise DCCConnectionError(
-                    f"Connection lost during {method!r}: {e}"
+                    f"Connection lost during {requests[0][0]!r}: {e}"
                 ) from e
 
-        if response is None:
-            self._sock = None
-            raise DCCConnectionError("Connection closed by server")
+        return pending
 
+    def _wait(
+        self, reply: _PendingReply, deadline: float, timeout: float
+    ) -> None:
+        """Wait for *reply* until *deadline*, a ``time.monotonic()``
+        value."""
+        if not reply.event.wait(max(0.0, deadline - time.monotonic())):
+            self._discard([reply])
+            raise RPCTimeoutError(
+                f"RPC call {reply.method!r} timed out after {timeout}s"
+            )
+        if reply.error is not None:
+            raise reply.error
+
+    def _discard(self, replies: list[_PendingReply]) -> None:
+        """Stop waiting for *replies*, their responses are ignored."""
+        with self._pending_lock:
+            for reply in replies:
+                self._pending.pop(reply.request_id, None)
+
+    def _result(self, reply: _PendingReply) -> Any:
+        """Return the result of the resolved *reply*, raising its error."""
+        response = reply.response
         if "error" in response:
             error = response["error"]
             code = error.get("code", -32000)
@@ -236,7 +388,7 @@ class DCCClient:
             remote_tb = data.get("traceback")
 
             if code == -32002:
-                raise WidgetNotFoundError(params or {})
+                raise WidgetNotFoundError(reply.params or {})
 
             raise RPCError(
                 code=code,
@@ -246,6 +398,47 @@ class DCCClient:
 
         return response.get("result")
 
+    def _read_responses(self, sock: socket.socket) -> None:
+        """Reader thread: resolve pending requests with their responses."""
+        error: Optional[Exception] = None
+        try:
+            while True:
+                message = read_message(sock)
+                if message is None:
+                    break
+                responses = message if isinstance(message, list) else [message]
+                for response in responses:
+                    with self._pending_lock:
+                        reply = self._pending.pop(response.get("id"), None)
+                    if reply is None:
+                        logger.debug(
+                            "Ignoring response to unknown request %r",
+                            response.get("id"),
+                        )
+                        continue
+                    reply.resolve(response)
+        except (ConnectionError, OSError, ValueError) as e:
+            error = e
+
+        if self._sock is sock:
+            self._sock = None
+        with self._pending_lock:
+            pending = [
+                reply for reply in self._pending.values() if reply.sock is sock
+            ]
+            for reply in pending:
+                del self._pending[reply.request_id]
+        for reply in pending:
+            if error is None:
+                connection_error = DCCConnectionError(
+                    "Connection closed by server"
+                )
+            else:
+                connection_error = DCCConnectionError(
+                    f"Connection lost during {reply.method!r}: {error}"
+                )
+            reply.resolve(error=connection_error)
+
     def execute(self, code: str) -> Any:
         """Execute arbitrary Python code inside the DCC.
 
@@ -289,6 +482,16 @@ class DCCClient:
             raise WidgetNotFoundError(query)
         return WidgetProxy(self, result)
 
+    def command_timings(self, clear: bool = False) -> list[dict]:
+        """Return the timings of the last commands run by the server.
+
+        Each entry holds the request ``id``, the ``method``, the seconds
+        the command waited for the DCC main thread (``queue_wait``) and
+        the seconds it ran (``execution``), oldest first. Timings are
+        forgotten after being returned if *clear* is set.
+        """
+        return self.call("timings", {"clear": clear})
+
     def shutdown_server(self) -> None:
         """Ask the DCC-side server to shut down."""
         try:
@@ -1,8 +1,9 @@
 """DCC-side RPC server.
 
 Runs inside a DCC's Python interpreter. Receives JSON-RPC requests
-over TCP, dispatches them on the main thread via QTimer, and returns
-results.
+over TCP, posts them to the main thread through a queued Qt signal,
+and returns results. Several clients can be connected at once, each can pipeline
+requests and send JSON-RPC 2.0 batches.
 
 DCC-agnostic: no Maya/Nuke/Houdini imports. DCC-specific commands
 are executed through the generic ``exec`` and ``eval`` methods.
@@ -11,10 +12,13 @@ Must remain compatible with Python 3.11+.
 
 from __future__ import annotations
 
+import collections
+import functools
 import logging
 import queue
 import socket
 import threading
+import time
 import traceback
 from typing import Any, Callable, Optional
 
@@ -29,12 +33,23 @@ logger = logging.getLogger(__name__)
 
 # Error codes (JSON-RPC 2.0 server error range: -32000 to -32099)
 ERR_INTERNAL = -32000
+ERR_INVALID_REQUEST = -32600
 ERR_METHOD_NOT_FOUND = -32601
 ERR_INVALID_PARAMS = -32602
 ERR_TIMEOUT = -32001
 ERR_WIDGET_NOT_FOUND = -32002
 ERR_WIDGET_INVALID = -32003
 
+# Seconds to wait for the main thread to run a command
+COMMAND_TIMEOUT = 30.0
+
+# Number of command timings kept for the ``timings`` method
+TIMINGS_SIZE = 1000
+
+# Seconds a command may wait and run on the main thread before it is
+# logged as slow
+SLOW_COMMAND_THRESHOLD = 1.0
+
 # Global server instance for management
 _server_instance: Optional[TestServer] = None
 
@@ -42,48 +57,358 @@ _server_instance: Optional[TestServer] = None
 class _CommandResult:
     """Holds the result of a command executed on the main thread."""
 
-    __slots__ = ("event", "result", "error")
+    __slots__ = ("event", "request_id", "queued_at", "result", "error")
 
-    def __init__(self) -> None:
+    def __init__(self, request_id: Any = None) -> None:
         self.event = threading.Event()
+        self.request_id = request_id
+        self.queued_at = time.monotonic()
         self.result: Any = None
         self.error: Optional[dict] = None
 
+    def set(
+        self, result: Optional[dict] = None, error: Optional[dict] = None
+    ) -> _CommandResult:
+        """Complete the command with a response or an error."""
+        self.result = result
+        self.error = error
+        self.event.set()
+        return self
+
+    def wait(self, deadline: float) -> dict:
+        """Return the response, or a timeout error once *deadline*, a
+        ``time.monotonic()`` value, has passed."""
+        if not self.event.wait(timeout=max(0.0, deadline - time.monotonic())):
+            return make_error(
+                self.request_id,
+                ERR_TIMEOUT,
+                "Command timed out waiting for main thread",
+            )
+        return self.result or self.error
+
 
 class _WidgetRegistry:
-    """Tracks Qt widgets by id() to prevent GC and enable cross-call refs."""
+    """Tracks Qt widgets by address to prevent GC and enable cross-call
+    refs. Entries are dropped when their widget is destroyed."""
 
     def __init__(self) -> None:
         self._widgets: dict[int, Any] = {}
 
+    def __len__(self) -> int:
+        return len(self._widgets)
+
     def register(self, widget: Any) -> int:
-        wid = id(widget)
-        self._widgets[wid] = widget
+        wid = _pointer(widget)
+        if self._widgets.get(wid) is not widget:
+            self._widgets[wid] = widget
+            try:
+                widget.destroyed.connect(functools.partial(self._forget, wid))
+            except (AttributeError, RuntimeError):
+                pass
         return wid
 
     def get(self, widget_id: int) -> Any:
         widget = self._widgets.get(widget_id)
         if widget is None:
             return None
-        try:
-            import shiboken6
-
-            if not shiboken6.isValid(widget):
-                del self._widgets[widget_id]
-                return None
-        except ImportError:
-            pass
+        if not _is_valid(widget):
+            del self._widgets[widget_id]
+            return None
         return widget
 
     def clear(self) -> None:
         self._widgets.clear()
 
+    def _forget(self, widget_id: int, *args: Any) -> None:
+        self._widgets.pop(widget_id, None)
+
+
+class _WidgetNode:
+    """A widget of the :class:`_WidgetIndex` and its position in the
+    widget tree."""
+
+    __slots__ = ("widget", "parent", "children", "object_name", "type_name")
+
+    def __init__(
+        self, widget: Any, parent: Optional[int], children: list[int]
+    ) -> None:
+        # Top-level widgets are not referenced, not to keep them alive.
+        # Other wrappers are, they may otherwise be collected while the
+        # widget owned by its parent is alive.
+        self.widget = widget if parent is not None else None
+        self.parent = parent
+        self.children = children
+        self.object_name: str = widget.objectName()
+        self.type_name = type(widget).__name__
+
+
+class _WidgetIndex:
+    """Incrementally maintained index of the widgets of the application,
+    by objectName, class name and top-level window.
+
+    An application event filter records the objects receiving ChildAdded
+    and ChildRemoved events; only their children are read again on the
+    next search, instead of walking the whole widget tree. Qt sends no
+    event when a widget is renamed, so the object names of the candidates
+    of a search by name are read again, and the names of all the indexed
+    widgets when none of them matches.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[int, _WidgetNode] = {}
+        self._roots: dict[int, Any] = {}
+        self._by_name: dict[str, set[int]] = {}
+        self._by_type: dict[str, set[int]] = {}
+        self._changed: set[int] = set()
+        self._order: Optional[dict[int, int]] = None
+        self._event_filter: Any = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def search(self, params: dict) -> Optional[list]:
+        """Return the widgets that may match *params*, in widget tree
+        order, None if the index is not available."""
+        if not self._update():
+            return None
+
+        object_name = params.get("object_name")
+        widget_type = params.get("widget_type")
+        if object_name is not None:
+            pointers: Any = self._refresh_names(
+                self._by_name.get(object_name, ()), object_name
+            )
+            if not pointers:
+                # Widgets renamed since they were indexed.
+                pointers = self._refresh_names(self._nodes, object_name)
+        elif widget_type is not None:
+            pointers = self._by_type.get(widget_type, ())
+        else:
+            pointers = self._nodes
+
+        window_title = params.get("window_title")
+        if window_title:
+            roots = set(
+                pointer
+                for pointer, root in self._roots.items()
+                if hasattr(root, "windowTitle")
+                and root.windowTitle() == window_title
+            )
+            pointers = [
+                pointer
+                for pointer in pointers
+                if self._root_of(pointer) in roots
+            ]
+
+        return self._widgets(pointers)
+
+    def descendants(self, widget: Any) -> Optional[list]:
+        """Return the widgets below *widget*, in widget tree order, None if
+        the index is not available or *widget* is not indexed."""
+        if not self._update():
+            return None
+
+        node = self._nodes.get(_pointer(widget))
+        if node is None:
+            return None
+
+        pointers: list[int] = []
+        stack = list(reversed(node.children))
+        while stack:
+            pointer = stack.pop()
+            pointers.append(pointer)
+            stack.extend(reversed(self._nodes[pointer].children))
+        return self._widgets(pointers)
+
+    def clear(self) -> None:
+        """Drop the index and remove the event filter."""
+        if self._event_filter is not None:
+            from PySide6.QtWidgets import QApplication
+
+            app = QApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self._event_filter)
+            self._event_filter = None
+        self._nodes.clear()
+        self._roots.clear()
+        self._by_name.clear()
+        self._by_type.clear()
+        self._changed.clear()
+        self._order = None
+
+    def _install(self) -> bool:
+        """Install the event filter recording widget tree changes."""
+        if self._event_filter is not None:
+            return True
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            return False
+
+        app = QApplication.instance()
+        if app is None:
+            return False
+        self._event_filter = _make_child_event_filter(self._changed)
+        app.installEventFilter(self._event_filter)
+        return True
+
+    def _update(self) -> bool:
+        """Apply the changes of the widget tree since the last search."""
+        if not self._install():
+            return False
+        from PySide6.QtWidgets import QApplication
+
+        roots = dict(
+            (_pointer(widget), widget)
+            for widget in QApplication.topLevelWidgets()
+        )
+        if list(roots) != list(self._roots):
+            for pointer in self._roots:
+                if pointer not in roots:
+                    self._remove(pointer, None)
+            for pointer, widget in roots.items():
+                if pointer not in self._roots:
+                    self._add(widget, None)
+            self._order = None
+        self._roots = roots
+
+        changed = list(self._changed)
+        self._changed.clear()
+        for pointer in changed:
+            node = self._nodes.get(pointer)
+            if node is None:
+                continue
+            widget = self._widget(pointer, node)
+            if widget is None:
+                self._remove(pointer, node.parent)
+                continue
+            self._rename(pointer, node, widget.objectName())
+            children = _widget_children(widget)
+            child_pointers = [_pointer(child) for child in children]
+            if child_pointers == node.children:
+                continue
+            previous = set(node.children)
+            current = set(child_pointers)
+            for child_pointer in previous - current:
+                self._remove(child_pointer, pointer)
+            for child, child_pointer in zip(children, child_pointers):
+                if child_pointer not in previous:
+                    self._add(child, pointer)
+            node.children = child_pointers
+            self._order = None
+        return True
+
+    def _refresh_names(self, pointers: Any, object_name: str) -> list[int]:
+        """Read the object names of the widgets at *pointers* again, and
+        return the pointers of those named *object_name*."""
+        named = []
+        for pointer in list(pointers):
+            node = self._nodes.get(pointer)
+            if node is None:
+                continue
+            widget = self._widget(pointer, node)
+            if widget is None:
+                continue
+            self._rename(pointer, node, widget.objectName())
+            if node.object_name == object_name:
+                named.append(pointer)
+        return named
+
+    def _rename(
+        self, pointer: int, node: _WidgetNode, object_name: str
+    ) -> None:
+        """Index the widget of *node* at *pointer* under *object_name*."""
+        if object_name != node.object_name:
+            self._by_name[node.object_name].discard(pointer)
+            self._by_name.setdefault(object_name, set()).add(pointer)
+            node.object_name = object_name
+
+    def _add(self, widget: Any, parent: Optional[int]) -> None:
+        """Index *widget* of *parent*, and the widgets below it."""
+        pointer = _pointer(widget)
+        if pointer in self._nodes:
+            # Reparented, or a new widget at the address of a deleted one.
+            self._remove(pointer, self._nodes[pointer].parent)
+        children = _widget_children(widget)
+        node = _WidgetNode(
+            widget, parent, [_pointer(child) for child in children]
+        )
+        self._nodes[pointer] = node
+        self._by_name.setdefault(node.object_name, set()).add(pointer)
+        self._by_type.setdefault(node.type_name, set()).add(pointer)
+        for child in children:
+            self._add(child, pointer)
+
+    def _remove(self, pointer: int, parent: Optional[int]) -> None:
+        """Drop the widget at *pointer* of *parent*, and the widgets below
+        it still in the same place."""
+        stack = [(pointer, parent)]
+        while stack:
+            pointer, parent = stack.pop()
+            node = self._nodes.get(pointer)
+            if node is None or node.parent != parent:
+                # Already moved to another parent.
+                continue
+            del self._nodes[pointer]
+            self._by_name.get(node.object_name, set()).discard(pointer)
+            self._by_type.get(node.type_name, set()).discard(pointer)
+            stack.extend((child, pointer) for child in node.children)
+        self._order = None
+
+    def _root_of(self, pointer: int) -> Optional[int]:
+        node = self._nodes.get(pointer)
+        while node is not None and node.parent is not None:
+            pointer = node.parent
+            node = self._nodes.get(pointer)
+        return pointer
+
+    def _widget(self, pointer: int, node: _WidgetNode) -> Any:
+        """Return the widget of *node*, None if it was destroyed."""
+        widget = node.widget if node.parent is not None else None
+        if widget is None:
+            widget = self._roots.get(pointer)
+        if widget is None or not _is_valid(widget):
+            return None
+        return widget
+
+    def _widgets(self, pointers: Any) -> list:
+        """Return the valid widgets at *pointers*, in widget tree order."""
+        if self._order is None:
+            self._order = {}
+            stack = list(reversed(list(self._roots)))
+            while stack:
+                pointer = stack.pop()
+                node = self._nodes.get(pointer)
+                if node is None:
+                    continue
+                self._order[pointer] = len(self._order)
+                stack.extend(reversed(node.children))
+
+        widgets = []
+        destroyed = []
+        last = len(self._order)
+        for pointer in sorted(
+            pointers, key=lambda pointer: self._order.get(pointer, last)
+        ):
+            node = self._nodes.get(pointer)
+            if node is None:
+                continue
+            widget = self._widget(pointer, node)
+            if widget is None:
+                destroyed.append((pointer, node.parent))
+            else:
+                widgets.append(widget)
+        for pointer, parent in destroyed:
+            self._remove(pointer, parent)
+        return widgets
+
 
 class CommandDispatcher:
     """Dispatches RPC method calls to the appropriate handler."""
 
     def __init__(self) -> None:
         self.widget_registry = _WidgetRegistry()
+        self.widget_index = _WidgetIndex()
 
     def dispatch(self, method: str, params: Optional[dict]) -> Any:
         if params is None:
@@ -182,7 +507,11 @@ class CommandDispatcher:
     def _qt_search(self, params: dict) -> list:
         from PySide6.QtWidgets import QApplication
 
-        candidates: list = []
+        candidates = self.widget_index.search(params)
+        if candidates is not None:
+            return self._filter_widgets(candidates, params)
+
+        candidates = []
 
         window_title = params.get("window_title")
         top_level = QApplication.topLevelWidgets()
@@ -210,6 +539,10 @@ class CommandDispatcher:
         return result
 
     def _search_children(self, parent: Any, query: dict) -> list:
+        children = self.widget_index.descendants(parent)
+        if children is not None:
+            return self._filter_widgets(children, query)
+
         children = []
         for child in parent.children():
             from PySide6.QtWidgets import QWidget
@@ -372,7 +705,11 @@ class CommandDispatcher:
 
 class TestServer:
     """TCP server that receives RPC requests and dispatches them on
-    the DCC's main thread via QTimer."""
+    the DCC's main thread.
+
+    Queued commands are posted to the main thread with a queued Qt
+    signal as soon as they are read, an idle DCC is not woken up.
+    """
 
     def __init__(
         self,
@@ -389,7 +726,15 @@ class TestServer:
         self._command_queue: queue.Queue = queue.Queue()
         self._server_socket: Optional[socket.socket] = None
         self._server_thread: Optional[threading.Thread] = None
-        self._timer: Optional[Any] = None
+        self._clients: set[socket.socket] = set()
+        self._clients_lock = threading.Lock()
+        self._invoker: Optional[Any] = None
+        self._wake_pending = False
+        self._wake_lock = threading.Lock()
+        self._timings: collections.deque = collections.deque(
+            maxlen=TIMINGS_SIZE
+        )
+        self._timings_lock = threading.Lock()
         self._running = False
         self._quit_requested = False
 
@@ -400,7 +745,7 @@ class TestServer:
             socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
         )
         self._server_socket.bind((self.host, self.port))
-        self._server_socket.listen(1)
+        self._server_socket.listen(socket.SOMAXCONN)
         self._server_socket.settimeout(1.0)
 
         actual_port = self._server_socket.getsockname()[1]
@@ -412,6 +757,10 @@ class TestServer:
 
         self._running = True
 
+        # Before accepting clients, so their first message can wake up
+        # the main thread.
+        self._start_dispatcher()
+
         self._server_thread = threading.Thread(
             target=self._accept_loop,
             daemon=True,
@@ -419,8 +768,6 @@ class TestServer:
         )
         self._server_thread.start()
 
-        self._start_timer()
-
         logger.info(
             "DCC test server listening on %s:%d",
             self.host,
@@ -434,28 +781,30 @@ class TestServer:
         """Stop the server and clean up."""
         self._running = False
 
-        if self._timer is not None:
-            self._timer.stop()
-            self._timer = None
+        self._stop_dispatcher()
 
         if self._server_socket is not None:
-            try:
-                self._server_socket.close()
-            except OSError:
-                pass
+            # Shutting down wakes up the accept loop right away.
+            _close_socket(self._server_socket)
             self._server_socket = None
 
         if self._server_thread is not None:
             self._server_thread.join(timeout=5.0)
             self._server_thread = None
 
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client_sock in clients:
+            _close_socket(client_sock)
+
         self.dispatcher.widget_registry.clear()
+        self.dispatcher.widget_index.clear()
         logger.info("DCC test server stopped")
 
     def _initiate_shutdown(self) -> None:
         """Signal a graceful shutdown from the background thread.
 
-        Sets a flag that the QTimer callback (main thread) checks.
+        Sets a flag checked by the main thread, woken up to quit.
         The actual quit happens on the main thread at a safe point
         in the Qt event loop, avoiding SIGTERM-during-paint crashes.
         """
@@ -468,20 +817,46 @@ class TestServer:
             except OSError:
                 pass
 
-    def _start_timer(self) -> None:
-        from PySide6.QtCore import QTimer
+        self._wake_main_thread()
 
-        self._timer = QTimer()
-        self._timer.setInterval(10)
-        self._timer.timeout.connect(self._process_commands)
-        self._timer.start()
+    def _start_dispatcher(self) -> None:
+        """Set up the delivery of queued commands to the main thread."""
+        self._invoker = _make_main_thread_invoker(self._process_commands)
+
+    def _stop_dispatcher(self) -> None:
+        invoker, self._invoker = self._invoker, None
+        if invoker is not None:
+            invoker.deleteLater()
+
+    def _wake_main_thread(self) -> None:
+        """Have the main thread process the queued commands.
+
+        Called from socket threads. Wake-ups are coalesced: a single
+        one is pending at a time, and it processes all the commands
+        queued until then.
+        """
+        with self._wake_lock:
+            invoker = self._invoker
+            if invoker is None or self._wake_pending:
+                return
+            self._wake_pending = True
+
+        try:
+            invoker.wake.emit()
+        except RuntimeError:
+            # Deleted by a concurrent stop(), no wake-up is pending.
+            with self._wake_lock:
+                self._wake_pending = False
 
     def _process_commands(self) -> None:
-        """Process pending commands on the main thread (called by QTimer)."""
+        """Process pending commands on the main thread."""
+        with self._wake_lock:
+            self._wake_pending = False
+
         if self._quit_requested:
-            self._timer.stop()
-            self._timer = None
+            self._stop_dispatcher()
             self.dispatcher.widget_registry.clear()
+            self.dispatcher.widget_index.clear()
             if self._quit_fn is not None:
                 try:
                     self._quit_fn()
@@ -497,6 +872,7 @@ class TestServer:
             except queue.Empty:
                 break
 
+            started = time.monotonic()
             try:
                 result = self.dispatcher.dispatch(method, params)
                 cmd_result.result = make_response(request_id, result)
@@ -523,10 +899,60 @@ class TestServer:
                     data={"traceback": tb},
                 )
             finally:
+                self._record_timing(
+                    request_id,
+                    method,
+                    started - cmd_result.queued_at,
+                    time.monotonic() - started,
+                )
                 cmd_result.event.set()
 
+    def _record_timing(
+        self,
+        request_id: Any,
+        method: str,
+        queue_wait: float,
+        execution: float,
+    ) -> None:
+        """Keep the time a command waited for the main thread and the
+        time it ran, in seconds."""
+        with self._timings_lock:
+            self._timings.append(
+                {
+                    "id": request_id,
+                    "method": method,
+                    "queue_wait": queue_wait,
+                    "execution": execution,
+                }
+            )
+
+        if queue_wait + execution >= SLOW_COMMAND_THRESHOLD:
+            logger.warning(
+                "Slow command %s: waited %.1f ms, ran %.1f ms",
+                method,
+                queue_wait * 1000,
+                execution * 1000,
+            )
+        else:
+            logger.debug(
+                "Command %s: waited %.1f ms, ran %.1f ms",
+                method,
+                queue_wait * 1000,
+                execution * 1000,
+            )
+
+    def _get_timings(self, params: Optional[dict]) -> list[dict]:
+        """Return the timings of the last commands run, oldest first,
+        and forget them if the ``clear`` parameter is set."""
+        with self._timings_lock:
+            timings = list(self._timings)
+            if params and params.get("clear"):
+                self._timings.clear()
+        return timings
+
     def _accept_loop(self) -> None:
-        """Background thread: accept connections and handle requests."""
+        """Background thread: accept connections, each served by its own
+        thread so several clients can share the DCC."""
         while self._running:
             try:
                 client_sock, addr = self._server_socket.accept()
@@ -536,66 +962,139 @@ class TestServer:
                 break
 
             logger.info("Client connected from %s", addr)
-            try:
-                self._handle_client(client_sock)
-            except Exception:
-                logger.exception("Error handling client")
-            finally:
-                try:
-                    client_sock.close()
-                except OSError:
-                    pass
-                logger.info("Client disconnected")
+            with self._clients_lock:
+                self._clients.add(client_sock)
+            threading.Thread(
+                target=self._serve_client,
+                args=(client_sock,),
+                daemon=True,
+                name=f"dcc-test-client-{addr[1]}",
+            ).start()
+
+    def _serve_client(self, client_sock: socket.socket) -> None:
+        """Client thread: handle requests until the client disconnects."""
+        try:
+            self._handle_client(client_sock)
+        except Exception:
+            logger.exception("Error handling client")
+        finally:
+            with self._clients_lock:
+                self._clients.discard(client_sock)
+            _close_socket(client_sock)
+            logger.info("Client disconnected")
 
     def _handle_client(self, client_sock: socket.socket) -> None:
-        """Handle a single client connection."""
-        while self._running:
-            try:
-                msg = read_message(client_sock)
-            except (ConnectionError, OSError):
-                break
-            if msg is None:
-                break
-
-            request_id = msg.get("id", 0)
-            method = msg.get("method", "")
-            params = msg.get("params")
-
-            if method == "ping":
-                write_message(
-                    client_sock,
-                    make_response(request_id, {"status": "ok"}),
-                )
-                continue
-
-            if method == "shutdown":
-                write_message(
-                    client_sock,
-                    make_response(request_id, {"status": "shutting_down"}),
-                )
-                self._initiate_shutdown()
-                return
+        """Handle a single client connection.
 
-            cmd_result = _CommandResult()
-            self._command_queue.put((request_id, method, params, cmd_result))
-
-            if not cmd_result.event.wait(timeout=30.0):
-                write_message(
-                    client_sock,
-                    make_error(
-                        request_id,
-                        ERR_TIMEOUT,
-                        "Command timed out waiting for main thread",
-                    ),
-                )
-                continue
+        Requests are queued for the main thread as soon as they are read,
+        without waiting for the previous replies, which a writer thread
+        sends back in order.
+        """
+        replies: queue.Queue = queue.Queue()
+        writer = threading.Thread(
+            target=self._write_replies,
+            args=(client_sock, replies),
+            daemon=True,
+            name="dcc-test-client-writer",
+        )
+        writer.start()
 
-            response = cmd_result.result or cmd_result.error
-            if response:
+        try:
+            while self._running:
                 try:
-                    write_message(client_sock, response)
+                    msg = read_message(client_sock)
                 except (ConnectionError, OSError):
                     break
+                if msg is None:
+                    break
+
+                if isinstance(msg, list):
+                    if not msg:
+                        replies.put(
+                            _CommandResult().set(
+                                error=make_error(
+                                    None, ERR_INVALID_REQUEST, "Empty batch"
+                                )
+                            )
+                        )
+                        continue
+                    requests = msg
+                    replies.put(
+                        [self._submit(request) for request in requests]
+                    )
+                else:
+                    requests = [msg]
+                    replies.put(self._submit(msg))
+                # Once per message, so a batch runs in one go.
+                if not self._command_queue.empty():
+                    self._wake_main_thread()
+
+                if any(
+                    isinstance(request, dict)
+                    and request.get("method") == "shutdown"
+                    for request in requests
+                ):
+                    # Reply before shutting down.
+                    replies.put(None)
+                    writer.join(timeout=COMMAND_TIMEOUT)
+                    self._initiate_shutdown()
+                    return
+        finally:
+            replies.put(None)
+
+    def _submit(self, request: Any) -> _CommandResult:
+        """Queue *request* for the main thread and return its result.
+
+        ``ping``, ``timings`` and ``shutdown`` are answered right away,
+        without waiting for the main thread.
+        """
+        if not isinstance(request, dict):
+            return _CommandResult().set(
+                error=make_error(None, ERR_INVALID_REQUEST, "Invalid request")
+            )
+
+        request_id = request.get("id", 0)
+        method = request.get("method", "")
+        params = request.get("params")
+        cmd_result = _CommandResult(request_id)
+
+        if method == "ping":
+            return cmd_result.set(make_response(request_id, {"status": "ok"}))
+
+        if method == "timings":
+            return cmd_result.set(
+                make_response(request_id, self._get_timings(params))
+            )
+
+        if method == "shutdown":
+            return cmd_result.set(
+                make_response(request_id, {"status": "shutting_down"})
+            )
+
+        self._command_queue.put((request_id, method, params, cmd_result))
+        return cmd_result
+
+    def _write_replies(
+        self, client_sock: socket.socket, replies: queue.Queue
+    ) -> None:
+        """Writer thread: send the replies of a client in order."""
+        while True:
+            pending = replies.get()
+            if pending is None:
+                break
+
+            deadline = time.monotonic() + COMMAND_TIMEOUT
+            if isinstance(pending, list):
+                response: Any = [
+                    cmd_result.wait(deadline) for cmd_result in pending
+                ]
+            else:
+                response = pending.wait(deadline)
+
+            try:
+                write_message(client_sock, response)
+            except (ConnectionError, OSError):
+                break
 
 
 class _MethodNotFoundError(Exception):
@@ -611,6 +1110,84 @@ class _WidgetInvalidError(Exception):
         )
 
 
+def _pointer(obj: Any) -> int:
+    """Return the address of the C++ object wrapped by *obj*, stable
+    across Python wrappers of the same object."""
+    try:
+        import shiboken6
+
+        return shiboken6.getCppPointer(obj)[0]
+    except (ImportError, TypeError):
+        return id(obj)
+
+
+def _is_valid(obj: Any) -> bool:
+    """Return whether the C++ object wrapped by *obj* still exists."""
+    try:
+        import shiboken6
+
+        return shiboken6.isValid(obj)
+    except ImportError:
+        return True
+
+
+def _widget_children(widget: Any) -> list:
+    """Return the direct QWidget children of *widget*."""
+    from PySide6.QtWidgets import QWidget
+
+    return [child for child in widget.children() if isinstance(child, QWidget)]
+
+
+def _make_child_event_filter(changed: set) -> Any:
+    """Return an event filter adding the address of objects receiving
+    ChildAdded or ChildRemoved events to *changed*."""
+    import shiboken6
+    from PySide6.QtCore import QEvent, QObject
+
+    child_events = (QEvent.Type.ChildAdded, QEvent.Type.ChildRemoved)
+
+    class _ChildEventFilter(QObject):
+        def eventFilter(self, obj: Any, event: Any) -> bool:
+            if event.type() in child_events:
+                changed.add(shiboken6.getCppPointer(obj)[0])
+            return False
+
+    return _ChildEventFilter()
+
+
+def _make_main_thread_invoker(callback: Callable[[], None]) -> Any:
+    """Return a QObject living in the main thread, calling *callback*
+    there from its event loop each time its ``wake`` signal is
+    emitted, from any thread."""
+    from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal, Slot
+
+    class _MainThreadInvoker(QObject):
+        wake = Signal()
+
+        @Slot()
+        def invoke(self) -> None:
+            callback()
+
+    invoker = _MainThreadInvoker()
+    app = QCoreApplication.instance()
+    if app is not None and invoker.thread() is not app.thread():
+        invoker.moveToThread(app.thread())
+    invoker.wake.connect(invoker.invoke, Qt.ConnectionType.QueuedConnection)
+    return invoker
+
+
+def _close_socket(sock: socket.socket) -> None:
+    """Shut down and close *sock*, ignoring errors."""
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
 def _make_serializable(obj: Any) -> Any:
     """Coerce a value to something JSON-serializable."""
     if obj is None or isinstance(obj, (bool, int, float, str)):
@@ -0,0 +1,230 @@
+"""Unit tests for pipelined and batched requests and multiple clients.
+
+The DCC-side server mostly runs without Qt: commands are processed by
+a background thread standing in for the DCC main thread.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from dcc_test_harness._protocol import (
+    make_response,
+    read_message,
+    write_message,
+)
+from dcc_test_harness.client import DCCClient
+from dcc_test_harness.exceptions import RPCError
+from dcc_test_harness import server as dcc_server
+
+
+class _ThreadedTestServer(dcc_server.TestServer):
+    """TestServer processing commands in a thread instead of the Qt
+    main thread."""
+
+    def _start_dispatcher(self):
+        self.batches = []
+        self._wake = threading.Event()
+        self._processor = threading.Thread(target=self._process, daemon=True)
+        self._processor.start()
+
+    def _stop_dispatcher(self):
+        self._wake.set()
+
+    def _wake_main_thread(self):
+        self._wake.set()
+
+    def _process(self):
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._command_queue.empty():
+                self.batches.append(self._command_queue.qsize())
+                self._process_commands()
+
+
+@pytest.fixture
+def server():
+    server = _ThreadedTestServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    client = DCCClient(port=server.port, timeout=5.0)
+    client.connect()
+    yield client
+    client.disconnect()
+
+
+def _eval(expression):
+    return ("eval", {"expression": expression})
+
+
+class TestCallMany:
+    def test_batch(self, client, server):
+        results = client.call_many(
+            [_eval(f"{index} * 2") for index in range(50)] + ["ping"]
+        )
+
+        assert results == [index * 2 for index in range(50)] + [
+            {"status": "ok"}
+        ]
+        # The whole batch is queued before the main thread runs it.
+        assert server.batches == [50]
+
+    def test_pipelined(self, client):
+        results = client.call_many(
+            [_eval(f"{index} + 1") for index in range(20)], batch=False
+        )
+
+        assert results == list(range(1, 21))
+
+    def test_errors(self, client):
+        results = client.call_many(
+            [_eval("1"), "unknown", _eval("2")], raise_on_error=False
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], RPCError)
+        assert results[1].code == dcc_server.ERR_METHOD_NOT_FOUND
+        assert results[2] == 2
+
+        with pytest.raises(RPCError):
+            client.call_many([_eval("1"), "unknown"])
+
+    def test_concurrent_calls(self, client):
+        results = {}
+
+        def call(index):
+            results[index] = client.call("eval", {"expression": str(index)})
+
+        threads = [
+            threading.Thread(target=call, args=(index,)) for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == {index: index for index in range(8)}
+
+
+def test_multiple_clients(server):
+    clients = [DCCClient(port=server.port, timeout=5.0) for _ in range(3)]
+    for client in clients:
+        client.connect()
+
+    try:
+        for index, client in enumerate(clients):
+            assert client.evaluate(f"{index} * 10") == index * 10
+            assert client.ping()
+    finally:
+        for client in clients:
+            client.disconnect()
+
+
+def test_responses_matched_by_id():
+    """Test responses arriving out of order resolve their own request."""
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    srv.settimeout(5)
+    port = srv.getsockname()[1]
+
+    def server_fn():
+        conn, _ = srv.accept()
+        requests = [read_message(conn) for _ in range(3)]
+        for request in reversed(requests):
+            write_message(
+                conn, make_response(request["id"], request["method"])
+            )
+        read_message(conn)
+        conn.close()
+        srv.close()
+
+    thread = threading.Thread(target=server_fn, daemon=True)
+    thread.start()
+
+    client = DCCClient(port=port, timeout=5.0)
+    client.connect()
+    assert client.call_many(["a", "b", "c"], batch=False) == ["a", "b", "c"]
+    client.disconnect()
+    thread.join(timeout=5)
+
+
+def test_command_timings(client):
+    client.call_many(
+        [_eval("1"), ("exec", {"code": "import time; time.sleep(0.05)"})]
+    )
+
+    timings = client.command_timings(clear=True)
+
+    assert [timing["method"] for timing in timings] == ["eval", "exec"]
+    assert timings[1]["execution"] >= 0.05
+    assert all(timing["queue_wait"] >= 0 for timing in timings)
+    assert client.command_timings() == []
+
+
+def test_commands_posted_to_main_thread():
+    """Test commands run on the Qt main thread as soon as they arrive."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    server = dcc_server.TestServer()
+    server.start()
+    results = []
+
+    def call():
+        client = DCCClient(port=server.port, timeout=5.0)
+        client.connect()
+        try:
+            results.append(
+                client.call_many(
+                    [_eval("__import__('threading').current_thread().name")]
+                    * 3
+                )
+            )
+        finally:
+            client.disconnect()
+
+    thread = threading.Thread(target=call)
+    try:
+        thread.start()
+        deadline = time.monotonic() + 5
+        while thread.is_alive():
+            assert time.monotonic() < deadline, "Timed out"
+            app.processEvents()
+            time.sleep(0.001)
+    finally:
+        server.stop()
+        thread.join(timeout=5)
+
+    assert results == [[threading.main_thread().name] * 3]
+
+
+def test_wake_before_dispatcher_started():
+    """Test a wake-up without dispatcher does not block later ones."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    server = dcc_server.TestServer()
+    server._wake_main_thread()
+    server._start_dispatcher()
+    try:
+        result = dcc_server._CommandResult()
+        server._command_queue.put((1, "ping", {}, result))
+        server._wake_main_thread()
+
+        deadline = time.monotonic() + 5
+        while not result.event.is_set():
+            assert time.monotonic() < deadline, "Timed out"
+            app.processEvents()
+            time.sleep(0.001)
+    finally:
+        server._stop_dispatcher()
+
+    assert result.result["result"] == {"status": "ok"}
@@ -0,0 +1,148 @@
+"""Unit tests for the widget index of the DCC-side server.
+
+Run against an offscreen QApplication, without a DCC.
+"""
+
+import gc
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from dcc_test_harness import server as dcc_server  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    window = QtWidgets.QWidget()
+    window.setWindowTitle("Index test")
+    layout = QtWidgets.QVBoxLayout(window)
+    for index in range(20):
+        button = QtWidgets.QPushButton(f"Button {index}")
+        button.setObjectName(f"button_{index}")
+        layout.addWidget(button)
+    combo = QtWidgets.QComboBox()
+    combo.setEditable(True)
+    layout.addWidget(combo)
+    window.show()
+    app.processEvents()
+    yield window
+    window.close()
+    _delete(window)
+
+
+@pytest.fixture
+def dispatcher(app):
+    dispatcher = dcc_server.CommandDispatcher()
+    yield dispatcher
+    dispatcher.widget_index.clear()
+
+
+def _delete(widget):
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(
+        None, QtCore.QEvent.Type.DeferredDelete
+    )
+
+
+def _full_scan(dispatcher, params):
+    """Search without the index."""
+    index = dispatcher.widget_index
+    index.search = lambda params: None
+    index.descendants = lambda widget: None
+    try:
+        return dispatcher._qt_search(params)
+    finally:
+        del index.search
+        del index.descendants
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"object_name": "button_3"},
+        {"widget_type": "QPushButton"},
+        {"widget_type": "QLineEdit", "window_title": "Index test"},
+        {"text": "Button 7", "visible_only": False},
+    ],
+)
+def test_search_matches_full_scan(dispatcher, window, params):
+    assert dispatcher._qt_search(params) == _full_scan(dispatcher, params)
+
+
+def test_index_follows_widget_tree_changes(app, dispatcher, window):
+    assert dispatcher._qt_search({"object_name": "late"}) == []
+
+    late = QtWidgets.QLabel("late", window)
+    late.setObjectName("late")
+    late.show()
+    assert dispatcher._qt_search({"object_name": "late"}) == [late]
+
+    _delete(window.findChild(QtWidgets.QPushButton, "button_0"))
+    assert dispatcher._qt_search({"object_name": "button_0"}) == []
+
+    late.setParent(None)
+    assert (
+        dispatcher._qt_search(
+            {"object_name": "late", "window_title": "Index test"}
+        )
+        == []
+    )
+    _delete(late)
+
+
+def test_renamed_widgets_are_found(dispatcher, window):
+    button = window.findChild(QtWidgets.QPushButton, "button_1")
+    assert dispatcher._qt_search({"object_name": "button_1"}) == [button]
+
+    button.setObjectName("renamed")
+
+    assert dispatcher._qt_search({"object_name": "renamed"}) == [button]
+    assert dispatcher._qt_search({"object_name": "button_1"}) == []
+    params = {"object_name": "renamed", "window_title": "Index test"}
+    assert dispatcher._qt_search(params) == _full_scan(dispatcher, params)
+
+
+def test_unchanged_tree_is_not_walked(dispatcher, window, monkeypatch):
+    dispatcher._qt_search({"widget_type": "QPushButton"})
+    calls = []
+    monkeypatch.setattr(
+        dcc_server,
+        "_widget_children",
+        lambda widget: calls.append(widget) or [],
+    )
+
+    buttons = dispatcher._qt_search({"widget_type": "QPushButton"})
+
+    assert len(buttons) == 20
+    assert calls == []
+
+
+def test_descendants(dispatcher, window):
+    children = dispatcher._search_children(
+        window, {"widget_type": "QPushButton"}
+    )
+
+    assert [child.objectName() for child in children] == [
+        f"button_{index}" for index in range(20)
+    ]
+
+
+def test_registry_forgets_destroyed_widgets(app, dispatcher):
+    widget = QtWidgets.QLabel("temporary")
+    widget_id = dispatcher.widget_registry.register(widget)
+    assert dispatcher.widget_registry.register(widget) == widget_id
+    assert dispatcher.widget_registry.get(widget_id) is widget
+
+    _delete(widget)
+    del widget
+    gc.collect()
+
+    assert len(dispatcher.widget_registry) == 0
+    assert dispatcher.widget_registry.get(widget_id) is None
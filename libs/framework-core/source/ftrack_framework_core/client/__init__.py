@@ -3,6 +3,7 @@
 
 import time
 import logging
+import threading
 import uuid
 from collections import defaultdict
 
@@ -36,6 +37,17 @@ class Client(object):
     _host_connection = None
     '''The singleton host connection used by all clients within the process space / DCC'''
 
+    _discovered_hosts = {}
+    '''The information of the hosts discovered or announced within the process
+    space / DCC, by host id'''
+
+    _discovered_hosts_condition = threading.Condition()
+    '''Condition notified when :attr:`_discovered_hosts` changes'''
+
+    cache_hosts = True
+    '''Connect to previously discovered hosts instead of discovering them
+    again'''
+
     def __repr__(self):
         return '<Client:{0}>'.format(self.id)
 
@@ -217,22 +229,46 @@ class Client(object):
 
         self.logger.debug('Initialising Client {}'.format(self))
 
+        # Keep the discovered hosts up to date
+        self.event_manager.subscribe.host_announce(
+            callback=self._host_announced_callback
+        )
+        self.event_manager.subscribe.host_depart(
+            callback=self._host_departed_callback
+        )
+
         self.discover_host()
 
     # Host
-    def discover_host(self, time_out=3):
+    def discover_host(self, time_out=3, refresh=False):
         '''
         Find for available hosts during the optional *time_out*.
 
+        Connect to a host discovered or announced earlier unless *refresh* is
+        True or :attr:`cache_hosts` is False. Otherwise a single discover
+        host event is published and the first replying host is connected.
+
         This removes all previously discovered host connections.
         '''
+        if self.cache_hosts and not refresh:
+            with self._discovered_hosts_condition:
+                discovered_hosts = dict(Client._discovered_hosts)
+            if discovered_hosts:
+                if (
+                    self.host_connection
+                    and self.host_connection.host_id in discovered_hosts
+                ):
+                    return
+                self._connect_discovered_host(discovered_hosts)
+                return
+
         # Reset host connections
         if self.host_connection:
             self._unsubscribe_host_context_changed()
             self.host_connection = None
+        with self._discovered_hosts_condition:
+            Client._discovered_hosts.clear()
 
-        # discovery host loop and timeout.
-        start_time = time.time()
         self.logger.debug('time out set to {}:'.format(time_out))
         if not time_out:
             self.logger.warning(
@@ -241,33 +277,76 @@ class Client(object):
                 'Terminate with: Ctrl-C'
             )
 
-        while not self.host_connection:
-            delta_time = time.time() - start_time
+        # Hosts reply from the event hub thread in remote mode, or from
+        # this thread in local mode.
+        self.event_manager.publish.discover_host(
+            callback=self._host_discovered_callback
+        )
+        deadline = time.monotonic() + time_out if time_out else None
+        with self._discovered_hosts_condition:
+            while not Client._discovered_hosts:
+                remaining = deadline - time.monotonic() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    self.logger.warning('Could not discover any host.')
+                    return
+                self._discovered_hosts_condition.wait(remaining)
+            discovered_hosts = dict(Client._discovered_hosts)
+        self._connect_discovered_host(discovered_hosts)
 
-            if time_out and delta_time >= time_out:
-                self.logger.warning('Could not discover any host.')
-                break
+    def _connect_discovered_host(self, discovered_hosts):
+        '''
+        Connect to the first host of the given *discovered_hosts*, in
+        discovery order.
+        '''
+        reply_data = next(iter(discovered_hosts.values()))
+        self.host_connection = HostConnection(self.event_manager, reply_data)
 
-            self.event_manager.publish.discover_host(
-                callback=self._host_discovered_callback
-            )
+    def _add_discovered_hosts(self, host_information_list):
+        '''
+        Store the given *host_information_list* replied or announced by
+        hosts, and wake up the clients waiting for hosts.
+        '''
+        with self._discovered_hosts_condition:
+            for host_information in host_information_list:
+                if not host_information or not host_information.get('host_id'):
+                    continue
+                Client._discovered_hosts[host_information['host_id']] = (
+                    host_information
+                )
+            self._discovered_hosts_condition.notify_all()
 
     @track_framework_usage('FRAMEWORK_HOST_DISCOVERED', {'module': 'client'})
     def _host_discovered_callback(self, event):
         '''
-        Reply callback of the discover host event, generate
-        :class:`~ftrack_framework_core.client.HostConnection`
-        of all discovered hosts from the given *event*.
+        Reply callback of the discover host event, store the information of
+        all discovered hosts from the given *event*.
 
         *event*: :class:`ftrack_api.event.base.Event`
         '''
         if not event['data']:
             return
-        for reply_data in event['data']:
-            self.host_connection = HostConnection(
-                self.event_manager, reply_data
+        self._add_discovered_hosts(event['data'])
+
+    def _host_announced_callback(self, event):
+        '''
+        Callback of the host announce event, store the information of the
+        host from the given *event*.
+        '''
+        self._add_discovered_hosts([event['data']])
+
+    def _host_departed_callback(self, event):
+        '''
+        Callback of the host depart event, forget the host from the given
+        *event*, and disconnect from it if connected.
+        '''
+        host_id = event['data']['host_id']
+        with self._discovered_hosts_condition:
+            Client._discovered_hosts.pop(host_id, None)
+        if self.host_connection and self.host_connection.host_id == host_id:
+            self.logger.warning(
+                'Host {} is no longer available'.format(host_id)
             )
-            break
+            self.host_connection = None
 
     def on_host_changed(self, host_connection):
         '''Called when the host has been (re-)selected by the user.'''
@@ -326,6 +405,10 @@ class Client(object):
             f"options: {log_item.options} \n"
             f"store: {log_item.store} \n"
         )
+        if getattr(log_item, 'store_snapshot', None) is not None:
+            self.logger.debug(
+                f"Store after {log_item.name}: {log_item.store_snapshot}"
+            )
         # Publish event to widget
         self.event_manager.publish.client_notify_log_item_added(
             self.id, event['data']['log_item']
@@ -537,9 +620,9 @@ class Client(object):
                 "Current given type: {}".format(options)
             )
         if not item_reference:
-            self._tool_config_options[tool_config_reference][
-                'options'
-            ] = options
+            self._tool_config_options[tool_config_reference]['options'] = (
+                options
+            )
         else:
             self._tool_config_options[tool_config_reference][
                 item_reference
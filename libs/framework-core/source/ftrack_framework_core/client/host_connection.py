@@ -2,9 +2,8 @@
 # :copyright: Copyright (c) 2024 ftrack
 
 import logging
-import copy
 
-from ftrack_utils.framework.config.tool import get_tool_config_by_name
+from ftrack_utils.framework.config.frozen import freeze
 
 
 class HostConnection(object):
@@ -57,14 +56,26 @@ class HostConnection(object):
 
     @property
     def _available_filtered_host_tool_configs(self):
-        '''Return available filtered host tool_configs'''
-        tool_configs = {}
-        if self.context_identifiers:
-            tool_configs = self._filter_tool_configs_by_context_identifier(
-                self.context_identifiers
-            )
-        else:
-            tool_configs = copy.deepcopy(self._raw_host_data['tool_configs'])
+        '''
+        Return available filtered host tool_configs, memoized per context
+        identifiers. The tool_configs are frozen and shared, use
+        :func:`copy.deepcopy` to get a writable copy.
+        '''
+        key = tuple(self.context_identifiers or ())
+        tool_configs = self._filtered_tool_configs_cache.get(key)
+        if tool_configs is None:
+            if key:
+                tool_configs = self._filter_tool_configs_by_context_identifier(
+                    self.context_identifiers
+                )
+            else:
+                tool_configs = {
+                    config_type: tuple(typed_tool_configs)
+                    for config_type, typed_tool_configs in self._raw_host_data[
+                        'tool_configs'
+                    ].items()
+                }
+            self._filtered_tool_configs_cache[key] = tool_configs
         return tool_configs
 
     @property
@@ -96,14 +107,15 @@ class HostConnection(object):
             '{0}.{1}'.format(__name__, self.__class__.__name__)
         )
 
-        copy_data = copy.deepcopy(host_data)
-
         self._tool_configs = {}
         self._context_id = None
         self._context_identifiers = []
+        self._filtered_tool_configs_cache = {}
 
         self._event_manager = event_manager
-        self._raw_host_data = copy_data
+        # Host data published in local mode is already frozen and shared
+        # with the host, data received from a remote host is frozen once.
+        self._raw_host_data = freeze(host_data)
         self.context_id = self._raw_host_data.get('context_id')
 
         self.event_manager.subscribe.host_context_changed(
@@ -176,62 +188,53 @@ class HostConnection(object):
                 if match:
                     type_result.append(tool_config)
 
-            # Convert the result to tool_config List
-            result[schema_title] = type_result
-        return copy.deepcopy(result)
+            result[schema_title] = tuple(type_result)
+        return result
 
     def _add_new_tool_configs(self):
         '''
         Add new tool_configs compatible with the new context,
         also purge the non-compatible ones
         '''
-        if not self._available_filtered_host_tool_configs:
+        available_tool_configs = self._available_filtered_host_tool_configs
+        if not available_tool_configs:
             return
 
         # If tool_configs haven't been set avoid the loops and set all available
         # tool_configs
         if not self._tool_configs:
-            self._tool_configs = self._available_filtered_host_tool_configs
+            self.reset_all_tool_configs()
             return
 
-        for config_type in list(
-            self._available_filtered_host_tool_configs.keys()
-        ):
-            # Add new tool_configs
-            for tool_config in self._available_filtered_host_tool_configs[
-                config_type
-            ]:
-                if config_type not in list(self._tool_configs.keys()):
-                    # No config_type of that type exists in the current tool_configs,
-                    # copy them all
-                    self._tool_configs[
-                        config_type
-                    ] = self._available_filtered_host_tool_configs[config_type]
-                    break
-                # If the new one is not in the current names, add it.
-                exist = get_tool_config_by_name(
-                    self._tool_configs[config_type], tool_config['name']
-                )
-                if not exist:
-                    self._tool_configs[config_type].append(tool_config)
-
-        for config_type in list(self._tool_configs.keys()):
-            # Purge not available tool_configs
-            for tool_config in self._tool_configs.get(config_type, []):
-                if config_type not in list(
-                    self._available_filtered_host_tool_configs.keys()
-                ):
-                    # No tool-configs of that type exists in the available
-                    # tool_configs, remove them all
-                    self._tool_configs[config_type] = []
-                    break
-                exist = get_tool_config_by_name(
-                    self._available_filtered_host_tool_configs[config_type],
-                    tool_config['name'],
-                )
-                if not exist:
-                    self._tool_configs[config_type].remove(tool_config)
+        tool_configs = {}
+        # Purge not available tool_configs, keeping the current order
+        for config_type, typed_tool_configs in self._tool_configs.items():
+            available_names = set(
+                tool_config['name']
+                for tool_config in available_tool_configs.get(config_type, ())
+            )
+            tool_configs[config_type] = [
+                tool_config
+                for tool_config in typed_tool_configs
+                if tool_config['name'] in available_names
+            ]
+        # Add new tool_configs
+        for config_type, typed_tool_configs in available_tool_configs.items():
+            current_tool_configs = tool_configs.setdefault(config_type, [])
+            current_names = set(
+                tool_config['name'] for tool_config in current_tool_configs
+            )
+            for tool_config in typed_tool_configs:
+                if tool_config['name'] not in current_names:
+                    current_tool_configs.append(tool_config)
+                    current_names.add(tool_config['name'])
+        self._tool_configs = tool_configs
 
     def reset_all_tool_configs(self):
         '''Reset all tool_configs to its original values sent from host'''
-        self._tool_configs = self._available_filtered_host_tool_configs
+        self._tool_configs = {
+            config_type: list(typed_tool_configs)
+            for config_type, typed_tool_configs in (
+                self._available_filtered_host_tool_configs.items()
+            )
+        }
@@ -3,10 +3,16 @@
 
 import logging
 
-import copy
+import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from ftrack_framework_core.plugin.plugin_info import PluginInfo
+from ftrack_framework_core.plugin import store_delta
+from ftrack_framework_core.engine import execution_graph
 
 import ftrack_constants as constants
 
@@ -19,6 +25,11 @@ from ftrack_framework_core.exceptions.plugin import (
 from ftrack_framework_core.exceptions.engine import EngineExecutionError
 
 
+#: Environment variable enabling the parallel execution of independent
+#: groups in all engines.
+PARALLEL_ENGINE_ENV = 'FTRACK_FRAMEWORK_PARALLEL_ENGINE'
+
+
 class BaseEngine(object):
     '''
     Base engine class.
@@ -28,6 +39,27 @@ class BaseEngine(object):
     engine_types = ['base']
     '''Engine type for this engine class'''
 
+    parallel = os.environ.get(PARALLEL_ENGINE_ENV, '').lower() in (
+        '1',
+        'true',
+        'yes',
+    )
+    '''Execute independent groups of plugins concurrently, see
+    :meth:`_execute_parallel`.'''
+
+    max_workers = 4
+    '''Maximum number of plugins executed concurrently off the main
+    thread in parallel mode.'''
+
+    store_snapshot = store_delta.store_snapshot_enabled()
+    '''Attach a full snapshot of the store to each plugin execution, for
+    debugging. Otherwise only the store keys added or changed by the plugin
+    are attached.'''
+
+    _executing_in_parallel = False
+    '''Set while :meth:`_execute_parallel` executes plugins, their store
+    delta is then unavailable.'''
+
     @property
     def session(self):
         '''
@@ -133,11 +165,17 @@ class BaseEngine(object):
         )
 
         plugin_info = PluginInfo(
-            name=plugin, reference=reference, options=options, store=store
+            name=plugin, reference=reference, options=options
         )
+        store_fingerprint = None
+        if not self._executing_in_parallel:
+            store_fingerprint = store_delta.fingerprint(store)
 
         # Start timer to check the execution time
         start_time = time.time()
+        plugin_instance.on_progress = partial(
+            self._report_plugin_progress, plugin_info, start_time
+        )
         try:
             # Run the plugin
             plugin_instance.run(store)
@@ -185,12 +223,37 @@ class BaseEngine(object):
             end_time = time.time()
             total_time = end_time - start_time
             plugin_info.execution_time = total_time
+            if store_fingerprint is None:
+                # Plugins running concurrently change the store meanwhile.
+                plugin_info.store = store_delta.DELTA_UNAVAILABLE
+            else:
+                plugin_info.store = store_delta.get_delta(
+                    store_fingerprint, store_delta.fingerprint(store)
+                )
+            if self.store_snapshot:
+                plugin_info.store_snapshot = str(store)
             self.logger.debug(
                 f"Result from running plugin {reference}: {plugin_info}"
             )
             if self.on_plugin_executed:
                 self.on_plugin_executed(plugin_info.to_dict())
 
+    def _report_plugin_progress(self, plugin_info, start_time, message):
+        '''
+        Notify the host of the progress of the plugin described by
+        *plugin_info*, started at *start_time*, with the given *message*.
+        '''
+        if not self.on_plugin_executed:
+            return
+        progress_info = plugin_info.to_dict()
+        progress_info['status'] = constants.status.RUNNING_STATUS
+        progress_info['boolean_status'] = PluginInfo.status_to_boolean(
+            constants.status.RUNNING_STATUS
+        )
+        progress_info['message'] = message
+        progress_info['execution_time'] = time.time() - start_time
+        self.on_plugin_executed(progress_info)
+
     @track_framework_usage('FRAMEWORK_ENGINE_EXECUTED', {'module': 'engine'})
     def execute_engine(self, engine, user_options):
         '''
@@ -198,61 +261,166 @@ class BaseEngine(object):
         *engine*: Portion list of a tool-config with groups and plugins.
         *user_options*: dictionary with options passed by the client to
         the plugins.
+
+        If :attr:`parallel` is set, independent groups are executed
+        concurrently, see :meth:`_execute_parallel`. The execution time of
+        each group is available in :attr:`group_timings` afterwards.
         '''
 
         store = self.get_store()
-        for item in engine:
-            tool_config_options = user_options.get('options') or {}
-            # If plugin is just string execute plugin with no options
-            if isinstance(item, str):
-                self.run_plugin(item, store, tool_config_options)
-
-            elif isinstance(item, dict):
-                if item.get("enabled") == False:
-                    continue
-                # If it's a group, execute all plugins from the group
-                if item["type"] == "group":
-                    group_options = copy.deepcopy(tool_config_options)
-                    group_options.update(item.get("options") or {})
-                    group_reference = item['reference']
-                    group_options.update(
-                        user_options.get(group_reference) or {}
-                    )
-                    for plugin_item in item.get("plugins", []):
-                        # Use plugin options if plugin is defined as string
-                        if isinstance(plugin_item, str):
-                            self.run_plugin(plugin_item, store, group_options)
-                        else:
-                            # Deepcopy the group option to override them for
-                            # this plugin
-                            options = copy.deepcopy(group_options)
-                            options.update(plugin_item.get("options") or {})
-                            plugin_reference = plugin_item['reference']
-                            options.update(
-                                user_options.get(plugin_reference) or {}
-                            )
-                            self.run_plugin(
-                                plugin_item["plugin"],
-                                store,
-                                # Override group options with the plugin options
-                                options,
-                                plugin_reference,
-                            )
-                        # TODO: (future improvements) if group inside a
-                        #  group recursively execute plugins inside
-
-                elif item["type"] == "plugin":
-                    options = copy.deepcopy(tool_config_options)
-                    options.update(item.get("options") or {})
-                    # Execute plugin only with its own options and tool_config
-                    # options if plugin is defined outside the group
-                    plugin_reference = item['reference']
-                    options.update(user_options.get(plugin_reference) or {})
+        units = execution_graph.build_units(engine, user_options)
+        self.group_timings = []
+        if self.parallel and sum(unit.is_group for unit in units) > 1:
+            self._execute_parallel(units, store)
+        else:
+            for unit in units:
+                started = time.perf_counter()
+                for step in unit.steps:
                     self.run_plugin(
-                        item["plugin"], store, options, plugin_reference
+                        step.plugin, store, step.options, step.reference
                     )
+                self._record_group_timing(unit, time.perf_counter() - started)
         return store
 
+    def _record_group_timing(self, unit, execution_time):
+        '''Record and log the *execution_time* of the group *unit*.'''
+        if not unit.is_group:
+            return
+        self.group_timings.append(
+            {
+                'name': unit.name,
+                'reference': unit.reference,
+                'execution_time': execution_time,
+            }
+        )
+        self.logger.info(
+            f"Group {unit.name} executed in {execution_time:.3f}s"
+        )
+
+    def is_main_thread_only(self, plugin):
+        '''
+        Return True if the given *plugin* must be executed on the thread
+        executing the engine, see :attr:`BasePlugin.main_thread_only`.
+        '''
+        registered_plugin = self.plugin_registry.get_one(name=plugin)
+        if not registered_plugin:
+            return True
+        return getattr(
+            registered_plugin['extension'], 'main_thread_only', True
+        )
+
+    def _execute_parallel(self, units, store):
+        '''
+        Execute the given execution *units* sharing *store*, each unit as
+        soon as the units it depends on are executed, see
+        :func:`~ftrack_framework_core.engine.execution_graph.resolve_dependencies`.
+
+        The plugins of a unit are executed in order, on a pool of
+        :attr:`max_workers` threads unless main thread only, in which case
+        they are executed on the calling thread. Plugin executions are
+        reported to the host from the calling thread, without their store
+        delta. The first error stops the execution once the running plugins
+        finished, and is raised.
+        '''
+        execution_graph.resolve_dependencies(units)
+        events = queue.Queue()
+        engine_thread = threading.current_thread()
+        on_plugin_executed = self.on_plugin_executed
+
+        def report(plugin_info):
+            if threading.current_thread() is engine_thread:
+                on_plugin_executed(plugin_info)
+            else:
+                events.put(('report', None, plugin_info))
+
+        dependents = {unit.index: [] for unit in units}
+        remaining = {}
+        for unit in units:
+            remaining[unit.index] = set(unit.depends_on)
+            for index in unit.depends_on:
+                dependents[index].append(unit)
+        positions = {unit.index: 0 for unit in units}
+        started = {}
+        state = {'in_flight': 0, 'finished': 0, 'error': None}
+
+        def run_step(unit, step):
+            self.run_plugin(step.plugin, store, step.options, step.reference)
+
+        def on_step_done(unit, future):
+            events.put(('done', unit, future.exception()))
+
+        def schedule(unit):
+            if positions[unit.index] == len(unit.steps):
+                finish(unit)
+                return
+            step = unit.steps[positions[unit.index]]
+            state['in_flight'] += 1
+            if self.is_main_thread_only(step.plugin):
+                events.put(('main', unit, step))
+            else:
+                future = executor.submit(run_step, unit, step)
+                future.add_done_callback(partial(on_step_done, unit))
+
+        def start(unit):
+            started[unit.index] = time.perf_counter()
+            schedule(unit)
+
+        def finish(unit):
+            state['finished'] += 1
+            self._record_group_timing(
+                unit, time.perf_counter() - started[unit.index]
+            )
+            for dependent in dependents[unit.index]:
+                remaining[dependent.index].discard(unit.index)
+                if not remaining[dependent.index]:
+                    start(dependent)
+
+        if on_plugin_executed:
+            self.on_plugin_executed = report
+        self._executing_in_parallel = True
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='ftrack-engine'
+        )
+        try:
+            for unit in units:
+                if not unit.depends_on:
+                    start(unit)
+            while state['in_flight'] or (
+                state['error'] is None and state['finished'] < len(units)
+            ):
+                kind, unit, value = events.get()
+                if kind == 'report':
+                    on_plugin_executed(value)
+                    continue
+                if kind == 'main':
+                    error = None
+                    if state['error'] is None:
+                        try:
+                            run_step(unit, value)
+                        except Exception as exception:
+                            error = exception
+                else:
+                    error = value
+                state['in_flight'] -= 1
+                if error is not None:
+                    if state['error'] is None:
+                        state['error'] = error
+                    continue
+                if state['error'] is None:
+                    positions[unit.index] += 1
+                    schedule(unit)
+            # Reports queued by the last plugins
+            while not events.empty():
+                kind, unit, value = events.get()
+                if kind == 'report':
+                    on_plugin_executed(value)
+        finally:
+            executor.shutdown(wait=True)
+            self.on_plugin_executed = on_plugin_executed
+            self._executing_in_parallel = False
+        if state['error'] is not None:
+            raise state['error']
+
     @classmethod
     def register(cls):
         '''
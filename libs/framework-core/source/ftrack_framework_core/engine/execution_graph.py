@@ -0,0 +1,180 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import copy
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+#: A plugin to execute, with its resolved options and reference.
+ExecutionStep = namedtuple('ExecutionStep', ['plugin', 'options', 'reference'])
+
+
+class ExecutionUnit(object):
+    '''
+    Top level item of a tool-config engine, a group or a plugin, with the
+    :class:`ExecutionStep` list of the plugins it executes in order.
+    '''
+
+    @property
+    def is_group(self):
+        '''Return True if the unit is a group of plugins.'''
+        return isinstance(self.item, dict) and self.item.get('type') == 'group'
+
+    @property
+    def name(self):
+        '''
+        Return the name of the unit, the name or component of a group, the
+        plugin name of a plugin.
+        '''
+        if not self.is_group:
+            return self.steps[0].plugin if self.steps else None
+        return self.item.get('name') or self.partition
+
+    @property
+    def partition(self):
+        '''Return the store component written by a group, None if unknown.'''
+        if not self.is_group:
+            return None
+        return (self.item.get('options') or {}).get('component')
+
+    @property
+    def reference(self):
+        if isinstance(self.item, dict):
+            return self.item.get('reference')
+        return None
+
+    def __init__(self, index, item, steps):
+        self.index = index
+        self.item = item
+        self.steps = steps
+        # Indexes of the units to execute before this one
+        self.depends_on = set()
+
+    def __repr__(self):
+        return '<ExecutionUnit {} {}>'.format(self.index, self.name)
+
+
+def build_units(engine, user_options):
+    '''
+    Return the :class:`ExecutionUnit` list of the given *engine* portion of
+    a tool-config, resolving the options of each plugin from the tool-config,
+    group, plugin and *user_options*. Disabled items are skipped.
+    '''
+    units = []
+    tool_config_options = user_options.get('options') or {}
+    for item in engine:
+        # If plugin is just string execute plugin with no options
+        if isinstance(item, str):
+            steps = [ExecutionStep(item, tool_config_options, None)]
+
+        elif isinstance(item, dict):
+            if item.get("enabled") == False:
+                continue
+            # If it's a group, execute all plugins from the group
+            if item["type"] == "group":
+                group_options = copy.deepcopy(tool_config_options)
+                group_options.update(item.get("options") or {})
+                group_reference = item['reference']
+                group_options.update(user_options.get(group_reference) or {})
+                steps = []
+                for plugin_item in item.get("plugins", []):
+                    # Use plugin options if plugin is defined as string
+                    if isinstance(plugin_item, str):
+                        steps.append(
+                            ExecutionStep(plugin_item, group_options, None)
+                        )
+                    else:
+                        # Deepcopy the group option to override them for
+                        # this plugin
+                        options = copy.deepcopy(group_options)
+                        options.update(plugin_item.get("options") or {})
+                        plugin_reference = plugin_item['reference']
+                        options.update(
+                            user_options.get(plugin_reference) or {}
+                        )
+                        steps.append(
+                            ExecutionStep(
+                                plugin_item["plugin"],
+                                # Override group options with the plugin
+                                # options
+                                options,
+                                plugin_reference,
+                            )
+                        )
+                    # TODO: (future improvements) if group inside a
+                    #  group recursively execute plugins inside
+
+            elif item["type"] == "plugin":
+                options = copy.deepcopy(tool_config_options)
+                options.update(item.get("options") or {})
+                # Execute plugin only with its own options and tool_config
+                # options if plugin is defined outside the group
+                plugin_reference = item['reference']
+                options.update(user_options.get(plugin_reference) or {})
+                steps = [
+                    ExecutionStep(item["plugin"], options, plugin_reference)
+                ]
+            else:
+                continue
+        else:
+            continue
+        units.append(ExecutionUnit(len(units), item, steps))
+    return units
+
+
+def resolve_dependencies(units):
+    '''
+    Set the dependencies of the given *units*, in tool-config order:
+
+    * Plugins outside of groups are barriers, executed after all previous
+      units and before all the following ones.
+    * A group depending on groups declared in its ``depends_on`` list, by
+      name or component, runs after them.
+    * Otherwise a group runs after the previous groups writing the same
+      store component, or after all previous groups if it has no
+      component.
+
+    Only previous units can be dependencies, the graph has no cycles.
+    '''
+    barrier = None
+    groups = []
+    for unit in units:
+        if not unit.is_group:
+            unit.depends_on.update(group.index for group in groups)
+            if barrier is not None:
+                unit.depends_on.add(barrier.index)
+            barrier = unit
+            groups = []
+            continue
+
+        if barrier is not None:
+            unit.depends_on.add(barrier.index)
+        depends_on = unit.item.get('depends_on')
+        if depends_on is not None:
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+            for name in depends_on:
+                dependencies = [
+                    other.index
+                    for other in units[: unit.index]
+                    if other.is_group
+                    and name in (other.item.get('name'), other.partition)
+                ]
+                if not dependencies:
+                    logger.warning(
+                        'Group {} depends on unknown group {}, '
+                        'ignored.'.format(unit.name, name)
+                    )
+                unit.depends_on.update(dependencies)
+        elif unit.partition is None:
+            unit.depends_on.update(group.index for group in groups)
+        else:
+            unit.depends_on.update(
+                group.index
+                for group in groups
+                if group.partition is None or group.partition == unit.partition
+            )
+        groups.append(unit)
+    return units
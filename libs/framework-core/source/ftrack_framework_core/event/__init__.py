@@ -158,11 +158,31 @@ class Publish(object):
         Publish an event with topic
         :const:`~ftrack_framework_core.constants.event.DISCOVER_HOST_TOPIC`
         '''
-        # TODO: review this implementation, for now this one can't never be remote as it goes into a loop.
         data = None
         event_topic = constants.event.DISCOVER_HOST_TOPIC
         return self._publish_event(event_topic, data, callback)
 
+    def host_announce(self, host_information, callback=None):
+        '''
+        Publish an event with topic
+        :const:`~ftrack_framework_core.constants.event.HOST_ANNOUNCE_TOPIC`
+        with the *host_information* provided to discover host events.
+        '''
+        data = host_information
+        event_topic = constants.event.HOST_ANNOUNCE_TOPIC
+        return self._publish_event(event_topic, data, callback)
+
+    def host_depart(self, host_id, callback=None):
+        '''
+        Publish an event with topic
+        :const:`~ftrack_framework_core.constants.event.HOST_DEPART_TOPIC`
+        '''
+        data = {
+            'host_id': host_id,
+        }
+        event_topic = constants.event.HOST_DEPART_TOPIC
+        return self._publish_event(event_topic, data, callback)
+
     def host_run_tool_config(
         self, host_id, tool_config_reference, client_options, callback=None
     ):
@@ -344,6 +364,22 @@ class Subscribe(object):
         topic = constants.event.DISCOVER_HOST_TOPIC
         return self._subscribe_event(topic, callback)
 
+    def host_announce(self, callback):
+        '''
+        Subscribe to an event with topic
+        :const:`~ftrack_framework_core.constants.event.HOST_ANNOUNCE_TOPIC`
+        '''
+        topic = constants.event.HOST_ANNOUNCE_TOPIC
+        return self._subscribe_event(topic, callback)
+
+    def host_depart(self, callback):
+        '''
+        Subscribe to an event with topic
+        :const:`~ftrack_framework_core.constants.event.HOST_DEPART_TOPIC`
+        '''
+        topic = constants.event.HOST_DEPART_TOPIC
+        return self._subscribe_event(topic, callback)
+
     def host_run_tool_config(self, host_id, callback=None):
         '''
         Subscribe to an event with topic
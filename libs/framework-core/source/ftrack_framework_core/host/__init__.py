@@ -1,6 +1,7 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
 
+import atexit
 import uuid
 import logging
 import os
@@ -17,6 +18,7 @@ from ftrack_utils.decorators import (
     delegate_to_main_thread_wrapper,
 )
 from ftrack_utils.decorators.threading import call_directly
+from ftrack_utils.session import get_session_pool, session_pool_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -91,26 +93,11 @@ class Host(object):
         self.logger.warning(
             'ftrack host context is now: {}'.format(self.context_id)
         )
-        # Need to unsubscribe to make sure we subscribe again with the new
-        # context
-        self.event_manager.unsubscribe(self._discover_host_subscribe_id)
-        # Reply to discover_host_callback to clients to pass the host information
-        discover_host_callback_reply = self.run_in_main_thread_wrapper(
-            partial(
-                provide_host_information,
-                self.id,
-                self.context_id,
-                self.tool_configs,
-            )
-        )
-        self._discover_host_subscribe_id = (
-            self.event_manager.subscribe.discover_host(
-                callback=discover_host_callback_reply
-            )
-        )
         self.event_manager.publish.host_context_changed(
             self.id, self.context_id
         )
+        # Update the host information cached by the clients
+        self.announce()
 
     @property
     def id(self):
@@ -129,14 +116,10 @@ class Host(object):
         '''
         Returns filtered tool_configs`
         '''
-        compatible_tool_configs = {}
-        for tool_config in self.registry.tool_configs:
-            content = tool_config['extension']
-            if content['config_type'] not in compatible_tool_configs.keys():
-                compatible_tool_configs[content['config_type']] = []
-            compatible_tool_configs[content['config_type']].append(content)
-
-        return compatible_tool_configs
+        # Shallow copy of the view cached by the registry, so it can be
+        # serialised in events. The tool_configs themselves are frozen and
+        # shared, not copied.
+        return dict(self.registry.tool_configs_by_type)
 
     @property
     def registry(self):
@@ -175,10 +158,19 @@ class Host(object):
         self._registry = registry
 
         self._discover_host_subscribe_id = None
+        self._closed = False
+
+        # Warm up the pooled sessions used to run tool configs and ui hooks,
+        # so the first run doesn't pay the session creation cost.
+        if session_pool_enabled():
+            get_session_pool().prewarm()
 
         # Subscribe to events
         self._subscribe_events()
 
+        # Hosts live as long as their DCC, let the clients know when it exits.
+        atexit.register(self.close)
+
         self.logger.debug('Host {} ready.'.format(self.id))
 
     # Subscribe
@@ -190,14 +182,10 @@ class Host(object):
             self.id, self._client_context_change_callback
         )
 
-        # Reply to discover_host_callback to client to pass the host information
+        # Reply to discover_host_callback to client to pass the host
+        # information, read on each reply so it follows context changes.
         discover_host_callback_reply = self.run_in_main_thread_wrapper(
-            partial(
-                provide_host_information,
-                self.id,
-                self.context_id,
-                self.tool_configs,
-            )
+            self._discover_host_callback
         )
 
         self._discover_host_subscribe_id = (
@@ -220,6 +208,50 @@ class Host(object):
             self.id, self._verify_plugins_callback
         )
 
+        # Let the clients already listening know this host is available
+        self.announce()
+
+    def _discover_host_callback(self, event):
+        '''Reply to the discover host *event* with the host information.'''
+        return provide_host_information(
+            self.id, self.context_id, self.tool_configs, event
+        )
+
+    def announce(self):
+        '''
+        Publish the host information to the clients, so they can connect
+        without discovering hosts.
+        '''
+        self.event_manager.publish.host_announce(
+            provide_host_information(
+                self.id, self.context_id, self.tool_configs, None
+            )
+        )
+
+    def close(self):
+        '''
+        Stop replying to discover host events and notify the clients this
+        host is no longer available. Called at exit if not called before.
+        '''
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            if self._discover_host_subscribe_id:
+                self.event_manager.unsubscribe(
+                    self._discover_host_subscribe_id
+                )
+                self._discover_host_subscribe_id = None
+            self.event_manager.publish.host_depart(self.id)
+        except Exception as error:
+            # The event hub may already be disconnected at exit.
+            self.logger.warning(
+                'Could not notify the departure of host {}: {}'.format(
+                    self.id, error
+                )
+            )
+
     @delegate_to_main_thread_wrapper
     def _client_context_change_callback(self, event):
         '''Callback when the client has changed context'''
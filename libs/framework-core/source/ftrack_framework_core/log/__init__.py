@@ -6,14 +6,18 @@ import logging
 import sqlite3
 import platformdirs
 import errno
+import functools
 import json
 from json import JSONEncoder
 import base64
 import traceback
 import datetime
+import queue
+import threading
 import time
 
 from ftrack_framework_core.log.log_item import LogItem
+from ftrack_framework_core.plugin import store_delta
 
 
 class ResultEncoder(JSONEncoder):
@@ -23,18 +27,218 @@ class ResultEncoder(JSONEncoder):
         return str(obj)
 
 
+def _connect(database_path):
+    '''Return a new connection to the database at *database_path*, in WAL
+    mode.'''
+    connection = sqlite3.connect(database_path, check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    # Only sync at checkpoints, a crash can lose the last log items but
+    # never corrupts the database.
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return connection
+
+
+def sweep_expired_databases(
+    directory, grace_s, sweep_interval_s=None, logger=None
+):
+    '''
+    Remove the log databases in *directory* not modified within *grace_s*
+    seconds, along with their write-ahead log files.
+
+    If *sweep_interval_s* is given, only sweep if the last sweep, from any
+    process, is older than *sweep_interval_s* seconds. Return True if swept.
+    '''
+    logger = logger or logging.getLogger(__name__)
+    if sweep_interval_s is not None:
+        marker_path = os.path.join(directory, '.framework-db-sweep')
+        try:
+            if time.time() - os.path.getmtime(marker_path) < sweep_interval_s:
+                return False
+        except OSError:
+            pass
+        try:
+            # Touch the marker first so concurrent hosts skip the sweep
+            with open(marker_path, 'a'):
+                pass
+            os.utime(marker_path, None)
+        except OSError as error:
+            logger.debug(
+                'Could not touch sweep marker {}: {}'.format(
+                    marker_path, error
+                )
+            )
+
+    expire_before = time.time() - grace_s
+    try:
+        entries = list(os.scandir(directory))
+    except OSError as error:
+        logger.debug(
+            'Could not sweep local persistent databases: {}'.format(error)
+        )
+        return False
+    for entry in entries:
+        if not entry.name.lower().endswith('.db'):
+            continue
+        wal_paths = [entry.path + '-wal', entry.path + '-shm']
+        try:
+            # In WAL mode the database file is only modified at checkpoints
+            date_modified = max(
+                [entry.stat().st_mtime]
+                + [
+                    os.path.getmtime(wal_path)
+                    for wal_path in wal_paths
+                    if os.path.exists(wal_path)
+                ]
+            )
+            if date_modified > expire_before:
+                continue
+            logger.info(
+                'Removing expired local persistent database: ' '{}'.format(
+                    entry.name
+                )
+            )
+            os.remove(entry.path)
+            for wal_path in wal_paths:
+                if os.path.exists(wal_path):
+                    os.remove(wal_path)
+        except Exception as e:
+            logger.error(e)
+    return True
+
+
+# Queued to have the writer write its batch without waiting for more rows
+_FLUSH = object()
+
+
+class _LogWriter(threading.Thread):
+    '''
+    Thread writing queued log rows to a database, in one transaction per
+    batch of up to *batch_size* rows queued within *flush_interval_s*
+    seconds.
+
+    The writer does not reference its :class:`LogDB`, so the database can
+    be garbage collected and close it.
+    '''
+
+    def __init__(
+        self, database_path, table_name, batch_size, flush_interval_s, logger
+    ):
+        super(_LogWriter, self).__init__(
+            name='ftrack-framework-log-writer', daemon=True
+        )
+        self.database_path = database_path
+        self.table_name = table_name
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.logger = logger
+        self.batch_count = 0
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._pending_condition = threading.Condition()
+        # Set before start to run once in the writer thread
+        self.on_start = None
+
+    def put(self, row):
+        '''Queue *row* to be written, None stops the writer.'''
+        with self._pending_condition:
+            self._pending += 1
+        self._queue.put(row)
+
+    def flush(self, timeout=None):
+        '''Wait until the queued rows are written, return True if none are
+        pending.'''
+        with self._pending_condition:
+            if self._pending == 0:
+                return True
+        self.put(_FLUSH)
+        with self._pending_condition:
+            self._pending_condition.wait_for(
+                lambda: self._pending == 0 or not self.is_alive(), timeout
+            )
+            return self._pending == 0
+
+    def run(self):
+        if self.on_start is not None:
+            try:
+                self.on_start()
+            except Exception:
+                self.logger.warning(traceback.format_exc())
+            self.on_start = None
+        connection = _connect(self.database_path)
+        try:
+            stopped = False
+            while not stopped:
+                rows = [self._queue.get()]
+                deadline = time.monotonic() + self.flush_interval_s
+                while len(rows) < self.batch_size and not (
+                    rows[-1] is None or rows[-1] is _FLUSH
+                ):
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        rows.append(self._queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                count = len(rows)
+                stopped = rows[-1] is None
+                rows = [
+                    row
+                    for row in rows
+                    if row is not None and row is not _FLUSH
+                ]
+                if rows:
+                    self._write(connection, rows)
+                with self._pending_condition:
+                    self._pending -= count
+                    self._pending_condition.notify_all()
+        finally:
+            connection.close()
+            with self._pending_condition:
+                self._pending_condition.notify_all()
+
+    def _write(self, connection, rows):
+        '''Insert *rows* in one transaction.'''
+        try:
+            with connection:
+                connection.executemany(
+                    '''INSERT INTO {0} (date,status,boolean_status,
+                    host_id, name,reference,
+                    execution_time,
+                    message,options,store)
+                    VALUES (?,?,?,?,?,?,?,?,?,?)'''.format(self.table_name),
+                    rows,
+                )
+            self.batch_count += 1
+        except sqlite3.Error as e:
+            self.logger.error(
+                'Error storing log message in local persistent'
+                ' database {}'.format(e)
+            )
+
+
 # TODO: review this class to make it easier to maintain.
 #  Define all keys in a common place.
 class LogDB(object):
     '''
     Log database class
+
+    The database is journaled in WAL mode and log items are written in
+    batches by a background writer thread, queries wait for the queued
+    log items to be written first.
     '''
 
     db_name = 'framework-{}.db'
     table_name = 'LOGMGR'
     database_expire_grace_s = 7 * 24 * 3600
+    database_sweep_interval_s = 24 * 3600
+    # Maximum number of log items written per transaction
+    batch_size = 100
+    # Seconds to wait for more log items before writing a batch
+    flush_interval_s = 0.25
     _connection = None
     _database_path = None
+    _writer = None
 
     def __init__(self, host_id, db_name=None, table_name=None):
         '''
@@ -56,9 +260,7 @@ class LogDB(object):
 
         self._database_path = self.get_database_path(host_id)
 
-        self._connection = sqlite3.connect(
-            self._database_path, check_same_thread=False
-        )
+        self._connection = _connect(self._database_path)
         cur = self.connection.cursor()
 
         # Check if tables are created
@@ -77,10 +279,32 @@ class LogDB(object):
                 ''' message text, options text,'''
                 ''' store text)'''.format(self.table_name)
             )
-
-            self.connection.commit()
             self.logger.debug('Initialised plugin log persistent storage.')
 
+        # Also used for the host_id only queries, as its prefix
+        cur.execute(
+            '''CREATE INDEX IF NOT EXISTS {0}_host_id_reference'''
+            ''' ON {0} (host_id, reference)'''.format(self.table_name)
+        )
+        self.connection.commit()
+
+        self._writer = _LogWriter(
+            self._database_path,
+            self.table_name,
+            self.batch_size,
+            self.flush_interval_s,
+            self.logger,
+        )
+        # Expire old databases off the startup path
+        self._writer.on_start = functools.partial(
+            sweep_expired_databases,
+            os.path.dirname(self._database_path),
+            self.database_expire_grace_s,
+            sweep_interval_s=self.database_sweep_interval_s,
+            logger=self.logger,
+        )
+        self._writer.start()
+
         # Log out the file exporters.
         self.logger.info(
             'Storing persistent log: {0}'.format(self._database_path)
@@ -88,13 +312,16 @@ class LogDB(object):
 
     def __del__(self):
         '''Release resources (called mostly, not by all DCC apps)'''
-        self.connection.close()
+        self.close()
         if not self._database_path is None:
             # Delete database from disk
             self.logger.info(
                 'Removing database @ {}'.format(self._database_path)
             )
             try:
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(self._database_path + suffix):
+                        os.remove(self._database_path + suffix)
                 os.remove(self._database_path)
                 self._database_path = None
             except Exception:
@@ -110,6 +337,9 @@ class LogDB(object):
         Will create the directory (recursively) if it does not exist.
 
         Raise if the directory can not be created.
+
+        Expired databases are removed by the writer thread, see
+        :func:`sweep_expired_databases`.
         '''
 
         user_data_dir = platformdirs.user_data_dir('ftrack-connect', 'ftrack')
@@ -124,68 +354,59 @@ class LogDB(object):
                     pass
                 else:
                     raise
-        else:
-            # Check for and remove expired db:s older than one week by default
-
-            date_grace = datetime.datetime.now() - datetime.timedelta(
-                seconds=self.database_expire_grace_s
-            )
-
-            for filename in os.listdir(user_data_dir):
-                if not filename.lower().endswith('.db'):
-                    continue
-                db_path = os.path.join(user_data_dir, filename)
-                date_modified = datetime.datetime.fromtimestamp(
-                    os.path.getmtime(db_path)
-                )
-                if date_modified <= date_grace:
-                    self.logger.info(
-                        'Removing expired local persistent database: '
-                        '{}'.format(filename)
-                    )
-                    try:
-                        os.remove(db_path)
-                    except Exception as e:
-                        self.logger.error(e)
 
         return os.path.join(user_data_dir, self.db_name.format(host_id))
 
     def add_log_item(self, host_id, log_item):
         '''
-        Stores a :class:`~ftrack_framework_core.log.log_item.LogItem` in
-        persistent log database.
+        Queues a :class:`~ftrack_framework_core.log.log_item.LogItem` to be
+        stored in persistent log database by the writer thread.
         '''
-        try:
-            cur = self.connection.cursor()
-
-            cur.execute(
-                '''INSERT INTO {0} (date,status,boolean_status,
-                host_id, name,reference,
-                execution_time,
-                message,options,store) 
-                VALUES (?,?,?,?,?,?,?,?,?,?)'''.format(
-                    self.table_name
-                ),
-                (
-                    time.time(),
-                    log_item.status,
-                    log_item.boolean_status,
-                    host_id,
-                    log_item.name,
-                    log_item.reference,
-                    log_item.execution_time,
-                    log_item.message,
-                    str(log_item.options),
-                    str(log_item.store),
-                ),
-            )
-            self.connection.commit()
-
-        except sqlite3.Error as e:
+        if self._writer is None or not self._writer.is_alive():
             self.logger.error(
                 'Error storing log message in local persistent'
-                ' database {}'.format(e)
+                ' database, the database is closed'
             )
+            return
+        self._writer.put(
+            (
+                time.time(),
+                log_item.status,
+                log_item.boolean_status,
+                host_id,
+                log_item.name,
+                log_item.reference,
+                log_item.execution_time,
+                log_item.message,
+                store_delta.summarize(
+                    log_item.options, store_delta.MAX_DELTA_LENGTH
+                ),
+                str(log_item.store),
+            )
+        )
+
+    def flush(self, timeout=None):
+        '''
+        Wait until the queued log items are written, at most *timeout*
+        seconds if given. Return True if no log item is pending.
+        '''
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self, timeout=5):
+        '''
+        Write the queued log items, stop the writer thread and close the
+        connection. Wait at most *timeout* seconds for the writer.
+        '''
+        writer = self._writer
+        self._writer = None
+        if writer is not None and writer.is_alive():
+            writer.put(None)
+            writer.join(timeout)
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
     def get_log_items(self, host_id):
         '''
@@ -193,6 +414,7 @@ class LogDB(object):
         persistent log database.
         '''
 
+        self.flush()
         cur = self.connection.cursor()
 
         log_items = []
@@ -232,6 +454,7 @@ class LogDB(object):
         persistent log database.
         '''
 
+        self.flush()
         cur = self.connection.cursor()
 
         log_items = []
@@ -21,8 +21,10 @@ class LogItem(object):
         self.message = log_result.get('message')
         self.execution_time = log_result.get('execution_time')
         self.options = log_result.get('options')
-        # Revisit this if store goes to big
+        # Keys of the store added or changed by the plugin
         self.store = log_result.get('store')
+        # Full store, only if snapshots are enabled
+        self.store_snapshot = log_result.get('store_snapshot')
 
     # TODO: remove this properties if not needed.
     @property
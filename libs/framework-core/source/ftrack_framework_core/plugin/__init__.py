@@ -10,6 +10,11 @@ class BasePlugin(ABC):
 
     name = None
 
+    main_thread_only = True
+    '''Execute the plugin on the thread executing the engine, the main
+    thread of the DCC, when the engine executes groups in parallel. Set to
+    False on plugins not touching the DCC nor the session.'''
+
     def __repr__(self):
         return '<{}>'.format(self.name)
 
@@ -45,6 +50,18 @@ class BasePlugin(ABC):
         self._options = options
         self._session = session
         self._context_id = context_id
+        # Set by the engine to forward progress to the host
+        self.on_progress = None
+
+    def report_progress(self, message):
+        '''
+        Report progress *message* of the running plugin, it is forwarded to
+        the host as a running plugin info through the engine
+        on_plugin_executed callback.
+        '''
+        self.logger.debug(message)
+        if self.on_progress:
+            self.on_progress(message)
 
     def ui_hook(self, payload):
         '''
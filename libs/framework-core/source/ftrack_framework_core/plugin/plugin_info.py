@@ -20,7 +20,9 @@ class PluginInfo:
         # Implement the logic to convert status to a boolean value
         return constants.status.status_bool_mapping[status]
 
-    def __init__(self, name, reference, options, store=None):
+    def __init__(
+        self, name, reference, options, store=None, store_snapshot=None
+    ):
         '''
         Class to manage and store plugin execution information.
 
@@ -31,7 +33,9 @@ class PluginInfo:
         *name*: Name of the plugin.
         *reference*: Reference identifier for the plugin.
         *options*: Options used for plugin execution.
-        *store*: Optional store for plugin-related data.
+        *store*: Optional store for plugin-related data, the serialized
+        store keys added or changed by the plugin when executed by an engine.
+        *store_snapshot*: Optional full snapshot of the store, for debugging.
         '''
         self.name = name
         self.reference = reference
@@ -41,6 +45,7 @@ class PluginInfo:
         self.execution_time = 0
         self.options = options
         self.store = store
+        self.store_snapshot = store_snapshot
         # set default status
         self.status = constants.status.UNKNOWN_STATUS
 
@@ -49,7 +54,7 @@ class PluginInfo:
         Returns a dictionary representation of the plugin information.
         Replaces the key '_plugin_status' with 'status'.
         '''
-        return {
+        result = {
             'name': self.name,
             'reference': self.reference,
             'status': self._status,  # Use 'status' instead of '_status'
@@ -59,3 +64,6 @@ class PluginInfo:
             'options': self.options,
             'store': self.store,
         }
+        if self.store_snapshot is not None:
+            result['store_snapshot'] = self.store_snapshot
+        return result
@@ -0,0 +1,98 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import os
+import reprlib
+from collections.abc import Mapping
+
+#: Environment variable to attach a full snapshot of the store to each
+#: plugin execution log, for debugging.
+STORE_SNAPSHOT_ENV = 'FTRACK_FRAMEWORK_STORE_SNAPSHOT'
+
+#: Store delta attached to plugins executed concurrently with others, whose
+#: changes to the store can't be told apart.
+DELTA_UNAVAILABLE = '<unavailable, plugins executed in parallel>'
+
+#: Maximum length of the summary of a single store value.
+MAX_VALUE_LENGTH = 256
+
+#: Maximum length of a serialized store delta.
+MAX_DELTA_LENGTH = 4096
+
+#: Depth of the nested dictionaries compared key by key, deeper values are
+#: compared through their summary.
+MAX_DEPTH = 3
+
+_repr = reprlib.Repr()
+_repr.maxlevel = 3
+_repr.maxdict = 8
+_repr.maxlist = 8
+_repr.maxtuple = 8
+_repr.maxset = 8
+_repr.maxstring = 120
+_repr.maxother = 120
+
+
+def store_snapshot_enabled():
+    '''Return True if full store snapshots are enabled through the
+    environment.'''
+    return os.environ.get(STORE_SNAPSHOT_ENV, '').lower() in (
+        '1',
+        'true',
+        'yes',
+    )
+
+
+def summarize(value, max_length=MAX_VALUE_LENGTH):
+    '''
+    Return a compact representation of *value*, at most *max_length*
+    characters. Its cost does not depend on the size of *value*.
+    '''
+    summary = _repr.repr(value)
+    if len(summary) > max_length:
+        summary = summary[: max_length - 3] + '...'
+    return summary
+
+
+def fingerprint(store, max_depth=MAX_DEPTH, _path=()):
+    '''
+    Return a mapping of the key path tuples of *store* to a summary of
+    their value, in store order. Nested dictionaries are walked up to
+    *max_depth* levels.
+    '''
+    result = {}
+    for key, value in list(store.items()):
+        key_path = _path + (key,)
+        if isinstance(value, Mapping) and value and len(key_path) < max_depth:
+            result.update(fingerprint(value, max_depth, key_path))
+        else:
+            result[key_path] = summarize(value)
+    return result
+
+
+def get_delta(before, after, max_length=MAX_DELTA_LENGTH):
+    '''
+    Return the keys added or changed between the *before* and *after*
+    :func:`fingerprint` of a store, serialized to at most *max_length*
+    characters. Removed keys are listed with a None value.
+    '''
+    changes = [
+        (key_path, summary)
+        for key_path, summary in after.items()
+        if before.get(key_path) != summary
+    ]
+    changes.extend(
+        (key_path, None) for key_path in before if key_path not in after
+    )
+    if not changes:
+        return '{}'
+    items = []
+    length = 2
+    for index, (key_path, summary) in enumerate(changes):
+        item = '{}: {}'.format('.'.join(str(key) for key in key_path), summary)
+        if length + len(item) + 2 > max_length:
+            items.append('... {} more'.format(len(changes) - index))
+            break
+        items.append(item)
+        length += len(item) + 2
+    return '{' + ', '.join(items) + '}'
@@ -7,11 +7,74 @@ import inspect
 
 import logging
 from collections import defaultdict
+from types import MappingProxyType
+
+import platformdirs
 
 from ftrack_utils.extensions import registry, overrides
+from ftrack_utils.extensions.cache import ExtensionCache, LazyExtension
+from ftrack_utils.framework.config.frozen import freeze
 
 logger = logging.getLogger(__name__)
 
+#: Environment variable setting the path of the extension cache manifest.
+EXTENSION_CACHE_PATH_ENV = 'FTRACK_FRAMEWORK_EXTENSION_CACHE_PATH'
+
+#: Environment variable to disable the extension cache.
+DISABLE_EXTENSION_CACHE_ENV = 'FTRACK_FRAMEWORK_DISABLE_EXTENSION_CACHE'
+
+_default_extension_cache = None
+
+
+def get_extension_cache():
+    '''
+    Return the process wide :class:`ExtensionCache`, persisted to the user
+    cache directory or the path set through the
+    FTRACK_FRAMEWORK_EXTENSION_CACHE_PATH environment variable. Return None
+    if disabled through the FTRACK_FRAMEWORK_DISABLE_EXTENSION_CACHE
+    environment variable.
+    '''
+    global _default_extension_cache
+    if os.environ.get(DISABLE_EXTENSION_CACHE_ENV, '').lower() in (
+        '1',
+        'true',
+        'yes',
+    ):
+        return None
+    path = os.environ.get(EXTENSION_CACHE_PATH_ENV) or os.path.join(
+        platformdirs.user_cache_dir('ftrack-connect', 'ftrack'),
+        'framework_extensions.json',
+    )
+    if (
+        _default_extension_cache is None
+        or _default_extension_cache.path != path
+    ):
+        _default_extension_cache = ExtensionCache(path)
+    return _default_extension_cache
+
+
+class _RegisteredExtension(dict):
+    '''
+    Registered extension, importing a :class:`LazyExtension` extension the
+    first time it is accessed.
+    '''
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if key == 'extension' and isinstance(value, LazyExtension):
+            value = value.load()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
 
 class Registry(object):
     @property
@@ -70,6 +133,26 @@ class Registry(object):
         '''
         return self.__registry.get('dcc_config')
 
+    @property
+    def tool_configs_by_type(self):
+        '''
+        Returns a read only mapping of config type to a tuple of the
+        registered tool_configs of that type. The mapping is cached and
+        rebuilt after an extension is added.
+        '''
+        if self._tool_configs_by_type is None:
+            tool_configs_by_type = defaultdict(list)
+            for tool_config in self.__registry.get('tool_config', []):
+                content = tool_config['extension']
+                tool_configs_by_type[content['config_type']].append(content)
+            self._tool_configs_by_type = MappingProxyType(
+                {
+                    config_type: tuple(contents)
+                    for config_type, contents in tool_configs_by_type.items()
+                }
+            )
+        return self._tool_configs_by_type
+
     @property
     def registered_modules(self):
         return self.__registry
@@ -78,9 +161,13 @@ class Registry(object):
     def registry(self):
         return self.__registry
 
-    def __init__(self):
+    def __init__(self, extension_cache=None):
         '''
         Initialise Registry
+
+        *extension_cache* is the :class:`ExtensionCache` used to skip
+        parsing and importing unchanged extension files when scanning, the
+        one returned by :func:`get_extension_cache` if not given.
         '''
         super(Registry, self).__init__()
 
@@ -92,12 +179,33 @@ class Registry(object):
 
         # Reset all registries
         self.__registry = defaultdict(list)
+        # Per extension type indexes of the registered extensions by name,
+        # path and tool_config reference, kept in registration order.
+        self._indexes = defaultdict(
+            lambda: {
+                'name': defaultdict(list),
+                'path': defaultdict(list),
+                'reference': defaultdict(list),
+                # Extensions not filtered out by reference, not tool_configs
+                'unreferenced': [],
+            }
+        )
+        self._tool_configs_by_type = None
+        self._extension_cache = (
+            extension_cache
+            if extension_cache is not None
+            else get_extension_cache()
+        )
 
     # Register
     def scan_extensions(self, paths, extension_types=None):
         '''
         Scan framework extension modules from the given *paths*. If *extension_types*
         is given, only consider the given extension types.
+
+        Unchanged extensions are read from the extension cache, python
+        extensions found in the cache are registered by name and their
+        module imported the first time the extension is accessed.
         '''
         unique_extensions = []
 
@@ -107,13 +215,18 @@ class Registry(object):
                 f'Scanning {path} for {f"{extension_types} " if extension_types else ""}extensions'
             )
             dir_extensions = registry.get_extensions_from_directory(
-                path, extension_types=extension_types
+                path,
+                extension_types=extension_types,
+                cache=self._extension_cache,
             )
             # Merge/override
             unique_extensions = overrides.set_overrides(
                 discovered_extensions, dir_extensions
             )
 
+        if self._extension_cache is not None:
+            self._extension_cache.save()
+
         for extension in unique_extensions:
             self.add(**extension)
 
@@ -124,17 +237,36 @@ class Registry(object):
         Add the given *extension_type* with *name*, *extension* and *path to
         the registry
         '''
-        if extension_type == 'tool_config' and create_reference:
-            self.create_unic_references(extension, skip_root=False)
+        if extension_type == 'tool_config':
+            if create_reference:
+                self.create_unic_references(extension, skip_root=False)
+            # Tool-configs are shared by the host and the host connections,
+            # they are read only from now on.
+            extension = freeze(extension)
         # We use extension_type and not type to not interfere with python
         # build in type
-        self.__registry[extension_type].append(
-            {
-                "name": name,
-                "extension": extension,
-                "path": path,
-            }
+        registered_extension = _RegisteredExtension(
+            name=name,
+            extension=extension,
+            path=path,
         )
+        self.__registry[extension_type].append(registered_extension)
+
+        indexes = self._indexes[extension_type]
+        indexes['name'][name].append(registered_extension)
+        indexes['path'][path].append(registered_extension)
+        if (
+            isinstance(extension, dict)
+            and extension.get('type') == 'tool_config'
+        ):
+            indexes['reference'][extension.get('reference')].append(
+                registered_extension
+            )
+        else:
+            indexes['unreferenced'].append(registered_extension)
+
+        if extension_type == 'tool_config':
+            self._tool_configs_by_type = None
 
     def _get(self, extensions, name, extension, path, reference=None):
         '''
@@ -158,6 +290,27 @@ class Registry(object):
             found_extensions.append(_extension)
         return found_extensions
 
+    def _candidates(self, extension_type, name, path, reference):
+        '''
+        Return the extensions of *extension_type* that can match the given
+        *name*, *path* and *reference*, from the smallest matching index.
+        '''
+        indexes = self._indexes.get(extension_type)
+        if indexes is None:
+            return []
+        candidates = None
+        if name:
+            candidates = indexes['name'].get(name, [])
+        if path:
+            by_path = indexes['path'].get(path, [])
+            if candidates is None or len(by_path) < len(candidates):
+                candidates = by_path
+        if reference and candidates is None and not indexes['unreferenced']:
+            candidates = indexes['reference'].get(reference, [])
+        if candidates is None:
+            candidates = self.__registry[extension_type]
+        return candidates
+
     def get(
         self,
         name=None,
@@ -169,31 +322,27 @@ class Registry(object):
         '''
         Return given matching *name*, *extension*, *path* or *extension_type*.
         If nothing provided, return all available extensions.
+
+        Lookups by *name*, *path* and *reference* use indexes, only the
+        extensions of the matching index entry are compared.
         '''
         found_extensions = []
         if extension_type:
-            extensions = self.registry.get(extension_type)
+            extension_types = [extension_type]
+        else:
+            extension_types = list(self.registry.keys())
+        for extension_type in extension_types:
             found_extensions.extend(
                 self._get(
-                    extensions=extensions,
+                    extensions=self._candidates(
+                        extension_type, name, path, reference
+                    ),
                     name=name,
                     extension=extension,
                     path=path,
                     reference=reference,
                 )
             )
-        else:
-            for extension_type in list(self.registry.keys()):
-                extensions = self.registry.get(extension_type)
-                found_extensions.extend(
-                    self._get(
-                        extensions=extensions,
-                        name=name,
-                        extension=extension,
-                        path=path,
-                        reference=reference,
-                    )
-                )
 
         return found_extensions
 
@@ -265,9 +414,9 @@ class Registry(object):
                                 'reference': f'{plugin_item}-{uuid.uuid4().hex}',
                             }
                             continue
-                        plugin_item[
-                            'reference'
-                        ] = f'{plugin_item["plugin"]}-{uuid.uuid4().hex}'
+                        plugin_item['reference'] = (
+                            f'{plugin_item["plugin"]}-{uuid.uuid4().hex}'
+                        )
                         if plugin_item['type'] == "group":
                             self._recursive_create_reference(
                                 plugin_item.get('plugins')
@@ -115,12 +115,20 @@ class InputEventBlockingWidget(QtWidgets.QWidget):
         return retval
 
 
-def build_progress_data(tool_config):
-    '''Build progress data from *tool_config*'''
+def build_progress_data(tool_config, item_options=None):
+    '''Build progress data from *tool_config*, *item_options* are the
+    options set on its plugins and groups by reference, overriding their
+    enabled state.'''
+    item_options = item_options or {}
+
+    def is_enabled(config):
+        options = item_options.get(config.get('reference')) or {}
+        return options.get('enabled', config.get('enabled')) != False
+
     progress_data = []
     for plugin_config in get_plugins(tool_config, with_parents=True):
         enabled = True
-        if plugin_config.get('enabled') == False:
+        if not is_enabled(plugin_config):
             enabled = False
             continue
         phase_data = {
@@ -129,7 +137,7 @@ def build_progress_data(tool_config):
         }
         tags = plugin_config.get('tags') or []
         for group in plugin_config.get('parents') or []:
-            if group.get('enabled') == False:
+            if not is_enabled(group):
                 enabled = False
                 continue
             if 'options' in group:
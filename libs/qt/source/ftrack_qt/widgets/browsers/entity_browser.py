@@ -27,6 +27,7 @@ from ftrack_qt.utils.widget import (
 )
 
 from ftrack_utils.threading import BaseThread
+from ftrack_utils.query import batch_query
 
 
 class EntityBrowser(ModalDialog):
@@ -143,6 +144,7 @@ class EntityBrowser(ModalDialog):
         self._external_navigator = None
         self._prev_search_text = ""
         self.working = False
+        self._child_tasks = {}
 
         self.mode = mode or EntityBrowser.MODE_TASK
 
@@ -314,11 +316,28 @@ class EntityBrowser(ModalDialog):
                 ).all()
             else:
                 entities = self.session.query(
-                    'select id, name{} from Context where parent.id is {}'.format(
-                        ', children' if self.SHOW_CHILDREN else '',
+                    'select id, name from Context where parent.id is {}'.format(
                         intermediate_entity['id'],
                     )
                 ).all()
+            self._child_tasks = {}
+            if self.SHOW_CHILDREN and entities:
+                # Tasks of all the entities in a few batched queries,
+                # instead of loading the children of each entity.
+                self._child_tasks = batch_query(
+                    self.session,
+                    'Task',
+                    'parent_id',
+                    [entity['id'] for entity in entities],
+                    projections=[
+                        'id',
+                        'name',
+                        'parent.name',
+                        'type.name',
+                        'type.color',
+                        'status.color',
+                    ],
+                )
             self.entitiesFetched.emit(entities)
             signal_emitted = True
         finally:
@@ -375,18 +394,15 @@ class EntityBrowser(ModalDialog):
                 entities_widget.layout().addWidget(entity_widget)
                 self.entity_widgets.append(entity_widget)
                 if self.SHOW_CHILDREN:
-                    for sub_entity in entity['children']:
-                        if sub_entity.entity_type == 'Task':
-                            sub_entity_widget = EntityWidget(
-                                sub_entity, True, self
-                            )
-                            sub_entity_widget.clicked.connect(
-                                partial(self._entity_selected, sub_entity)
-                            )
-                            entities_widget.layout().addWidget(
-                                sub_entity_widget
-                            )
-                            self.entity_widgets.append(sub_entity_widget)
+                    for sub_entity in self._child_tasks.get(entity['id'], []):
+                        sub_entity_widget = EntityWidget(
+                            sub_entity, True, self
+                        )
+                        sub_entity_widget.clicked.connect(
+                            partial(self._entity_selected, sub_entity)
+                        )
+                        entities_widget.layout().addWidget(sub_entity_widget)
+                        self.entity_widgets.append(sub_entity_widget)
 
             entities_widget.layout().addWidget(QtWidgets.QLabel(), 100)
 
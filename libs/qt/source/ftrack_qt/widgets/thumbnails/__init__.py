@@ -8,3 +8,7 @@ from ftrack_qt.widgets.thumbnails.user_thumbnail import UserThumbnail
 from ftrack_qt.widgets.thumbnails.session_base_thumbnail import (
     SessionThumbnailBase,
 )
+from ftrack_qt.widgets.thumbnails.thumbnail_service import (
+    ThumbnailService,
+    get_thumbnail_service,
+)
@@ -1,6 +1,6 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
-import time
+import functools
 import os
 import logging
 import urllib.request, urllib.parse, urllib.error
@@ -12,22 +12,17 @@ except ImportError:
     from PySide2 import QtCore, QtWidgets, QtGui
     import shiboken2 as shiboken
 
-from ftrack_utils.threading import BaseThread
-
-# Cache of thumbnail images.
-IMAGE_CACHE = dict()
+from ftrack_qt.widgets.thumbnails.thumbnail_service import (
+    get_thumbnail_service,
+)
 
 
 class ThumbnailBase(QtWidgets.QLabel):
     '''Widget to load thumbnails from ftrack server.'''
 
-    MAX_CONNECTIONS = 10  # Maximum number of parallel connections to allow
-
     thumbnailFetched = QtCore.Signal(object)
     thumbnailNotFound = QtCore.Signal()
 
-    _connection_count = 0
-
     def __init__(self, scale=True, parent=None):
         super(ThumbnailBase, self).__init__(parent)
         self._server_url = None
@@ -58,68 +53,45 @@ class ThumbnailBase(QtWidgets.QLabel):
 
     def load(self, reference):
         '''Load thumbnail from *reference* and display it.'''
-
-        if reference in IMAGE_CACHE:
-            if IMAGE_CACHE[reference] is not None:
-                self._updatePixmapData(IMAGE_CACHE[reference])
-            else:
-                self._updateWithPlaceholderPixmap()
-            return
-
-        thread = BaseThread(
-            name='get_thumbnail_thread',
-            target=self._download_async,
-            callback=self._downloaded_async,
-            target_args=[reference],
-        )
-        thread.start()
-
         self.__loadingReference = reference
+        get_thumbnail_service().request(
+            reference,
+            self._download,
+            functools.partial(self._loaded, reference),
+        )
 
-    def _download_async(self, reference):
-        '''(Run in background thread) Download image'''
-        while ThumbnailBase.MAX_CONNECTIONS <= ThumbnailBase._connection_count:
-            time.sleep(0.01)
-            # Thumbnail widget still active?
-            if not shiboken.isValid(self):
-                return
-        ThumbnailBase._connection_count += 1
-        try:
-            return self._download(reference)
-        except urllib.error.URLError:
-            # Not found
-            if not shiboken.isValid(self):
-                # Thumbnail widget has been destroyed
-                return
-            self.thumbnailNotFound.emit()
-        finally:
-            ThumbnailBase._connection_count -= 1
-
-    def _downloaded_async(self, html):
-        '''(Run in background thread) Image has been downloaded, propagate to QT thread'''
+    def _loaded(self, reference, image):
+        '''Thumbnail service has loaded *image* for *reference*.'''
         if not shiboken.isValid(self):
             # Thumbnail widget has been destroyed
             return
-        self.thumbnailFetched.emit(html)
+        if reference != self.__loadingReference:
+            # Another thumbnail has been requested since
+            return
+        if image is None:
+            self.thumbnailNotFound.emit()
+        else:
+            self.thumbnailFetched.emit(image)
 
     def _downloaded(self, result):
         '''Handler worker finished event.'''
         if not shiboken.isValid(self):
             # Thumbnail widget has been destroyed
             return
-        IMAGE_CACHE[self.__loadingReference] = result
         self._updatePixmapData(result)
 
         self.__loadingReference = None
 
     def use_placeholder(self):
         '''Use placeholder image'''
-        IMAGE_CACHE[self.__loadingReference] = None
+        self.__loadingReference = None
         self._updateWithPlaceholderPixmap()
 
     def _updatePixmapData(self, data):
-        '''Update thumbnail with *data*'''
-        if data:
+        '''Update thumbnail with *data*, a decoded image or raw bytes'''
+        if isinstance(data, QtGui.QImage):
+            self._scaleAndSetPixmap(QtGui.QPixmap.fromImage(data))
+        elif data:
             pixmap = QtGui.QPixmap()
             pixmap.loadFromData(data)
             self._scaleAndSetPixmap(pixmap)
@@ -165,14 +137,17 @@ class ThumbnailBase(QtWidgets.QLabel):
                     httpHandle = 'http'
 
                 proxy = urllib.request.ProxyHandler({httpHandle: ftrackProxy})
-                opener = urllib.request.build_opener(proxy)
-                response = self._safeDownload(url, opener.open)
-                html = response.read()
+                opener_callback = urllib.request.build_opener(proxy).open
             else:
-                response = self._safeDownload(url, urllib.request.urlopen)
-                html = response.read()
-
-            return html
+                opener_callback = urllib.request.urlopen
+
+            # Served from the on-disk cache when still valid
+            return get_thumbnail_service().fetch(
+                url,
+                functools.partial(
+                    self._safeDownload, opener_callback=opener_callback
+                ),
+            )
 
         self.logger.warning('There is no url image to download')
         return None
@@ -0,0 +1,494 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+import collections
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+try:
+    from PySide6 import QtCore, QtGui
+except ImportError:
+    from PySide2 import QtCore, QtGui
+
+#: Environment variable overriding the on-disk thumbnail cache location.
+THUMBNAIL_CACHE_DIRECTORY_ENV = 'FTRACK_THUMBNAIL_CACHE_DIR'
+
+# Cost accounted for thumbnails that could not be found.
+_MISSING_COST = 64
+
+
+class LRUCache(object):
+    '''Thread safe least recently used cache bounded by a size in bytes.'''
+
+    @property
+    def max_bytes(self):
+        '''Maximum total cost of the cached values.'''
+        return self._max_bytes
+
+    @property
+    def size_in_bytes(self):
+        '''Total cost of the cached values.'''
+        with self._lock:
+            return self._size
+
+    def __init__(self, max_bytes):
+        '''
+        Initialise LRUCache.
+
+        *max_bytes* : Maximum total cost of the cached values, least recently
+        used values are evicted once exceeded.
+        '''
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._size = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, default=None):
+        '''Return the value cached for *key* and mark it as recently used.'''
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def set(self, key, value, cost):
+        '''Cache *value* for *key*, accounting *cost* bytes for it.'''
+        with self._lock:
+            self._pop(key)
+            if cost > self._max_bytes:
+                return
+            self._entries[key] = (value, cost)
+            self._size += cost
+            while self._size > self._max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def pop(self, key, default=None):
+        '''Remove *key* from the cache and return its value.'''
+        with self._lock:
+            entry = self._pop(key)
+            return default if entry is None else entry[0]
+
+    def clear(self):
+        '''Remove all values from the cache.'''
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+        return entry
+
+
+class DiskCache(object):
+    '''
+    On-disk thumbnail cache keyed by component id and size, entries are
+    revalidated against the server through their ETag and Last-Modified
+    headers once older than *revalidate_after* seconds.
+    '''
+
+    @property
+    def directory(self):
+        '''Directory holding the cached thumbnails.'''
+        return self._directory
+
+    def __init__(self, directory, revalidate_after=300, max_bytes=None):
+        '''
+        Initialise DiskCache.
+
+        *directory* : Directory the thumbnails are stored in, created on
+        first write.
+
+        *revalidate_after* : Seconds after which a cached thumbnail is
+        revalidated with the server before being used.
+
+        *max_bytes* : Maximum size of the cache on disk, least recently
+        validated thumbnails are removed by :meth:`prune`. None disables
+        pruning.
+        '''
+        self.logger = logging.getLogger(
+            __name__ + '.' + self.__class__.__name__
+        )
+        self._directory = directory
+        self._revalidate_after = revalidate_after
+        self._max_bytes = max_bytes
+
+    def key(self, url):
+        '''
+        Return the cache key for *url*, built from a hash of the server url
+        and the component id and size query parameters. Other urls are
+        keyed by a hash of the url without credentials.
+        '''
+        parsed = urllib.parse.urlsplit(url)
+        query = urllib.parse.parse_qs(parsed.query)
+        component_id = query.get('id', [None])[0]
+        if component_id and parsed.path.endswith('/component/thumbnail'):
+            size = query.get('size', ['full'])[0]
+            # Component ids are only unique per server.
+            server = hashlib.sha1(
+                '{}://{}'.format(parsed.scheme, parsed.netloc).encode('utf-8')
+            ).hexdigest()[:12]
+            return '{}_{}_{}'.format(server, component_id, size)
+        public_query = urllib.parse.urlencode(
+            sorted(
+                (name, value)
+                for name, value in urllib.parse.parse_qsl(parsed.query)
+                if name not in ('username', 'apiKey')
+            )
+        )
+        return hashlib.sha1(
+            parsed._replace(query=public_query).geturl().encode('utf-8')
+        ).hexdigest()
+
+    def fetch(self, url, opener_callback, timeout=5):
+        '''
+        Return the thumbnail data for *url*, from disk when valid. Otherwise
+        download it through *opener_callback*, called with a
+        :class:`urllib.request.Request` and *timeout*, sending conditional
+        headers if the thumbnail is cached.
+        '''
+        key = self.key(url)
+        data_path = os.path.join(self._directory, key)
+        metadata_path = data_path + '.json'
+
+        try:
+            age = time.time() - os.path.getmtime(data_path)
+        except OSError:
+            age = None
+        if age is not None and age < self._revalidate_after:
+            data = self._read(data_path)
+            if data is not None:
+                return data
+
+        request = urllib.request.Request(url)
+        metadata = {}
+        if age is not None:
+            metadata = self._read_metadata(metadata_path)
+            if metadata.get('etag'):
+                request.add_header('If-None-Match', metadata['etag'])
+            if metadata.get('last_modified'):
+                request.add_header(
+                    'If-Modified-Since', metadata['last_modified']
+                )
+
+        try:
+            response = opener_callback(request, timeout=timeout)
+            data = response.read()
+        except urllib.error.HTTPError as error:
+            if error.code != 304 or age is None:
+                raise
+            data = self._read(data_path)
+            if data is None:
+                raise
+            # Not modified, restart the revalidation period.
+            self._touch(data_path)
+            return data
+        except urllib.error.URLError as error:
+            if age is None:
+                raise
+            data = self._read(data_path)
+            if data is None:
+                raise
+            self.logger.debug(
+                'Using stale thumbnail {}, server unreachable: {}'.format(
+                    key, error
+                )
+            )
+            return data
+
+        if data:
+            headers = getattr(response, 'headers', None) or {}
+            self._write(
+                data_path,
+                metadata_path,
+                data,
+                {
+                    'etag': headers.get('ETag'),
+                    'last_modified': headers.get('Last-Modified'),
+                },
+            )
+        return data
+
+    def prune(self):
+        '''Remove least recently validated thumbnails above max_bytes.'''
+        if self._max_bytes is None:
+            return
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self._directory) as iterator:
+                for entry in iterator:
+                    if entry.name.endswith(('.json', '.tmp')):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            for removed_path in (path, path + '.json'):
+                try:
+                    os.remove(removed_path)
+                except OSError:
+                    pass
+            total -= size
+
+    def clear(self):
+        '''Remove all cached thumbnails from disk.'''
+        self._max_bytes, max_bytes = 0, self._max_bytes
+        try:
+            self.prune()
+        finally:
+            self._max_bytes = max_bytes
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _read_metadata(self, path):
+        try:
+            with open(path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _write(self, data_path, metadata_path, data, metadata):
+        '''Write *data* and *metadata* atomically, failures are not fatal.'''
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            for path, content, mode in (
+                (metadata_path, json.dumps(metadata), 'w'),
+                (data_path, data, 'wb'),
+            ):
+                temporary_path = '{}.{}.tmp'.format(
+                    path, threading.get_ident()
+                )
+                with open(temporary_path, mode) as file:
+                    file.write(content)
+                os.replace(temporary_path, path)
+        except OSError as error:
+            self.logger.debug(
+                'Failed to cache thumbnail {}: {}'.format(data_path, error)
+            )
+
+
+class ThumbnailService(QtCore.QObject):
+    '''
+    Load thumbnails for thumbnail widgets on a bounded pool of workers.
+
+    Concurrent requests for the same reference share one download, images
+    are decoded to :class:`QtGui.QImage` in the workers and kept in a
+    memory cache bounded in bytes.
+    '''
+
+    _imageLoaded = QtCore.Signal(object, object, bool)
+
+    @property
+    def memory_cache(self):
+        '''The :class:`LRUCache` holding decoded images.'''
+        return self._memory_cache
+
+    @property
+    def disk_cache(self):
+        '''The :class:`DiskCache` holding downloaded thumbnails.'''
+        return self._disk_cache
+
+    @property
+    def pending_count(self):
+        '''Number of references being loaded.'''
+        with self._lock:
+            return len(self._pending)
+
+    def __init__(
+        self,
+        max_workers=10,
+        memory_limit=64 * 1024 * 1024,
+        cache_directory=None,
+        revalidate_after=300,
+        disk_limit=256 * 1024 * 1024,
+        parent=None,
+    ):
+        '''
+        Initialise ThumbnailService, must be called from the Qt main thread.
+
+        *max_workers* : Maximum number of thumbnails loaded in parallel.
+
+        *memory_limit* : Maximum size in bytes of the decoded images kept in
+        memory.
+
+        *cache_directory* : Directory of the on-disk cache, defaults to
+        FTRACK_THUMBNAIL_CACHE_DIR or the user cache location.
+
+        *revalidate_after* : Seconds after which a thumbnail cached on disk
+        is revalidated with the server.
+
+        *disk_limit* : Maximum size in bytes of the on-disk cache.
+        '''
+        super(ThumbnailService, self).__init__(parent)
+        self.logger = logging.getLogger(
+            __name__ + '.' + self.__class__.__name__
+        )
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='ftrack-thumbnail'
+        )
+        self._memory_cache = LRUCache(memory_limit)
+        self._disk_cache = DiskCache(
+            cache_directory or _default_cache_directory(),
+            revalidate_after=revalidate_after,
+            max_bytes=disk_limit,
+        )
+        self._lock = threading.Lock()
+        # Callbacks waiting for a reference being loaded
+        self._pending = {}
+        self._imageLoaded.connect(self._on_image_loaded)
+        self._executor.submit(self._disk_cache.prune)
+
+    def cached(self, reference):
+        '''
+        Return a tuple (found, image) for *reference* in the memory cache,
+        image is None for thumbnails that were not found.
+        '''
+        missing = object()
+        image = self._memory_cache.get(reference, missing)
+        if image is missing:
+            return False, None
+        return True, image
+
+    def request(self, reference, loader, callback):
+        '''
+        Load the thumbnail for *reference* and call *callback* with the
+        :class:`QtGui.QImage`, or None if not found, in the Qt main thread.
+        Only thumbnails found or definitely missing (HTTP 404) are cached.
+
+        *loader* is called with *reference* in a worker thread and returns
+        the image data, it is only called if no load of *reference* is
+        pending.
+        '''
+        found, image = self.cached(reference)
+        if found:
+            callback(image)
+            return
+        with self._lock:
+            if reference in self._pending:
+                self._pending[reference].append(callback)
+                return
+            self._pending[reference] = [callback]
+        self._executor.submit(self._load, reference, loader)
+
+    def fetch(self, url, opener_callback, timeout=5):
+        '''Return thumbnail data for *url* through the on-disk cache, see
+        :meth:`DiskCache.fetch`.'''
+        return self._disk_cache.fetch(url, opener_callback, timeout=timeout)
+
+    def invalidate(self, reference=None):
+        '''Forget *reference*, or all references, from the memory cache.'''
+        if reference is None:
+            self._memory_cache.clear()
+        else:
+            self._memory_cache.pop(reference)
+
+    def shutdown(self):
+        '''Stop the workers, pending loads are not delivered.'''
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, reference, loader):
+        '''(Run in worker thread) Load and decode thumbnail.'''
+        image = None
+        cacheable = True
+        try:
+            data = loader(reference)
+            if data:
+                image = QtGui.QImage()
+                if not image.loadFromData(data):
+                    image = None
+        except urllib.error.HTTPError as error:
+            if error.code != 404:
+                self.logger.debug(
+                    'Failed to load thumbnail {}: {}'.format(reference, error)
+                )
+                cacheable = False
+        except urllib.error.URLError as error:
+            # Server unreachable, try again on the next request.
+            self.logger.debug(
+                'Failed to load thumbnail {}: {}'.format(reference, error)
+            )
+            cacheable = False
+        except Exception as error:
+            self.logger.warning(
+                'Failed to load thumbnail {}: {}'.format(reference, error)
+            )
+            cacheable = False
+        self._imageLoaded.emit(reference, image, cacheable)
+
+    def _on_image_loaded(self, reference, image, cacheable):
+        '''Cache *image* and notify the callbacks waiting for *reference*.'''
+        if cacheable:
+            cost = image.sizeInBytes() if image is not None else 0
+            self._memory_cache.set(reference, image, max(cost, _MISSING_COST))
+        with self._lock:
+            callbacks = self._pending.pop(reference, [])
+        for callback in callbacks:
+            try:
+                callback(image)
+            except Exception as error:
+                self.logger.exception(
+                    'Thumbnail callback failed: {}'.format(error)
+                )
+
+
+def _default_cache_directory():
+    directory = os.environ.get(THUMBNAIL_CACHE_DIRECTORY_ENV)
+    if not directory:
+        directory = os.path.join(
+            QtCore.QStandardPaths.writableLocation(
+                QtCore.QStandardPaths.StandardLocation.GenericCacheLocation
+            ),
+            'ftrack',
+            'thumbnails',
+        )
+    return directory
+
+
+_service = None
+
+
+def get_thumbnail_service():
+    '''
+    Return the :class:`ThumbnailService` shared by all thumbnail widgets,
+    created on first access from the Qt main thread.
+    '''
+    global _service
+    if _service is None:
+        _service = ThumbnailService()
+    return _service
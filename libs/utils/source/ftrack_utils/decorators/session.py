@@ -4,13 +4,33 @@
 import ftrack_api
 import time
 
+from ftrack_utils.session.session_pool import (
+    get_session_pool,
+    session_pool_enabled,
+)
+
 
 def with_new_session(func):
     def wrapper(*args, **kwargs):
         '''
-        Creates an ftrack session and passes the session as an argument of the
-        function
+        Leases an ftrack session from the shared session pool and passes the
+        session as an argument of the function. If pooling is disabled
+        through FTRACK_DISABLE_SESSION_POOL, a new session is created and
+        closed after the call instead.
         '''
+        if session_pool_enabled():
+            try:
+                with get_session_pool().lease() as session:
+                    # Add session as argument
+                    kwargs['session'] = session
+                    # Call function
+                    return func(*args, **kwargs)
+            except Exception as error:
+                raise Exception(
+                    "Error on leasing a session and executing method {}, "
+                    "error: {}".format(func, error)
+                )
+
         result = None
         session = None
         try:
@@ -10,6 +10,46 @@ import inspect
 logger = logging.getLogger('ftrack_utils:usage')
 
 
+_usage_module = None
+
+
+def _get_usage_module():
+    """Return the ftrack_utils.usage module, imported on first use as it
+    depends on this module."""
+    global _usage_module
+    if _usage_module is None:
+        from ftrack_utils import usage
+
+        _usage_module = usage
+    return _usage_module
+
+
+def _get_tracked_parameters(func, tracked_args):
+    """
+    Return a list of (name, position, default) tuples for the *tracked_args*
+    parameters of *func*, position being None for keyword only parameters.
+    """
+    parameters = list(inspect.signature(func).parameters.values())
+    tracked_parameters = []
+    for key in tracked_args:
+        for index, parameter in enumerate(parameters):
+            if parameter.name != key or parameter.kind in (
+                parameter.VAR_POSITIONAL,
+                parameter.VAR_KEYWORD,
+            ):
+                continue
+            if parameter.kind == parameter.KEYWORD_ONLY:
+                index = None
+            tracked_parameters.append((key, index, parameter.default))
+            break
+        else:
+            logger.warning(
+                f'Provided kwarg mapping {key} seems to not '
+                f'exists as argument of this function'
+            )
+    return tracked_parameters
+
+
 def track_framework_usage(event_name, metadata, tracked_args=None):
     """
     Decorator to track usage of framework functions.
@@ -47,16 +87,16 @@ def track_framework_usage(event_name, metadata, tracked_args=None):
         tracked_args = []
 
     def decorator(func):
+        # Resolve the tracked arguments once, binding the signature on each
+        # call is too slow for hot paths like BaseEngine.run_plugin.
+        tracked_parameters = _get_tracked_parameters(func, tracked_args)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            from ftrack_utils.usage import (
-                get_usage_tracker,
-                set_usage_tracker,
-                UsageTracker,
-            )
+            usage = _get_usage_module()
 
             # Ensure UsageTracker is set and available
-            usage_tracker = get_usage_tracker()
+            usage_tracker = usage.get_usage_tracker()
             if not usage_tracker:
                 logger.warning(
                     "UsageTracker instance is not set. Try to initialize a default one."
@@ -68,7 +108,7 @@ def track_framework_usage(event_name, metadata, tracked_args=None):
                         if hasattr(instance, 'session'):
                             session = getattr(instance, 'session')
                         else:
-                            return AttributeError(
+                            raise AttributeError(
                                 "The 'session' property is required to initialize UsageTracker but "
                                 "not found in the class. Skipping initialization as can't track usage."
                             )
@@ -101,8 +141,8 @@ def track_framework_usage(event_name, metadata, tracked_args=None):
                             os=current_os,
                         )
                         # Set the Usage tracker
-                        set_usage_tracker(
-                            UsageTracker(
+                        usage.set_usage_tracker(
+                            usage.UsageTracker(
                                 session=session, default_data=default_metadata
                             )
                         )
@@ -111,28 +151,19 @@ def track_framework_usage(event_name, metadata, tracked_args=None):
                     logger.error(e)
 
                 finally:
-                    usage_tracker = get_usage_tracker()
-
-            # Get the function's signature
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Build a dictionary of argument names and their bound values
-            args_metadata = bound_args.arguments
-
-            # Update metadata with function arguments if specified in kwarg_mapping_list
-            for key in tracked_args:
-                if key in args_metadata:
-                    metadata[key] = args_metadata[key]
-                else:
-                    logger.warning(
-                        f'Provided kwarg mapping {key} seems to not '
-                        f'exists as argument of this function'
-                    )
+                    usage_tracker = usage.get_usage_tracker()
 
             if usage_tracker:
-                usage_tracker.track(event_name, metadata)
+                # Copy to not modify the metadata shared by all calls
+                event_metadata = dict(metadata)
+                for name, index, default in tracked_parameters:
+                    if name in kwargs:
+                        event_metadata[name] = kwargs[name]
+                    elif index is not None and index < len(args):
+                        event_metadata[name] = args[index]
+                    elif default is not inspect.Parameter.empty:
+                        event_metadata[name] = default
+                usage_tracker.track(event_name, event_metadata)
 
             # Call the original function
             return func(*args, **kwargs)
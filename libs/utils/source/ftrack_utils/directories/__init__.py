@@ -1,2 +1,7 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
+
+from ftrack_utils.directories.expression_scan import (
+    DirectoryCache,
+    ExpressionScanner,
+)
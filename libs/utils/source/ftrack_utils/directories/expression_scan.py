@@ -0,0 +1,184 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+import concurrent.futures
+import logging
+import os
+import threading
+
+from ftrack_utils.json.manifest import JsonManifest
+
+logger = logging.getLogger(__name__)
+
+#: Number of directories listed at once, the latency of network mounted
+#: software depots is overlapped rather than added up.
+MAX_WORKERS = 8
+
+
+class DirectoryCache(JsonManifest):
+    """
+    Listings of directories, persisted as JSON to *path*.
+
+    Entries are keyed by directory path and only returned while the
+    modification time of the directory is unchanged, which it is as long
+    as no entry is added, removed or renamed in it. A warm scan then only
+    stats the directories instead of listing them.
+    """
+
+    ENTRIES_KEY = "directories"
+    DESCRIPTION = "directory cache"
+
+    def get(self, directory, directory_stat):
+        """
+        Return the ``(folders, files)`` names listed in *directory*, None if
+        missing or if the directory changed since. *directory_stat* is the
+        :func:`os.stat` result of the directory.
+        """
+        with self._lock:
+            entry = self._load().get(directory)
+            if entry is None or entry[0] != directory_stat.st_mtime_ns:
+                return None
+            return entry[1], entry[2]
+
+    def set(self, directory, directory_stat, folders, files):
+        """Cache the *folders* and *files* names listed in *directory*,
+        with *directory_stat* its :func:`os.stat` result."""
+        with self._lock:
+            self._load()[directory] = [
+                directory_stat.st_mtime_ns,
+                list(folders),
+                list(files),
+            ]
+            self._modified = True
+
+
+class ExpressionScanner(object):
+    """
+    Find the paths matching a list of compiled regular expressions, one
+    per path segment below a root directory, see
+    ``ApplicationStore._search_filesystem`` of ftrack Connect.
+
+    Only the directories whose path matches the expressions so far are
+    listed, the directories of a level are listed in parallel, and each
+    directory is listed once until :meth:`reset`, however many scans
+    traverse it. Listings are kept in *cache*, a :class:`DirectoryCache`,
+    if given.
+    """
+
+    @property
+    def cache(self):
+        """Return the :class:`DirectoryCache` of listings, None if not
+        cached."""
+        return self._cache
+
+    def __init__(self, cache=None, max_workers=MAX_WORKERS):
+        self._cache = cache
+        self._max_workers = max_workers
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget the directories listed, so they are checked for changes
+        by the next scans."""
+        with self._lock:
+            self._listings.clear()
+
+    def save(self):
+        """Persist the cached listings."""
+        if self._cache is not None:
+            self._cache.save()
+
+    def scan(self, start, expressions):
+        """
+        Return the paths of the entries matching *expressions* below the
+        *start* directory.
+
+        Each directory *level* segments deep in the filesystem is matched
+        against ``expressions[level]``, a root directory being at level 0.
+        The entries of the last level, files or folders, are returned.
+        """
+        level = start.rstrip(os.path.sep).count(os.path.sep)
+        locations = [start]
+        paths = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="ExpressionScanner",
+        ) as executor:
+            while locations and level < len(expressions):
+                expression = expressions[level]
+                final = level == len(expressions) - 1
+                next_locations = []
+                for location, (folders, files) in zip(
+                    locations, executor.map(self.list_directory, locations)
+                ):
+                    entries = folders + files if final else folders
+                    for entry in entries:
+                        if expression.match(entry):
+                            path = os.path.join(location, entry)
+                            (paths if final else next_locations).append(path)
+                locations = next_locations
+                level += 1
+        return paths
+
+    def scan_many(self, searches):
+        """
+        Run the scans of *searches*, a list of ``(start, expressions)``,
+        at once and return their paths in the same order. Directories
+        shared by several searches are listed once.
+        """
+        if not searches:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(searches), self._max_workers),
+            thread_name_prefix="ExpressionScan",
+        ) as executor:
+            return list(
+                executor.map(lambda search: self.scan(*search), searches)
+            )
+
+    def list_directory(self, directory):
+        """
+        Return the ``(folders, files)`` names listed in *directory*, empty
+        if it cannot be listed. Folders include symbolic links to folders.
+        """
+        with self._lock:
+            future = self._listings.get(directory)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._listings[directory] = future
+        if owner:
+            try:
+                future.set_result(self._read_directory(directory))
+            except BaseException as error:
+                future.set_exception(error)
+        return future.result()
+
+    def _read_directory(self, directory):
+        try:
+            directory_stat = os.stat(directory)
+        except OSError:
+            return [], []
+
+        if self._cache is not None:
+            listing = self._cache.get(directory, directory_stat)
+            if listing is not None:
+                return listing
+
+        folders = []
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (folders if is_dir else files).append(entry.name)
+        except OSError as error:
+            logger.debug("Could not list {}: {}".format(directory, error))
+            return [], []
+
+        if self._cache is not None:
+            self._cache.set(directory, directory_stat, folders, files)
+        return folders, files
@@ -2,3 +2,7 @@
 # :copyright: Copyright (c) 2024 ftrack
 
 from ftrack_utils.event_hub.event_hub_thread import EventHubThread
+from ftrack_utils.event_hub.event_loop import (
+    EventLoopDriver,
+    run_event_loop,
+)
@@ -0,0 +1,175 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+import logging
+import signal
+import socket
+
+logger = logging.getLogger(__name__)
+
+#: Seconds between checks that the event hub is still being listened to.
+EVENT_HUB_CHECK_INTERVAL = 5
+
+
+def _import_qt_core():
+    '''Return the QtCore module of the Qt binding available.'''
+    try:
+        from PySide6 import QtCore
+    except ImportError:
+        from PySide2 import QtCore
+    return QtCore
+
+
+class EventLoopDriver(object):
+    '''
+    Keep a standalone integration alive by running the Qt event loop,
+    while the ftrack event hub is listened to from an
+    :class:`~ftrack_utils.event_hub.EventHubThread`.
+
+    Nothing is polled: the main thread sleeps in the Qt event loop until
+    a Qt event arrives, and the event hub thread blocks on the event hub.
+    Callbacks that must run on the main thread are posted to it by
+    ``invoke_in_qt_main_thread``, as for any other event hub thread.
+
+    Example::
+
+        driver = EventLoopDriver(session, app)
+        driver.run()
+    '''
+
+    @property
+    def session(self):
+        '''Return the :class:`ftrack_api.session.Session` listened to.'''
+        return self._session
+
+    @property
+    def app(self):
+        '''Return the Qt application whose event loop is run.'''
+        return self._app
+
+    @property
+    def running(self):
+        '''Return whether the event loop is running.'''
+        return self._running
+
+    def __init__(self, session, app):
+        '''
+        Initialise the driver of the Qt event loop of *app*, listening to
+        the event hub of *session*.
+        '''
+        self._session = session
+        self._app = app
+        self._running = False
+        self._interrupted = False
+        self._event_hub_timer = None
+
+    def run(self):
+        '''
+        Run the event loop until :meth:`quit` is called or the process is
+        interrupted with CTRL+C, in which case :class:`KeyboardInterrupt`
+        is raised.
+
+        Return the exit code of the Qt event loop.
+        '''
+        QtCore = _import_qt_core()
+
+        # Closing the last dialog must not end the integration.
+        quit_on_last_window_closed = self._app.quitOnLastWindowClosed()
+        self._app.setQuitOnLastWindowClosed(False)
+
+        self._ensure_event_hub_thread()
+        self._event_hub_timer = QtCore.QTimer()
+        self._event_hub_timer.timeout.connect(self._ensure_event_hub_thread)
+        self._event_hub_timer.start(EVENT_HUB_CHECK_INTERVAL * 1000)
+
+        restore_signals = self._install_signal_handlers(QtCore)
+        self._running = True
+        self._interrupted = False
+        try:
+            exec_ = getattr(self._app, 'exec', None) or self._app.exec_
+            exit_code = exec_()
+        finally:
+            self._running = False
+            restore_signals()
+            self._event_hub_timer.stop()
+            self._event_hub_timer = None
+            self._app.setQuitOnLastWindowClosed(quit_on_last_window_closed)
+
+        if self._interrupted:
+            raise KeyboardInterrupt()
+        return exit_code
+
+    def quit(self):
+        '''Stop the event loop, can be called from any thread.'''
+        QtCore = _import_qt_core()
+        QtCore.QMetaObject.invokeMethod(
+            self._app, 'quit', QtCore.Qt.QueuedConnection
+        )
+
+    def _ensure_event_hub_thread(self):
+        '''Start listening to the event hub if not done yet, or if the
+        listening thread stopped after a disconnection.'''
+        # Imported here, ftrack_utils.session depends on this package.
+        from ftrack_utils.session import create_event_hub_thread
+
+        try:
+            create_event_hub_thread(self._session)
+        except Exception as error:
+            logger.warning(
+                'Could not listen to the event hub, retrying in {}s: '
+                '{}'.format(EVENT_HUB_CHECK_INTERVAL, error)
+            )
+
+    def _on_interrupt(self, signum, frame):
+        '''Stop the event loop on CTRL+C.'''
+        self._interrupted = True
+        self.quit()
+
+    def _install_signal_handlers(self, QtCore):
+        '''
+        Have CTRL+C stop the event loop, return a function restoring the
+        previous handlers.
+
+        Python signal handlers only run when the interpreter gets control
+        back, so the signal wakes up the event loop through a socket pair
+        watched by a socket notifier.
+        '''
+        try:
+            previous_handler = signal.signal(signal.SIGINT, self._on_interrupt)
+        except ValueError:
+            # Not the main thread of the interpreter.
+            return lambda: None
+
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        previous_fd = signal.set_wakeup_fd(writer.fileno())
+
+        def drain():
+            try:
+                while reader.recv(1024):
+                    pass
+            except OSError:
+                pass
+
+        notifier = QtCore.QSocketNotifier(
+            reader.fileno(), QtCore.QSocketNotifier.Read
+        )
+        notifier.activated.connect(drain)
+
+        def restore():
+            notifier.setEnabled(False)
+            signal.set_wakeup_fd(previous_fd)
+            signal.signal(signal.SIGINT, previous_handler)
+            reader.close()
+            writer.close()
+
+        return restore
+
+
+def run_event_loop(session, app):
+    '''
+    Run the Qt event loop of *app* while listening to the event hub of
+    *session*, see :class:`EventLoopDriver`.
+    '''
+    return EventLoopDriver(session, app).run()
@@ -0,0 +1,159 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import copy
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+
+from ftrack_utils.json.manifest import JsonManifest
+
+logger = logging.getLogger(__name__)
+
+
+class ExtensionCache(JsonManifest):
+    """
+    Manifest of the extensions discovered in extension files, persisted as
+    JSON to *path*.
+
+    Entries are keyed by file path and only returned while the modification
+    time and size of the file are unchanged, so unchanged .yaml extensions
+    are not parsed again and unchanged python modules are not imported to
+    discover their extensions.
+    """
+
+    ENTRIES_KEY = "files"
+    DESCRIPTION = "extension cache"
+
+    @staticmethod
+    def _signature(file_stat):
+        return [file_stat.st_mtime_ns, file_stat.st_size]
+
+    def get(self, file_path, kind, file_stat=None):
+        """
+        Return a copy of the data cached for *file_path* of *kind*, None if
+        missing or if the file or the environment variables it depends on
+        changed. *file_stat* is the :func:`os.stat` result of the file, read
+        if not given.
+        """
+        with self._lock:
+            entry = self._load().get(file_path)
+            if entry is None or entry.get("kind") != kind:
+                return None
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    return None
+            if entry.get("signature") != self._signature(file_stat):
+                return None
+            for name, value in entry.get("environment", {}).items():
+                if os.environ.get(name, "") != value:
+                    return None
+            # Callers modify the data, e.g. when merging overrides
+            return copy.deepcopy(entry["data"])
+
+    def set(self, file_path, kind, data, file_stat=None, environment=None):
+        """
+        Cache *data* of *kind* for *file_path*, with *file_stat* the
+        :func:`os.stat` result of the file it was read from. *environment*
+        is a list of environment variable names the data depends on. Data
+        that cannot be serialised to JSON is not cached.
+        """
+        try:
+            if file_stat is None:
+                file_stat = os.stat(file_path)
+            # Serialise now to detect unsupported data and keep a copy
+            data = json.loads(json.dumps(data))
+        except (OSError, TypeError, ValueError) as error:
+            logger.debug(
+                "Not caching extension file {}: {}".format(file_path, error)
+            )
+            return
+        entry = {
+            "kind": kind,
+            "signature": self._signature(file_stat),
+            "data": data,
+        }
+        if environment:
+            entry["environment"] = {
+                name: os.environ.get(name, "") for name in environment
+            }
+        with self._lock:
+            self._load()[file_path] = entry
+            self._modified = True
+
+
+class LazyExtension(object):
+    """
+    Reference to the extension class *class_name* of the python module
+    *module_name* at *module_path*, imported on the first call to
+    :meth:`load`.
+
+    :attr:`__name__` is the class name, so extensions can be compared by
+    name without importing their module.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, module_name, module_path, class_name):
+        self.module_name = module_name
+        self.module_path = module_path
+        self.__name__ = class_name
+        self._extension = None
+
+    def __repr__(self):
+        return "<{} {} from {}>".format(
+            self.__class__.__name__, self.__name__, self.module_path
+        )
+
+    def _import_module(self):
+        """Return the module at :attr:`module_path`, importing it if not
+        already imported."""
+        module = sys.modules.get(self.module_name)
+        if module is not None and os.path.normcase(
+            os.path.abspath(getattr(module, "__file__", None) or "")
+        ) == os.path.normcase(os.path.abspath(self.module_path)):
+            return module
+        module_spec = importlib.util.spec_from_file_location(
+            self.module_name, self.module_path
+        )
+        if module_spec is None or module_spec.loader is None:
+            raise ImportError(
+                "Could not resolve module spec for {} at {}".format(
+                    self.module_name, self.module_path
+                )
+            )
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[self.module_name] = module
+        try:
+            module_spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(self.module_name, None)
+            raise
+        return module
+
+    def load(self):
+        """Import the module if needed and return the extension class."""
+        if self._extension is not None:
+            return self._extension
+        with self._lock:
+            if self._extension is None:
+                logger.debug(
+                    "Importing extension {} from {}".format(
+                        self.__name__, self.module_path
+                    )
+                )
+                module = self._import_module()
+                try:
+                    self._extension = getattr(module, self.__name__)
+                except AttributeError:
+                    raise ImportError(
+                        "Extension {} not found in module {}".format(
+                            self.__name__, self.module_path
+                        )
+                    )
+        return self._extension
@@ -12,6 +12,7 @@ import yaml
 import re
 
 from ftrack_utils.directories.scan_dir import fast_scandir
+from ftrack_utils.extensions.cache import LazyExtension
 
 logger = logging.getLogger(__name__)
 
@@ -27,43 +28,71 @@ def env_constructor(loader, node):
     return os.environ.get(env_var, "") + value[match.end() :]
 
 
-yaml.add_implicit_resolver("!env", env_matcher, None, yaml.SafeLoader)
-yaml.add_constructor("!env", env_constructor, yaml.SafeLoader)
+# Use the faster libyaml based loader when available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+for _loader in {yaml.SafeLoader, YamlLoader}:
+    yaml.add_implicit_resolver("!env", env_matcher, None, _loader)
+    yaml.add_constructor("!env", env_constructor, _loader)
 
-def register_yaml_files(file_list):
+
+def _load_yaml_file(_file, cache=None):
+    """
+    Return the content of the .yaml file *_file*, from *cache* if given and
+    the file is unchanged. Raise :class:`yaml.YAMLError` if invalid.
+    """
+    file_stat = os.stat(_file) if cache is not None else None
+    if cache is not None:
+        yaml_content = cache.get(_file, "yaml", file_stat=file_stat)
+        if yaml_content is not None:
+            return yaml_content
+    with open(_file, "r") as yaml_file:
+        text = yaml_file.read()
+    yaml_content = yaml.load(text, Loader=YamlLoader)
+    if cache is not None:
+        # Substituted environment variables invalidate the entry if changed
+        cache.set(
+            _file,
+            "yaml",
+            yaml_content,
+            file_stat=file_stat,
+            environment=sorted(set(env_matcher.findall(text))),
+        )
+    return yaml_content
+
+
+def register_yaml_files(file_list, cache=None):
     """
     Generate data registry files for all extension compatible .yaml files in
     the given *file_list*. Support environment variable substitution in the yaml file.
+    Unchanged files are read from the :class:`ExtensionCache` *cache* if
+    given.
     """
 
     registered_files = []
     for _file in file_list:
-        with open(_file, "r") as yaml_file:
-            try:
-                yaml_content = yaml.safe_load(yaml_file)
-            except yaml.YAMLError as exc:
-                # Log an error if the yaml file is invalid.
-                logger.error(
-                    "Invalid .yaml file\nFile: {}\nError: {}".format(
-                        _file, exc
-                    )
-                )
-                continue
-            if not yaml_content.get("type"):
-                # Log warning if yaml file doesn't contain type key.
-                logger.warning(
-                    "No extension compatible .yaml file, missing 'type'."
-                    "\nFile: {}".format(_file)
-                )
-                continue
-            data = {
-                "extension_type": yaml_content["type"],
-                "name": yaml_content["name"],
-                "extension": yaml_content,
-                "path": _file,
-            }
-            registered_files.append(data)
+        try:
+            yaml_content = _load_yaml_file(_file, cache=cache)
+        except yaml.YAMLError as exc:
+            # Log an error if the yaml file is invalid.
+            logger.error(
+                "Invalid .yaml file\nFile: {}\nError: {}".format(_file, exc)
+            )
+            continue
+        if not yaml_content.get("type"):
+            # Log warning if yaml file doesn't contain type key.
+            logger.warning(
+                "No extension compatible .yaml file, missing 'type'."
+                "\nFile: {}".format(_file)
+            )
+            continue
+        data = {
+            "extension_type": yaml_content["type"],
+            "name": yaml_content["name"],
+            "extension": yaml_content,
+            "path": _file,
+        }
+        registered_files.append(data)
     return registered_files
 
 
@@ -78,8 +107,9 @@ def get_files_from_folder(_dir, filetype_pattern):
     return file_list
 
 
-def get_extensions_from_directory(scan_dir, extension_types=None):
-    """Return available extensions on the given directory"""
+def get_extensions_from_directory(scan_dir, extension_types=None, cache=None):
+    """Return available extensions on the given directory, using the
+    :class:`ExtensionCache` *cache* if given for unchanged files"""
     subfolders = fast_scandir(scan_dir)
     if not subfolders:
         subfolders = [scan_dir]
@@ -93,7 +123,7 @@ def get_extensions_from_directory(scan_dir, extension_types=None):
         file_list = get_files_from_folder(_dir, filetype_pattern="*.y*ml")
         if not file_list:
             continue
-        registered_files = register_yaml_files(file_list)
+        registered_files = register_yaml_files(file_list, cache=cache)
         if not registered_files:
             logger.warning(
                 "No compatible yaml extensions found in " "folder {}".format(
@@ -115,7 +145,9 @@ def get_extensions_from_directory(scan_dir, extension_types=None):
         or "widget" in extension_types
         or "dialog" in extension_types
     ):
-        extension_data = get_modules_extension_data_from_folders(subfolders)
+        extension_data = get_modules_extension_data_from_folders(
+            subfolders, cache=cache
+        )
         for data in extension_data:
             if (
                 extension_types is None
@@ -126,8 +158,24 @@ def get_extensions_from_directory(scan_dir, extension_types=None):
     return available_extensions
 
 
-def get_modules_extension_data_from_folders(folders):
-    """Get the extension data dictionary of the framework extension python modules found in the given *folders*"""
+def _get_module_path(loader, module_name):
+    """Return the path of the module *module_name* found by *loader* without
+    importing it, None if unknown."""
+    if not hasattr(loader, "find_spec"):
+        return None
+    module_spec = loader.find_spec(module_name)
+    if module_spec is None or not module_spec.has_location:
+        return None
+    return module_spec.origin
+
+
+def get_modules_extension_data_from_folders(folders, cache=None):
+    """Get the extension data dictionary of the framework extension python modules found in the given *folders*
+
+    If the :class:`ExtensionCache` *cache* is given, the extensions of
+    unchanged modules are returned from it with a :class:`LazyExtension` as
+    extension, only importing the module on first use.
+    """
 
     def _load_module(loader, module_name):
         if hasattr(loader, "find_spec"):
@@ -157,6 +205,29 @@ def get_modules_extension_data_from_folders(folders):
 
     extension_data = []
     for loader, module_name, is_pkg in pkgutil.walk_packages(folders):
+        module_path = None
+        if cache is not None:
+            module_path = _get_module_path(loader, module_name)
+            cached_extensions = (
+                cache.get(module_path, "python") if module_path else None
+            )
+            if cached_extensions is not None:
+                for cached_extension in cached_extensions:
+                    extension_data.append(
+                        {
+                            "name": cached_extension["name"],
+                            "extension_type": cached_extension[
+                                "extension_type"
+                            ],
+                            "extension": LazyExtension(
+                                module_name,
+                                module_path,
+                                cached_extension["class_name"],
+                            ),
+                            "path": cached_extension["path"],
+                        }
+                    )
+                continue
         try:
             _module = _load_module(loader, module_name)
         except Exception as error:
@@ -170,6 +241,7 @@ def get_modules_extension_data_from_folders(folders):
 
         cls_members = inspect.getmembers(_module, inspect.isclass)
         success_registry = False
+        module_extensions = []
         for name, obj in cls_members:
             if obj.__module__ != _module.__name__:
                 # We just want to check the current module, not the imported or
@@ -190,6 +262,14 @@ def get_modules_extension_data_from_folders(folders):
                     )
 
                 extension_data.append(registry_result)
+                module_extensions.append(
+                    {
+                        "name": registry_result["name"],
+                        "extension_type": registry_result["extension_type"],
+                        "class_name": name,
+                        "path": registry_result["path"],
+                    }
+                )
                 success_registry = True
             except Exception as e:
                 logger.warning(
@@ -206,4 +286,6 @@ def get_modules_extension_data_from_folders(folders):
                     module_name, getattr(loader, "path", "<unknown>")
                 )
             )
+        if module_path and module_extensions:
+            cache.set(module_path, "python", module_extensions)
     return extension_data
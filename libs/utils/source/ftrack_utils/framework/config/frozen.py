@@ -0,0 +1,82 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+import copy
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        '{} is read only, use copy.deepcopy() to get a writable '
+        'copy.'.format(type(self).__name__)
+    )
+
+
+class FrozenDict(dict):
+    '''
+    Read only dictionary, shared between the registry, the host and the
+    host connections instead of copied.
+
+    It is a :class:`dict` so it is serialised in events and checked as any
+    tool-config dictionary. :func:`copy.copy` and :func:`copy.deepcopy`
+    return writable copies.
+    '''
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    copy = __copy__
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    '''Read only list, see :class:`FrozenDict`.'''
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = _read_only
+    sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    copy = __copy__
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def freeze(value):
+    '''
+    Return a read only version of *value*, converting nested dictionaries
+    and lists to :class:`FrozenDict` and :class:`FrozenList`. Values already
+    frozen are returned as is, so freezing is only paid once.
+    '''
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    '''Return a writable deep copy of the given frozen *value*.'''
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return copy.deepcopy(value)
@@ -0,0 +1,123 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class JsonManifest(object):
+    '''
+    Versioned entries persisted as JSON to *path*, base of the caches
+    keeping their entries between sessions.
+
+    The entries are read on first access and written back by :meth:`save`
+    if modified. Subclasses set :attr:`VERSION`, :attr:`ENTRIES_KEY` and
+    :attr:`DESCRIPTION`, and mark the entries modified when changing them.
+    '''
+
+    #: Version of the manifest format, manifests of other versions are
+    #: discarded.
+    VERSION = 1
+
+    #: Key of the entries in the manifest file.
+    ENTRIES_KEY = 'entries'
+
+    #: Description of the manifest in log messages.
+    DESCRIPTION = 'manifest'
+
+    @property
+    def path(self):
+        '''Return the path of the manifest file, None if not persisted.'''
+        return self._path
+
+    @property
+    def modified(self):
+        '''Return True if entries were added since the manifest was loaded
+        or saved.'''
+        return self._modified
+
+    def __init__(self, path=None):
+        self._path = path
+        self._entries = None
+        self._modified = False
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._load())
+
+    def _load(self):
+        '''Return the entries, reading the manifest on first access.'''
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if not self._path or not os.path.exists(self._path):
+            return self._entries
+        try:
+            with open(self._path, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get('version') == self.VERSION:
+                self._entries = manifest[self.ENTRIES_KEY]
+            else:
+                logger.debug(
+                    'Discarding {} {} of version {}'.format(
+                        self.DESCRIPTION, self._path, manifest.get('version')
+                    )
+                )
+        except (OSError, ValueError, KeyError, AttributeError) as error:
+            logger.warning(
+                'Could not read {} {}: {}'.format(
+                    self.DESCRIPTION, self._path, error
+                )
+            )
+        return self._entries
+
+    def clear(self):
+        '''Remove all entries, and the manifest file.'''
+        with self._lock:
+            self._entries = {}
+            self._modified = False
+            if self._path and os.path.exists(self._path):
+                os.remove(self._path)
+
+    def save(self):
+        '''
+        Write the manifest to :attr:`path` if modified. The file is replaced
+        atomically so concurrent readers never see a partial manifest.
+        '''
+        with self._lock:
+            if not self._modified or not self._path:
+                return
+            directory = os.path.dirname(self._path)
+            try:
+                if directory and not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+                file_descriptor, temporary_path = tempfile.mkstemp(
+                    dir=directory or None, suffix='.tmp'
+                )
+                try:
+                    with os.fdopen(file_descriptor, 'w') as manifest_file:
+                        json.dump(
+                            {
+                                'version': self.VERSION,
+                                self.ENTRIES_KEY: self._entries,
+                            },
+                            manifest_file,
+                        )
+                    os.replace(temporary_path, self._path)
+                except Exception:
+                    os.remove(temporary_path)
+                    raise
+            except OSError as error:
+                logger.warning(
+                    'Could not write {} {}: {}'.format(
+                        self.DESCRIPTION, self._path, error
+                    )
+                )
+                return
+            self._modified = False
@@ -5,6 +5,13 @@ import os
 import clique
 import tempfile
 
+from ftrack_utils.paths.file_copy import (
+    CopyProgress,
+    copy_file,
+    copy_files,
+    copy_sequence,
+)
+
 
 def find_image_sequence(file_path):
     '''Try to find a continuous image sequence in the *file_path*, supplied either as
@@ -0,0 +1,277 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import logging
+import os
+import shutil
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+
+logger = logging.getLogger(__name__)
+
+# Linux ioctl cloning a file, sharing its blocks copy on write (reflink).
+_FICLONE = 0x40049409
+
+# Bytes copied per copy_file_range/sendfile call.
+_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _reflink(source_fd, destination_fd):
+    '''Clone *source_fd* into *destination_fd*, raise OSError if the
+    filesystem does not support it.'''
+    import fcntl
+
+    fcntl.ioctl(destination_fd, _FICLONE, source_fd)
+
+
+def _copy_range(copy_function, source_fd, destination_fd, size):
+    '''Copy *size* bytes with *copy_function*, a kernel side copy function
+    such as :func:`os.copy_file_range` or :func:`os.sendfile`.'''
+    offset = 0
+    while offset < size:
+        copied = copy_function(
+            source_fd, destination_fd, min(_CHUNK_SIZE, size - offset), offset
+        )
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def _copy_file_range(source_fd, destination_fd, count, offset):
+    return os.copy_file_range(source_fd, destination_fd, count, offset)
+
+
+def _sendfile(source_fd, destination_fd, count, offset):
+    return os.sendfile(destination_fd, source_fd, offset, count)
+
+
+def _copy_data(source_path, destination_path, size):
+    '''Copy the data of *source_path* to *destination_path* without going
+    through user space when supported, return the method used.'''
+    with open(source_path, 'rb') as source_file:
+        with open(destination_path, 'xb') as destination_file:
+            source_fd = source_file.fileno()
+            destination_fd = destination_file.fileno()
+            if sys.platform.startswith('linux'):
+                try:
+                    _reflink(source_fd, destination_fd)
+                    return 'reflink'
+                except OSError:
+                    pass
+                for method, copy_function in (
+                    ('copy_file_range', _copy_file_range),
+                    ('sendfile', _sendfile),
+                ):
+                    if not hasattr(os, method):
+                        continue
+                    try:
+                        if (
+                            _copy_range(
+                                copy_function, source_fd, destination_fd, size
+                            )
+                            == size
+                        ):
+                            return method
+                    except OSError:
+                        pass
+                    # Start over with the next method
+                    destination_file.seek(0)
+                    destination_file.truncate()
+                    source_file.seek(0)
+            shutil.copyfileobj(source_file, destination_file, _CHUNK_SIZE)
+            return 'copyfileobj'
+
+
+def _temporary_path(destination_path):
+    '''Return a unique path next to *destination_path*, so the copy can
+    replace it at once.'''
+    directory, name = os.path.split(destination_path)
+    return os.path.join(directory, f'.{name}.{uuid.uuid4().hex}.tmp')
+
+
+def copy_file(source_path, destination_path, link=False):
+    '''
+    Copy *source_path* to *destination_path*, a file or a directory, and
+    return the destination file path.
+
+    The data is cloned (reflink) or copied in the kernel with
+    :func:`os.copy_file_range` or :func:`os.sendfile` when available,
+    falling back to a regular copy. If *link* is True the destination is
+    hardlinked to the source when both are on the same filesystem, only use
+    it when neither file is modified in place afterwards.
+
+    The copy is written to a temporary file replacing the destination once
+    complete, an existing destination is never truncated in place. As with
+    :func:`shutil.copy`, :class:`shutil.SameFileError` is raised if the
+    destination is the source, or a hardlink to it.
+
+    The permission bits are copied as :func:`shutil.copy` does and the size
+    of the destination is verified, raising an :class:`IOError` on
+    mismatch.
+    '''
+    if os.path.isdir(destination_path):
+        destination_path = os.path.join(
+            destination_path, os.path.basename(source_path)
+        )
+    if os.path.exists(destination_path) and os.path.samefile(
+        source_path, destination_path
+    ):
+        raise shutil.SameFileError(
+            f'{source_path} and {destination_path} are the same file.'
+        )
+    size = os.stat(source_path).st_size
+
+    temporary_path = _temporary_path(destination_path)
+    try:
+        linked = False
+        if link:
+            try:
+                os.link(source_path, temporary_path)
+                linked = True
+            except OSError as error:
+                logger.debug(
+                    f'Could not hardlink {source_path} to {destination_path},'
+                    f' copying instead: {error}'
+                )
+        if not linked:
+            _copy_data(source_path, temporary_path, size)
+            shutil.copymode(source_path, temporary_path)
+
+        copied_size = os.stat(temporary_path).st_size
+        if copied_size != size:
+            raise IOError(
+                f'Copy of {source_path} to {destination_path} is incomplete, '
+                f'{copied_size} of {size} bytes written.'
+            )
+        os.replace(temporary_path, destination_path)
+    except BaseException:
+        if os.path.lexists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return destination_path
+
+
+class CopyProgress(object):
+    '''Progress of a :func:`copy_files` operation.'''
+
+    def __init__(self, total_files, total_bytes):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.copied_files = 0
+        self.copied_bytes = 0
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self):
+        '''Seconds elapsed since the copy started.'''
+        return time.monotonic() - self.started
+
+    @property
+    def bytes_per_second(self):
+        '''Average throughput of the copy.'''
+        elapsed = self.elapsed
+        return self.copied_bytes / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (
+            f'Copied {self.copied_files}/{self.total_files} files, '
+            f'{self.copied_bytes / 1024**2:.1f}/'
+            f'{self.total_bytes / 1024**2:.1f} MB at '
+            f'{self.bytes_per_second / 1024**2:.1f} MB/s'
+        )
+
+
+def copy_files(
+    file_pairs,
+    max_workers=None,
+    link=False,
+    progress_callback=None,
+    progress_interval=0.5,
+):
+    '''
+    Copy the (source, destination) *file_pairs* in parallel on up to
+    *max_workers* threads, see :func:`copy_file` for *link*. Return the list
+    of destination file paths, in the order of *file_pairs*.
+
+    *progress_callback* is called from the calling thread with a
+    :class:`CopyProgress` at most every *progress_interval* seconds, and
+    once all files are copied.
+
+    The first failure cancels the pending copies and is raised.
+    '''
+    file_pairs = list(file_pairs)
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+    max_workers = max(1, min(max_workers, len(file_pairs) or 1))
+    sizes = [os.stat(source).st_size for source, _ in file_pairs]
+    progress = CopyProgress(len(file_pairs), sum(sizes))
+    results = [None] * len(file_pairs)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='ftrack-copy'
+    ) as executor:
+        futures = {
+            executor.submit(copy_file, source, destination, link): index
+            for index, (source, destination) in enumerate(file_pairs)
+        }
+        pending = set(futures)
+        last_report = time.monotonic()
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=progress_interval,
+                return_when=FIRST_EXCEPTION,
+            )
+            for future in done:
+                index = futures[future]
+                error = future.exception()
+                if error is not None:
+                    for pending_future in pending:
+                        pending_future.cancel()
+                    raise error
+                results[index] = future.result()
+                progress.copied_files += 1
+                progress.copied_bytes += sizes[index]
+            now = time.monotonic()
+            if progress_callback and (
+                not pending or now - last_report >= progress_interval
+            ):
+                progress_callback(progress)
+                last_report = now
+    logger.debug(str(progress))
+    return results
+
+
+def copy_sequence(
+    collection,
+    destination_directory,
+    max_workers=None,
+    link=False,
+    progress_callback=None,
+    progress_interval=0.5,
+):
+    '''
+    Copy the files of the :class:`clique.Collection` *collection* to
+    *destination_directory*, keeping their names, see :func:`copy_files`.
+    Return the list of destination file paths.
+    '''
+    if not os.path.isdir(destination_directory):
+        os.makedirs(destination_directory)
+    return copy_files(
+        [
+            (
+                file_path,
+                os.path.join(
+                    destination_directory, os.path.basename(file_path)
+                ),
+            )
+            for file_path in collection
+        ],
+        max_workers=max_workers,
+        link=link,
+        progress_callback=progress_callback,
+        progress_interval=progress_interval,
+    )
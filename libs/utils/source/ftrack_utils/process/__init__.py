@@ -5,3 +5,7 @@ from ftrack_utils.process.monitor import (
     MonitorProcess,
     terminate_current_process,
 )
+from ftrack_utils.process.watcher import (
+    ProcessWatcher,
+    is_process_running,
+)
@@ -6,6 +6,8 @@ import sys
 import os
 import signal
 
+from ftrack_utils.process.watcher import ProcessWatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,11 @@ def terminate_current_process():
 
 
 class MonitorProcess(object):
-    """Assist monitor a process by its PID"""
+    """Assist monitor a process by its PID.
+
+    The process is looked up with the probe callback until found, it is
+    then watched by a :class:`ProcessWatcher`, without probing again.
+    """
 
     @property
     def process_pid(self):
@@ -33,16 +39,41 @@ class MonitorProcess(object):
         if self._process_pid != value:
             self._process_pid = value
             logger.info(f"Process detected: {self.process_pid}")
+            self._watch(value)
+
+    def __init__(self, probe_pid_callback, on_exit_callback=None):
+        """Monitor process probing pid through *probe_pid_callback*.
 
-    def __init__(self, probe_pid_callback):
-        """Monitor process probing pid through *probe_pid_callback*."""
+        *on_exit_callback* is called with the PID from a background thread
+        as soon as the detected process exits.
+        """
         self._probe_pid_callback = probe_pid_callback
+        self._on_exit_callback = on_exit_callback
         self._process_pid = None
+        self._watcher = None
+
+    def _watch(self, pid):
+        """Watch the exit of process *pid* instead of the previous one."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        # Probes may return a negative pid when unsure, keep probing then.
+        if pid and pid > 0:
+            self._watcher = ProcessWatcher(pid, self._on_process_exit)
+            self._watcher.start()
+
+    def _on_process_exit(self, pid):
+        logger.info(f"Process {pid} no longer running.")
+        if self._on_exit_callback is not None:
+            self._on_exit_callback(pid)
 
     def _check_still_running(self):
         logger.debug(
             f"Checking if application is still alive (pid: {self.process_pid})..."
         )
+        if self._watcher is not None:
+            return self._watcher.running
+
         pid = self._probe_pid_callback()
         is_same_process = pid == self.process_pid
 
@@ -67,3 +98,7 @@ class MonitorProcess(object):
 
         logger.warning("Process not yet detected. Probing...")
         return False
+
+    def stop(self):
+        """Stop watching the process."""
+        self._watch(None)
@@ -0,0 +1,320 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+import functools
+import logging
+import os
+import select
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks when the platform cannot notify process exits
+POLL_INTERVAL = 1.0
+
+# Win32 constants
+_SYNCHRONIZE = 0x00100000
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_STILL_ACTIVE = 259
+_ERROR_ACCESS_DENIED = 5
+_ERROR_INVALID_PARAMETER = 87
+_INFINITE = 0xFFFFFFFF
+_WAIT_OBJECT_0 = 0
+
+
+@functools.lru_cache(maxsize=None)
+def _kernel32():
+    """Return the kernel32 library, with the signatures used here."""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.argtypes = [
+        wintypes.DWORD,
+        wintypes.BOOL,
+        wintypes.DWORD,
+    ]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.CreateEventW.argtypes = [
+        wintypes.LPVOID,
+        wintypes.BOOL,
+        wintypes.BOOL,
+        wintypes.LPCWSTR,
+    ]
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+    kernel32.GetExitCodeProcess.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    kernel32.WaitForMultipleObjects.argtypes = [
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.HANDLE),
+        wintypes.BOOL,
+        wintypes.DWORD,
+    ]
+    kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    return kernel32
+
+
+def is_process_running(pid):
+    """Return True if the process with *pid* is running, without
+    listing processes."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = _kernel32()
+        handle = kernel32.OpenProcess(
+            _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            # The process exists but belongs to someone else.
+            return ctypes.get_last_error() == _ERROR_ACCESS_DENIED
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(
+                handle, ctypes.byref(exit_code)
+            ):
+                return True
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    if hasattr(os, "waitid"):
+        # An exited child is a zombie until reaped, which os.kill() does
+        # not tell apart. Leave it to be reaped by its owner.
+        try:
+            return (
+                os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+                is None
+            )
+        except ChildProcessError:
+            pass
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ProcessWatcher(object):
+    """Watch a process by its PID from a background thread, and call back
+    the moment it exits.
+
+    The exit is waited for with a pidfd on Linux, a kqueue on macOS and
+    BSD and a process handle on Windows. Elsewhere, or if the process
+    cannot be opened, it is checked every *poll_interval* seconds with
+    :func:`is_process_running`.
+    """
+
+    @property
+    def pid(self):
+        """Return the PID watched."""
+        return self._pid
+
+    @property
+    def running(self):
+        """Return False once the process is known to have exited."""
+        return not self._exited.is_set()
+
+    @property
+    def method(self):
+        """Return how the exit is waited for: 'pidfd', 'kqueue', 'win32'
+        or 'poll', None until the watcher started waiting."""
+        return self._method
+
+    def __init__(self, pid, on_exit=None, poll_interval=POLL_INTERVAL):
+        """Watch process *pid*, calling *on_exit* with the PID from the
+        watcher thread when it exits."""
+        self._pid = pid
+        self._poll_interval = poll_interval
+        self._callbacks = [on_exit] if on_exit else []
+        self._lock = threading.Lock()
+        self._exited = threading.Event()
+        self._stopped = threading.Event()
+        self._method = None
+        self._thread = None
+        self._wake_fds = None
+        self._wake_handle = None
+
+    def add_callback(self, callback):
+        """Call *callback* with the PID when the process exits, right away
+        if it has exited already."""
+        with self._lock:
+            if not self._exited.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self._pid)
+
+    def start(self):
+        """Start watching the process."""
+        if self._thread is not None:
+            return
+        if sys.platform != "win32":
+            self._wake_fds = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"ProcessWatcher-{self._pid}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching the process, callbacks will not be called."""
+        with self._lock:
+            self._stopped.set()
+            if self._wake_fds is not None:
+                os.write(self._wake_fds[1], b"\0")
+            if self._wake_handle is not None:
+                _kernel32().SetEvent(self._wake_handle)
+        if (
+            self._thread is not None
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join()
+
+    def wait(self, timeout=None):
+        """Block until the process has exited, at most *timeout* seconds.
+        Return True if it has exited."""
+        return self._exited.wait(timeout)
+
+    def _run(self):
+        try:
+            exited = self._wait_for_exit()
+        except Exception:
+            logger.exception(
+                f"Failed waiting for process {self._pid}, polling it."
+            )
+            exited = self._wait_poll()
+        finally:
+            with self._lock:
+                if self._wake_fds is not None:
+                    for fd in self._wake_fds:
+                        os.close(fd)
+                    self._wake_fds = None
+
+        if not exited or self._stopped.is_set():
+            return
+
+        logger.info(f"Process {self._pid} exited.")
+        with self._lock:
+            self._exited.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(self._pid)
+            except Exception:
+                logger.exception(
+                    f"Process {self._pid} exit callback {callback} failed."
+                )
+
+    def _wait_for_exit(self):
+        """Return True once the process exited, False if stopped."""
+        if sys.platform == "win32":
+            waiter = self._wait_win32
+        elif hasattr(os, "pidfd_open"):
+            waiter = self._wait_pidfd
+        elif hasattr(select, "kqueue"):
+            waiter = self._wait_kqueue
+        else:
+            waiter = None
+
+        exited = waiter() if waiter else None
+        if exited is None:
+            # Not supported, or the process cannot be opened.
+            exited = self._wait_poll()
+        return exited
+
+    def _wait_pidfd(self):
+        try:
+            pidfd = os.pidfd_open(self._pid)
+        except ProcessLookupError:
+            return True
+        except OSError as error:
+            logger.debug(f"Cannot open a pidfd for {self._pid}: {error}")
+            return None
+
+        self._method = "pidfd"
+        try:
+            readable, _, _ = select.select([pidfd, self._wake_fds[0]], [], [])
+            return pidfd in readable
+        finally:
+            os.close(pidfd)
+
+    def _wait_kqueue(self):
+        kqueue = select.kqueue()
+        try:
+            try:
+                kqueue.control(
+                    [
+                        select.kevent(
+                            self._pid,
+                            filter=select.KQ_FILTER_PROC,
+                            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                            fflags=select.KQ_NOTE_EXIT,
+                        ),
+                        select.kevent(
+                            self._wake_fds[0],
+                            filter=select.KQ_FILTER_READ,
+                            flags=select.KQ_EV_ADD,
+                        ),
+                    ],
+                    0,
+                )
+            except ProcessLookupError:
+                return True
+            except OSError as error:
+                logger.debug(f"Cannot watch {self._pid} exit: {error}")
+                return None
+
+            self._method = "kqueue"
+            events = kqueue.control(None, 1)
+            return any(
+                event.filter == select.KQ_FILTER_PROC for event in events
+            )
+        finally:
+            kqueue.close()
+
+    def _wait_win32(self):
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = _kernel32()
+        handle = kernel32.OpenProcess(_SYNCHRONIZE, False, self._pid)
+        if not handle:
+            error = ctypes.get_last_error()
+            if error == _ERROR_INVALID_PARAMETER:
+                # No such process.
+                return True
+            logger.debug(f"Cannot open process {self._pid}: {error}")
+            return None
+
+        self._method = "win32"
+        with self._lock:
+            self._wake_handle = kernel32.CreateEventW(None, True, False, None)
+        try:
+            if self._stopped.is_set():
+                return False
+            handles = (wintypes.HANDLE * 2)(handle, self._wake_handle)
+            result = kernel32.WaitForMultipleObjects(
+                2, handles, False, _INFINITE
+            )
+            return result == _WAIT_OBJECT_0
+        finally:
+            with self._lock:
+                kernel32.CloseHandle(self._wake_handle)
+                self._wake_handle = None
+            kernel32.CloseHandle(handle)
+
+    def _wait_poll(self):
+        self._method = "poll"
+        while not self._stopped.wait(self._poll_interval):
+            if not is_process_running(self._pid):
+                return True
+        return False
@@ -0,0 +1,195 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import collections
+import logging
+
+logger = logging.getLogger('ftrack_utils:query')
+
+#: Maximum number of values in a single ``in (...)`` expression, keeping
+#: queries well within the server limits.
+CHUNK_SIZE = 100
+
+
+def chunk(values, size=CHUNK_SIZE):
+    '''Yield lists of at most *size* items from *values*.'''
+    values = list(values)
+    for index in range(0, len(values), size):
+        yield values[index : index + size]
+
+
+def quote(value):
+    '''Return *value* quoted for use in a query expression.'''
+    return '"{}"'.format(str(value).replace('\\', '\\\\').replace('"', '\\"'))
+
+
+def get_attribute(entity, attribute):
+    '''Return the value of the dotted *attribute* path of *entity*, None if
+    any entity along the path is missing.'''
+    value = entity
+    for key in attribute.split('.'):
+        if value is None:
+            return None
+        value = value[key]
+    return value
+
+
+class BatchResult(object):
+    '''Entities looked up for a value of a :class:`BatchQuery`.'''
+
+    @property
+    def value(self):
+        '''Return the value looked up.'''
+        return self._value
+
+    @property
+    def resolved(self):
+        '''Return whether the batch this lookup is part of has run.'''
+        return self._entities is not None
+
+    @property
+    def entities(self):
+        '''Return the entities matching the value, raise a
+        :class:`RuntimeError` if the batch has not run yet.'''
+        if self._entities is None:
+            raise RuntimeError(
+                'Lookup of {} is not resolved, call BatchQuery.execute() '
+                'first.'.format(self._value)
+            )
+        return self._entities
+
+    def __init__(self, value):
+        self._value = value
+        self._entities = None
+
+
+class BatchQuery(object):
+    '''
+    Collect entity lookups on an attribute and resolve them in a few
+    ``attribute in (...)`` queries instead of one query per lookup.
+
+    Example::
+
+        batch = BatchQuery(session, 'Task', 'parent_id', ['name'])
+        results = [batch.add(shot['id']) for shot in shots]
+        batch.execute()
+        for result in results:
+            print(result.value, [task['name'] for task in result.entities])
+
+    Values are queried in chunks of *chunk_size*, and each value is queried
+    once however many times it is added.
+    '''
+
+    @property
+    def session(self):
+        '''Return the :class:`ftrack_api.session.Session` queried.'''
+        return self._session
+
+    def __init__(
+        self,
+        session,
+        entity_type,
+        attribute='id',
+        projections=None,
+        criteria=None,
+        chunk_size=CHUNK_SIZE,
+    ):
+        '''
+        Initialise a batch looking up *entity_type* entities by *attribute*,
+        a dotted attribute path, in *session*.
+
+        *projections* are the attributes to select, *criteria* an optional
+        expression all the entities must match as well.
+        '''
+        self._session = session
+        self._entity_type = entity_type
+        self._attribute = attribute
+        self._projections = list(projections or [])
+        if attribute not in self._projections:
+            self._projections.append(attribute)
+        self._criteria = criteria
+        self._chunk_size = chunk_size
+        self._pending = collections.OrderedDict()
+
+    def add(self, value, callback=None):
+        '''
+        Add a lookup of the entities having *value* as attribute and return
+        its :class:`BatchResult`, resolved by :meth:`execute`.
+
+        *callback* is called with the result once resolved.
+        '''
+        result = BatchResult(value)
+        self._pending.setdefault(value, []).append((result, callback))
+        return result
+
+    def expression(self, values):
+        '''Return the query expression looking up *values*.'''
+        expression = 'select {} from {} where {} in ({})'.format(
+            ', '.join(self._projections),
+            self._entity_type,
+            self._attribute,
+            ', '.join(quote(value) for value in values),
+        )
+        if self._criteria:
+            expression += ' and ({})'.format(self._criteria)
+        return expression
+
+    def execute(self):
+        '''
+        Query the entities of all the pending lookups and resolve them.
+
+        Return a dictionary mapping each value to the list of entities
+        having it, in the order returned by the server.
+        '''
+        pending, self._pending = self._pending, collections.OrderedDict()
+        entities_by_value = collections.OrderedDict(
+            (value, []) for value in pending
+        )
+
+        for values in chunk(pending, self._chunk_size):
+            expression = self.expression(values)
+            logger.debug(
+                'Looking up {} {} by {}.'.format(
+                    len(values), self._entity_type, self._attribute
+                )
+            )
+            for entity in self._session.query(expression).all():
+                value = get_attribute(entity, self._attribute)
+                if value in entities_by_value:
+                    entities_by_value[value].append(entity)
+
+        for value, lookups in pending.items():
+            for result, callback in lookups:
+                result._entities = entities_by_value[value]
+                if callback is not None:
+                    callback(result)
+
+        return entities_by_value
+
+
+def batch_query(
+    session,
+    entity_type,
+    attribute,
+    values,
+    projections=None,
+    criteria=None,
+    chunk_size=CHUNK_SIZE,
+):
+    '''
+    Look up the *entity_type* entities having any of *values* as
+    *attribute* in a few batched queries, see :class:`BatchQuery`.
+
+    Return a dictionary mapping each value to the list of its entities.
+    '''
+    batch = BatchQuery(
+        session,
+        entity_type,
+        attribute,
+        projections=projections,
+        criteria=criteria,
+        chunk_size=chunk_size,
+    )
+    for value in values:
+        batch.add(value)
+    return batch.execute()
@@ -1,4 +1,4 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
 
-from ftrack_utils.rpc.js_rpc import JavascriptRPC
+from ftrack_utils.rpc.js_rpc import JavascriptRPC, RPCTimeoutError
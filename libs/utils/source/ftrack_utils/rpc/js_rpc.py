@@ -3,11 +3,33 @@
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    InvalidStateError,
+    TimeoutError as FutureTimeoutError,
+)
 
 import ftrack_api.event.base
 
 import ftrack_constants.framework as constants
 from ftrack_utils.framework.remote import get_remote_integration_session_id
+from ftrack_utils.session import create_event_hub_thread
+
+
+class RPCTimeoutError(Exception):
+    """Raised when no reply is received for a remote event in time."""
+
+
+class ReplyFuture(Future):
+    """Future resolved with the reply to a published event."""
+
+    def __init__(self, event_id, event_topic, callback=None):
+        super(ReplyFuture, self).__init__()
+        self.event_id = event_id
+        self.event_topic = event_topic
+        self.callback = callback
 
 
 class JavascriptRPC(object):
@@ -124,6 +146,11 @@ class JavascriptRPC(object):
         self._dcc_version = None
         self._connected = False
 
+        # Futures awaiting a reply, keyed by the id of the published event
+        self._pending_replies = {}
+        self._pending_replies_lock = threading.Lock()
+        self._event_hub_thread = None
+
         self.logger = logging.getLogger(__name__)
 
         self._initialise()
@@ -158,6 +185,16 @@ class JavascriptRPC(object):
             event_topic, self._on_discover_remote_integration_callback
         )
 
+        # Have replies dispatched as they arrive by a background thread, so
+        # waiting on them does not require polling the event hub.
+        try:
+            self._event_hub_thread = create_event_hub_thread(self.session)
+        except Exception as error:
+            self.logger.warning(
+                f"Could not start event hub thread, replies will be polled: "
+                f"{error}"
+            )
+
         event_topic = (
             f"topic={constants.event.REMOTE_INTEGRATION_RUN_DIALOG_TOPIC} and source.applicationId=ftrack.api.javascript "
             f"and data.remote_integration_session_id={self.remote_integration_session_id}"
@@ -190,54 +227,129 @@ class JavascriptRPC(object):
     ):
         """
         Common method that calls the private publish method from the
-        remote event manager
+        remote event manager. If *fetch_reply* is True, wait at most
+        *timeout* milliseconds for the reply and return its data.
         """
+        if fetch_reply:
+            future = self._publish_event_async(
+                event_topic, data, callback=callback
+            )
+            return self.wait_for_reply(
+                future, timeout=timeout, description=event_topic
+            )
 
         publish_event = ftrack_api.event.base.Event(
             topic=event_topic, data=data
         )
+        return self.event_hub.publish(publish_event, on_reply=callback)
 
-        reply_event = None
+    def _publish_event_async(self, event_topic, data, callback=None):
+        """
+        Publish event with *event_topic* and *data*, returning a
+        :class:`ReplyFuture` resolved with the reply data.
+        *callback* is called with the raw reply event if supplied.
+        """
+        publish_event = ftrack_api.event.base.Event(
+            topic=event_topic, data=data
+        )
+        future = ReplyFuture(publish_event["id"], event_topic, callback)
+        with self._pending_replies_lock:
+            self._pending_replies[future.event_id] = future
 
-        def default_callback(event):
-            if callback:
-                callback(event)
-            nonlocal reply_event
-            reply_event = event
+        try:
+            self.event_hub.publish(publish_event, on_reply=self._on_reply)
+        except Exception:
+            with self._pending_replies_lock:
+                self._pending_replies.pop(future.event_id, None)
+            raise
+        return future
+
+    def _on_reply(self, event):
+        """Resolve the pending future matching reply *event*."""
+        with self._pending_replies_lock:
+            future = self._pending_replies.pop(
+                event.get("in_reply_to_event"), None
+            )
+        if future is None or future.done():
+            return
+        if future.callback:
+            try:
+                future.callback(event)
+            except Exception as error:
+                self.logger.exception(error)
+        retval = event["data"]
+        try:
+            if "error_message" in retval:
+                future.set_exception(
+                    Exception(
+                        f"An error occurred while publishing event "
+                        f"{future.event_topic}: {retval['error_message']}"
+                    )
+                )
+            else:
+                future.set_result(retval)
+        except InvalidStateError:
+            # Cancelled by a timed out waiter in the meantime
+            pass
 
-        if fetch_reply:
-            callback_effective = default_callback
-        else:
-            callback_effective = callback
+    @property
+    def pending_reply_count(self):
+        """Return the number of published events awaiting a reply."""
+        with self._pending_replies_lock:
+            return len(self._pending_replies)
 
-        publish_result = self.event_hub.publish(
-            publish_event, on_reply=callback_effective
-        )
+    def wait_for_reply(self, future, timeout=10 * 1000, description=None):
+        """
+        Block until *future* returned by an async call is resolved and return
+        its result, raising :class:`RPCTimeoutError` if no reply is received
+        within *timeout* milliseconds.
 
-        if fetch_reply:
-            waited = 0
-            while not reply_event:
-                if self.process_events_callback:
-                    self.process_events_callback()
-                self.session.event_hub.wait(0.01)
-                waited += 10
-                if waited > timeout:
-                    raise Exception(
-                        "Timeout waiting for remote integration event reply - "
-                        " panel plugin installed and functioning?"
-                        f"Waited {waited / 1000}s"
-                    )
-                if waited % 1000 == 0:
-                    self.logger.info(
-                        f"Waited {waited / 1000}s for {event_topic} reply"
-                    )
-            retval = reply_event["data"]
-            if "error_message" in retval:
-                raise Exception(
-                    f"An error occurred while publishing event {event_topic}: {retval['error_message']}"
+        The process events callback is called while waiting, so the UI stays
+        responsive. The wait returns as soon as the reply is received.
+        """
+        deadline = time.monotonic() + timeout / 1000.0
+        next_log = time.monotonic() + 1.0
+        hub_thread_alive = (
+            self._event_hub_thread is not None
+            and self._event_hub_thread.is_alive()
+        )
+        while True:
+            if self.process_events_callback:
+                self.process_events_callback()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.discard_reply(future)
+                raise RPCTimeoutError(
+                    "Timeout waiting for remote integration event reply - "
+                    " panel plugin installed and functioning?"
+                    f"Waited {timeout / 1000}s"
+                )
+            # Only block in short slices if events need processing while
+            # waiting, the future wakes us up as soon as the reply arrives.
+            wait_slice = remaining
+            if self.process_events_callback or not hub_thread_alive:
+                wait_slice = min(remaining, 0.05)
+            if not hub_thread_alive:
+                # Nobody else is dispatching events, process them here.
+                self.event_hub.wait(wait_slice)
+                wait_slice = 0
+            try:
+                return future.result(timeout=wait_slice)
+            except FutureTimeoutError:
+                pass
+            if time.monotonic() >= next_log:
+                next_log += 1.0
+                self.logger.info(
+                    f"Waited {timeout / 1000 - max(remaining, 0):.1f}s for "
+                    f"{description or future.event_topic} reply"
                 )
-            return retval
-        return publish_result
+
+    def discard_reply(self, future):
+        """Forget *future* returned by an async call, so a late reply is
+        ignored. Does nothing if it is already resolved."""
+        with self._pending_replies_lock:
+            self._pending_replies.pop(future.event_id, None)
+        future.cancel()
 
     def _append_context_data(self, data):
         """Append and return context data to event payload *data*"""
@@ -299,13 +411,29 @@ class JavascriptRPC(object):
 
     # RPC methods
 
-    def rpc(self, function_name, args=None, callback=None, fetch_reply=True):
+    def _rpc_data(self, function_name, args):
+        """Return the RPC event payload for *function_name* with *args*."""
+        return {
+            "remote_integration_session_id": self.remote_integration_session_id,
+            "function_name": function_name,
+            "args": args or [],
+        }
+
+    def rpc(
+        self,
+        function_name,
+        args=None,
+        callback=None,
+        fetch_reply=True,
+        timeout=10 * 1000,
+    ):
         """
         Publish an event with topic
         :const:`~ftrack_framework_core.constants.event.REMOTE_INTEGRATION_RPC_TOPIC`
         , to run remote *function_name* with arguments in *args* list, calling
         *callback* providing the reply (async) or
         awaiting and fetching the reply if *fetch_reply* is True (sync, default).
+        *timeout* is the maximum time in milliseconds to wait for the reply.
 
         """
 
@@ -313,18 +441,17 @@ class JavascriptRPC(object):
             callback and fetch_reply
         ), "Cannot use callback and fetch reply at the same time!"
 
-        data = {
-            "remote_integration_session_id": self.remote_integration_session_id,
-            "function_name": function_name,
-            "args": args or [],
-        }
+        data = self._rpc_data(function_name, args)
 
         self.logger.debug(f"Running {self.dcc_name.title()} RPC call: {data}")
 
         event_topic = constants.event.REMOTE_INTEGRATION_RPC_TOPIC
 
+        if not fetch_reply:
+            return self._publish_event(event_topic, data, callback)
+
         result = self._publish_event(
-            event_topic, data, callback, fetch_reply=fetch_reply
+            event_topic, data, fetch_reply=True, timeout=timeout
         )["result"]
 
         self.logger.debug(
@@ -332,3 +459,35 @@ class JavascriptRPC(object):
         )
 
         return result
+
+    def rpc_async(self, function_name, args=None):
+        """
+        Run remote *function_name* with arguments in *args* list without
+        waiting for the reply. Returns a :class:`ReplyFuture` resolved with
+        the result, several calls can be outstanding at once.
+        Use :meth:`wait_for_reply` to block on the future while keeping the
+        UI responsive.
+        """
+        data = self._rpc_data(function_name, args)
+
+        self.logger.debug(
+            f"Running {self.dcc_name.title()} async RPC call: {data}"
+        )
+
+        reply_future = self._publish_event_async(
+            constants.event.REMOTE_INTEGRATION_RPC_TOPIC, data
+        )
+        result_future = ReplyFuture(
+            reply_future.event_id, reply_future.event_topic
+        )
+
+        def _on_done(future):
+            if future.cancelled():
+                result_future.cancel()
+            elif future.exception() is not None:
+                result_future.set_exception(future.exception())
+            else:
+                result_future.set_result(future.result()["result"])
+
+        reply_future.add_done_callback(_on_done)
+        return result_future
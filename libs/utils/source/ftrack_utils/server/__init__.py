@@ -2,4 +2,8 @@
 # :copyright: Copyright (c) 2024 ftrack
 
 from ftrack_utils.server.track_usage import send_usage_event
-from ftrack_utils.server.send_event import send_async_event, send_event
+from ftrack_utils.server.send_event import (
+    send_async_event,
+    send_event,
+    send_events,
+)
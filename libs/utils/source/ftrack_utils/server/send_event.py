@@ -15,8 +15,14 @@ def send_event(session, action, event_name, metadata=None):
     if not isinstance(metadata, list):
         metadata = [metadata]
 
+    send_events(session, action, [(event_name, data) for data in metadata])
+
+
+def send_events(session, action, events):
+    """Send the (event_name, metadata) *events* in a single call."""
+
     payload = []
-    for data in metadata:
+    for event_name, data in events:
         payload.append(
             {
                 "action": action,
@@ -34,7 +40,10 @@ def send_event(session, action, event_name, metadata=None):
     except Exception as exc:
         # Log but don't raise - usage tracking should never break the application
         logger.warning(
-            'Failed to send event "{}": {}'.format(event_name, exc),
+            'Failed to send events "{}": {}'.format(
+                ", ".join(sorted({event_name for event_name, _ in events})),
+                exc,
+            ),
             exc_info=True,
         )
 
@@ -6,3 +6,8 @@ from ftrack_utils.session.ftrack_api_session import (
     get_event_hub_thread,
     create_event_hub_thread,
 )
+from ftrack_utils.session.session_pool import (
+    SessionPool,
+    get_session_pool,
+    session_pool_enabled,
+)
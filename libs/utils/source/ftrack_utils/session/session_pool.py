@@ -0,0 +1,359 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2024 ftrack
+
+import atexit
+import contextlib
+import logging
+import os
+import threading
+import time
+
+import ftrack_api
+
+logger = logging.getLogger('ftrack_utils:session_pool')
+
+#: Environment variable to disable pooling and always create a new session.
+DISABLE_SESSION_POOL_ENV = 'FTRACK_DISABLE_SESSION_POOL'
+
+#: Environment variable overriding the maximum size of the default pool.
+SESSION_POOL_SIZE_ENV = 'FTRACK_SESSION_POOL_SIZE'
+
+
+def _create_connected_session(timeout=30, poll_interval=0.1):
+    '''Create a new :class:`ftrack_api.Session` and wait until its event hub
+    is connected, raising a :class:`TimeoutError` after *timeout* seconds.'''
+    session = ftrack_api.Session(auto_connect_event_hub=True)
+    deadline = time.monotonic() + timeout
+    while not session.event_hub.connected:
+        if time.monotonic() > deadline:
+            session.close()
+            raise TimeoutError(
+                f'Failed to connect to the event hub within {timeout} seconds.'
+            )
+        time.sleep(poll_interval)
+    return session
+
+
+class _PooledSession(object):
+    '''Book keeping for a session owned by a :class:`SessionPool`.'''
+
+    __slots__ = ('session', 'created', 'last_used')
+
+    def __init__(self, session):
+        self.session = session
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class SessionPool(object):
+    '''
+    Bounded pool of pre-warmed, connected :class:`ftrack_api.Session`.
+
+    Sessions are leased to a single caller at a time, reset when given back
+    and reused, so schema fetching and event hub setup is paid once per
+    session instead of once per call.
+    '''
+
+    @property
+    def max_size(self):
+        '''Maximum number of sessions, leased and idle, owned by the pool.'''
+        return self._max_size
+
+    @property
+    def size(self):
+        '''Number of sessions currently owned by the pool.'''
+        with self._condition:
+            return len(self._idle) + len(self._leased)
+
+    @property
+    def idle_count(self):
+        '''Number of sessions available to be leased.'''
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def leased_count(self):
+        '''Number of sessions currently leased.'''
+        with self._condition:
+            return len(self._leased)
+
+    @property
+    def closed(self):
+        '''Return whether the pool has been closed.'''
+        return self._closed
+
+    def __init__(
+        self,
+        max_size=4,
+        min_size=1,
+        idle_timeout=600,
+        max_age=None,
+        session_factory=None,
+    ):
+        '''
+        Initialise SessionPool.
+
+        *max_size* : Maximum number of sessions owned by the pool, leasing
+        blocks when reached.
+
+        *min_size* : Number of sessions kept warm, these are never evicted
+        for being idle.
+
+        *idle_timeout* : Seconds after which an idle session above
+        *min_size* is closed. None disables idle eviction.
+
+        *max_age* : Seconds after which a session is recycled when given
+        back to the pool. None disables recycling.
+
+        *session_factory* : Callable returning a new connected session,
+        defaults to creating a :class:`ftrack_api.Session` with the event hub
+        connected.
+        '''
+        if max_size < 1:
+            raise ValueError('Session pool max_size must be at least 1.')
+        self.logger = logging.getLogger(
+            __name__ + '.' + self.__class__.__name__
+        )
+        self._max_size = max_size
+        self._min_size = max(0, min(min_size, max_size))
+        self._idle_timeout = idle_timeout
+        self._max_age = max_age
+        self._session_factory = session_factory or _create_connected_session
+
+        self._condition = threading.Condition()
+        # Most recently used sessions are at the end of the list
+        self._idle = []
+        self._leased = {}
+        # Sessions being created, counted against max_size
+        self._pending = 0
+        self._closed = False
+
+    def is_healthy(self, session):
+        '''Return True if *session* is open and its event hub connected.'''
+        try:
+            return not session.closed and session.event_hub.connected
+        except Exception:
+            return False
+
+    def prewarm(self, count=None, asynchronous=True):
+        '''
+        Create sessions until *count* (defaults to min_size) are idle.
+
+        If *asynchronous* is True, sessions are created in a background
+        thread so the caller is not blocked.
+        '''
+        count = self._min_size if count is None else min(count, self._max_size)
+
+        def _prewarm():
+            while True:
+                with self._condition:
+                    if (
+                        self._closed
+                        or len(self._idle) + self._pending >= count
+                        or self._total() >= self._max_size
+                    ):
+                        return
+                    self._pending += 1
+                pooled = self._create()
+                with self._condition:
+                    self._pending -= 1
+                    if pooled is None:
+                        self._condition.notify()
+                        return
+                    if self._closed:
+                        self._close_session(pooled)
+                        return
+                    self._idle.append(pooled)
+                    self._condition.notify()
+
+        if asynchronous:
+            thread = threading.Thread(
+                target=_prewarm, name='ftrack-session-pool-prewarm'
+            )
+            thread.daemon = True
+            thread.start()
+            return thread
+        _prewarm()
+
+    def acquire(self, timeout=None):
+        '''
+        Lease a healthy session from the pool, creating one if the pool is
+        not full. Blocks up to *timeout* seconds for a session to be released
+        when the pool is exhausted, raising :class:`TimeoutError`.
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError('Session pool is closed.')
+                self._evict_idle()
+                pooled = None
+                while self._idle:
+                    candidate = self._idle.pop()
+                    if self.is_healthy(candidate.session):
+                        pooled = candidate
+                        break
+                    self.logger.debug(
+                        f'Discarding unhealthy session {candidate.session}'
+                    )
+                    self._close_session(candidate)
+                if pooled is not None:
+                    self._leased[id(pooled.session)] = pooled
+                    return pooled.session
+                if self._total() < self._max_size:
+                    self._pending += 1
+                else:
+                    remaining = (
+                        None
+                        if deadline is None
+                        else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            'Timed out waiting for a session from the pool.'
+                        )
+                    self._condition.wait(remaining)
+                    continue
+            # Create outside of the lock, this is the slow path.
+            pooled = self._create()
+            with self._condition:
+                self._pending -= 1
+                if pooled is None:
+                    self._condition.notify()
+                    raise RuntimeError('Failed to create a new session.')
+                self._leased[id(pooled.session)] = pooled
+                return pooled.session
+
+    def release(self, session, discard=False):
+        '''
+        Give back a leased *session* to the pool. The session is reset,
+        clearing pending operations and its local cache. If *discard* is
+        True, or the session is unhealthy or too old, it is closed instead.
+        '''
+        with self._condition:
+            pooled = self._leased.pop(id(session), None)
+            if pooled is None:
+                self.logger.warning(
+                    f'Session {session} was not leased from this pool.'
+                )
+                return
+            if not discard and not self._closed:
+                discard = not self.is_healthy(session) or (
+                    self._max_age is not None
+                    and time.monotonic() - pooled.created > self._max_age
+                )
+            if not discard and not self._closed:
+                try:
+                    session.reset()
+                except Exception as error:
+                    self.logger.debug(
+                        f'Failed to reset session {session}: {error}'
+                    )
+                    discard = True
+            if discard or self._closed:
+                self._close_session(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._evict_idle()
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def lease(self, timeout=None):
+        '''
+        Context manager leasing a session for the duration of the block. The
+        session is discarded rather than reused if the block raises.
+        '''
+        session = self.acquire(timeout=timeout)
+        failed = False
+        try:
+            yield session
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.release(session, discard=failed)
+
+    def evict_idle(self):
+        '''Close idle sessions above min_size that exceeded idle_timeout.'''
+        with self._condition:
+            self._evict_idle()
+
+    def close(self):
+        '''Close all idle sessions. Leased sessions are closed on release.'''
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._close_session(self._idle.pop())
+            self._condition.notify_all()
+
+    def _total(self):
+        return len(self._idle) + len(self._leased) + self._pending
+
+    def _evict_idle(self):
+        '''Evict idle sessions, expects the lock to be held.'''
+        if self._idle_timeout is None:
+            return
+        now = time.monotonic()
+        evictable = len(self._idle) + len(self._leased) - self._min_size
+        # Least recently used sessions are at the start of the list
+        while (
+            evictable > 0
+            and self._idle
+            and now - self._idle[0].last_used > self._idle_timeout
+        ):
+            self._close_session(self._idle.pop(0))
+            evictable -= 1
+
+    def _create(self):
+        try:
+            session = self._session_factory()
+        except Exception as error:
+            self.logger.error(f'Failed to create pooled session: {error}')
+            return None
+        self.logger.debug(f'Created pooled session {session}')
+        return _PooledSession(session)
+
+    def _close_session(self, pooled):
+        try:
+            pooled.session.close()
+        except Exception as error:
+            self.logger.debug(
+                f'Failed to close pooled session {pooled.session}: {error}'
+            )
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool():
+    '''
+    Return the process wide :class:`SessionPool`, creating it on first
+    access. Its size can be set through the FTRACK_SESSION_POOL_SIZE
+    environment variable.
+    '''
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool.closed:
+            try:
+                max_size = int(os.environ.get(SESSION_POOL_SIZE_ENV, 4))
+            except ValueError:
+                max_size = 4
+            _default_pool = SessionPool(max_size=max(1, max_size))
+        return _default_pool
+
+
+def session_pool_enabled():
+    '''Return False if pooling is disabled through the environment.'''
+    return os.environ.get(DISABLE_SESSION_POOL_ENV, '').lower() not in (
+        '1',
+        'true',
+        'yes',
+    )
+
+
+@atexit.register
+def _close_default_pool():
+    if _default_pool is not None:
+        _default_pool.close()
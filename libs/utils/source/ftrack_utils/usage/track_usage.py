@@ -1,13 +1,19 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
 
+import atexit
 import logging
-import copy
+import queue
+import threading
+import time
 
-from ftrack_utils.server.track_usage import send_usage_event
+from ftrack_utils.server.send_event import send_events
 
 logger = logging.getLogger("ftrack_utils:usage")
 
+# Queued to have the flusher send the pending events right away
+_FLUSH = object()
+
 # Singleton instance placeholder
 usage_tracker_singleton = None
 
@@ -40,10 +46,23 @@ def get_usage_tracker():
 class UsageTracker:
     """
     A singleton class for tracking usage events.
+
+    Tracked events are queued, up to *max_queue_size*, and sent by a single
+    background thread in batches of up to *batch_size* events, at least
+    every *flush_interval* seconds. Pending events are sent at exit.
     """
 
     _instance = None
 
+    #: Maximum number of events sent in one call.
+    batch_size = 50
+
+    #: Seconds to wait for more events before sending a batch.
+    flush_interval = 5.0
+
+    #: Maximum number of queued events, new events are dropped when full.
+    max_queue_size = 1000
+
     def __new__(cls, session, default_data):
         """
         Create a new instance of the UsageTracker class or return the existing instance.
@@ -53,6 +72,13 @@ class UsageTracker:
             # Initialize the instance only once
             cls._instance._session = session
             cls._instance._default_data = default_data
+            cls._instance._queue = queue.Queue(maxsize=cls.max_queue_size)
+            cls._instance._pending = 0
+            cls._instance._pending_condition = threading.Condition()
+            cls._instance._flusher = None
+            cls._instance._flusher_lock = threading.Lock()
+            cls._instance.dropped_events = 0
+            atexit.register(cls._instance.flush, timeout=5)
         return cls._instance
 
     def update_session(self, session):
@@ -69,16 +95,81 @@ class UsageTracker:
         Track a usage event with the specified *event_name* and *metadata*.
         *event_name* (str): The name of the event to track.
         *metadata* (dict): A dictionary of metadata to include with the event.
+
+        The event is queued to be sent by the background flusher thread.
         """
-        # To not modify the default metadata dictionary instance, we do a deep copy of it.
-        default_metadata = copy.deepcopy(self._default_data)
-        default_metadata.update(metadata)
-        send_usage_event(
-            self._session,
-            event_name,
-            default_metadata,
-            _asynchronous=True,
-        )
+        # Don't modify the default metadata dictionary instance
+        event_metadata = dict(self._default_data)
+        event_metadata.update(metadata)
+        if not self._put((event_name, event_metadata)):
+            self.dropped_events += 1
+            logger.debug(
+                f"Usage event queue full, dropped event: {event_name}"
+            )
+            return
         logger.debug(
             f"Tracking: event_name: {event_name}, metadata: {metadata}"
         )
+
+    def _put(self, item):
+        """Queue *item* for the flusher, return False if the queue is
+        full."""
+        self._ensure_flusher()
+        with self._pending_condition:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                return False
+            self._pending += 1
+        return True
+
+    def _ensure_flusher(self):
+        """Start the flusher thread if not running."""
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._flusher_lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name="ftrack-usage-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+
+    def _flush_loop(self):
+        """Send the queued events in batches."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _FLUSH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            events = [item for item in batch if item is not _FLUSH]
+            if events:
+                try:
+                    send_events(self._session, "_track_usage", events)
+                except Exception as error:
+                    logger.debug(f"Failed to send usage events: {error}")
+            with self._pending_condition:
+                self._pending -= len(batch)
+                self._pending_condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Send the queued events now and wait at most *timeout* seconds for
+        them to be sent. Return True if no event is pending.
+        """
+        with self._pending_condition:
+            if self._pending == 0:
+                return True
+        # If the queue is full, batches are sent without waiting anyway
+        self._put(_FLUSH)
+        with self._pending_condition:
+            return self._pending_condition.wait_for(
+                lambda: self._pending == 0, timeout
+            )
@@ -21,6 +21,7 @@ from ftrack_constants import framework as constants
 from ftrack_utils.extensions.environment import (
     get_extensions_path_from_environment,
 )
+from ftrack_utils.event_hub import run_event_loop
 from ftrack_utils.rpc import JavascriptRPC
 from ftrack_utils.process import MonitorProcess, terminate_current_process
 from ftrack_utils.usage import set_usage_tracker, UsageTracker
@@ -60,6 +61,10 @@ aftereffects_rpc_connection = None
 startup_tools = []
 session = None
 process_monitor = None
+process_watchdog_timer = None
+integration_alive_seconds = 0
+
+PROCESS_WATCHDOG_INTERVAL_SECONDS = 5
 
 # Create Qt application
 app = QtWidgets.QApplication.instance()
@@ -90,6 +95,42 @@ def rpc_process_events_callback():
     app.processEvents()
 
 
+def on_process_exit_callback(pid):
+    """After Effects has exited, shut down right away"""
+    logger.warning(f"After Effects process ({pid}) gone, shutting down!")
+    terminate_current_process()
+
+
+def process_watchdog_callback():
+    """Check After Effects process + panel responsiveness periodically."""
+    global integration_alive_seconds
+
+    integration_alive_seconds += PROCESS_WATCHDOG_INTERVAL_SECONDS
+    if integration_alive_seconds % 10 == 0:
+        logger.info(
+            f"Integration alive has been for {integration_alive_seconds}s, "
+            f"connected: {aftereffects_rpc_connection.connected}"
+        )
+
+    # Check if After Effects still is running
+    if not process_monitor.check_running():
+        logger.warning("After Effects process gone, shutting down!")
+        terminate_current_process()
+        return
+
+    # Check if After Effects panel is alive
+    respond_result = aftereffects_rpc_connection.check_responding()
+    if not respond_result and aftereffects_rpc_connection.connected:
+        aftereffects_rpc_connection.connected = False
+        logger.info(
+            f"After Effects is not responding but process ({process_monitor.process_pid}) "
+            f"is still there, panel temporarily closed?"
+        )
+    elif respond_result and not aftereffects_rpc_connection.connected:
+        aftereffects_rpc_connection.connected = True
+        logger.info("After Effects is responding again, panel alive.")
+
+
 def probe_aftereffects_pid(aftereffects_version):
     """
     Probe the running After Effects PID
@@ -148,7 +189,8 @@ def bootstrap_integration(framework_extensions_path):
         aftereffects_rpc_connection, \
         startup_tools, \
         session, \
-        process_monitor
+        process_monitor, \
+        process_watchdog_timer
 
     logger.debug(
         "After Effects standalone integration initialising, extensions path:"
@@ -279,7 +321,8 @@ def bootstrap_integration(framework_extensions_path):
     process_monitor = MonitorProcess(
         partial(
             probe_aftereffects_pid, aftereffects_rpc_connection.dcc_version
-        )
+        ),
+        on_exit_callback=on_process_exit_callback,
     )
 
     for _ in range(30 * 2):  # Wait 30s for After Effects to connect
@@ -303,49 +346,21 @@ def bootstrap_integration(framework_extensions_path):
         " After Effects."
     )
 
+    process_watchdog_timer = QtCore.QTimer()
+    process_watchdog_timer.timeout.connect(process_watchdog_callback)
+    process_watchdog_timer.start(PROCESS_WATCHDOG_INTERVAL_SECONDS * 1000)
+    logger.info(
+        "After Effects process watchdog started with %ss interval.",
+        PROCESS_WATCHDOG_INTERVAL_SECONDS,
+    )
+
 
 def run_integration():
     """Run After Effects Framework Python standalone part as long as After Effects is alive."""
 
-    global session
-
-    # Run until it's closed, or CTRL+C
-    active_time = 0
-    while True:
-        app.processEvents()
-        session.event_hub.wait(0.01)
-        active_time += 10
-        if active_time % 10000 == 0:
-            logger.info(
-                f"Integration alive has been for {active_time / 1000}s, "
-                f"connected: {aftereffects_rpc_connection.connected}"
-            )
-        # Failsafe check if PS is still alive every 5s
-        if active_time % (5 * 1000) == 0:
-            # Check if After Effects still is running
-            if not process_monitor.check_running():
-                logger.warning("After Effects process gone, shutting down!")
-                terminate_current_process()
-            else:
-                # Check if After Effects panel is alive
-                respond_result = aftereffects_rpc_connection.check_responding()
-                if (
-                    not respond_result
-                    and aftereffects_rpc_connection.connected
-                ):
-                    aftereffects_rpc_connection.connected = False
-                    logger.info(
-                        f"After Effects is not responding but process ({process_monitor.process_pid}) "
-                        f"is still there, panel temporarily closed?"
-                    )
-                elif (
-                    respond_result
-                    and not aftereffects_rpc_connection.connected
-                ):
-                    aftereffects_rpc_connection.connected = True
-                    logger.info(
-                        "After Effects is responding again, panel alive."
-                    )
+    # Run until it's closed, or CTRL+C. The watchdog terminates the
+    # process once After Effects is gone.
+    run_event_loop(session, app)
 
 
 # Find and read DCC config
@@ -166,15 +166,19 @@ class StandardPublisherDialog(BaseContextDialog):
             self.tool_config, filters={'tags': ['component']}
         )
 
+        item_options = self._get_item_options()
         self._accordion_widgets_registry = []
         for _group in component_groups:
+            group_options = item_options.get(_group.get('reference')) or {}
             group_accordion_widget = AccordionBaseWidget(
                 selectable=False,
                 show_checkbox=True,
                 checkable=_group.get('optional', False),
                 title=_group.get('options').get('component'),
                 selected=False,
-                checked=_group.get('enabled', True),
+                checked=group_options.get(
+                    'enabled', _group.get('enabled', True)
+                ),
                 collapsable=True,
                 collapsed=True,
             )
@@ -264,8 +268,18 @@ class StandardPublisherDialog(BaseContextDialog):
         self.set_tool_config_option(
             {'enabled': enabled}, group_config['reference']
         )
-        group_config['enabled'] = enabled
-        self._progress_widget.set_data(build_progress_data(self.tool_config))
+        # The tool-config is shared and read only, the override is read
+        # back from the options of the client.
+        self._progress_widget.set_data(
+            build_progress_data(self.tool_config, self._get_item_options())
+        )
+
+    def _get_item_options(self):
+        '''Return the options set on the plugins and groups of the current
+        tool config, by reference'''
+        return (
+            self.tool_config_options.get(self.tool_config['reference']) or {}
+        )
 
     def _on_run_button_clicked(self):
         '''(Override) Drive the progress widget'''
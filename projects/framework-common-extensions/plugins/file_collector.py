@@ -9,6 +9,7 @@ from ftrack_framework_core.exceptions.plugin import PluginExecutionError
 
 class FileCollectorPlugin(BasePlugin):
     name = 'file_collector'
+    main_thread_only = False
 
     def run(self, store):
         '''
@@ -11,6 +11,7 @@ import clique
 
 class FileExistsValidatorPlugin(BasePlugin):
     name = 'file_exists_validator'
+    main_thread_only = False
 
     def validate(self, file_path):
         '''
@@ -2,6 +2,9 @@
 # :copyright: Copyright (c) 2024 ftrack
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ftrack_utils.session import get_session_pool, session_pool_enabled
 
 from ftrack_framework_core.plugin import BasePlugin
 from ftrack_framework_core.exceptions.plugin import PluginExecutionError
@@ -10,6 +13,14 @@ from ftrack_framework_core.exceptions.plugin import PluginExecutionError
 class PublishToFtrack(BasePlugin):
     name = 'publish_to_ftrack'
 
+    #: Default number of components uploaded in parallel, overridden by the
+    #: max_workers option.
+    DEFAULT_MAX_WORKERS = 4
+
+    #: Default number of times failed uploads are retried, overridden by the
+    #: upload_retries option.
+    DEFAULT_UPLOAD_RETRIES = 1
+
     # TODO: review this code to check if the rollback works as it is.
     def run(self, store):
         '''
@@ -82,37 +93,20 @@ class PublishToFtrack(BasePlugin):
             # Undo version creation from this point in case it fails
             rollback = True
 
-            results = {}
-
-            for component_name in components:
-                if not store['components'].get(component_name):
-                    continue
-                # TODO: allow multiple paths
-                if component_name == 'thumbnail':
-                    self._create_thumbnail(
-                        asset_version_object,
-                        store['components'][component_name].get(
-                            'exported_path'
-                        ),
-                    )
-                elif component_name == 'reviewable':
-                    self._create_reviewable(
-                        asset_version_object,
-                        store['components'][component_name].get(
-                            'exported_path'
-                        ),
-                    )
-                else:
-                    self._create_component(
-                        asset_version_object,
-                        component_name,
-                        store['components'][component_name].get(
-                            'exported_path'
-                        ),
-                    )
-                store['components'][component_name][
-                    'published_to_ftrack'
-                ] = True
+            # TODO: allow multiple paths
+            uploads = [
+                (
+                    component_name,
+                    store['components'][component_name].get('exported_path'),
+                )
+                for component_name in components
+                if store['components'].get(component_name)
+            ]
+            self._upload_components(asset_version_object, uploads)
+            for component_name, _ in uploads:
+                store['components'][component_name]['published_to_ftrack'] = (
+                    True
+                )
             self.session.commit()
             rollback = False
         except:
@@ -215,8 +209,197 @@ class PublishToFtrack(BasePlugin):
         )
         return asset_version_object
 
+    def _upload_components(self, asset_version_entity, uploads):
+        '''
+        Upload the given *uploads*, a list of (component name, path) tuples,
+        to *asset_version_entity*.
+
+        Independent components are uploaded in parallel, each on its own
+        session leased from the session pool, and progress is reported as
+        they complete. Failed uploads, and only those, are retried before
+        raising a :class:`PluginExecutionError`.
+        '''
+        max_workers = min(
+            int(self.options.get('max_workers', self.DEFAULT_MAX_WORKERS)),
+            len(uploads),
+        )
+        retries = int(
+            self.options.get('upload_retries', self.DEFAULT_UPLOAD_RETRIES)
+        )
+        pool = get_session_pool() if session_pool_enabled() else None
+        if pool is None:
+            max_workers = 1
+        else:
+            # Leave room for the sessions already leased, including the one
+            # running this plugin.
+            max_workers = min(max_workers, pool.max_size - pool.leased_count)
+
+        pending = list(uploads)
+        attempt = 0
+        while True:
+            if max_workers > 1:
+                failed = self._upload_parallel(
+                    pool,
+                    asset_version_entity['id'],
+                    pending,
+                    max_workers,
+                    retry=attempt > 0,
+                )
+            else:
+                failed = self._upload_sequential(
+                    asset_version_entity, pending, retry=attempt > 0
+                )
+            if not failed:
+                return
+            if attempt >= retries:
+                raise PluginExecutionError(
+                    'Failed to upload components: {}'.format(
+                        ', '.join(
+                            f'{component_name} ({error})'
+                            for component_name, error in failed.items()
+                        )
+                    )
+                )
+            attempt += 1
+            pending = [upload for upload in pending if upload[0] in failed]
+            self.logger.warning(
+                f'Retrying upload of {list(failed)}, attempt {attempt} of '
+                f'{retries}.'
+            )
+
+    def _upload_sequential(self, asset_version_entity, uploads, retry=False):
+        '''
+        Upload *uploads* one after another with the plugin session, return
+        a dictionary of the failed component names and their error. *retry*
+        is True when uploading components that failed before.
+        '''
+        failed = {}
+        for index, (component_name, component_path) in enumerate(uploads):
+            try:
+                self._upload(
+                    self.session,
+                    asset_version_entity,
+                    component_name,
+                    component_path,
+                    retry=retry,
+                )
+            except Exception as error:
+                self.logger.exception(error)
+                failed[component_name] = error
+                # Drop the operations of the failed upload
+                self.session.rollback()
+            self._report_upload(component_name, index + 1, uploads, failed)
+        return failed
+
+    def _upload_parallel(
+        self, pool, asset_version_id, uploads, max_workers, retry=False
+    ):
+        '''
+        Upload *uploads* on *max_workers* threads, each using a session
+        leased from *pool*, return a dictionary of the failed component
+        names and their error. *retry* is True when uploading components
+        that failed before.
+        '''
+        failed = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='ftrack-publish'
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._upload_with_leased_session,
+                    pool,
+                    asset_version_id,
+                    component_name,
+                    component_path,
+                    retry,
+                ): component_name
+                for component_name, component_path in uploads
+            }
+            # Progress is reported from this thread as uploads complete.
+            for index, future in enumerate(as_completed(futures)):
+                component_name = futures[future]
+                try:
+                    future.result()
+                except Exception as error:
+                    self.logger.exception(error)
+                    failed[component_name] = error
+                self._report_upload(component_name, index + 1, uploads, failed)
+        return failed
+
+    def _upload_with_leased_session(
+        self, pool, asset_version_id, component_name, component_path, retry
+    ):
+        '''(Run in worker thread) Upload a component on a leased session.'''
+        with pool.lease() as session:
+            asset_version_entity = session.get(
+                'AssetVersion', asset_version_id
+            )
+            self._upload(
+                session,
+                asset_version_entity,
+                component_name,
+                component_path,
+                retry=retry,
+            )
+
+    def _upload(
+        self,
+        session,
+        asset_version_entity,
+        component_name,
+        component_path,
+        retry=False,
+    ):
+        '''
+        Create the component, thumbnail or reviewable named *component_name*
+        from *component_path* on *asset_version_entity* through *session*.
+        If *retry* is True, components left behind by a previous failed
+        attempt are removed first.
+        '''
+        if component_name == 'thumbnail':
+            self._create_thumbnail(asset_version_entity, component_path)
+        elif component_name == 'reviewable':
+            self._create_reviewable(asset_version_entity, component_path)
+        else:
+            if retry:
+                self._delete_partial_components(
+                    session, asset_version_entity, component_name
+                )
+            self._create_component(
+                asset_version_entity,
+                component_name,
+                component_path,
+                session=session,
+            )
+
+    def _delete_partial_components(
+        self, session, asset_version_entity, component_name
+    ):
+        '''Delete components named *component_name* on
+        *asset_version_entity* left behind by a failed upload.'''
+        components = session.query(
+            f'Component where version_id is {asset_version_entity["id"]}'
+            f' and name is "{component_name}"'
+        ).all()
+        for component in components:
+            session.delete(component)
+        if components:
+            session.commit()
+
+    def _report_upload(self, component_name, completed, uploads, failed):
+        '''Report progress of the upload of *component_name*.'''
+        status = 'failed' if component_name in failed else 'published'
+        self.report_progress(
+            f'Component {component_name} {status} '
+            f'({completed}/{len(uploads)})'
+        )
+
     def _create_component(
-        self, asset_version_entity, component_name, component_path
+        self,
+        asset_version_entity,
+        component_name,
+        component_path,
+        session=None,
     ):
         '''
         Creates a ftrack component on the given *asset_version_entity* with the given
@@ -228,11 +411,14 @@ class PublishToFtrack(BasePlugin):
         *component_name* : Name of the component to be created.
 
         *component_path* : Linked path of the component data.
+
+        *session* : Session to create the component with, defaults to the
+        plugin session.
         '''
         self.logger.debug(
             f'publishing component:{component_name} to from {component_path}'
         )
-        location = self.session.pick_location()
+        location = (session or self.session).pick_location()
 
         asset_version_entity.create_component(
             component_path, data={'name': component_name}, location=location
@@ -1,16 +1,16 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 ftrack
 import os.path
-import shutil
 
 import clique
 
 from ftrack_framework_core.plugin import BasePlugin
-from ftrack_utils.paths import get_temp_path
+from ftrack_utils.paths import get_temp_path, copy_file, copy_sequence
 
 
 class RenameExporterPlugin(BasePlugin):
     name = 'rename_file_exporter'
+    main_thread_only = False
 
     def check_collection(self, path):
         '''
@@ -43,7 +43,7 @@ class RenameExporterPlugin(BasePlugin):
                 destination_path, base_name + extension_format
             )
 
-        return shutil.copy(origin_path, destination_path)
+        return copy_file(origin_path, destination_path)
 
     def run(self, store):
         '''
@@ -60,18 +60,22 @@ class RenameExporterPlugin(BasePlugin):
         collection = self.check_collection(collected_path)
 
         if collection:
-            new_location = []
-            for file_path in collection:
-                if export_destination and not os.path.isdir(
-                    export_destination
-                ):
-                    export_destination = os.path.dirname(export_destination)
-                if not export_destination:
-                    export_destination = get_temp_path(is_directory=True)
-                new_location.append(self.rename(file_path, export_destination))
-                self.logger.debug(
-                    f"Copied {collected_path} to {export_destination}."
-                )
+            if export_destination and not os.path.isdir(export_destination):
+                export_destination = os.path.dirname(export_destination)
+            if not export_destination:
+                export_destination = get_temp_path(is_directory=True)
+            new_location = copy_sequence(
+                collection,
+                export_destination,
+                max_workers=self.options.get('max_workers'),
+                link=self.options.get('hardlink', False),
+                progress_callback=lambda progress: self.report_progress(
+                    str(progress)
+                ),
+            )
+            self.logger.debug(
+                f"Copied {collected_path} to {export_destination}."
+            )
             collections, remainder = clique.assemble(new_location)
             store['components'][component_name]['exported_path'] = collections[
                 0
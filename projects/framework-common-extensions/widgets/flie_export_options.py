@@ -68,10 +68,10 @@ class FileExportOptionsWidget(BaseWidget):
             elif type(value) == bool:
                 # TODO: implement
                 pass
-            elif type(value) == list:
+            elif isinstance(value, list):
                 # TODO: implement
                 pass
-            elif type(value) == dict:
+            elif isinstance(value, dict):
                 # TODO: implement
                 pass
             else:
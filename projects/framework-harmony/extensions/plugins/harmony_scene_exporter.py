@@ -25,18 +25,17 @@ class HarmonySceneExporterPlugin(BasePlugin):
         try:
             harmony_connection = TCPRPCClient.instance()
 
-            # Persist the scene so the on-disk folder is up to date.
-            # RPC timeouts are in milliseconds.
-            save_response = harmony_connection.rpc("saveScene", timeout=120000)
+            # Persist the scene so the on-disk folder is up to date, and
+            # resolve its path in the same round trip - Harmony runs the
+            # calls in order. RPC timeouts are in milliseconds.
+            save_response, scene_path_response = harmony_connection.rpc_many(
+                [("saveScene", None), ("getScenePath", None)], timeout=150000
+            )
             if not save_response.get("result"):
                 raise PluginExecutionError(
                     f"Error saving the scene: "
                     f"{save_response.get('error_message')}"
                 )
-
-            scene_path_response = harmony_connection.rpc(
-                "getScenePath", timeout=30000
-            )
         except Exception as e:
             self.logger.exception(e)
             raise PluginExecutionError(
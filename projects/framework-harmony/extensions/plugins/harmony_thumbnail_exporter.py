@@ -1,9 +1,8 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2014-2023 ftrack
 import clique
-import shutil
 
-from ftrack_utils.paths import get_temp_path
+from ftrack_utils.paths import get_temp_path, copy_file
 
 from ftrack_framework_core.plugin import BasePlugin
 from ftrack_framework_core.exceptions.plugin import PluginExecutionError
@@ -53,6 +52,6 @@ class HarmonyThumbnailExporterPlugin(BasePlugin):
         src = collection.format("{head}%s{tail}" % middle_frame)
 
         self.logger.debug(f"Copying {src} to {image_path}")
-        shutil.copy(src, image_path)
+        copy_file(src, image_path)
 
         store["components"][component_name]["exported_path"] = image_path
@@ -5,6 +5,7 @@ import json
 import time
 import uuid
 import os
+from concurrent.futures import Future, InvalidStateError
 
 try:
     from PySide6 import QtCore, QtNetwork
@@ -15,6 +16,15 @@ import ftrack_constants.framework as constants
 from ftrack_utils.framework.remote import get_remote_integration_session_id
 
 
+class ReplyFuture(Future):
+    """Future resolved with the data of the DCC reply to an event."""
+
+    def __init__(self, event_id, topic):
+        super(ReplyFuture, self).__init__()
+        self.event_id = event_id
+        self.topic = topic
+
+
 class TCPRPCClient(QtCore.QObject):
     """Role-agnostic RPC channel to a DCC that cannot import the ftrack
     API (Harmony/Javascript).
@@ -28,11 +38,22 @@ class TCPRPCClient(QtCore.QObject):
     engine. The class name is kept (callers do
     ``TCPRPCClient.instance().rpc(...)``); only the socket lifecycle
     moved from dialing out to listening.
+
+    Requests are multiplexed: any number of events can await a reply at
+    once, each tracked by a :class:`ReplyFuture` keyed on its event id.
+    Outgoing events are coalesced into a single socket write per event
+    loop iteration, so a batch sent with :meth:`rpc_many` costs one round
+    trip to the DCC instead of one per call.
     """
 
-    MAX_WRITE_RESPONSE_TIME = 10000
     INT32_SIZE = 4
     REPLY_WAIT_TIMEOUT = 5 * 60 * 1000  # Wait 5 minutes tops
+    WAIT_LOG_INTERVAL = 2000
+
+    # Emitted with the event id and data of every reply received
+    reply_received = QtCore.Signal(str, object)
+    # Emitted when the DCC connection is lost
+    connection_lost = QtCore.Signal()
 
     # Connection should be a singleton accessible also during plugin execution
     _instance = None
@@ -145,9 +166,12 @@ class TCPRPCClient(QtCore.QObject):
         self._ever_connected = False
 
         self._on_listen_failure = None
-        self._handle_reply_event_callback = None
         self._blocksize = 0
-        self._reply_event_data = None
+        # Futures awaiting a reply, keyed by the id of the sent event
+        self._pending_replies = {}
+        # Framed events waiting to be written to the socket in one go
+        self._write_buffer = QtCore.QByteArray()
+        self._flush_scheduled = False
 
         self._initialise()
 
@@ -289,6 +313,11 @@ class TCPRPCClient(QtCore.QObject):
             self._ever_connected = True
             self.on_connected_callback()
 
+    @property
+    def pending_reply_count(self):
+        """Return the number of sent events awaiting a reply."""
+        return len(self._pending_replies)
+
     def _on_bytes_written(self, bytes):
         """Callback on *bytes* written to the socket"""
         self.logger.debug(f"Connection bytes written: {bytes}")
@@ -305,7 +334,12 @@ class TCPRPCClient(QtCore.QObject):
             self._receive()
 
     def _send(self, data):
-        """Send *data* to the DCC as string."""
+        """Queue *data* to be sent to the DCC as string.
+
+        Writes are coalesced: every event queued before control returns to
+        the Qt event loop goes out in a single socket write, see
+        :meth:`flush`.
+        """
         # make sure we are connected
         if self._connection is None or self._connection.state() in (
             QtNetwork.QAbstractSocket.SocketState.UnconnectedState,
@@ -321,37 +355,54 @@ class TCPRPCClient(QtCore.QObject):
 
         outstr.writeString(str(data))
 
-        self._connection.write(block)
+        self._write_buffer.append(block)
 
-        if not self._connection.waitForBytesWritten(
-            self.MAX_WRITE_RESPONSE_TIME
-        ):
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """Write all queued events to the socket. Qt sends the data
+        asynchronously, the caller is not blocked until it is written."""
+        self._flush_scheduled = False
+        if self._write_buffer.isEmpty():
+            return
+        block = self._write_buffer
+        self._write_buffer = QtCore.QByteArray()
+        if self._connection is None:
+            self.logger.warning(
+                f"Dropping {block.size()} bytes, not connected to DCC."
+            )
+            return
+        if self._connection.write(block) == -1:
             self.logger.error(
                 f"Could not write to socket: {self._connection.errorString()}"
             )
         else:
-            self.logger.debug(f"Sent data ok. {self._connection.state()}")
+            self.logger.debug(
+                f"Queued {block.size()} bytes for writing. "
+                f"{self._connection.state()}"
+            )
 
     def _receive(self):
-        """Receive data from the DCC"""
+        """Receive all complete events available from the DCC"""
         self.logger.debug("Receiving data")
 
         stream = QtCore.QDataStream(self._connection)
         stream.setVersion(QtCore.QDataStream.Version.Qt_4_6)
 
-        i = 0
-        while self._connection.bytesAvailable() > 0:
-            if (
-                self._blocksize == 0
-                and self._connection.bytesAvailable() >= self.INT32_SIZE
-            ) or (0 < self._blocksize <= self._connection.bytesAvailable()):
+        while self._connection is not None:
+            if self._blocksize == 0:
+                if self._connection.bytesAvailable() < self.INT32_SIZE:
+                    break
                 self._blocksize = stream.readInt32()
-            if 0 < self._blocksize <= self._connection.bytesAvailable():
-                data = stream.readRawData(self._blocksize)
-                raw_event = data.decode("utf-8")
-                self._decode_and_process_event(raw_event)
-                self._blocksize = 0
-                i += 1
+            # Wait for the rest of the event to arrive
+            if self._connection.bytesAvailable() < self._blocksize:
+                break
+            data = stream.readRawData(self._blocksize)
+            self._blocksize = 0
+            raw_event = data.decode("utf-8")
+            self._decode_and_process_event(raw_event)
 
         return None
 
@@ -379,13 +430,19 @@ class TCPRPCClient(QtCore.QObject):
             return None
 
         # Is someone waiting for a reply?
-        if self._handle_reply_event_callback:
-            if event.get("in_reply_to_event") == self._reply_id:
-                self.logger.info(f"Got reply for event: {self._reply_id}")
-                self._handle_reply_event_callback(
-                    event["topic"], event_data, event["id"]
-                )
-                return None
+        reply_id = event.get("in_reply_to_event")
+        future = self._pending_replies.pop(reply_id, None)
+        if future is not None:
+            self.logger.info(
+                f"Got reply for event: {reply_id} ({event['topic']})"
+            )
+            try:
+                future.set_result(event_data)
+            except InvalidStateError:
+                # Cancelled after timing out
+                pass
+            self.reply_received.emit(reply_id, event_data)
+            return None
 
         if (
             event["topic"]
@@ -413,102 +470,135 @@ class TCPRPCClient(QtCore.QObject):
         @param event_data: The data of the event
         @param in_reply_to_event: The event to reply to
         @param synchronous: If the event should be sent synchronously
-        @param timeout: The timeout in seconds to wait for a response, -1 and it will wait forever.
+        @param timeout: The timeout in milliseconds to wait for a response, -1 and it will wait forever.
         """
+        if not synchronous:
+            self._send_event(topic, event_data, in_reply_to_event)
+            return None
+        future = self.send_async(topic, event_data)
+        return self.wait_for_replies([future], timeout=timeout)[0]
+
+    def _send_event(
+        self, topic, event_data, in_reply_to_event=None, future_id=None
+    ):
+        """Build and queue an event, returning its id."""
         event_data["remote_integration_session_id"] = (
             self.remote_integration_session_id
         )
         event = {
-            "id": str(uuid.uuid4()),
+            "id": future_id or str(uuid.uuid4()),
             "topic": topic,
             "data": event_data,
         }
         if in_reply_to_event:
             event["in_reply_to_event"] = in_reply_to_event
 
-        st = time.time()
         self._send(json.dumps(event))
-        et = time.time()
-        self.logger.info(
-            f"Sent {topic} event (took: {(et - st)} secs): {event}"
-        )
+        self.logger.info(f"Sent {topic} event: {event}")
+        return event["id"]
+
+    def send_async(self, topic, event_data):
+        """
+        Send an event to the DCC without waiting, returning a
+        :class:`ReplyFuture` resolved with the reply data. Any number of
+        events can be awaiting a reply at once.
+        """
+        future = ReplyFuture(str(uuid.uuid4()), topic)
+        self._pending_replies[future.event_id] = future
+        try:
+            self._send_event(topic, event_data, future_id=future.event_id)
+        except Exception:
+            self._pending_replies.pop(future.event_id, None)
+            raise
+        return future
 
-        if synchronous:
-            self._reply_event_data = None
+    def wait_for_replies(self, futures, timeout=None):
+        """
+        Block until all *futures* are resolved and return their results in
+        order, running a local Qt event loop woken as soon as a reply or
+        disconnection happens.
 
-            def handle_reply_event(topic, event_data, id):
-                self.logger.info(
-                    f"Registering incoming reply event: {topic} ({id}), "
-                    f"data: {event_data}"
-                )
-                self._reply_event_data = event_data
+        @param futures: List of :class:`ReplyFuture` returned by send_async
+        @param timeout: The timeout in milliseconds to wait for all replies, -1 and it will wait forever.
+        """
+        wait = timeout or self.REPLY_WAIT_TIMEOUT
+        started = time.monotonic()
+        deadline = None if wait < 0 else started + wait / 1000.0
+        ids = ", ".join(future.event_id for future in futures)
 
-            self._reply_id = event["id"]
-            self._handle_reply_event_callback = handle_reply_event
+        # Events have to be on the wire before we can get replies
+        self.flush()
 
-            wait = timeout or self.REPLY_WAIT_TIMEOUT
-            waited = 0
-            try:
-                self.logger.info(
-                    f"Waiting to receive reply for {event['id']}..."
-                )
-                while True:
-                    if self.process_events_callback:
-                        self.process_events_callback()
-                    time.sleep(0.1)
-                    waited += 100
-
-                    # Fail fast if the DCC connection drops mid-wait (e.g.
-                    # a scene switch during a long renderSequence) instead
-                    # of spinning to the full timeout.
-                    if not self.connected:
-                        raise Exception(
-                            f"DCC connection dropped while waiting for "
-                            f"reply for event: {event['id']}"
-                        )
+        loop = QtCore.QEventLoop()
+        timer = QtCore.QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
 
-                    if -1 < wait <= waited:
+        def on_reply(event_id, event_data):
+            if all(future.done() for future in futures):
+                loop.quit()
+
+        self.reply_received.connect(on_reply)
+        self.connection_lost.connect(loop.quit)
+        try:
+            self.logger.info(f"Waiting to receive reply for {ids}...")
+            while not all(future.done() for future in futures):
+                # Fail fast if the DCC connection drops mid-wait (e.g.
+                # a scene switch during a long renderSequence) instead
+                # of spinning to the full timeout.
+                if not self.connected:
+                    raise Exception(
+                        f"DCC connection dropped while waiting for "
+                        f"reply for event: {ids}"
+                    )
+                interval = self.WAIT_LOG_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         raise Exception(
-                            f"Timeout waiting for reply for event: {event['id']}"
-                        )
-                    elif waited % 2000 == 0:
-                        self.logger.info(
-                            f"Waited {int(waited / 1000)}s for reply..."
+                            f"Timeout waiting for reply for event: {ids}"
                         )
-
-                    if self._reply_event_data:
-                        return self._reply_event_data
-
-            finally:
-                self._handle_reply_event_callback = None
-                self._reply_id = None
+                    interval = min(interval, int(remaining * 1000) + 1)
+                if self.process_events_callback:
+                    self.process_events_callback()
+                if all(future.done() for future in futures):
+                    break
+                timer.start(interval)
+                if hasattr(loop, "exec"):
+                    loop.exec()
+                else:
+                    loop.exec_()
+                if not all(future.done() for future in futures):
+                    self.logger.info(
+                        f"Waited {int(time.monotonic() - started)}s for "
+                        f"reply..."
+                    )
+            return [future.result() for future in futures]
+        except Exception:
+            for future in futures:
+                if not future.done():
+                    self._pending_replies.pop(future.event_id, None)
+                    future.cancel()
+            raise
+        finally:
+            timer.stop()
+            self.reply_received.disconnect(on_reply)
+            self.connection_lost.disconnect(loop.quit)
 
     def send_reply(self, event, data):
         """Send a reply to an event back to DCC"""
         self.send(event["topic"], data, in_reply_to_event=event["id"])
 
-    def rpc(self, function_name, args=None, timeout=None):
-        """
-        Make a remote procedure call to the DCC and return the result.
-
-        :param function_name: The function to execute
-        :param args: The arguments to pass
-        :param timeout: The timeout in seconds to wait for a response, -1 and it will wait forever.
-        :return: The result return from DCC.
-        """
-
-        data = {
+    def _rpc_data(self, function_name, args):
+        """Return the RPC event payload for *function_name* with *args*."""
+        return {
             "remote_integration_session_id": self.remote_integration_session_id,
             "function_name": function_name,
             "args": args or [],
         }
 
-        self.logger.debug(f"Running {self.dcc_name.title()} RPC call: {data}")
-
-        event_topic = constants.event.REMOTE_INTEGRATION_RPC_TOPIC
-
-        response = self.send(event_topic, data, None, True, timeout=timeout)
-
+    def _check_rpc_response(self, response):
+        """Validate and return RPC *response*."""
         self.logger.debug(
             f"Got {self.dcc_name.title()} RPC response: {response}"
         )
@@ -520,6 +610,53 @@ class TCPRPCClient(QtCore.QObject):
 
         return response
 
+    def rpc(self, function_name, args=None, timeout=None):
+        """
+        Make a remote procedure call to the DCC and return the result.
+
+        :param function_name: The function to execute
+        :param args: The arguments to pass
+        :param timeout: The timeout in milliseconds to wait for a response, -1 and it will wait forever.
+        :return: The result return from DCC.
+        """
+        return self.rpc_many([(function_name, args)], timeout=timeout)[0]
+
+    def rpc_async(self, function_name, args=None):
+        """
+        Make a remote procedure call to the DCC without waiting, returning
+        a :class:`ReplyFuture` resolved with the response. Pass it to
+        :meth:`wait_for_replies` to block until it is resolved.
+
+        :param function_name: The function to execute
+        :param args: The arguments to pass
+        """
+        data = self._rpc_data(function_name, args)
+
+        self.logger.debug(f"Running {self.dcc_name.title()} RPC call: {data}")
+
+        return self.send_async(
+            constants.event.REMOTE_INTEGRATION_RPC_TOPIC, data
+        )
+
+    def rpc_many(self, calls, timeout=None):
+        """
+        Make a batch of remote procedure calls, sent to the DCC in a single
+        write and awaited together, returning the responses in order. The
+        DCC still executes the calls one after the other.
+
+        :param calls: List of (function_name, args) tuples
+        :param timeout: The timeout in milliseconds to wait for all responses, -1 and it will wait forever.
+        :return: List of results returned from DCC.
+        """
+        futures = [
+            self.rpc_async(function_name, args)
+            for function_name, args in calls
+        ]
+        return [
+            self._check_rpc_response(response)
+            for response in self.wait_for_replies(futures, timeout=timeout)
+        ]
+
     def error(self, socketError):
         """Handle socket errors"""
         if (
@@ -551,8 +688,10 @@ class TCPRPCClient(QtCore.QObject):
         """Stop listening and drop any live DCC connection."""
         self._server.close()
         if self._connection is not None:
+            self.flush()
             self._connection.abort()
             self._connection = None
+        self._fail_pending_replies(Exception("RPC server closed"))
 
     def _on_disconnected(self):
         """Callback on disconnection of the DCC socket.
@@ -577,3 +716,18 @@ class TCPRPCClient(QtCore.QObject):
         self.connected = False
         self._connection = None
         self._blocksize = 0
+        self._write_buffer = QtCore.QByteArray()
+        self._fail_pending_replies(
+            Exception("DCC connection dropped while waiting for reply")
+        )
+        self.connection_lost.emit()
+
+    def _fail_pending_replies(self, error):
+        """Resolve all futures awaiting a reply with *error*."""
+        pending = self._pending_replies
+        self._pending_replies = {}
+        for future in pending.values():
+            try:
+                future.set_exception(error)
+            except InvalidStateError:
+                pass
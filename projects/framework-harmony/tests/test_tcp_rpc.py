@@ -0,0 +1,198 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2026 ftrack
+
+"""Unit tests for the multiplexed TCP RPC channel (no DCC required).
+
+A QTcpSocket stand-in plays Harmony's role: it dials the standalone
+server, answers the context-data handshake and replies to RPC events
+using the same wire framing as resource/bootstrap/js/configure.js.
+"""
+
+import importlib.util
+import json
+import struct
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from PySide6 import QtCore, QtNetwork
+
+# Importing the ftrack_framework_harmony package bootstraps the whole
+# standalone integration, load the RPC module from the source tree instead.
+TCP_RPC_PATH = (
+    Path(__file__).parent.parent
+    / "source"
+    / "ftrack_framework_harmony"
+    / "utils"
+    / "tcp_rpc.py"
+)
+
+SESSION_ID = "test-session-id"
+
+
+class FakeClient:
+    context_id = "context-id"
+
+
+class FakeHarmony(QtCore.QObject):
+    """Client side of the wire protocol, replying to RPC events.
+
+    Events are answered in the reverse order of arrival once
+    *batch_size* events are buffered, to prove replies are matched by id.
+    Calls to ``hang`` are never answered.
+    """
+
+    def __init__(self, port, batch_size=1):
+        super().__init__()
+        self.batch_size = batch_size
+        self.received = []
+        self.reads = 0
+        self._buffer = b""
+        self._queued = []
+        self.socket = QtNetwork.QTcpSocket(self)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self.socket.connectToHost("127.0.0.1", port)
+
+    def _on_ready_read(self):
+        self.reads += 1
+        self._buffer += bytes(self.socket.readAll())
+        while len(self._buffer) >= 4:
+            (size,) = struct.unpack(">I", self._buffer[:4])
+            if len(self._buffer) < 4 + size:
+                break
+            # QDataStream.writeString sends UTF-16, the JS side drops the
+            # NUL bytes.
+            payload = self._buffer[4 : 4 + size].replace(b"\x00", b"")
+            self._buffer = self._buffer[4 + size :]
+            event = json.loads(payload.decode("utf-8"))
+            self.received.append(event)
+            if event["data"].get("function_name") != "hang":
+                self._queued.append(event)
+        if len(self._queued) >= self.batch_size:
+            for event in reversed(self._queued):
+                self._reply(event)
+            self._queued = []
+
+    def _reply(self, event):
+        data = {"integration_session_id": SESSION_ID}
+        if "function_name" in event["data"]:
+            data["result"] = event["data"]["args"]
+        reply = json.dumps(
+            {
+                "id": str(uuid.uuid4()),
+                "topic": event["topic"],
+                "in_reply_to_event": event["id"],
+                "data": data,
+            }
+        ).encode("utf-8")
+        self.socket.write(struct.pack(">i", len(reply)) + reply)
+
+
+def process_events_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents(
+            QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50
+        )
+    return predicate()
+
+
+@pytest.fixture(scope="module")
+def tcp_rpc():
+    """The tcp_rpc module, loaded from the source tree."""
+    spec = importlib.util.spec_from_file_location(
+        "harmony_tcp_rpc_under_test", TCP_RPC_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def qt_application():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def rpc_client(tcp_rpc, qt_application, monkeypatch):
+    monkeypatch.setenv("FTRACK_HARMONY_VERSION", "24")
+    monkeypatch.setenv("FTRACK_REMOTE_INTEGRATION_SESSION_ID", SESSION_ID)
+    connected = []
+    client = tcp_rpc.TCPRPCClient(
+        "harmony",
+        "localhost",
+        0,
+        FakeClient(),
+        [],
+        lambda: connected.append(True),
+        None,
+        None,
+    )
+    client.listen(lambda: pytest.fail("Could not listen"))
+    client.connected_callbacks = connected
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def fake_harmony(rpc_client):
+    harmony = FakeHarmony(rpc_client._server.serverPort())
+    assert process_events_until(lambda: rpc_client.connected_callbacks)
+    return harmony
+
+
+def test_handshake_is_answered(rpc_client, fake_harmony):
+    assert rpc_client.connected
+    assert fake_harmony.received[0]["data"]["context_id"] == "context-id"
+    assert rpc_client.pending_reply_count == 0
+
+
+def test_rpc_returns_response(rpc_client, fake_harmony):
+    response = rpc_client.rpc("getScenePath", ["a"], timeout=5000)
+    assert response["result"] == ["a"]
+
+
+def test_rpc_many_is_pipelined(rpc_client, fake_harmony):
+    fake_harmony.batch_size = 3
+    reads_before = fake_harmony.reads
+
+    responses = rpc_client.rpc_many(
+        [("first", [1]), ("second", [2]), ("third", [3])], timeout=5000
+    )
+
+    assert [response["result"] for response in responses] == [[1], [2], [3]]
+    # All three requests went out in a single coalesced write.
+    assert fake_harmony.reads - reads_before == 1
+
+
+def test_outstanding_rpcs_resolve_out_of_order(rpc_client, fake_harmony):
+    fake_harmony.batch_size = 2
+    first = rpc_client.rpc_async("first", [1])
+    second = rpc_client.rpc_async("second", [2])
+    assert rpc_client.pending_reply_count == 2
+
+    results = rpc_client.wait_for_replies([first, second], timeout=5000)
+
+    assert [result["result"] for result in results] == [[1], [2]]
+    assert rpc_client.pending_reply_count == 0
+
+
+def test_rpc_timeout(rpc_client, fake_harmony):
+    started = time.monotonic()
+    with pytest.raises(Exception, match="Timeout"):
+        rpc_client.rpc("hang", timeout=200)
+
+    assert time.monotonic() - started < 2
+    assert rpc_client.pending_reply_count == 0
+
+
+def test_disconnect_fails_pending_rpcs(rpc_client, fake_harmony):
+    future = rpc_client.rpc_async("hang")
+    rpc_client.flush()
+    QtCore.QTimer.singleShot(100, fake_harmony.socket.disconnectFromHost)
+
+    with pytest.raises(Exception, match="dropped"):
+        rpc_client.wait_for_replies([future], timeout=5000)
+    assert not rpc_client.connected
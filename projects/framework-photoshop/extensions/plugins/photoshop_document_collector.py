@@ -19,34 +19,48 @@ class PhotoshopDocumentCollectorPlugin(BasePlugin):
         # Get existing RPC connection instance
         photoshop_connection = JavascriptRPC.instance()
 
-        # Get document data containing the path
-        try:
-            document_data = photoshop_connection.rpc('getDocumentData')
-        except Exception as e:
-            self.logger.exception(e)
-            raise PluginExecutionError(
-                f'Exception querying the document data: {e}'
-            )
-        # Will return a dictionary with information about the document,
-        # an empty dict is returned if no document is open.
+        # Issue both queries at once, so they are resolved in a single round
+        # trip to Photoshop
+        document_data_reply = photoshop_connection.rpc_async('getDocumentData')
+        document_saved_reply = photoshop_connection.rpc_async('documentSaved')
 
-        self.logger.debug(f'Got Photoshop document data: {document_data}')
-
-        if not document_data:
-            raise PluginExecutionError(
-                'No document data available. Please have'
-                ' an active work document before you can '
-                'publish'
-            )
-
-        # Check if document is saved
         try:
-            document_saved_result = photoshop_connection.rpc('documentSaved')
-        except Exception as e:
-            self.logger.exception(e)
-            raise PluginExecutionError(
-                f'Exception querying if the document is saved: {e}'
-            )
+            # Get document data containing the path
+            try:
+                document_data = photoshop_connection.wait_for_reply(
+                    document_data_reply
+                )
+            except Exception as e:
+                self.logger.exception(e)
+                raise PluginExecutionError(
+                    f'Exception querying the document data: {e}'
+                )
+            # Will return a dictionary with information about the document,
+            # an empty dict is returned if no document is open.
+
+            self.logger.debug(f'Got Photoshop document data: {document_data}')
+
+            if not document_data:
+                raise PluginExecutionError(
+                    'No document data available. Please have'
+                    ' an active work document before you can '
+                    'publish'
+                )
+
+            # Check if document is saved
+            try:
+                document_saved_result = photoshop_connection.wait_for_reply(
+                    document_saved_reply
+                )
+            except Exception as e:
+                self.logger.exception(e)
+                raise PluginExecutionError(
+                    f'Exception querying if the document is saved: {e}'
+                )
+        finally:
+            # Forget the reply still outstanding if a query failed
+            photoshop_connection.discard_reply(document_data_reply)
+            photoshop_connection.discard_reply(document_saved_reply)
 
         self.logger.debug(
             f'Got Photoshop saved query result: {document_saved_result}'
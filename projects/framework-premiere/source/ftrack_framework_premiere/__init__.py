@@ -20,6 +20,7 @@ from ftrack_constants import framework as constants
 from ftrack_utils.extensions.environment import (
     get_extensions_path_from_environment,
 )
+from ftrack_utils.event_hub import run_event_loop
 from ftrack_utils.rpc import JavascriptRPC
 from ftrack_utils.process import MonitorProcess, terminate_current_process
 from ftrack_utils.usage import set_usage_tracker, UsageTracker
@@ -198,6 +199,12 @@ def rpc_process_events_callback():
     app.processEvents()
 
 
+def on_process_exit_callback(pid):
+    """Premiere has exited, shut down right away"""
+    logger.warning(f"Premiere process ({pid}) gone, shutting down!")
+    terminate_current_process()
+
+
 def process_watchdog_callback():
     """Check Premiere process + panel responsiveness periodically."""
     global integration_alive_seconds
@@ -640,7 +647,8 @@ def bootstrap_integration(framework_extensions_path):
             premiere_rpc_connection.dcc_version,
             launcher_expected_premiere_pid,
             launcher_expected_application_path,
-        )
+        ),
+        on_exit_callback=on_process_exit_callback,
     )
 
     for _ in range(30 * 2):  # Wait 30s for Premiere to connect
@@ -676,12 +684,9 @@ def bootstrap_integration(framework_extensions_path):
 def run_integration():
     """Run Premiere Framework Python standalone as long as Premiere is alive."""
 
-    global session
-
-    # Run until it's closed, or CTRL+C
-    while True:
-        app.processEvents()
-        session.event_hub.wait(0.01)
+    # Run until it's closed, or CTRL+C. The watchdog terminates the
+    # process once Premiere is gone.
+    run_event_loop(session, app)
 
 
 # Find and read DCC config
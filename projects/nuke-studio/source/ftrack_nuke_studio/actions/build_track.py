@@ -14,6 +14,8 @@ from ftrack_nuke_studio.overrides.version_scanner import add_ftrack_build_tag
 from ftrack_nuke_studio.template import get_project_template, match
 import ftrack_nuke_studio.exception
 
+from ftrack_utils.query import batch_query, quote
+
 import hiero
 
 try:
@@ -71,6 +73,7 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
     def __init__(self, selection, parent=None):
         """Initialise class with *selection* and *parent* widget."""
         self._result_data = {}
+        self._context_leafs = None
 
         if not parent:
             parent = hiero.ui.mainWindow()
@@ -238,24 +241,62 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
                 QtWidgets.QMessageBox.Ok,
             )
 
-    def _get_context_leafs(self, data):
-        """return the lower most context leaf for the given set of data"""
-        results = []
-        for datum in data:
-            project = datum[0]
-            first_parent = datum[1]
-            query = 'name is "{}" and project.name is "{}"'.format(
-                first_parent, project
+    @property
+    def context_leafs(self):
+        """Return a dictionary with the context leafs of each parsed
+        TrackItem, resolved once for the lifetime of the dialog."""
+        if self._context_leafs is None:
+            parsed_selection = self.parsed_selection
+            leafs = self._get_context_leafs(parsed_selection.values())
+            self._context_leafs = dict(
+                (track_item, leafs[tuple(context)])
+                for track_item, context in parsed_selection.items()
             )
-            for index, item in enumerate(datum[2:]):
-                query = (
-                    'name is "{}" and parent[TypedContext] has ({})'.format(
-                        item, query
-                    )
-                )
-            full_query = "TypedContext where {}".format(query)
+        return self._context_leafs
+
+    @property
+    def context_leaf_ids(self):
+        """Return the ids of all the context leafs of the selection."""
+        return list(
+            dict.fromkeys(
+                context_leaf["id"]
+                for context_leafs in self.context_leafs.values()
+                for context_leaf in context_leafs
+            )
+        )
 
-            results.extend(self.session.query(full_query).all())
+    def _get_context_leafs(self, data):
+        """Return a dictionary with the lower most context leafs for each
+        path of names in the given set of data.
+
+        Contexts are looked up a level at a time for all the paths, in a
+        few batched queries, then matched to their parents.
+        """
+        paths = [tuple(datum) for datum in data]
+        results = dict((path, []) for path in paths)
+        paths = [path for path in paths if len(path) > 1]
+
+        for level in range(1, max([len(path) for path in paths] or [0])):
+            level_paths = [path for path in paths if len(path) > level]
+            for project in set(path[0] for path in level_paths):
+                project_paths = [
+                    path for path in level_paths if path[0] == project
+                ]
+                contexts = batch_query(
+                    self.session,
+                    "TypedContext",
+                    "name",
+                    sorted(set(path[level] for path in project_paths)),
+                    projections=["id", "parent_id"],
+                    criteria="project.name is {}".format(quote(project)),
+                )
+                for path in project_paths:
+                    parent_ids = set(parent["id"] for parent in results[path])
+                    results[path] = [
+                        context
+                        for context in contexts[path[level]]
+                        if level == 1 or context["parent_id"] in parent_ids
+                    ]
 
         return results
 
@@ -270,28 +311,35 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
         if not all([task_name, asset_type_name, component_name]):
             return self._result_data
 
-        for taskItem, context in self.parsed_selection.items():
-            context_leafs = self._get_context_leafs([context])
-            for context_leaf in context_leafs:
-                query = (
-                    'Component where name is "{}" '  # component name
-                    'and version.asset.type.name is "{}" '  # asset type
-                    'and version.task.name is "{}" '  # task name
-                    'and version.asset.parent.id is "{}" '  # shot
-                    "".format(
-                        component_name,
-                        asset_type_name,
-                        task_name,
-                        context_leaf["id"],
-                    )
-                )
+        criteria = (
+            "name is {} "  # component name
+            "and version.asset.type.name is {} "  # asset type
+            "and version.task.name is {}"  # task name
+            "".format(
+                quote(component_name),
+                quote(asset_type_name),
+                quote(task_name),
+            )
+        )
+
+        if asset_status != "- ANY -":
+            criteria += " and version.status.name is {}".format(
+                quote(asset_status)
+            )
 
-                if asset_status != "- ANY -":
-                    query += ' and version.status.name is "{}"'.format(
-                        asset_status
-                    )
+        # Components of all the shots in a single batch.
+        components = batch_query(
+            self.session,
+            "Component",
+            "version.asset.parent.id",
+            self.context_leaf_ids,
+            projections=["id", "version.version"],
+            criteria=criteria,
+        )
 
-                all_components = self.session.query(query).all()
+        for taskItem, context_leafs in self.context_leafs.items():
+            for context_leaf in context_leafs:
+                all_components = components[context_leaf["id"]]
 
                 if not all_components:
                     continue
@@ -318,14 +366,15 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
         """Populate the components widget."""
         all_component_names = []
 
-        context_leafs = self._get_context_leafs(self.parsed_selection.values())
-
-        for context in context_leafs:
-            task_query = 'select name from Component where version.asset.parent.id is "{}"'.format(
-                context["id"]
-            )
-            components = self.session.query(task_query).all()
+        components_by_context = batch_query(
+            self.session,
+            "Component",
+            "version.asset.parent.id",
+            self.context_leaf_ids,
+            projections=["name"],
+        )
 
+        for components in components_by_context.values():
             if not components:
                 continue
 
@@ -353,14 +402,15 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
     def populate_asset_types(self):
         """Populate the asset types widget."""
         all_asset_types_names = []
-        context_leafs = self._get_context_leafs(self.parsed_selection.values())
-
-        for context in context_leafs:
-            task_query = 'select type, type.name, name from Asset where parent.id is "{}"'.format(
-                context["id"]
-            )
-            assets = self.session.query(task_query).all()
+        assets_by_context = batch_query(
+            self.session,
+            "Asset",
+            "parent.id",
+            self.context_leaf_ids,
+            projections=["type", "type.name", "name"],
+        )
 
+        for assets in assets_by_context.values():
             if not assets:
                 continue
 
@@ -374,16 +424,15 @@ class FtrackReBuildServerTrackDialog(QtWidgets.QDialog, FtrackBase):
     def populate_tasks(self):
         """Populate the tasks widget."""
         all_tasks = []
-        context_leafs = self._get_context_leafs(self.parsed_selection.values())
-
-        for context in context_leafs:
-            task_query = (
-                'select name from Task where parent.id is "{}"'.format(
-                    context["id"]
-                )
-            )
-            tasks = self.session.query(task_query).all()
+        tasks_by_context = batch_query(
+            self.session,
+            "Task",
+            "parent.id",
+            self.context_leaf_ids,
+            projections=["name"],
+        )
 
+        for tasks in tasks_by_context.values():
             if not tasks:
                 continue
 
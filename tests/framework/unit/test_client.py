@@ -0,0 +1,124 @@
+# test_client.py
+import threading
+import time
+
+import pytest
+
+from ftrack_framework_core.client import Client
+
+
+def host_information(host_id):
+    return {'host_id': host_id, 'context_id': None, 'tool_configs': {}}
+
+
+class Reply(dict):
+    def __init__(self, data):
+        super(Reply, self).__init__(data=data)
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    '''Reset the hosts shared by all the clients of the process.'''
+    Client._discovered_hosts.clear()
+    Client._host_connection = None
+    yield
+    Client._discovered_hosts.clear()
+    Client._host_connection = None
+
+
+@pytest.fixture
+def event_manager(mocker):
+    '''Return an event manager mock subscribing and publishing nothing.'''
+    event_manager = mocker.MagicMock()
+    event_manager.subscribe.host_context_changed.return_value = 'id'
+    return event_manager
+
+
+def test_discover_host_publishes_once(event_manager):
+    '''Test a host replying late is connected after a single broadcast.'''
+
+    def discover_host(callback=None):
+        threading.Timer(
+            0.1, callback, [Reply([host_information('host-a')])]
+        ).start()
+
+    event_manager.publish.discover_host.side_effect = discover_host
+
+    started = time.monotonic()
+    client = Client(event_manager, registry=None)
+
+    assert client.host_id == 'host-a'
+    assert event_manager.publish.discover_host.call_count == 1
+    assert time.monotonic() - started < 2
+
+
+def test_discover_host_times_out(event_manager):
+    '''Test discovery gives up after the time out without host.'''
+    event_manager.publish.discover_host.side_effect = (
+        lambda callback=None: callback(Reply([host_information('host-a')]))
+    )
+    client = Client(event_manager, registry=None)
+    event_manager.publish.discover_host.side_effect = None
+    started = time.monotonic()
+
+    client.discover_host(time_out=0.2, refresh=True)
+
+    assert 0.2 <= time.monotonic() - started < 1
+    assert client.host_connection is None
+    assert event_manager.publish.discover_host.call_count == 2
+
+
+def test_second_client_uses_discovered_hosts(event_manager):
+    '''Test clients connect instantly to hosts discovered or announced.'''
+    event_manager.publish.discover_host.side_effect = (
+        lambda callback=None: callback(Reply([host_information('host-a')]))
+    )
+    first_client = Client(event_manager, registry=None)
+
+    second_client = Client(event_manager, registry=None)
+
+    assert second_client.host_connection is first_client.host_connection
+    assert event_manager.publish.discover_host.call_count == 1
+
+    second_client._host_announced_callback(Reply(host_information('host-b')))
+    second_client._host_departed_callback(Reply({'host_id': 'host-a'}))
+    assert second_client.host_connection is None
+
+    second_client.discover_host()
+    assert second_client.host_id == 'host-b'
+    assert event_manager.publish.discover_host.call_count == 1
+
+
+def test_host_departs_at_exit(event_manager, mocker, monkeypatch):
+    '''Test clients forget a host when its process exits.'''
+    from ftrack_framework_core import host as host_module
+    from ftrack_utils.session.session_pool import DISABLE_SESSION_POOL_ENV
+
+    monkeypatch.setenv(DISABLE_SESSION_POOL_ENV, '1')
+    exit_callbacks = []
+    monkeypatch.setattr(host_module.atexit, 'register', exit_callbacks.append)
+    monkeypatch.setattr(
+        host_module.atexit, 'unregister', exit_callbacks.remove
+    )
+    registry = mocker.MagicMock()
+    registry.tool_configs_by_type = {}
+    host = host_module.Host(event_manager, registry=registry)
+    event_manager.publish.discover_host.side_effect = (
+        lambda callback=None: callback(Reply([host_information(host.id)]))
+    )
+    client = Client(event_manager, registry=None)
+    assert client.host_id == host.id
+    event_manager.publish.host_depart.side_effect = (
+        lambda host_id: client._host_departed_callback(
+            Reply({'host_id': host_id})
+        )
+    )
+
+    for callback in list(exit_callbacks):
+        callback()
+    host.close()
+
+    assert client.host_connection is None
+    assert Client._discovered_hosts == {}
+    assert event_manager.publish.host_depart.call_count == 1
+    assert exit_callbacks == []
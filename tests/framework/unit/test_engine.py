@@ -1,5 +1,6 @@
 # test_standard_engine.py
 import pytest
+import ftrack_constants as constants
 from ftrack_framework_core import registry
 
 
@@ -17,6 +18,7 @@ def plugin_instance():
 
         def run(self, store):
             '''Set test_data in store.'''
+            self.report_progress('Storing test_data')
             store['test_data'] = self.options
 
     return TestPlugin
@@ -85,6 +87,40 @@ def test_run_plugin(test_engine_instance):
     assert store == {'test_data': options}
 
 
+def test_run_plugin_reports_progress(test_engine_instance):
+    '''Test progress reported by a plugin reaches on_plugin_executed.'''
+    plugin_infos = []
+    test_engine_instance.on_plugin_executed = plugin_infos.append
+
+    test_engine_instance.run_plugin("test_plugin", {}, {}, "123")
+
+    progress_info, result_info = plugin_infos
+    assert progress_info['status'] == constants.status.RUNNING_STATUS
+    assert progress_info['message'] == 'Storing test_data'
+    assert progress_info['reference'] == "123"
+    assert result_info['status'] == constants.status.SUCCESS_STATUS
+
+
+def test_run_plugin_records_store_delta(test_engine_instance):
+    '''Test only the store keys changed by the plugin are attached.'''
+    plugin_infos = []
+    test_engine_instance.on_plugin_executed = plugin_infos.append
+    store = {'untouched': list(range(10000))}
+
+    test_engine_instance.run_plugin("test_plugin", store, {'a': 1}, "123")
+
+    result_info = plugin_infos[-1]
+    assert result_info['store'] == "{test_data.a: 1}"
+    assert 'store_snapshot' not in result_info
+
+    test_engine_instance.store_snapshot = True
+    test_engine_instance.run_plugin("test_plugin", store, {'a': 2}, "123")
+
+    result_info = plugin_infos[-1]
+    assert result_info['store'] == "{test_data.a: 2}"
+    assert result_info['store_snapshot'] == str(store)
+
+
 @pytest.mark.parametrize(
     "engine, user_options, expected_result",
     [
@@ -119,3 +155,173 @@ def test_execute_engine(
     # Call the method and assert the expected behavior
     result = test_engine_instance.execute_engine(engine, user_options)
     assert result == expected_result
+
+
+@pytest.fixture
+def parallel_engine_instance(test_engine_instance):
+    '''Return the test engine with parallel execution enabled and plugins
+    recording their thread added to its registry.'''
+    import threading
+    import time
+
+    from ftrack_framework_core.plugin import BasePlugin
+
+    class MainThreadPlugin(BasePlugin):
+        name = 'main_thread_plugin'
+
+        def run(self, store):
+            component = self.options['component']
+            store.setdefault('components', {})[component] = {
+                'main_thread': threading.current_thread()
+            }
+
+    class ExportPlugin(BasePlugin):
+        name = 'export_plugin'
+        main_thread_only = False
+
+        def run(self, store):
+            self.report_progress('Exporting')
+            component = store['components'][self.options['component']]
+            component['export_thread'] = threading.current_thread()
+            component['started'] = time.monotonic()
+            time.sleep(0.2)
+            if self.options.get('fail'):
+                raise Exception('Export failed')
+            component['finished'] = time.monotonic()
+
+    registry_instance = test_engine_instance.plugin_registry
+    for plugin in (MainThreadPlugin, ExportPlugin):
+        registry_instance.add('plugin', plugin.name, plugin, 'test/path.py')
+    test_engine_instance.parallel = True
+    return test_engine_instance
+
+
+def component_group(component, **kwargs):
+    group = {
+        "type": "group",
+        "reference": f"group-{component}",
+        "options": {"component": component},
+        "plugins": ["main_thread_plugin", "export_plugin"],
+    }
+    group.update(kwargs)
+    return group
+
+
+def test_execute_engine_runs_independent_groups_in_parallel(
+    parallel_engine_instance,
+):
+    '''Test groups of different components are executed concurrently, main
+    thread only plugins and reports on the calling thread.'''
+    import threading
+    import time
+
+    from ftrack_framework_core.plugin import store_delta
+
+    plugin_infos = []
+    report_threads = set()
+
+    def on_plugin_executed(plugin_info):
+        report_threads.add(threading.current_thread())
+        plugin_infos.append(plugin_info)
+
+    parallel_engine_instance.on_plugin_executed = on_plugin_executed
+    engine = [
+        component_group("snapshot"),
+        component_group("thumbnail"),
+        component_group("reviewable"),
+        {"type": "plugin", "plugin": "test_plugin", "reference": "last"},
+    ]
+
+    started = time.monotonic()
+    store = parallel_engine_instance.execute_engine(engine, {})
+
+    assert time.monotonic() - started < 0.5
+    components = store['components']
+    assert all(
+        component['main_thread'] is threading.current_thread()
+        for component in components.values()
+    )
+    assert all(
+        component['export_thread'] is not threading.current_thread()
+        for component in components.values()
+    )
+    assert store['test_data'] == {}
+    assert report_threads == {threading.current_thread()}
+    # A progress report and a result per plugin execution
+    assert len(plugin_infos) == 3 * 3 + 2
+    assert plugin_infos[-1]['name'] == 'test_plugin'
+    # Concurrent changes to the store can't be attributed to a plugin.
+    assert set(
+        plugin_info['store']
+        for plugin_info in plugin_infos
+        if plugin_info['status'] != constants.status.RUNNING_STATUS
+    ) == {store_delta.DELTA_UNAVAILABLE}
+    assert sorted(
+        timing['name'] for timing in parallel_engine_instance.group_timings
+    ) == ['reviewable', 'snapshot', 'thumbnail']
+    assert parallel_engine_instance.on_plugin_executed is on_plugin_executed
+
+
+def test_execute_engine_respects_dependencies(parallel_engine_instance):
+    '''Test groups wait for the groups they depend on and the groups of
+    the same component.'''
+    engine = [
+        component_group("snapshot"),
+        component_group("reviewable", depends_on=["snapshot"]),
+        component_group("thumbnail"),
+    ]
+
+    store = parallel_engine_instance.execute_engine(engine, {})
+
+    components = store['components']
+    assert (
+        components['reviewable']['started']
+        >= components['snapshot']['finished']
+    )
+    assert (
+        components['thumbnail']['started'] < components['snapshot']['finished']
+    )
+
+
+def test_execute_engine_raises_first_error(parallel_engine_instance):
+    '''Test a failing plugin stops the execution and its error is raised.'''
+    from ftrack_framework_core.exceptions.engine import EngineExecutionError
+
+    engine = [
+        component_group("snapshot", options={"component": "a", "fail": 1}),
+        component_group("thumbnail"),
+        {"type": "plugin", "plugin": "test_plugin", "reference": "last"},
+    ]
+
+    with pytest.raises(EngineExecutionError, match='Export failed'):
+        parallel_engine_instance.execute_engine(engine, {})
+
+
+def test_resolve_dependencies():
+    '''Test plugins outside groups are barriers and groups depend on the
+    previous groups of their component.'''
+    from ftrack_framework_core.engine import execution_graph
+
+    engine = [
+        {"type": "plugin", "plugin": "context", "reference": "context"},
+        component_group("a"),
+        component_group("b"),
+        component_group("a"),
+        {"type": "group", "reference": "any", "plugins": []},
+        component_group("c", depends_on=[]),
+        "publish",
+    ]
+
+    units = execution_graph.resolve_dependencies(
+        execution_graph.build_units(engine, {})
+    )
+
+    assert [unit.depends_on for unit in units] == [
+        set(),
+        {0},
+        {0},
+        {0, 1},
+        {0, 1, 2, 3},
+        {0},
+        {1, 2, 3, 4, 5, 0},
+    ]
@@ -0,0 +1,110 @@
+# test_host_connection.py
+import copy
+import json
+
+import pytest
+
+from ftrack_utils.framework.config.frozen import freeze, FrozenDict
+from ftrack_framework_core.client.host_connection import HostConnection
+
+TOOL_CONFIG_COUNT = 200
+
+
+def tool_config(index, discoverable=None):
+    return {
+        'name': f'publisher_{index}',
+        'config_type': 'publisher',
+        'discoverable': discoverable,
+        'engine': [{'type': 'plugin', 'plugin': 'test_plugin'}],
+        'options': {'tags': ['context']},
+    }
+
+
+@pytest.fixture
+def host_data():
+    '''Return host data as published by the host, with frozen tool_configs.'''
+    return {
+        'host_id': 'host-id',
+        'context_id': None,
+        'tool_configs': {
+            'publisher': tuple(
+                freeze(
+                    tool_config(index, ['compositing'] if index % 2 else None)
+                )
+                for index in range(TOOL_CONFIG_COUNT)
+            )
+        },
+    }
+
+
+@pytest.fixture
+def host_connection(mocker, host_data):
+    return HostConnection(mocker.MagicMock(), host_data)
+
+
+def test_frozen_tool_configs_are_read_only():
+    '''Test frozen tool_configs can't be modified but can be copied.'''
+    frozen = freeze(tool_config(0))
+
+    with pytest.raises(TypeError):
+        frozen['name'] = 'other'
+    with pytest.raises(TypeError):
+        frozen['options']['tags'].append('component')
+
+    writable = copy.deepcopy(frozen)
+    writable['options']['tags'].append('component')
+    assert not isinstance(writable, FrozenDict)
+    assert frozen['options']['tags'] == ['context']
+    assert freeze(frozen) is frozen
+    assert json.loads(json.dumps(frozen)) == tool_config(0)
+
+
+def test_tool_configs_are_shared(host_connection, host_data):
+    '''Test the host connection doesn't copy the host tool_configs.'''
+    host_connection.reset_all_tool_configs()
+    tool_configs = host_connection.tool_configs['publisher']
+
+    assert len(tool_configs) == TOOL_CONFIG_COUNT
+    assert all(
+        tool_config is host_tool_config
+        for tool_config, host_tool_config in zip(
+            tool_configs, host_data['tool_configs']['publisher']
+        )
+    )
+
+
+def test_filtered_tool_configs_are_memoized(host_connection):
+    '''Test tool_configs are filtered once per context identifiers.'''
+    host_connection._context_identifiers = ['task', 'compositing']
+    filtered = host_connection._available_filtered_host_tool_configs
+
+    assert len(filtered['publisher']) == TOOL_CONFIG_COUNT
+    assert host_connection._available_filtered_host_tool_configs is filtered
+
+    host_connection._context_identifiers = ['task', 'modeling']
+    assert len(
+        host_connection._available_filtered_host_tool_configs['publisher']
+    ) == (TOOL_CONFIG_COUNT // 2)
+
+
+def test_context_change_purges_and_adds_tool_configs(host_connection):
+    '''Test changing context keeps the order of the available tool_configs.'''
+    host_connection._context_identifiers = ['task', 'modeling']
+    host_connection._add_new_tool_configs()
+    names = [
+        tool_config['name']
+        for tool_config in host_connection.tool_configs['publisher']
+    ]
+    assert names == [
+        f'publisher_{index}' for index in range(0, TOOL_CONFIG_COUNT, 2)
+    ]
+
+    host_connection._context_identifiers = ['task', 'compositing']
+    host_connection._add_new_tool_configs()
+    names = [
+        tool_config['name']
+        for tool_config in host_connection.tool_configs['publisher']
+    ]
+    assert names == [
+        f'publisher_{index}' for index in range(0, TOOL_CONFIG_COUNT, 2)
+    ] + [f'publisher_{index}' for index in range(1, TOOL_CONFIG_COUNT, 2)]
@@ -0,0 +1,108 @@
+# test_log.py
+import os
+import time
+
+import pytest
+
+from ftrack_framework_core import log
+from ftrack_framework_core.log.log_item import LogItem
+
+ITEM_COUNT = 300
+
+
+@pytest.fixture
+def user_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        log.platformdirs, 'user_data_dir', lambda *args: str(tmp_path)
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def log_db(user_data_dir):
+    log_db = log.LogDB('host-id')
+    yield log_db
+    log_db.close()
+
+
+def log_item(index, reference='plugin-reference'):
+    return LogItem(
+        {
+            'name': f'plugin_{index}',
+            'reference': reference,
+            'status': 'success',
+            'boolean_status': True,
+            'message': f'Executed {index}',
+            'execution_time': 0.1,
+            'options': {},
+            'store': {'index': index},
+        }
+    )
+
+
+def test_log_items_are_written_in_batches(log_db):
+    '''Test many log items are committed in a few transactions.'''
+    for index in range(ITEM_COUNT):
+        log_db.add_log_item('host-id', log_item(index))
+
+    log_items = log_db.get_log_items('host-id')
+    assert [item.name for item in log_items] == [
+        f'plugin_{index}' for index in range(ITEM_COUNT)
+    ]
+    assert log_db._writer.batch_count <= ITEM_COUNT // log_db.batch_size + 2
+
+
+def test_log_items_by_reference_use_index(log_db):
+    '''Test queries by reference see queued items, through the index.'''
+    log_db.add_log_item('host-id', log_item(0, reference='a'))
+    log_db.add_log_item('host-id', log_item(1, reference='b'))
+
+    log_items = log_db.get_log_items_by_reference('host-id', 'b')
+
+    assert [item.name for item in log_items] == ['plugin_1']
+    plan = log_db.connection.execute(
+        'EXPLAIN QUERY PLAN SELECT * FROM LOGMGR '
+        'WHERE host_id=? AND reference=?',
+        ('host-id', 'b'),
+    ).fetchall()
+    assert 'LOGMGR_host_id_reference' in str(plan)
+    assert log_db.connection.execute('PRAGMA journal_mode').fetchone() == (
+        'wal',
+    )
+
+
+def test_close_writes_pending_items(log_db):
+    '''Test closing the database writes the queued log items.'''
+    for index in range(5):
+        log_db.add_log_item('host-id', log_item(index))
+    database_path = log_db._database_path
+
+    log_db.close()
+
+    connection = log.sqlite3.connect(database_path)
+    assert connection.execute('SELECT count(*) FROM LOGMGR').fetchone() == (5,)
+    connection.close()
+
+
+def test_expired_databases_are_swept_periodically(user_data_dir):
+    '''Test expired databases are removed at most once per interval.'''
+    expired_time = time.time() - log.LogDB.database_expire_grace_s - 60
+    for name in ('framework-old.db', 'framework-old.db-wal'):
+        (user_data_dir / name).write_text('')
+        os.utime(str(user_data_dir / name), (expired_time, expired_time))
+    (user_data_dir / 'framework-recent.db').write_text('')
+
+    assert log.sweep_expired_databases(
+        str(user_data_dir), log.LogDB.database_expire_grace_s, 3600
+    )
+    assert sorted(os.listdir(str(user_data_dir))) == [
+        '.framework-db-sweep',
+        'framework-recent.db',
+    ]
+
+    (user_data_dir / 'framework-old.db').write_text('')
+    os.utime(str(user_data_dir / 'framework-old.db'), (0, 0))
+    assert not log.sweep_expired_databases(
+        str(user_data_dir), log.LogDB.database_expire_grace_s, 3600
+    )
+    assert (user_data_dir / 'framework-old.db').exists()
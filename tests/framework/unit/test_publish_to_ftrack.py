@@ -0,0 +1,205 @@
+# test_publish_to_ftrack.py
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ftrack_framework_core.exceptions.plugin import PluginExecutionError
+from ftrack_utils.session.session_pool import SessionPool
+
+PLUGIN_PATH = (
+    Path(__file__).parents[3]
+    / 'projects'
+    / 'framework-common-extensions'
+    / 'plugins'
+    / 'publish_to_ftrack.py'
+)
+
+
+@pytest.fixture(scope='module')
+def publish_module():
+    '''Return the publish_to_ftrack plugin module, loaded from its file.'''
+    spec = importlib.util.spec_from_file_location(
+        'publish_to_ftrack_under_test', PLUGIN_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeLocation(object):
+    '''Location stand-in recording transfers, failing on demand.'''
+
+    def __init__(self, transfer_time=0.1):
+        self.transfer_time = transfer_time
+        self.failures = {}
+        self.transfers = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transfer(self, name, path):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.transfer_time)
+            with self._lock:
+                if self.failures.get(name):
+                    self.failures[name] -= 1
+                    raise IOError(f'Transfer of {name} interrupted')
+                self.transfers.append((name, path))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class FakeAssetVersion(dict):
+    def __init__(self, location):
+        super(FakeAssetVersion, self).__init__(id='version-id')
+        self.location = location
+
+    def create_component(self, path, data=None, location=None):
+        location.transfer(data['name'], path)
+
+    def create_thumbnail(self, path):
+        self.location.transfer('thumbnail', path)
+
+    def encode_media(self, path):
+        self.location.transfer('reviewable', path)
+
+
+class FakeQuery(object):
+    def all(self):
+        return []
+
+
+class FakeSession(object):
+    def __init__(self, location):
+        self.location = location
+        self.closed = False
+        self.rollback_count = 0
+
+    @property
+    def event_hub(self):
+        return self
+
+    connected = True
+
+    def get(self, entity_type, entity_id):
+        return FakeAssetVersion(self.location)
+
+    def query(self, expression):
+        return FakeQuery()
+
+    def pick_location(self):
+        return self.location
+
+    def rollback(self):
+        self.rollback_count += 1
+
+    def reset(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def location():
+    return FakeLocation()
+
+
+@pytest.fixture
+def session_pool(publish_module, location, monkeypatch):
+    pool = SessionPool(
+        max_size=8, session_factory=lambda: FakeSession(location)
+    )
+    monkeypatch.setattr(publish_module, 'get_session_pool', lambda: pool)
+    monkeypatch.setattr(publish_module, 'session_pool_enabled', lambda: True)
+    return pool
+
+
+def create_plugin(publish_module, location, options):
+    plugin = publish_module.PublishToFtrack(options, FakeSession(location))
+    plugin.progress = []
+    plugin.on_progress = plugin.progress.append
+    return plugin
+
+
+UPLOADS = [
+    ('main', '/tmp/scene.ma'),
+    ('sequence', '/tmp/image.%04d.exr [1001-1100]'),
+    ('other', '/tmp/other.abc'),
+    ('another', '/tmp/another.abc'),
+]
+
+
+def test_components_upload_in_parallel(publish_module, location, session_pool):
+    plugin = create_plugin(publish_module, location, {'max_workers': 4})
+    started = time.monotonic()
+
+    plugin._upload_components(FakeAssetVersion(location), UPLOADS)
+
+    assert time.monotonic() - started < 0.3
+    assert location.max_active == 4
+    assert sorted(location.transfers) == sorted(UPLOADS)
+    assert len(plugin.progress) == 4
+    assert plugin.progress[-1].endswith('(4/4)')
+    assert session_pool.leased_count == 0
+
+
+def test_pool_size_is_set_by_options(publish_module, location, session_pool):
+    plugin = create_plugin(publish_module, location, {'max_workers': 2})
+
+    plugin._upload_components(FakeAssetVersion(location), UPLOADS)
+
+    assert location.max_active == 2
+
+
+def test_only_failed_uploads_are_retried(
+    publish_module, location, session_pool
+):
+    location.failures['sequence'] = 1
+    plugin = create_plugin(publish_module, location, {'max_workers': 4})
+
+    plugin._upload_components(FakeAssetVersion(location), UPLOADS)
+
+    names = [name for name, _ in location.transfers]
+    assert sorted(names) == sorted(name for name, _ in UPLOADS)
+    assert names[-1] == 'sequence'
+    assert any(
+        message.startswith('Component sequence failed')
+        for message in plugin.progress[:4]
+    )
+    assert plugin.progress[-1] == 'Component sequence published (1/1)'
+
+
+def test_upload_fails_once_retries_exhausted(
+    publish_module, location, session_pool
+):
+    location.failures['main'] = 2
+    plugin = create_plugin(
+        publish_module, location, {'max_workers': 4, 'upload_retries': 1}
+    )
+
+    with pytest.raises(PluginExecutionError, match='main'):
+        plugin._upload_components(FakeAssetVersion(location), UPLOADS)
+    assert len(location.transfers) == 3
+
+
+def test_sequential_upload_without_session_pool(
+    publish_module, location, monkeypatch
+):
+    monkeypatch.setattr(publish_module, 'session_pool_enabled', lambda: False)
+    location.transfer_time = 0
+    location.failures['other'] = 1
+    plugin = create_plugin(publish_module, location, {})
+
+    plugin._upload_components(FakeAssetVersion(location), UPLOADS)
+
+    assert location.max_active == 1
+    assert len(location.transfers) == 4
+    assert plugin.session.rollback_count == 1
@@ -0,0 +1,238 @@
+# test_registry.py
+import os
+import sys
+import textwrap
+
+import pytest
+from ftrack_framework_core import registry
+from ftrack_utils.extensions.cache import ExtensionCache
+
+EXTENSION_COUNT = 300
+LOOKUP_COUNT = 10000
+
+
+def plugin(index):
+    return f'plugin_{index}'
+
+
+def tool_config(name, config_type):
+    return {
+        'type': 'tool_config',
+        'name': name,
+        'config_type': config_type,
+        'engine': [{'type': 'plugin', 'plugin': 'plugin_0'}],
+    }
+
+
+@pytest.fixture
+def registry_instance():
+    '''Return a registry with EXTENSION_COUNT plugins and tool_configs.'''
+    registry_instance = registry.Registry()
+    for index in range(EXTENSION_COUNT):
+        registry_instance.add(
+            'plugin', plugin(index), object(), f'/plugins/{plugin(index)}.py'
+        )
+    registry_instance.add(
+        'tool_config',
+        'publisher',
+        tool_config('publisher', 'publisher'),
+        '/tool-configs/publisher.yaml',
+    )
+    registry_instance.add(
+        'tool_config',
+        'opener',
+        tool_config('opener', 'opener'),
+        '/tool-configs/opener.yaml',
+    )
+    return registry_instance
+
+
+def test_get_by_name_and_path(registry_instance):
+    '''Test lookups through the indexes return the registered extension.'''
+    found = registry_instance.get_one(
+        name='plugin_42', extension_type='plugin'
+    )
+    assert found['path'] == '/plugins/plugin_42.py'
+
+    assert registry_instance.get(path='/plugins/plugin_7.py') == [
+        registry_instance.plugins[7]
+    ]
+    assert registry_instance.get('plugin_1', extension_type='plugin') == [
+        registry_instance.plugins[1]
+    ]
+    assert registry_instance.get(name='missing') == []
+    assert registry_instance.get(extension_type='missing') == []
+    assert len(registry_instance.get()) == EXTENSION_COUNT + 2
+
+
+def test_get_by_reference(registry_instance):
+    '''Test tool_configs are looked up by their generated reference.'''
+    publisher = registry_instance.tool_configs_by_type['publisher'][0]
+
+    found = registry_instance.get_one(
+        extension_type='tool_config', reference=publisher['reference']
+    )
+
+    assert found['extension'] is publisher
+
+
+def test_duplicated_names_are_ambiguous(registry_instance):
+    '''Test get_one returns None if several extensions match.'''
+    registry_instance.add('plugin', 'plugin_3', object(), '/other/plugin_3.py')
+
+    assert len(registry_instance.get(name='plugin_3')) == 2
+    assert registry_instance.get_one(name='plugin_3') is None
+
+
+def test_tool_configs_by_type_is_cached_and_invalidated(registry_instance):
+    '''Test the tool_configs view is frozen, cached and rebuilt on add.'''
+    view = registry_instance.tool_configs_by_type
+    assert view is registry_instance.tool_configs_by_type
+    assert list(view) == ['publisher', 'opener']
+    with pytest.raises(TypeError):
+        view['loader'] = ()
+
+    registry_instance.add(
+        'tool_config',
+        'loader',
+        tool_config('loader', 'loader'),
+        '/tool-configs/loader.yaml',
+    )
+    assert registry_instance.tool_configs_by_type is not view
+    assert 'loader' in registry_instance.tool_configs_by_type
+
+
+def test_lookups_use_indexes(registry_instance, monkeypatch):
+    '''Test LOOKUP_COUNT plugin lookups, as done by the engine once per
+    plugin execution, only compare the extensions of the index entry.'''
+    compared = []
+    _get = registry_instance._get
+
+    def counting_get(extensions, *args, **kwargs):
+        compared.append(len(extensions))
+        return _get(extensions, *args, **kwargs)
+
+    monkeypatch.setattr(registry_instance, '_get', counting_get)
+
+    for index in range(LOOKUP_COUNT):
+        name = plugin(index % EXTENSION_COUNT)
+        assert registry_instance.get_one(name=name, extension_type='plugin')
+    registry_instance.get(path='/plugins/plugin_7.py', extension_type='plugin')
+
+    assert compared == [1] * (LOOKUP_COUNT + 1)
+
+
+PLUGIN_MODULE = textwrap.dedent(
+    '''
+    class CachedPlugin(object):
+        name = 'cached_plugin'
+
+        @classmethod
+        def register(cls):
+            return {
+                'extension_type': 'plugin',
+                'name': cls.name,
+                'extension': cls,
+                'path': __file__,
+            }
+    '''
+)
+
+TOOL_CONFIG = textwrap.dedent(
+    '''
+    type: tool_config
+    name: cached-publisher
+    config_type: publisher
+    engine:
+      - type: plugin
+        plugin: ${FTRACK_TEST_PLUGIN}
+    '''
+)
+
+
+@pytest.fixture
+def extension_directory(tmp_path, monkeypatch):
+    '''Return a directory of one plugin module and one tool_config.'''
+    monkeypatch.setenv('FTRACK_TEST_PLUGIN', 'cached_plugin')
+    directory = tmp_path / 'extensions'
+    (directory / 'plugins').mkdir(parents=True)
+    (directory / 'tool-configs').mkdir()
+    (directory / 'plugins' / 'ftrack_test_cached_plugin.py').write_text(
+        PLUGIN_MODULE
+    )
+    (directory / 'tool-configs' / 'publisher.yaml').write_text(TOOL_CONFIG)
+    yield directory
+    sys.modules.pop('ftrack_test_cached_plugin', None)
+
+
+def scan(extension_directory, cache):
+    registry_instance = registry.Registry(extension_cache=cache)
+    registry_instance.scan_extensions([str(extension_directory)])
+    return registry_instance
+
+
+def test_unchanged_modules_are_imported_on_first_use(
+    extension_directory, tmp_path
+):
+    '''Test cached plugins are registered without importing their module.'''
+    cache_path = str(tmp_path / 'cache' / 'extensions.json')
+    scan(extension_directory, ExtensionCache(cache_path))
+    assert os.path.exists(cache_path)
+    sys.modules.pop('ftrack_test_cached_plugin')
+
+    # New cache instance, read from disk as in a new process
+    registry_instance = scan(extension_directory, ExtensionCache(cache_path))
+
+    plugin = registry_instance.get_one(
+        name='cached_plugin', extension_type='plugin'
+    )
+    assert 'ftrack_test_cached_plugin' not in sys.modules
+    assert plugin['extension'].__name__ == 'CachedPlugin'
+    assert 'ftrack_test_cached_plugin' in sys.modules
+    assert plugin['extension'] is plugin['extension']
+    assert plugin['extension'].register()['name'] == 'cached_plugin'
+
+
+def test_yaml_extensions_are_cached(
+    extension_directory, tmp_path, monkeypatch
+):
+    '''Test tool_configs are read from the cache until modified.'''
+    cache = ExtensionCache(str(tmp_path / 'extensions.json'))
+    first = scan(extension_directory, cache).tool_configs[0]['extension']
+    tool_config_path = str(
+        extension_directory / 'tool-configs' / 'publisher.yaml'
+    )
+    assert first['engine'][0]['plugin'] == 'cached_plugin'
+
+    second = scan(extension_directory, cache).tool_configs[0]['extension']
+    # Each registry gets its own copy, with its own references
+    assert second is not first
+    assert second['reference'] != first['reference']
+    assert second['engine'] == [
+        dict(item, reference=second['engine'][0]['reference'])
+        for item in first['engine']
+    ]
+
+    # Environment variables are substituted again when changed
+    monkeypatch.setenv('FTRACK_TEST_PLUGIN', 'other_plugin')
+    third = scan(extension_directory, cache).tool_configs[0]['extension']
+    assert third['engine'][0]['plugin'] == 'other_plugin'
+
+    # Modified files are parsed again
+    with open(tool_config_path, 'a') as tool_config_file:
+        tool_config_file.write('ui_hook: publisher\n')
+    fourth = scan(extension_directory, cache).tool_configs[0]['extension']
+    assert fourth['ui_hook'] == 'publisher'
+
+
+def test_corrupt_cache_is_ignored(extension_directory, tmp_path):
+    '''Test an unreadable manifest is discarded and rewritten.'''
+    cache_path = tmp_path / 'extensions.json'
+    cache_path.write_text('{not json')
+
+    registry_instance = scan(
+        extension_directory, ExtensionCache(str(cache_path))
+    )
+
+    assert len(registry_instance.plugins) == 1
+    assert len(ExtensionCache(str(cache_path))) == 2
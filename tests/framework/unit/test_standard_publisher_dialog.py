@@ -0,0 +1,106 @@
+# test_standard_publisher_dialog.py
+import importlib.util
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('PySide6')
+
+from ftrack_utils.framework.config.frozen import freeze  # noqa: E402
+from ftrack_utils.framework.config.tool import get_groups  # noqa: E402
+
+DIALOG_PATH = (
+    Path(__file__).parents[3]
+    / 'projects'
+    / 'framework-common-extensions'
+    / 'dialogs'
+    / 'standard_publisher_dialog.py'
+)
+
+
+@pytest.fixture(scope='module')
+def dialog_module():
+    '''Return the standard publisher dialog module, loaded from its file.'''
+    spec = importlib.util.spec_from_file_location(
+        'standard_publisher_dialog_under_test', DIALOG_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def component(name):
+    return {
+        'type': 'group',
+        'reference': f'{name}-group',
+        'tags': ['component'],
+        'optional': True,
+        'options': {'component': name},
+        'plugins': [
+            {
+                'type': 'plugin',
+                'plugin': f'{name}_collector',
+                'reference': f'{name}-collector',
+                'tags': ['collector'],
+            },
+        ],
+    }
+
+
+class FakeProgressWidget(object):
+    def __init__(self):
+        self.data = None
+
+    def set_data(self, data):
+        self.data = data
+
+
+class FakeDialog(object):
+    '''Dialog state used by the enable component callback, the client
+    options being recorded as by the client.'''
+
+    def __init__(self, dialog_class, tool_config):
+        self._dialog_class = dialog_class
+        self.tool_config = tool_config
+        self.tool_config_options = defaultdict(defaultdict)
+        self._progress_widget = FakeProgressWidget()
+
+    def set_tool_config_option(self, options, item_reference=None):
+        self.tool_config_options[self.tool_config['reference']][
+            item_reference
+        ] = options
+
+    def _get_item_options(self):
+        return self._dialog_class._get_item_options(self)
+
+
+def test_toggle_component(dialog_module):
+    '''Test toggling a component of a shared, read only tool-config.'''
+    tool_config = freeze(
+        {
+            'reference': 'publisher',
+            'name': 'publisher',
+            'engine': [component('snapshot'), component('thumbnail')],
+        }
+    )
+    dialog_class = dialog_module.StandardPublisherDialog
+    dialog = FakeDialog(dialog_class, tool_config)
+    snapshot = get_groups(tool_config, filters={'tags': ['component']})[0]
+
+    dialog_class._on_enable_component_changed_callback(dialog, snapshot, False)
+
+    assert [phase['id'] for phase in dialog._progress_widget.data] == [
+        'thumbnail-collector'
+    ]
+    assert 'enabled' not in snapshot
+    assert dialog.tool_config_options['publisher']['snapshot-group'] == {
+        'enabled': False
+    }
+
+    dialog_class._on_enable_component_changed_callback(dialog, snapshot, True)
+
+    assert [phase['id'] for phase in dialog._progress_widget.data] == [
+        'snapshot-collector',
+        'thumbnail-collector',
+    ]
@@ -0,0 +1,37 @@
+# test_store_delta.py
+from ftrack_framework_core.plugin import store_delta
+
+
+def test_delta_lists_added_changed_and_removed_keys():
+    '''Test nested keys are compared one by one.'''
+    store = {
+        'components': {'main': {'path': '/a.ma', 'frames': [1, 2]}},
+        'removed': True,
+        'same': 'value',
+    }
+    before = store_delta.fingerprint(store)
+
+    store['components']['main']['frames'].append(3)
+    store['components']['thumbnail'] = {'path': '/b.jpg'}
+    del store['removed']
+
+    delta = store_delta.get_delta(before, store_delta.fingerprint(store))
+
+    assert delta == (
+        "{components.main.frames: [1, 2, 3], "
+        "components.thumbnail.path: '/b.jpg', removed: None}"
+    )
+    assert store_delta.get_delta(before, before) == '{}'
+
+
+def test_summaries_and_deltas_are_capped():
+    '''Test the size of the serialized delta does not depend on the store.'''
+    store = {'key_{}'.format(index): 'x' * 10000 for index in range(1000)}
+
+    delta = store_delta.get_delta({}, store_delta.fingerprint(store))
+
+    assert len(store_delta.summarize('x' * 10000)) <= (
+        store_delta.MAX_VALUE_LENGTH
+    )
+    assert len(delta) <= store_delta.MAX_DELTA_LENGTH + 20
+    assert delta.endswith('more}')
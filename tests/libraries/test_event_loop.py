@@ -0,0 +1,122 @@
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip('PySide6.QtCore')
+QtWidgets = pytest.importorskip('PySide6.QtWidgets')
+
+from ftrack_utils.event_hub import EventLoopDriver  # noqa: E402
+
+
+class FakeEventHub(object):
+    '''Event hub calling *handler* with the events put in its queue.'''
+
+    def __init__(self, handler):
+        self.connected = True
+        self.handler = handler
+        self.events = queue.Queue()
+
+    def wait(self, duration=None):
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            self.handler(event)
+
+
+class FakeSession(object):
+    def __init__(self, handler=lambda event: None):
+        self.event_hub = FakeEventHub(handler)
+
+
+@pytest.fixture
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def session():
+    session = FakeSession()
+    yield session
+    session.event_hub.events.put(None)
+
+
+def test_idle_event_loop_sleeps(app, session):
+    '''Test an idle integration uses next to no CPU.'''
+    driver = EventLoopDriver(session, app)
+    # Leave out the set up of the first event loop of the application.
+    QtCore.QTimer.singleShot(0, driver.quit)
+    driver.run()
+    QtCore.QTimer.singleShot(1000, driver.quit)
+
+    started = time.process_time()
+    driver.run()
+    cpu_time = time.process_time() - started
+
+    assert cpu_time < 0.05
+    assert not driver.running
+
+
+def test_events_are_dispatched(app, session):
+    '''Test event hub events are handled as soon as they arrive.'''
+    driver = EventLoopDriver(session, app)
+    handled = []
+
+    def handler(event):
+        handled.append((event, time.monotonic()))
+        driver.quit()
+
+    session.event_hub.handler = handler
+    published = []
+
+    def publish():
+        published.append(time.monotonic())
+        session.event_hub.events.put('event')
+
+    QtCore.QTimer.singleShot(100, publish)
+    QtCore.QTimer.singleShot(5000, driver.quit)
+    driver.run()
+
+    assert [event for event, _ in handled] == ['event']
+    assert handled[0][1] - published[0] < 0.05
+
+
+def test_closing_last_window_does_not_quit(app, session):
+    '''Test closing a dialog keeps the integration running.'''
+    driver = EventLoopDriver(session, app)
+    window = QtWidgets.QWidget()
+    window.show()
+    closed = []
+
+    def close():
+        closed.append(window.close())
+
+    QtCore.QTimer.singleShot(50, close)
+    QtCore.QTimer.singleShot(300, lambda: closed.append(driver.running))
+    QtCore.QTimer.singleShot(400, driver.quit)
+    driver.run()
+
+    assert closed == [True, True]
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='POSIX signals')
+def test_interrupt(app, session):
+    '''Test CTRL+C stops the event loop.'''
+    driver = EventLoopDriver(session, app)
+    QtCore.QTimer.singleShot(
+        50,
+        lambda: threading.Thread(
+            target=os.kill, args=(os.getpid(), signal.SIGINT)
+        ).start(),
+    )
+    QtCore.QTimer.singleShot(5000, driver.quit)
+
+    with pytest.raises(KeyboardInterrupt):
+        driver.run()
+
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
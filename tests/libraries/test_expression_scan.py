@@ -0,0 +1,159 @@
+import os
+import re
+
+import pytest
+
+from ftrack_utils.directories import DirectoryCache, ExpressionScanner
+
+#: Expressions start at the filesystem root, as in launcher configurations.
+ROOT = os.path.abspath(os.sep)
+
+
+def _walk(start, expressions):
+    '''Return the paths matching *expressions* found with os.walk.'''
+    paths = []
+    for location, folders, files in os.walk(start, followlinks=True):
+        level = location.rstrip(os.path.sep).count(os.path.sep)
+        expression = expressions[level]
+        if level < len(expressions) - 1:
+            folders[:] = [
+                folder for folder in folders if expression.match(folder)
+            ]
+        else:
+            for entry in folders + files:
+                if expression.match(entry):
+                    paths.append(os.path.join(location, entry))
+            del folders[:]
+    return paths
+
+
+def _expressions(root, pieces):
+    '''Return compiled expressions matching the existing *root* directory
+    literally, then *pieces*.'''
+    parts = [part for part in str(root).split(os.path.sep)[1:] if part]
+    return [re.compile(re.escape(part) + '$') for part in parts] + [
+        re.compile(piece) for piece in pieces
+    ]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    '''Software depot with a few versions of two applications.'''
+    for application, versions in (
+        ('Maya', ['2023', '2024', '2025']),
+        ('Nuke', ['14.0v1', '15.1v2']),
+    ):
+        for version in versions:
+            bin_path = tmp_path / 'apps' / (application + version) / 'bin'
+            bin_path.mkdir(parents=True)
+            (bin_path / application.lower()).touch()
+            (bin_path / 'readme.txt').touch()
+    (tmp_path / 'apps' / 'docs').mkdir()
+    os.symlink(
+        tmp_path / 'apps' / 'Maya2025', tmp_path / 'apps' / 'MayaLatest'
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def listed(monkeypatch):
+    '''List of the directories read.'''
+    directories = []
+    scandir = os.scandir
+
+    def tracked_scandir(path):
+        directories.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', tracked_scandir)
+    return directories
+
+
+def test_scan_matches_walk(tree):
+    '''Test the scan finds what os.walk finds.'''
+    scanner = ExpressionScanner()
+    for pieces in (
+        ['apps', r'Maya\d+', 'bin', 'maya$'],
+        ['apps', 'Nuke.*', 'bin', '.*'],
+        ['apps', 'Maya.*'],
+        ['apps', 'Houdini.*', 'bin', 'houdini$'],
+    ):
+        expressions = _expressions(tree, pieces)
+
+        paths = scanner.scan(ROOT, expressions)
+
+        assert sorted(paths) == sorted(_walk(ROOT, expressions))
+
+    # Symbolic links to folders are followed.
+    expressions = _expressions(tree, ['apps', 'Maya.*', 'bin', 'maya$'])
+    assert len(scanner.scan(ROOT, expressions)) == 4
+
+
+def test_directories_listed_once(tree, listed):
+    '''Test searches sharing directories list them once.'''
+    scanner = ExpressionScanner()
+    searches = [
+        (ROOT, _expressions(tree, ['apps', r'Maya\d+', 'bin', 'maya$'])),
+        (ROOT, _expressions(tree, ['apps', 'Maya.*', 'bin', 'maya$'])),
+        (ROOT, _expressions(tree, ['apps', 'Nuke.*', 'bin', 'nuke$'])),
+    ]
+
+    results = scanner.scan_many(searches)
+
+    assert [len(paths) for paths in results] == [3, 4, 2]
+    assert len(listed) == len(set(listed))
+    # Pruned: the docs directory is never listed.
+    assert str(tree / 'apps' / 'docs') not in listed
+
+    del listed[:]
+    scanner.scan(*searches[0])
+    assert listed == []
+
+    scanner.reset()
+    scanner.scan(*searches[0])
+    assert listed
+
+
+def test_warm_start_only_stats(tree, tmp_path_factory, listed):
+    '''Test persisted listings are reused until a directory changes.'''
+    cache_path = str(tmp_path_factory.mktemp('cache') / 'directories.json')
+    search = (
+        ROOT,
+        _expressions(tree, ['apps', r'Maya\d+', 'bin', 'maya$']),
+    )
+    scanner = ExpressionScanner(cache=DirectoryCache(cache_path))
+    cold = scanner.scan(*search)
+    scanner.save()
+    assert os.path.exists(cache_path)
+
+    del listed[:]
+    warm = ExpressionScanner(cache=DirectoryCache(cache_path)).scan(*search)
+
+    assert sorted(warm) == sorted(cold)
+    assert listed == []
+
+    # A new version changes the modification time of its parent only.
+    apps = tree / 'apps'
+    (apps / 'Maya2026' / 'bin').mkdir(parents=True)
+    (apps / 'Maya2026' / 'bin' / 'maya').touch()
+    mtime = os.stat(apps).st_mtime_ns + 10**9
+    os.utime(apps, ns=(mtime, mtime))
+
+    updated = ExpressionScanner(cache=DirectoryCache(cache_path)).scan(*search)
+
+    assert len(updated) == len(cold) + 1
+    assert str(apps) in listed
+    assert str(apps / 'Maya2023') not in listed
+
+
+def test_corrupt_cache_is_ignored(tree, tmp_path_factory):
+    '''Test an unreadable cache is discarded.'''
+    cache_path = tmp_path_factory.mktemp('cache') / 'directories.json'
+    cache_path.write_text('not json')
+    cache = DirectoryCache(str(cache_path))
+
+    assert len(cache) == 0
+    scanner = ExpressionScanner(cache=cache)
+    assert scanner.scan(
+        ROOT, _expressions(tree, ['apps', 'Nuke.*', 'bin', 'nuke$'])
+    )
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from ftrack_utils.rpc import JavascriptRPC, RPCTimeoutError
+
+
+class FakeEventHub(object):
+    '''Event hub replying to RPC events from a background thread.'''
+
+    def __init__(self, reply_delay=0.01):
+        self.connected = True
+        self.reply_delay = reply_delay
+        self.published = []
+        self.hanging = {'hang'}
+        self._stopped = threading.Event()
+
+    def subscribe(self, subscription, callback):
+        pass
+
+    def wait(self, duration=None):
+        self._stopped.wait(duration)
+
+    def stop(self):
+        self._stopped.set()
+
+    def publish(self, event, on_reply=None):
+        self.published.append(event)
+        data = event['data']
+        if on_reply is None or data.get('function_name') in self.hanging:
+            return
+        if data.get('function_name') == 'fail':
+            reply_data = {'error_message': 'Failed in DCC'}
+        else:
+            reply_data = {'result': data['args']}
+        reply = {'in_reply_to_event': event['id'], 'data': reply_data}
+        threading.Timer(self.reply_delay, on_reply, args=(reply,)).start()
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.event_hub = FakeEventHub()
+
+
+@pytest.fixture
+def rpc_connection(monkeypatch):
+    monkeypatch.setenv('FTRACK_PHOTOSHOP_VERSION', '2025')
+    monkeypatch.setenv('FTRACK_REMOTE_INTEGRATION_SESSION_ID', 'session-id')
+    session = FakeSession()
+    connection = JavascriptRPC(
+        'photoshop', session, None, [], None, None, None
+    )
+    yield connection
+    session.event_hub.stop()
+
+
+def test_rpc_returns_result(rpc_connection):
+    assert rpc_connection.rpc('echo', ['a', 1]) == ['a', 1]
+    assert rpc_connection.pending_reply_count == 0
+
+
+def test_rpc_async_allows_outstanding_calls(rpc_connection):
+    rpc_connection.session.event_hub.reply_delay = 0.2
+    started = time.monotonic()
+    futures = [
+        rpc_connection.rpc_async('echo', [index]) for index in range(20)
+    ]
+    assert rpc_connection.pending_reply_count == 20
+
+    results = [rpc_connection.wait_for_reply(future) for future in futures]
+
+    assert results == [[index] for index in range(20)]
+    # Replies are awaited concurrently, not one after another.
+    assert time.monotonic() - started < 2
+
+
+def test_rpc_raises_remote_error(rpc_connection):
+    with pytest.raises(Exception, match='Failed in DCC'):
+        rpc_connection.rpc('fail')
+
+
+def test_rpc_timeout(rpc_connection):
+    started = time.monotonic()
+    with pytest.raises(RPCTimeoutError):
+        rpc_connection.rpc('hang', timeout=200)
+
+    assert time.monotonic() - started < 1
+    assert rpc_connection.pending_reply_count == 0
+
+
+def test_discard_reply(rpc_connection):
+    '''Test a discarded call is forgotten and its late reply ignored.'''
+    rpc_connection.session.event_hub.reply_delay = 0.1
+    future = rpc_connection.rpc_async('echo', [1])
+
+    rpc_connection.discard_reply(future)
+
+    assert rpc_connection.pending_reply_count == 0
+    assert future.cancelled()
+    time.sleep(0.2)
+
+
+def test_document_collector_discards_replies(rpc_connection):
+    '''Test the Photoshop document collector leaves no call outstanding
+    when it fails before waiting for all its replies.'''
+    import importlib.util
+    from pathlib import Path
+
+    from ftrack_framework_core.exceptions.plugin import PluginExecutionError
+
+    spec = importlib.util.spec_from_file_location(
+        'photoshop_document_collector_under_test',
+        Path(__file__).parents[2]
+        / 'projects'
+        / 'framework-photoshop'
+        / 'extensions'
+        / 'plugins'
+        / 'photoshop_document_collector.py',
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    rpc_connection.connected = True
+    plugin = module.PhotoshopDocumentCollectorPlugin({}, None)
+
+    # No document open, replied with an empty result before the saved
+    # state query replies.
+    rpc_connection.session.event_hub.hanging.add('documentSaved')
+    with pytest.raises(PluginExecutionError, match='No document data'):
+        plugin.run({'components': {}})
+
+    assert rpc_connection.pending_reply_count == 0
@@ -26,3 +26,116 @@ def test__get_temp_path__directory_exists() -> None:
     assert os.path.exists(temp_directory) and os.path.isdir(
         temp_directory_with_extension
     )
+
+
+def test__copy_sequence__copies_and_reports_progress(tmp_path) -> None:
+    """Tests copying an image sequence in parallel with progress."""
+    import os
+    import clique
+    from ftrack_utils.paths import copy_sequence
+
+    source_directory = tmp_path / "source"
+    source_directory.mkdir()
+    for frame in range(1001, 1051):
+        (source_directory / f"image.{frame}.exr").write_bytes(
+            os.urandom(1024 * (frame - 1000))
+        )
+    collection = clique.parse(
+        str(source_directory / "image.%04d.exr [1001-1050]")
+    )
+    progress_reports = []
+
+    copied = copy_sequence(
+        collection,
+        str(tmp_path / "destination"),
+        max_workers=4,
+        progress_callback=progress_reports.append,
+    )
+
+    assert [os.path.basename(path) for path in copied] == [
+        os.path.basename(path) for path in collection
+    ]
+    for source, destination in zip(collection, copied):
+        with open(source, "rb") as source_file:
+            with open(destination, "rb") as destination_file:
+                assert source_file.read() == destination_file.read()
+    final_progress = progress_reports[-1]
+    assert final_progress.copied_files == 50
+    assert final_progress.copied_bytes == final_progress.total_bytes
+    assert final_progress.bytes_per_second > 0
+
+
+def test__copy_file__hardlinks_when_requested(tmp_path) -> None:
+    """Tests hardlinking a file on the same filesystem."""
+    import os
+    from ftrack_utils.paths import copy_file
+
+    source = tmp_path / "scene.ma"
+    source.write_bytes(b"scene")
+
+    copied = copy_file(str(source), str(tmp_path / "copy.ma"))
+    linked = copy_file(str(source), str(tmp_path / "link.ma"), link=True)
+
+    assert os.stat(copied).st_nlink == 1
+    assert os.path.samefile(linked, str(source))
+
+
+def test__copy_file__same_file_is_left_alone(tmp_path) -> None:
+    """Tests copying a file onto itself, or onto a hardlink to it, raises
+    without modifying it."""
+    import os
+    import shutil
+    import pytest
+    from ftrack_utils.paths import copy_file
+
+    source = tmp_path / "scene.ma"
+    source.write_bytes(b"scene")
+    hardlink = tmp_path / "hardlink.ma"
+    os.link(str(source), str(hardlink))
+
+    for destination in (str(source), str(tmp_path), str(hardlink)):
+        for link in (False, True):
+            with pytest.raises(shutil.SameFileError):
+                copy_file(str(source), destination, link=link)
+            assert source.read_bytes() == b"scene"
+    assert sorted(os.listdir(str(tmp_path))) == ["hardlink.ma", "scene.ma"]
+
+
+def test__copy_file__replaces_destination(tmp_path) -> None:
+    """Tests an existing destination is replaced, not written through."""
+    import os
+    from ftrack_utils.paths import copy_file
+
+    source = tmp_path / "scene.ma"
+    source.write_bytes(b"new scene")
+    destination = tmp_path / "copy.ma"
+    destination.write_bytes(b"old")
+    other_link = tmp_path / "other.ma"
+    os.link(str(destination), str(other_link))
+
+    copy_file(str(source), str(destination))
+
+    assert destination.read_bytes() == b"new scene"
+    assert other_link.read_bytes() == b"old"
+    assert sorted(os.listdir(str(tmp_path))) == [
+        "copy.ma",
+        "other.ma",
+        "scene.ma",
+    ]
+
+
+def test__copy_files__raises_first_failure(tmp_path) -> None:
+    """Tests a failed copy is raised."""
+    import pytest
+    from ftrack_utils.paths import copy_files
+
+    source = tmp_path / "image.exr"
+    source.write_bytes(b"image")
+
+    with pytest.raises(OSError):
+        copy_files(
+            [
+                (str(source), str(tmp_path / "copy.exr")),
+                (str(source), str(tmp_path / "missing" / "copy.exr")),
+            ]
+        )
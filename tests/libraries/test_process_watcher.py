@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from ftrack_utils.process import (
+    MonitorProcess,
+    ProcessWatcher,
+    is_process_running,
+)
+from ftrack_utils.process import watcher as watcher_module
+
+
+@pytest.fixture
+def process():
+    process = subprocess.Popen(
+        [sys.executable, '-c', 'import time; time.sleep(60)']
+    )
+    yield process
+    process.kill()
+    process.wait()
+
+
+def _watch(pid, **kwargs):
+    exited = []
+    called = threading.Event()
+
+    def on_exit(pid):
+        exited.append((pid, time.monotonic()))
+        called.set()
+
+    watcher = ProcessWatcher(pid, on_exit, **kwargs)
+    watcher.start()
+    return watcher, exited, called
+
+
+def test_exit_is_notified(process):
+    '''Test callbacks are called as soon as the process exits.'''
+    watcher, exited, called = _watch(process.pid)
+    time.sleep(0.1)
+    assert watcher.running
+
+    killed = time.monotonic()
+    process.kill()
+
+    assert called.wait(5)
+    assert not watcher.running
+    assert exited[0][0] == process.pid
+    assert exited[0][1] - killed < 0.5
+    if sys.platform == 'linux' and hasattr(os, 'pidfd_open'):
+        assert watcher.method == 'pidfd'
+    elif sys.platform == 'darwin':
+        assert watcher.method == 'kqueue'
+    elif sys.platform == 'win32':
+        assert watcher.method == 'win32'
+
+    late = []
+    watcher.add_callback(late.append)
+    assert late == [process.pid]
+
+
+def test_poll_fallback(process, monkeypatch):
+    '''Test processes are polled when exits cannot be waited for.'''
+    monkeypatch.setattr(
+        watcher_module.ProcessWatcher,
+        '_wait_for_exit',
+        watcher_module.ProcessWatcher._wait_poll,
+    )
+    watcher, exited, called = _watch(process.pid, poll_interval=0.05)
+
+    process.kill()
+
+    assert called.wait(5)
+    assert watcher.method == 'poll'
+
+
+def test_stop(process):
+    '''Test a stopped watcher does not call back.'''
+    watcher, exited, called = _watch(process.pid)
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    watcher.stop()
+    assert time.monotonic() - started < 1
+
+    process.kill()
+    assert not called.wait(0.3)
+
+
+def test_is_process_running(process):
+    assert is_process_running(os.getpid())
+    assert is_process_running(process.pid)
+
+    process.kill()
+    deadline = time.monotonic() + 5
+    while is_process_running(process.pid):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    # Not reaped.
+    assert process.poll() is not None
+
+
+def test_monitor_process(process):
+    '''Test the process is probed until found, then watched.'''
+    probed = []
+    exited = threading.Event()
+
+    def probe():
+        probed.append(process.pid)
+        return process.pid if len(probed) > 1 else None
+
+    monitor = MonitorProcess(probe, lambda pid: exited.set())
+    assert not monitor.check_running()
+    assert monitor.check_running()
+    assert monitor.check_running()
+    assert len(probed) == 2
+
+    process.kill()
+
+    assert exited.wait(5)
+    assert not monitor.check_running()
+    assert len(probed) == 2
+    monitor.stop()
@@ -0,0 +1,96 @@
+import re
+
+import pytest
+
+from ftrack_utils.query import BatchQuery, batch_query, chunk, quote
+
+
+class FakeQueryResult(list):
+    def all(self):
+        return list(self)
+
+
+class FakeSession(object):
+    '''Session answering ``attribute in (...)`` queries from *entities*.'''
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.queries = []
+
+    def query(self, expression):
+        self.queries.append(expression)
+        match = re.search(r'where (\S+) in \(([^)]*)\)', expression)
+        attribute = match.group(1)
+        values = re.findall(r'"((?:[^"\\]|\\.)*)"', match.group(2))
+        values = [value.replace('\\"', '"') for value in values]
+        return FakeQueryResult(
+            entity for entity in self.entities if entity[attribute] in values
+        )
+
+
+@pytest.fixture
+def session():
+    return FakeSession(
+        [
+            {
+                'id': 'task-{}'.format(index),
+                'parent_id': 'shot-{}'.format(index // 2),
+            }
+            for index in range(600)
+        ]
+    )
+
+
+def test_lookups_are_batched(session):
+    '''Test lookups are resolved in chunked queries.'''
+    batch = BatchQuery(session, 'Task', 'parent_id', ['name'], chunk_size=100)
+    results = [batch.add('shot-{}'.format(index)) for index in range(300)]
+    results.append(batch.add('shot-0'))
+    resolved = []
+    batch.add('shot-1', resolved.append)
+
+    assert not results[0].resolved
+    with pytest.raises(RuntimeError):
+        results[0].entities
+
+    batch.execute()
+
+    assert len(session.queries) == 3
+    assert session.queries[0].startswith(
+        'select name, parent_id from Task where parent_id in ("shot-0", '
+    )
+    assert [entity['id'] for entity in results[1].entities] == [
+        'task-2',
+        'task-3',
+    ]
+    assert results[-1].entities is results[0].entities
+    assert [result.value for result in resolved] == ['shot-1']
+
+
+def test_batch_query(session):
+    '''Test values without entities resolve to an empty list.'''
+    result = batch_query(
+        session, 'Task', 'parent_id', ['shot-4', 'shot-missing']
+    )
+
+    assert list(result) == ['shot-4', 'shot-missing']
+    assert [entity['id'] for entity in result['shot-4']] == [
+        'task-8',
+        'task-9',
+    ]
+    assert result['shot-missing'] == []
+    assert len(session.queries) == 1
+
+
+def test_criteria_and_quoting():
+    '''Test criteria are appended and values escaped.'''
+    batch = BatchQuery(
+        FakeSession([]), 'Context', 'name', criteria='project.name is "p"'
+    )
+
+    assert batch.expression(['a"b']) == (
+        'select name from Context where name in ({}) and '
+        '(project.name is "p")'.format(quote('a"b'))
+    )
+    assert quote('a"b') == '"a\\"b"'
+    assert list(chunk(range(5), 2)) == [[0, 1], [2, 3], [4]]
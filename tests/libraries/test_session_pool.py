@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+
+from ftrack_utils.session.session_pool import SessionPool
+
+
+class FakeEventHub(object):
+    def __init__(self):
+        self.connected = True
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.closed = False
+        self.event_hub = FakeEventHub()
+        self.reset_count = 0
+
+    def reset(self):
+        self.reset_count += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created_sessions():
+    return []
+
+
+@pytest.fixture
+def session_factory(created_sessions):
+    def factory():
+        session = FakeSession()
+        created_sessions.append(session)
+        return session
+
+    return factory
+
+
+def test_lease_reuses_and_resets_session(session_factory, created_sessions):
+    pool = SessionPool(max_size=2, session_factory=session_factory)
+
+    with pool.lease() as session:
+        assert pool.leased_count == 1
+    with pool.lease() as second_session:
+        pass
+
+    assert session is second_session
+    assert len(created_sessions) == 1
+    assert session.reset_count == 2
+    assert pool.idle_count == 1
+
+
+def test_prewarm_creates_min_size_sessions(session_factory, created_sessions):
+    pool = SessionPool(max_size=4, min_size=2, session_factory=session_factory)
+    pool.prewarm(asynchronous=False)
+
+    assert pool.idle_count == 2
+    with pool.lease():
+        pass
+    assert len(created_sessions) == 2
+
+
+def test_unhealthy_session_is_replaced(session_factory, created_sessions):
+    pool = SessionPool(max_size=2, session_factory=session_factory)
+    with pool.lease() as session:
+        pass
+    session.event_hub.connected = False
+
+    with pool.lease() as new_session:
+        assert new_session is not session
+
+    assert session.closed
+    assert len(created_sessions) == 2
+
+
+def test_lease_discards_session_on_error(session_factory):
+    pool = SessionPool(max_size=1, session_factory=session_factory)
+    with pytest.raises(ValueError):
+        with pool.lease() as session:
+            raise ValueError('engine failure')
+
+    assert session.closed
+    assert pool.size == 0
+
+
+def test_pool_is_bounded(session_factory):
+    pool = SessionPool(max_size=1, session_factory=session_factory)
+    session = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    released = []
+
+    def _release_later():
+        time.sleep(0.05)
+        released.append(True)
+        pool.release(session)
+
+    thread = threading.Thread(target=_release_later)
+    thread.start()
+    assert pool.acquire(timeout=5) is session
+    assert released
+    thread.join()
+
+
+def test_idle_sessions_above_min_size_are_evicted(session_factory):
+    pool = SessionPool(
+        max_size=3, min_size=1, idle_timeout=0, session_factory=session_factory
+    )
+    sessions = [pool.acquire() for _ in range(3)]
+    for session in sessions:
+        pool.release(session)
+    time.sleep(0.01)
+    pool.evict_idle()
+
+    assert pool.idle_count == 1
+    assert sum(session.closed for session in sessions) == 2
+
+
+def test_close_closes_idle_sessions(session_factory):
+    pool = SessionPool(max_size=2, session_factory=session_factory)
+    leased = pool.acquire()
+    with pool.lease() as idle:
+        pass
+    pool.close()
+
+    assert idle.closed
+    assert not leased.closed
+    pool.release(leased)
+    assert leased.closed
+    with pytest.raises(RuntimeError):
+        pool.acquire()
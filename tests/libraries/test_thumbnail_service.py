@@ -0,0 +1,220 @@
+import io
+import os
+import threading
+import time
+import urllib.error
+
+import pytest
+
+from PySide6 import QtCore, QtGui
+
+from ftrack_qt.widgets.thumbnails.thumbnail_service import (
+    DiskCache,
+    LRUCache,
+    ThumbnailService,
+)
+
+URL = (
+    'https://example.ftrackapp.com/component/thumbnail'
+    '?id=component-id&username=user&apiKey=secret'
+)
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, data, headers):
+        super(FakeResponse, self).__init__(data)
+        self.headers = headers
+
+
+class FakeServer(object):
+    '''Opener callback serving one image, honouring conditional headers.'''
+
+    def __init__(self, data=b'image-data', etag='"v1"'):
+        self.data = data
+        self.etag = etag
+        self.requests = []
+        self.online = True
+
+    def __call__(self, request, timeout=None):
+        self.requests.append(request)
+        if not self.online:
+            raise urllib.error.URLError('offline')
+        if request.get_header('If-none-match') == self.etag:
+            raise urllib.error.HTTPError(
+                request.full_url, 304, 'Not Modified', {}, None
+            )
+        return FakeResponse(self.data, {'ETag': self.etag})
+
+
+def png_data():
+    image = QtGui.QImage(4, 4, QtGui.QImage.Format.Format_ARGB32)
+    image.fill(0)
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG')
+    return bytes(buffer.data())
+
+
+def test_lru_cache_is_bounded_in_bytes():
+    cache = LRUCache(max_bytes=10)
+    cache.set('a', 'A', 4)
+    cache.set('b', 'B', 4)
+    assert cache.get('a') == 'A'
+
+    cache.set('c', 'C', 4)
+
+    # 'b' is the least recently used
+    assert 'b' not in cache
+    assert cache.get('a') == 'A'
+    assert cache.size_in_bytes == 8
+
+    cache.set('huge', 'H', 11)
+    assert 'huge' not in cache
+
+
+def test_disk_cache_key_ignores_credentials(tmp_path):
+    cache = DiskCache(str(tmp_path))
+
+    assert cache.key(URL).endswith('_component-id_full')
+    assert cache.key(URL + '&size=small').endswith('_component-id_small')
+    assert cache.key(URL) == cache.key(URL.replace('secret', 'other'))
+    assert cache.key(
+        'https://example.ftrackapp.com/img/thumbnail2.png?apiKey=a'
+    ) == cache.key('https://example.ftrackapp.com/img/thumbnail2.png?apiKey=b')
+
+
+def test_disk_cache_key_includes_server(tmp_path):
+    cache = DiskCache(str(tmp_path))
+
+    assert cache.key(URL) != cache.key(
+        URL.replace('example.ftrackapp.com', 'other.ftrackapp.com')
+    )
+
+
+def test_disk_cache_serves_fresh_entries(tmp_path):
+    server = FakeServer()
+    cache = DiskCache(str(tmp_path), revalidate_after=60)
+
+    assert cache.fetch(URL, server) == b'image-data'
+    assert cache.fetch(URL, server) == b'image-data'
+
+    assert len(server.requests) == 1
+    key = cache.key(URL)
+    assert sorted(os.listdir(str(tmp_path))) == [key, key + '.json']
+
+
+def test_disk_cache_revalidates_with_etag(tmp_path):
+    server = FakeServer()
+    cache = DiskCache(str(tmp_path), revalidate_after=0)
+    cache.fetch(URL, server)
+
+    assert cache.fetch(URL, server) == b'image-data'
+    assert server.requests[-1].get_header('If-none-match') == '"v1"'
+
+    server.etag = '"v2"'
+    server.data = b'new-image-data'
+    assert cache.fetch(URL, server) == b'new-image-data'
+
+    server.online = False
+    assert cache.fetch(URL, server) == b'new-image-data'
+
+
+def test_disk_cache_prune(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=15)
+    keys = []
+    for index in range(3):
+        server = FakeServer(data=b'0123456789')
+        url = URL.replace('component-id', str(index))
+        cache.fetch(url, server)
+        keys.append(cache.key(url))
+        os.utime(os.path.join(str(tmp_path), keys[-1]), (index, index))
+
+    cache.prune()
+
+    assert sorted(
+        name for name in os.listdir(str(tmp_path)) if '.' not in name
+    ) == [keys[2]]
+
+
+@pytest.fixture(scope='module')
+def qt_application():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def process_events_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents(
+            QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50
+        )
+    return predicate()
+
+
+def test_service_deduplicates_and_decodes_off_main_thread(
+    qt_application, tmp_path
+):
+    service = ThumbnailService(max_workers=4, cache_directory=str(tmp_path))
+    data = png_data()
+    release = threading.Event()
+    loads = []
+    results = []
+
+    def loader(reference):
+        loads.append(threading.current_thread())
+        release.wait(5)
+        return data
+
+    for _ in range(5):
+        service.request('reference', loader, results.append)
+    release.set()
+
+    assert process_events_until(lambda: len(results) == 5)
+    assert len(loads) == 1
+    assert loads[0] is not threading.main_thread()
+    assert all(isinstance(image, QtGui.QImage) for image in results)
+    assert results[0].width() == 4
+
+    # Served from memory, synchronously
+    service.request('reference', loader, results.append)
+    assert len(results) == 6
+    assert len(loads) == 1
+    service.shutdown()
+
+
+def test_service_caches_missing_thumbnails(qt_application, tmp_path):
+    service = ThumbnailService(max_workers=1, cache_directory=str(tmp_path))
+    results = []
+
+    def loader(reference):
+        raise urllib.error.HTTPError(reference, 404, 'Not Found', {}, None)
+
+    service.request('missing', loader, results.append)
+    assert process_events_until(lambda: results)
+
+    assert results == [None]
+    assert service.cached('missing') == (True, None)
+    service.shutdown()
+
+
+def test_service_retries_unreachable_thumbnails(qt_application, tmp_path):
+    service = ThumbnailService(max_workers=1, cache_directory=str(tmp_path))
+    data = png_data()
+    errors = [
+        urllib.error.URLError('offline'),
+        urllib.error.HTTPError('reference', 503, 'Unavailable', {}, None),
+    ]
+    results = []
+
+    def loader(reference):
+        if errors:
+            raise errors.pop(0)
+        return data
+
+    for attempt in range(3):
+        service.request('reference', loader, results.append)
+        assert process_events_until(lambda: len(results) == attempt + 1)
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], QtGui.QImage)
+    assert service.cached('reference')[0]
+    service.shutdown()
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from ftrack_utils.decorators import track_framework_usage
+from ftrack_utils.usage import track_usage
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def call(self, payload):
+        self.threads.add(threading.current_thread())
+        self.calls.append(payload)
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    '''Return a new UsageTracker set as the global one.'''
+    monkeypatch.setattr(track_usage.UsageTracker, '_instance', None)
+    monkeypatch.setattr(track_usage, 'usage_tracker_singleton', None)
+    tracker = track_usage.UsageTracker(FakeSession(), {'os': 'test'})
+    track_usage.set_usage_tracker(tracker)
+    return tracker
+
+
+def test_events_are_sent_in_batches_by_one_thread(tracker):
+    for index in range(120):
+        tracker.track('PLUGIN_RUN', {'index': index})
+
+    assert tracker.flush(timeout=5)
+
+    session = tracker._session
+    events = [item for payload in session.calls for item in payload]
+    assert len(session.calls) <= 4
+    assert [event['data']['metadata']['index'] for event in events] == list(
+        range(120)
+    )
+    assert events[0] == {
+        'action': '_track_usage',
+        'data': {
+            'type': 'event',
+            'name': 'PLUGIN_RUN',
+            'metadata': {'os': 'test', 'index': 0},
+        },
+    }
+    assert len(session.threads) == 1
+    assert threading.current_thread() not in session.threads
+
+
+def test_full_queue_drops_events(tracker, monkeypatch):
+    monkeypatch.setattr(tracker, '_ensure_flusher', lambda: None)
+    monkeypatch.setattr(tracker, '_queue', track_usage.queue.Queue(2))
+
+    for index in range(5):
+        tracker.track('PLUGIN_RUN', {'index': index})
+
+    assert tracker.dropped_events == 3
+
+
+def test_decorator_tracks_arguments_without_sharing_metadata(tracker):
+    metadata = {'module': 'engine'}
+    tracked = []
+    tracker.track = lambda event_name, data: tracked.append(data)
+
+    class Engine(object):
+        session = None
+
+        @track_framework_usage('RUN', metadata, ['plugin', 'reference'])
+        def run_plugin(self, plugin, options=None, reference='default'):
+            return plugin
+
+    engine = Engine()
+    assert engine.run_plugin('a') == 'a'
+    engine.run_plugin(plugin='b', reference='c')
+
+    assert tracked == [
+        {'module': 'engine', 'plugin': 'a', 'reference': 'default'},
+        {'module': 'engine', 'plugin': 'b', 'reference': 'c'},
+    ]
+    assert metadata == {'module': 'engine'}